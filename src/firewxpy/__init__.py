@@ -1,21 +1,44 @@
 # (C) Eric J. Drewitz 2024 - 2026
 
-# - Upper Air
-# - Observed Soundings
-# - Observed Vertical Profiles
-import firewxpy.observations.upper_air.soundings as observed_soundings
-import firewxpy.observations.upper_air.profiles as observed_vertical_profiles
+# The modules are imported the first time they are accessed (i.e. firewxpy.rtma_conus) so
+# import firewxpy does not import matplotlib, cartopy, metpy, pandas or wxdata (see firewxpy._lazy).
+from firewxpy._lazy import lazy_modules as _lazy_modules
 
-# - Real Time Mesoscale Analysis (RTMA)
-# - RTMA CONUS
-# - RTMA Comparison CONUS
-# - RTMA Alaska
-# - RTMA Comparison Alaska
-# - RTMA Hawaii
-# - RTMA Comparison Hawaii
-import firewxpy.rtma.conus.rtma as rtma_conus
-import firewxpy.rtma.conus.rtma_comparison as rtma_comparison_conus
-import firewxpy.rtma.alaska.rtma as rtma_alaska
-import firewxpy.rtma.alaska.rtma_comparison as rtma_comparison_alaska
-import firewxpy.rtma.hawaii.rtma as rtma_hawaii
-import firewxpy.rtma.hawaii.rtma_comparison as rtma_comparison_hawaii
+_modules = {
+    
+    # - Subpackages
+    'calc':'firewxpy.calc',
+    'observations':'firewxpy.observations',
+    'rtma':'firewxpy.rtma',
+    'utils':'firewxpy.utils',
+    
+    # - Upper Air
+    # - Observed Soundings
+    # - Observed Vertical Profiles
+    'observed_soundings':'firewxpy.observations.upper_air.soundings',
+    'observed_vertical_profiles':'firewxpy.observations.upper_air.profiles',
+    
+    # - Real Time Mesoscale Analysis (RTMA)
+    # - RTMA CONUS
+    # - RTMA Comparison CONUS
+    # - RTMA Alaska
+    # - RTMA Comparison Alaska
+    # - RTMA Hawaii
+    # - RTMA Comparison Hawaii
+    'rtma_conus':'firewxpy.rtma.conus.rtma',
+    'rtma_comparison_conus':'firewxpy.rtma.conus.rtma_comparison',
+    'rtma_alaska':'firewxpy.rtma.alaska.rtma',
+    'rtma_comparison_alaska':'firewxpy.rtma.alaska.rtma_comparison',
+    'rtma_hawaii':'firewxpy.rtma.hawaii.rtma',
+    'rtma_comparison_hawaii':'firewxpy.rtma.hawaii.rtma_comparison',
+    
+    # - Render Daemon
+    'render_daemon':'firewxpy.rtma.daemon',
+
+    # - RTMA Watcher
+    'rtma_watcher':'firewxpy.rtma.watcher'
+}
+
+__all__ = list(_modules)
+
+__getattr__, __dir__ = _lazy_modules(globals(), _modules)
@@ -0,0 +1,63 @@
+"""
+This file hosts the lazy loading of the FireWxPy modules (PEP 562).
+
+The graphics modules pull in matplotlib, cartopy, metpy, pandas and wxdata. The packages only name their modules and each
+module (and its dependencies) is imported the first time it is accessed (i.e. firewxpy.rtma_conus) so a script that only
+makes a sounding does not pay for importing the RTMA modules.
+
+This module must stay free of heavy imports since every package imports it.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import importlib as _importlib
+
+def lazy_modules(package,
+                 modules,
+                 attributes=None):
+
+    """
+    This function returns the module level __getattr__() and __dir__() of a package that loads its modules lazily.
+
+    Required Arguments:
+
+    1) package (dict) - The globals() of the package.
+
+    2) modules (dict) - The attribute names mapped to the full names of the modules
+        (i.e. {'rtma_conus':'firewxpy.rtma.conus.rtma'}).
+
+    Optional Arguments:
+
+    1) attributes (dict or None) - Default=None. The names re-exported from the modules of the package mapped to the full
+        name of the module that defines them (i.e. {'hold_datasets':'firewxpy.utils.dataset_cache'}).
+
+    Returns
+    -------
+
+    1) The __getattr__() function of the package.
+
+    2) The __dir__() function of the package.
+    """
+
+    if attributes is None:
+        attributes = {}
+
+    def __getattr__(name):
+
+        if name in modules:
+            value = _importlib.import_module(modules[name])
+        elif name in attributes:
+            value = getattr(_importlib.import_module(attributes[name]), name)
+        else:
+            raise AttributeError(f"module '{package['__name__']}' has no attribute '{name}'")
+
+        # The value is stored in the package so __getattr__() is only called on the first access.
+        package[name] = value
+
+        return value
+
+    def __dir__():
+
+        return sorted(set(package) | set(modules) | set(attributes))
+
+    return __getattr__, __dir__
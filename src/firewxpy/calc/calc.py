@@ -1,11 +1,16 @@
 """
 This file hosts functions used to perform various calculations of our weather data.
 
+Every unit conversion goes through one registry that maps each (from_units, to_units) pair to a fused affine kernel
+(converted = values * scale + offset) working on NumPy arrays, xarray.DataArrays, pandas Series/DataFrames and scalars.
+Units that are not in the registry are derived once from the MetPy (pint) unit registry and added to it.
+
 (C) Eric J. Drewitz 2024-2026
 """
 
 import pandas as pd
 import numpy as np
+import xarray as xr
 
 def knots_to_mph(knots):
     
@@ -18,7 +23,7 @@ def knots_to_mph(knots):
     Speed in mpg.     
     """
     
-    return knots * 1.1507767864272770986
+    return convert(knots, 'kts', 'mph')
 
 def knots_to_mps(knots):
     
@@ -31,7 +36,7 @@ def knots_to_mps(knots):
     Speed in m/s.     
     """
     
-    return knots * 0.51444325460445
+    return convert(knots, 'kts', 'mps')
 
 def mps_to_mph(mps):
     
@@ -44,18 +49,33 @@ def mps_to_mph(mps):
     Speed in mph    
     """
     
-    return mps * 2.23694
+    return convert(mps, 'mps', 'mph')
 
-def mph_to_kts(mps):
+def mps_to_kts(mps):
     
     """
-    Converts mps to knots
+    Converts m/s to knots
     
     Returns
     -------
     
     Speed in knots
     """
+    
+    return convert(mps, 'mps', 'kts')
+
+def mph_to_kts(mph):
+    
+    """
+    Converts mph to knots
+    
+    Returns
+    -------
+    
+    Speed in knots
+    """
+    
+    return convert(mph, 'mph', 'kts')
 
 def round_values(df,
                   parameter,
@@ -110,11 +130,7 @@ def kelvin_to_fahrenheit(kelvin):
     
     Temperature in fahrenheit.    
     """
-    celsius= kelvin - 273.15
-    
-    fahrenheit = (celsius * (9/5)) + 32
-    
-    return fahrenheit
+    return convert(kelvin, 'kelvin', 'fahrenheit')
 
 def fahrenheit_to_kelvin(fahrenheit):
     
@@ -130,11 +146,7 @@ def fahrenheit_to_kelvin(fahrenheit):
     
     Temperature in kelvin.    
     """
-    celsius = (fahrenheit - 32) * (5/9)
-    
-    kelvin = celsius + 273.15
-    
-    return kelvin
+    return convert(fahrenheit, 'fahrenheit', 'kelvin')
     
 def celsius_to_fahrenheit(celsius):
     
@@ -151,9 +163,7 @@ def celsius_to_fahrenheit(celsius):
     Temperature in fahrenheit.    
     """
     
-    fahrenheit = (celsius * (9/5)) + 32
-    
-    return fahrenheit
+    return convert(celsius, 'celsius', 'fahrenheit')
 
 def fahrenheit_to_celsius(fahrenheit):
     
@@ -170,9 +180,7 @@ def fahrenheit_to_celsius(fahrenheit):
     Temperature in celsius.    
     """
     
-    celsius = (fahrenheit - 32) * (5/9)
-    
-    return celsius
+    return convert(fahrenheit, 'fahrenheit', 'celsius')
 
 def kelvin_to_celsius(celsius):
     
@@ -189,7 +197,7 @@ def kelvin_to_celsius(celsius):
     Temperature in celsius.    
     """
     
-    return celsius - 273.15
+    return convert(celsius, 'kelvin', 'celsius')
 
 def celsius_to_kelvin(celsius):
     
@@ -206,7 +214,7 @@ def celsius_to_kelvin(celsius):
     Temperature in kelvin.    
     """
     
-    return celsius + 273.15
+    return convert(celsius, 'celsius', 'kelvin')
 
 def kilometers_to_meters(kilometers):
     
@@ -223,7 +231,7 @@ def kilometers_to_meters(kilometers):
     Height in meters    
     """
     
-    return kilometers * 1000
+    return convert(kilometers, 'kilometers', 'meters')
 
 
 def meters_to_feet(meters):
@@ -241,7 +249,116 @@ def meters_to_feet(meters):
     Height in feet.    
     """
     
-    return meters * 3.28084
+    return convert(meters, 'meters', 'feet')
+
+def wind_components(speed,
+                    direction,
+                    u=None,
+                    v=None,
+                    dtype=None):
+    
+    """
+    Calculates the u and v components of the wind from the speed and the direction the wind is blowing from.
+    
+    The components are written straight into {u} and {v} (the radians are held in {v}) so no temporary fields
+    are created. Use this on the decimated station plot points rather than on the full grid when only the
+    wind barbs need the components.
+    
+    Required Arguments:
+    
+    1) speed (numpy.array) - The wind speed.
+    
+    2) direction (numpy.array) - The wind direction in degrees.
+    
+    Optional Arguments:
+    
+    1) u (numpy.array or None) - Default=None. The array the u component is written into. When None, a new array is created.
+    
+    2) v (numpy.array or None) - Default=None. The array the v component is written into. When None, a new array is created.
+    
+    3) dtype (String or None) - Default=None. The data type of new arrays. When None, the data type of {speed} is used
+        (float64 for integers).
+    
+    Returns
+    -------
+    
+    1) The u component.
+    
+    2) The v component.    
+    """
+    
+    speed = np.asarray(speed)
+    direction = np.asarray(direction)
+    shape = np.broadcast_shapes(speed.shape, direction.shape)
+    
+    if dtype is None:
+        dtype = speed.dtype if speed.dtype.kind == 'f' else np.float64
+    if u is None:
+        u = np.empty(shape, dtype=dtype)
+    if v is None:
+        v = np.empty(shape, dtype=dtype)
+        
+    np.multiply(direction, np.pi / 180, out=v)
+    np.sin(v, out=u)
+    np.cos(v, out=v)
+    
+    np.multiply(u, speed, out=u)
+    np.negative(u, out=u)
+    np.multiply(v, speed, out=v)
+    np.negative(v, out=v)
+    
+    return u, v
+
+def speed_and_direction(u,
+                        v,
+                        speed=None,
+                        direction=None,
+                        dtype=None):
+    
+    """
+    Calculates the wind speed and the direction the wind is blowing from out of the u and v components.
+    
+    Required Arguments:
+    
+    1) u (numpy.array) - The u component.
+    
+    2) v (numpy.array) - The v component.
+    
+    Optional Arguments:
+    
+    1) speed (numpy.array or None) - Default=None. The array the speed is written into. When None, a new array is created.
+    
+    2) direction (numpy.array or None) - Default=None. The array the direction (degrees) is written into. When None, a new array is created.
+    
+    3) dtype (String or None) - Default=None. The data type of new arrays. When None, the data type of {u} is used
+        (float64 for integers).
+    
+    Returns
+    -------
+    
+    1) The wind speed.
+    
+    2) The wind direction in degrees.    
+    """
+    
+    u = np.asarray(u)
+    v = np.asarray(v)
+    shape = np.broadcast_shapes(u.shape, v.shape)
+    
+    if dtype is None:
+        dtype = u.dtype if u.dtype.kind == 'f' else np.float64
+    if speed is None:
+        speed = np.empty(shape, dtype=dtype)
+    if direction is None:
+        direction = np.empty(shape, dtype=dtype)
+        
+    np.hypot(u, v, out=speed)
+    np.arctan2(u, v, out=direction)
+    np.multiply(direction, 180 / np.pi, out=direction)
+    np.add(direction, 180, out=direction)
+    np.remainder(direction, 360, out=direction)
+    
+    return speed, direction
 
 def u_v_components(ds,
                    u_var_key,
@@ -258,10 +375,478 @@ def u_v_components(ds,
     Data Array with u and v components.    
     """
     
-    ds['wind_direction_radians'] = np.deg2rad(ds[deg_var_key])
-    ds[u_var_key] = -ds[speed_var_key] * np.sin(ds['wind_direction_radians'])
-    ds[v_var_key] = -ds[speed_var_key] * np.cos(ds['wind_direction_radians'])
+    speed = ds[speed_var_key]
+    u, v = wind_components(speed.values, ds[deg_var_key].values)
+    
+    ds[u_var_key] = speed.copy(deep=False, data=u)
+    ds[v_var_key] = speed.copy(deep=False, data=v)
+    
+    return ds
+    
+    
+# The units a variable was converted to by convert_units() are recorded under this attribute so a dataset that is passed
+# through several plotting functions is never converted twice.
+units_attribute = 'firewxpy_units'
+
+# Each unit maps to its quantity and the (scale, offset) that converts it to the base unit of the quantity.
+_units = {
+    'kelvin':('temperature', 1.0, 0.0),
+    'celsius':('temperature', 1.0, 273.15),
+    'fahrenheit':('temperature', 5/9, 459.67 * (5/9)),
+    'mps':('speed', 1.0, 0.0),
+    'mph':('speed', 0.44704, 0.0),
+    'kts':('speed', 1852/3600, 0.0),
+    'meters':('length', 1.0, 0.0),
+    'kilometers':('length', 1000.0, 0.0),
+    'feet':('length', 0.3048, 0.0)
+}
+
+_unit_aliases = {
+    'k':'kelvin',
+    'c':'celsius',
+    'degc':'celsius',
+    'f':'fahrenheit',
+    'degf':'fahrenheit',
+    'm/s':'mps',
+    'ms':'mps',
+    'm s-1':'mps',
+    'm s**-1':'mps',
+    'knots':'kts',
+    'kt':'kts',
+    'm':'meters',
+    'km':'kilometers',
+    'ft':'feet'
+}
+
+def normalize_units(units):
+    
+    """
+    Returns the FireWxPy name of a unit (i.e. 'K' -> 'kelvin', 'm s**-1' -> 'mps', 'knots' -> 'kts').
+    
+    Required Arguments:
+    
+    1) units (String) - The units.
+    
+    Returns
+    -------
+    
+    The name of the units. Units that are not in the registry are looked up in the MetPy (pint) unit registry and
+    their pint name is returned (i.e. 'degR' -> 'degree_Rankine'). A ValueError is raised for unknown units.    
+    """
+    
+    name = str(units).strip().lower()
+    name = _unit_aliases.get(name, name)
+    
+    if name in _units:
+        return name
+    
+    from metpy.units import units as _pint_units
+    
+    try:
+        return str(_pint_units.Unit(str(units).strip()))
+    except Exception:
+        raise ValueError(f"Unknown units: {units}. Valid units are: {list(_units.keys())} or any unit known to MetPy (pint).")
+
+def unit_factors(from_units,
+                 to_units):
+    
+    """
+    Returns the scale and offset that convert values from one unit to another (converted = values * scale + offset).
+    
+    Required Arguments:
+    
+    1) from_units (String) - The units of the values.
+    
+    2) to_units (String) - The units to convert to.
+    
+    Returns
+    -------
+    
+    1) The scale.
+    
+    2) The offset.    
+    """
+    
+    from_units = normalize_units(from_units)
+    to_units = normalize_units(to_units)
+    
+    if from_units not in _units or to_units not in _units:
+        return _pint_factors(from_units, to_units)
+    
+    from_quantity, from_scale, from_offset = _units[from_units]
+    to_quantity, to_scale, to_offset = _units[to_units]
+    
+    if from_quantity != to_quantity:
+        raise ValueError(f"Cannot convert {from_quantity} ({from_units}) to {to_quantity} ({to_units}).")
+    
+    return from_scale / to_scale, (from_offset - to_offset) / to_scale
+
+# The pint names of the units of the registry.
+_pint_names = {
+    'kelvin':'kelvin',
+    'celsius':'degC',
+    'fahrenheit':'degF',
+    'mps':'m/s',
+    'mph':'mph',
+    'kts':'knot',
+    'meters':'meter',
+    'kilometers':'kilometer',
+    'feet':'foot'
+}
+
+def _pint_factors(from_units,
+                  to_units):
+    
+    """
+    Returns the scale and offset of a conversion the registry does not hold, derived from the MetPy (pint) unit registry.
+    """
+    
+    from metpy.units import units as _pint_units
+    
+    from_units = _pint_names.get(from_units, from_units)
+    to_units = _pint_names.get(to_units, to_units)
+    
+    try:
+        offset = _pint_units.Quantity(0.0, from_units).to(to_units).magnitude
+        scale = _pint_units.Quantity(1.0, from_units).to(to_units).magnitude - offset
+    except Exception as e:
+        raise ValueError(f"Cannot convert {from_units} to {to_units}: {e}")
+    
+    return float(scale), float(offset)
+
+def _affine_kernel(scale,
+                   offset):
+    
+    """
+    Returns the fused kernel that computes values * scale + offset with at most one new array.
+    """
+    
+    def kernel(values,
+               out=None,
+               dtype=None):
+        
+        values = np.asarray(values)
+        
+        if out is None:
+            if dtype is None:
+                dtype = values.dtype if values.dtype.kind == 'f' else np.float64
+            out = np.empty(values.shape, dtype=dtype)
+            
+        if scale != 1 or out is not values:
+            np.multiply(values, scale, out=out)
+        if offset != 0:
+            np.add(out, offset, out=out)
+            
+        return out
+    
+    return kernel
+
+# The conversion registry: every (from_units, to_units) pair of the same quantity maps to its affine kernel.
+_kernels = {(a, b):_affine_kernel(*unit_factors(a, b)) for a in _units for b in _units if _units[a][0] == _units[b][0]}
+
+# Differences (i.e. the dew point depression) are only scaled: a difference of 1 K is a difference of 1.8 °F.
+_difference_kernels = {(a, b):_affine_kernel(unit_factors(a, b)[0], 0.0) for a, b in _kernels}
+
+def conversion(from_units,
+               to_units,
+               difference=False):
+    
+    """
+    Returns the kernel of the conversion registry that converts from one unit to another.
+    
+    Required Arguments:
+    
+    1) from_units (String) - The units of the values.
+    
+    2) to_units (String) - The units to convert to.
+    
+    Optional Arguments:
+    
+    1) difference (Boolean) - Default=False. When set to True, the values are differences (i.e. the dew point depression)
+        and are only scaled.
+    
+    Returns
+    -------
+    
+    A function kernel(values, out=None, dtype=None) that returns the converted NumPy array.    
+    """
+    
+    key = (normalize_units(from_units), normalize_units(to_units))
+    
+    # Conversions between units that are not in the registry are derived from pint once and added to it.
+    if key not in _kernels:
+        scale, offset = unit_factors(*key)
+        _kernels[key] = _affine_kernel(scale, offset)
+        _difference_kernels[key] = _affine_kernel(scale, 0.0)
+        
+    if difference is True:
+        return _difference_kernels[key]
+        
+    return _kernels[key]
+
+def convert_array(values,
+                  from_units,
+                  to_units,
+                  dtype='float32',
+                  out=None,
+                  difference=False):
+    
+    """
+    Converts an array of values from one unit to another without creating any temporary arrays.
+    
+    Required Arguments:
     
+    1) values (numpy.array) - The values.
+    
+    2) from_units (String) - The units of the values.
+    
+    3) to_units (String) - The units to convert to.
+    
+    Optional Arguments:
+    
+    1) dtype (String or None) - Default='float32'. The data type of the converted values. When None, the data type of
+        the values is kept.
+        
+    2) out (numpy.array or None) - Default=None. The array the converted values are written into. This may be {values}
+        itself to convert in place. When None, a new array is created.
+        
+    3) difference (Boolean) - Default=False. When set to True, the values are differences and are only scaled.
+    
+    Returns
+    -------
+    
+    The converted values.    
+    """
+    
+    return conversion(from_units, to_units, difference)(values, out=out, dtype=dtype)
+
+def convert(values,
+            from_units,
+            to_units,
+            dtype=None,
+            in_place=False):
+    
+    """
+    Converts values from one unit to another with the kernel of the conversion registry.
+    
+    Required Arguments:
+    
+    1) values (Integer, Float, numpy.array, xarray.DataArray, pandas.Series or pandas.DataFrame) - The values.
+    
+    2) from_units (String) - The units of the values (i.e. 'kelvin', 'celsius', 'fahrenheit', 'mps', 'mph', 'kts',
+        'meters', 'kilometers', 'feet').
+    
+    3) to_units (String) - The units to convert to.
+    
+    Optional Arguments:
+    
+    1) dtype (String or None) - Default=None. The data type of the converted values. When None, the data type of
+        floating point values is kept and integers are converted to float64.
+        
+    2) in_place (Boolean) - Default=False. When set to True, the values are converted in their own buffer when the
+        data type allows it.
+    
+    Returns
+    -------
+    
+    The converted values with the same type (and index, coordinates and attributes) as {values}. Other types
+    (i.e. pint quantities) are converted with plain arithmetic.    
+    """
+    
+    kernel = conversion(from_units, to_units)
+    
+    if isinstance(values, xr.DataArray):
+        data = values.values
+        out = _in_place_buffer(data, dtype) if in_place is True else None
+        converted = values.copy(deep=False, data=kernel(data, out=out, dtype=dtype))
+        converted.attrs[units_attribute] = normalize_units(to_units)
+        return converted
+    
+    if isinstance(values, pd.Series):
+        data = values.to_numpy()
+        out = _in_place_buffer(data, dtype) if in_place is True else None
+        return pd.Series(kernel(data, out=out, dtype=dtype), index=values.index, name=values.name, copy=False)
+    
+    if isinstance(values, pd.DataFrame):
+        return pd.DataFrame(kernel(values.to_numpy(dtype=float), dtype=dtype), index=values.index, columns=values.columns)
+    
+    if isinstance(values, np.ndarray):
+        out = _in_place_buffer(values, dtype) if in_place is True else None
+        return kernel(values, out=out, dtype=dtype)
+    
+    if isinstance(values, (int, float, np.number)):
+        return kernel(values, dtype=dtype)[()]
+    
+    scale, offset = unit_factors(from_units, to_units)
+    
+    values = values * scale
+    if offset != 0:
+        values = values + offset
+    
+    return values
+
+def _in_place_buffer(values,
+                     dtype):
+    
+    """
+    Returns {values} when they can hold the converted values in place, otherwise None.
+    """
+    
+    if values.dtype.kind == 'f' and values.flags.writeable and (dtype is None or np.dtype(dtype) == values.dtype):
+        return values
+    
+    return None
+
+def units_of(ds,
+             var_key,
+             default=None):
+    
+    """
+    Returns the units a variable of a dataset was converted to by convert_units().
+    
+    Required Arguments:
+    
+    1) ds (xarray.array) - The dataset.
+    
+    2) var_key (String) - The variable key name.
+    
+    Optional Arguments:
+    
+    1) default (String or None) - Default=None. The units returned when the variable was never converted.
+    
+    Returns
+    -------
+    
+    The units of the variable.    
+    """
+    
+    return ds[var_key].attrs.get(units_attribute, default)
+
+def convert_units(ds,
+                  var_keys,
+                  to_units,
+                  from_units=None,
+                  dtype='float32',
+                  in_place=False,
+                  difference=False):
+    
+    """
+    Converts variables of a dataset to new units, keeping track of the units each variable is in.
+    
+    Each variable is converted with one multiply and one add into a single new array of {dtype} (float32 by default)
+    so no float64 temporaries are created. The units are recorded in the attributes of the variable and a variable
+    that is already in {to_units} is left alone, so a dataset that is passed through several plotting functions is
+    never converted twice.
+    
+    Required Arguments:
+    
+    1) ds (xarray.array) - The dataset.
+    
+    2) var_keys (String or List) - The variable key name(s).
+    
+    3) to_units (String) - The units to convert to (i.e. 'fahrenheit', 'celsius', 'kelvin', 'mph', 'kts', 'mps').
+    
+    Optional Arguments:
+    
+    1) from_units (String or None) - Default=None. The units of variables that were never converted by convert_units()
+        (i.e. 'kelvin' for the raw RTMA temperature). A ValueError is raised when the units of a variable are unknown.
+        
+    2) dtype (String or None) - Default='float32'. The data type of the converted variables. When None, the data type of
+        each variable is kept.
+        
+    3) in_place (Boolean) - Default=False. When set to True, the variables of {ds} itself are replaced and a variable that
+        already has the data type {dtype} is converted in its own buffer (out=). Only use this when nothing else (i.e. the
+        dataset cache) holds the arrays of {ds}. When False, a shallow copy of {ds} is returned and {ds} is not altered.
+        
+    4) difference (Boolean) - Default=False. When set to True, the variables are differences of temperatures (i.e. the dew
+        point depression) and are only scaled, never offset.
+    
+    Returns
+    -------
+    
+    The dataset with the converted variables.    
+    """
+    
+    if isinstance(var_keys, str):
+        var_keys = [var_keys]
+        
+    to_units = normalize_units(to_units)
+    
+    if in_place is False:
+        ds = ds.copy(deep=False)
+        
+    for var_key in var_keys:
+        da = ds[var_key]
+        units = units_of(ds, var_key, from_units)
+        if units is None:
+            raise ValueError(f"The units of {var_key} are unknown. Pass from_units.")
+        
+        units = normalize_units(units)
+        values = da.values
+        target = values.dtype if dtype is None else np.dtype(dtype)
+        
+        if units == to_units and values.dtype == target:
+            continue
+        
+        if in_place is True and values.dtype == target and values.flags.writeable:
+            out = values
+        else:
+            out = None
+            
+        values = convert_array(values,
+                               units,
+                               to_units,
+                               dtype=target,
+                               out=out,
+                               difference=difference)
+        
+        da = da.copy(deep=False, data=values)
+        da.attrs[units_attribute] = to_units
+        ds[var_key] = da
+        
     return ds
+
+# The RTMA temperatures and temperature differences.
+temperature_keys = ['2m_temperature',
+                    '2m_dew_point',
+                    '2m_apparent_temperature']
+
+difference_keys = ['2m_dew_point_depression']
+
+def convert_temperature_fields(ds,
+                               to_units='fahrenheit',
+                               from_units='kelvin',
+                               temperature_keys=temperature_keys,
+                               difference_keys=difference_keys):
+    
+    """
+    Converts every temperature and temperature difference of an RTMA dataset once.
+    
+    This is used before one dataset is handed to many plotting functions: the temperature products convert the
+    variable they plot themselves while the products that combine a temperature with the wind plot the dataset as it is.
+    The units are recorded (see convert_units()) so the temperature products do not convert the variables again.
     
-    
\ No newline at end of file
+    Required Arguments:
+    
+    1) ds (xarray.array) - The RTMA dataset.
+    
+    Optional Arguments:
+    
+    1) to_units (String) - Default='fahrenheit'. The units to convert to.
+    
+    2) from_units (String) - Default='kelvin'. The units of variables that were never converted by convert_units().
+    
+    3) temperature_keys (List) - Default=['2m_temperature', '2m_dew_point', '2m_apparent_temperature']. The temperatures.
+    
+    4) difference_keys (List) - Default=['2m_dew_point_depression']. The temperature differences (only scaled).
+    
+    Returns
+    -------
+    
+    A shallow copy of the dataset with the converted variables. Variables that are not in the dataset are skipped.    
+    """
+    
+    ds = convert_units(ds, [k for k in temperature_keys if k in ds.variables], to_units, from_units=from_units)
+    ds = convert_units(ds, [k for k in difference_keys if k in ds.variables], to_units, from_units=from_units, difference=True)
+    
+    return ds
@@ -0,0 +1,9 @@
+from firewxpy._lazy import lazy_modules as _lazy_modules
+
+_modules = {
+    'upper_air':'firewxpy.observations.upper_air'
+}
+
+__all__ = list(_modules)
+
+__getattr__, __dir__ = _lazy_modules(globals(), _modules)
@@ -1,2 +1,12 @@
-import firewxpy.observations.upper_air.soundings as observed_soundings
-import firewxpy.observations.upper_air.profiles as observed_vertical_profiles
\ No newline at end of file
+from firewxpy._lazy import lazy_modules as _lazy_modules
+
+_modules = {
+    'soundings':'firewxpy.observations.upper_air.soundings',
+    'profiles':'firewxpy.observations.upper_air.profiles',
+    'observed_soundings':'firewxpy.observations.upper_air.soundings',
+    'observed_vertical_profiles':'firewxpy.observations.upper_air.profiles'
+}
+
+__all__ = list(_modules)
+
+__getattr__, __dir__ = _lazy_modules(globals(), _modules)
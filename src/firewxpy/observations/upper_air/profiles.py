@@ -28,8 +28,6 @@ from firewxpy.utils.directory import build_directory_branch as _build_directory_
 _plt.rcParams["axes.labelweight"] = "bold"
 _mpl.rcParams['font.weight'] = 'bold'
 _pd.options.mode.copy_on_write = True
-_local, _utc = _plot_creation_time()
-_timezone = _get_timezone_abbreviation()
     
 def plot_temperature_relative_humidity_wind_profile(station_id,
                                                     current=True,
@@ -290,6 +288,8 @@ def plot_temperature_relative_humidity_wind_profile(station_id,
     
     A figure of the vertical profiles saved to {path}
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(path)
 
@@ -457,9 +457,9 @@ def plot_temperature_relative_humidity_wind_profile(station_id,
     
     ax1.text(signature_box_x, 
              signature_box_y, 
-             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{_utc.strftime('%Y')} "
+             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{utc.strftime('%Y')} "
              f"| Data Source: weather.uwyo.edu\n"
-             f"                      Image Created: {_local.strftime(f'%m/%d/%Y %H:00 {_timezone}')} - {_utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
+             f"                      Image Created: {local.strftime(f'%m/%d/%Y %H:00 {timezone}')} - {utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
              fontsize=signature_fontsize, 
              bbox=props, 
              fontweight='bold', 
@@ -806,6 +806,8 @@ def plot_temperature_wind_profile(station_id,
     
     A figure of the vertical profiles saved to {path}
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(path)
 
@@ -968,9 +970,9 @@ def plot_temperature_wind_profile(station_id,
     
     ax.text(signature_box_x, 
              signature_box_y, 
-             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{_utc.strftime('%Y')} "
+             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{utc.strftime('%Y')} "
              f"| Data Source: weather.uwyo.edu\n"
-             f"                      Image Created: {_local.strftime(f'%m/%d/%Y %H:00 {_timezone}')} - {_utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
+             f"                      Image Created: {local.strftime(f'%m/%d/%Y %H:00 {timezone}')} - {utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
              fontsize=signature_fontsize, 
              bbox=props, 
              fontweight='bold', 
@@ -1280,6 +1282,8 @@ def plot_relative_humidity_wind_profile(station_id,
     
     A figure of the vertical profiles saved to {path}
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(path)
 
@@ -1412,9 +1416,9 @@ def plot_relative_humidity_wind_profile(station_id,
     
     ax.text(signature_box_x, 
              signature_box_y, 
-             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{_utc.strftime('%Y')} "
+             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{utc.strftime('%Y')} "
              f"| Data Source: weather.uwyo.edu\n"
-             f"                      Image Created: {_local.strftime(f'%m/%d/%Y %H:00 {_timezone}')} - {_utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
+             f"                      Image Created: {local.strftime(f'%m/%d/%Y %H:00 {timezone}')} - {utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
              fontsize=signature_fontsize, 
              bbox=props, 
              fontweight='bold', 
@@ -1799,6 +1803,8 @@ def plot_temperature_relative_humidity_wind_profile_comparison(station_id,
     
     A figure of the vertical profiles comparison saved to {path}
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(path)
 
@@ -2037,9 +2043,9 @@ def plot_temperature_relative_humidity_wind_profile_comparison(station_id,
     
     ax1.text(signature_box_x, 
              signature_box_y, 
-             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{_utc.strftime('%Y')} "
+             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{utc.strftime('%Y')} "
              f"| Data Source: weather.uwyo.edu\n"
-             f"                      Image Created: {_local.strftime(f'%m/%d/%Y %H:00 {_timezone}')} - {_utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
+             f"                      Image Created: {local.strftime(f'%m/%d/%Y %H:00 {timezone}')} - {utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
              fontsize=signature_fontsize, 
              bbox=props, 
              fontweight='bold', 
@@ -2412,6 +2418,8 @@ def plot_temperature_wind_profile_comparison(station_id,
     
     A figure of the vertical profiles comparison saved to {path}
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(path)
 
@@ -2627,9 +2635,9 @@ def plot_temperature_wind_profile_comparison(station_id,
     
     ax.text(signature_box_x, 
              signature_box_y, 
-             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{_utc.strftime('%Y')} "
+             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{utc.strftime('%Y')} "
              f"| Data Source: weather.uwyo.edu\n"
-             f"                      Image Created: {_local.strftime(f'%m/%d/%Y %H:00 {_timezone}')} - {_utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
+             f"                      Image Created: {local.strftime(f'%m/%d/%Y %H:00 {timezone}')} - {utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
              fontsize=signature_fontsize, 
              bbox=props, 
              fontweight='bold', 
@@ -2934,6 +2942,8 @@ def plot_relative_humidity_wind_profile_comparison(station_id,
     
     A figure of the vertical profiles comparison saved to {path}
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(path)
 
@@ -3126,9 +3136,9 @@ def plot_relative_humidity_wind_profile_comparison(station_id,
     
     ax.text(signature_box_x, 
              signature_box_y, 
-             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{_utc.strftime('%Y')} "
+             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{utc.strftime('%Y')} "
              f"| Data Source: weather.uwyo.edu\n"
-             f"                      Image Created: {_local.strftime(f'%m/%d/%Y %H:00 {_timezone}')} - {_utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
+             f"                      Image Created: {local.strftime(f'%m/%d/%Y %H:00 {timezone}')} - {utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
              fontsize=signature_fontsize, 
              bbox=props, 
              fontweight='bold', 
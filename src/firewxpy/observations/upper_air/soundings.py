@@ -23,8 +23,6 @@ from firewxpy.utils.directory import build_directory_branch as _build_directory_
 
 _mpl.rcParams['font.weight'] = 'bold'
 _pd.options.mode.copy_on_write = True
-_local, _utc = _plot_creation_time()
-_timezone = _get_timezone_abbreviation()
 
 def plot_observed_sounding(station_id,
                            current=True,
@@ -321,6 +319,8 @@ def plot_observed_sounding(station_id,
     
     A observed sounding graphic for the user-specified time and preferences saved to {path}
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
 
     _build_directory_branch(path)
 
@@ -540,9 +540,9 @@ def plot_observed_sounding(station_id,
         
     skew.ax.text(signature_box_x, 
              signature_box_y, 
-             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{_utc.strftime('%Y')} "
+             f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024-{utc.strftime('%Y')} "
              f"| Data Source: weather.uwyo.edu\n"
-             f"                      Image Created: {_local.strftime(f'%m/%d/%Y %H:00 {_timezone}')} - {_utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
+             f"                      Image Created: {local.strftime(f'%m/%d/%Y %H:00 {timezone}')} - {utc.strftime(f'%m/%d/%Y %H:00 UTC')}", 
              fontsize=signature_fontsize, 
              bbox=props, 
              fontweight='bold', 
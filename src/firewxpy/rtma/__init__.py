@@ -1,6 +1,21 @@
-import firewxpy.rtma.conus.rtma as rtma_conus
-import firewxpy.rtma.conus.rtma_comparison as rtma_comparison_conus
-import firewxpy.rtma.alaska.rtma as rtma_alaska
-import firewxpy.rtma.alaska.rtma_comparison as rtma_comparison_alaska
-import firewxpy.rtma.hawaii.rtma as rtma_hawaii
-import firewxpy.rtma.hawaii.rtma_comparison as rtma_comparison_hawaii
+from firewxpy._lazy import lazy_modules as _lazy_modules
+
+_modules = {
+    'conus':'firewxpy.rtma.conus',
+    'alaska':'firewxpy.rtma.alaska',
+    'hawaii':'firewxpy.rtma.hawaii',
+    'suite':'firewxpy.rtma.suite',
+    'daemon':'firewxpy.rtma.daemon',
+    'watcher':'firewxpy.rtma.watcher',
+    'fetch':'firewxpy.rtma.fetch',
+    'rtma_conus':'firewxpy.rtma.conus.rtma',
+    'rtma_comparison_conus':'firewxpy.rtma.conus.rtma_comparison',
+    'rtma_alaska':'firewxpy.rtma.alaska.rtma',
+    'rtma_comparison_alaska':'firewxpy.rtma.alaska.rtma_comparison',
+    'rtma_hawaii':'firewxpy.rtma.hawaii.rtma',
+    'rtma_comparison_hawaii':'firewxpy.rtma.hawaii.rtma_comparison'
+}
+
+__all__ = list(_modules)
+
+__getattr__, __dir__ = _lazy_modules(globals(), _modules)
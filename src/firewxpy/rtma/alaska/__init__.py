@@ -1,2 +1,12 @@
-import firewxpy.rtma.alaska.rtma as rtma_alaska
-import firewxpy.rtma.alaska.rtma_comparison as rtma_comparison_alaska
\ No newline at end of file
+from firewxpy._lazy import lazy_modules as _lazy_modules
+
+_modules = {
+    'rtma':'firewxpy.rtma.alaska.rtma',
+    'rtma_comparison':'firewxpy.rtma.alaska.rtma_comparison',
+    'rtma_alaska':'firewxpy.rtma.alaska.rtma',
+    'rtma_comparison_alaska':'firewxpy.rtma.alaska.rtma_comparison'
+}
+
+__all__ = list(_modules)
+
+__getattr__, __dir__ = _lazy_modules(globals(), _modules)
@@ -173,8 +173,9 @@ Arguments and Settings
         of the geometries in the custom geojson.
         
 - refresh_cartographic_files (Boolean) - Default=True. Users that have automated pipelines set up for shapefiles. Having this set to
-        True allows the client to delete and re-download the shapefiles with each run of the script. This is useful for shapefiles
-        that have frequent geometry updates.
+        True re-validates the shapefiles with the server (ETag/Last-Modified) once the freshness window expires and only deletes and 
+        re-downloads the shapefiles when they changed on the server. The freshness window (default 24 hours) is shared across all calls 
+        and processes and is set with firewxpy.utils.set_refresh_policy(ttl=seconds). When set to False, the shapefiles are only downloaded once.
         
 - reference_system (String) - Default='States & Counties'. The name of the borders overlaid onto the map.
     
@@ -455,47 +456,108 @@ Arguments and Settings
 
 - dwpt_value_loc (String) - Default='NW'. The location of dew point on the station plot in the form of compass directions.
 
+- crop_to_region (Boolean) - Default=True. When set to True, the data is cropped to the region plus a small halo before it is contoured
+        and before the pixel query values are built. This significantly speeds up plots of smaller regions (i.e. States or GACCs).
+        Set to False to contour the full grid.
+
+- pixel_query_spacing (Integer, Float or None) - Default=None. When set to a number of pixels, the pixel queries are thinned on the screen
+        so the values/barbs keep this minimum spacing regardless of the map projection and region. This keeps the number of 
+        station plot values predictable and speeds up drawing. decimate then only selects the candidate grid points 
+        (i.e. decimate=1 makes every grid point a candidate). The selected points are cached for each grid, region and figure size.
+        When None, the pixel queries are only thinned by decimate.
+
+- reuse_base_map (Boolean) - Default=True. When set to True, the scaffold of the map (the figure, the extent, the coastlines/land/ocean/lakes
+        and the reference layers) is built once for each region, projection, figure size and reference layer style and is reused by every later
+        plot with the same settings. Only the contours, colorbar, titles and station plot are drawn for each product.
+        The templates are not pyplot figures, so they are never shown (i.e. in a notebook) or left open in pyplot.
+        Set to False to build a new figure for every plot.
+
+- rasterize_base_map (Boolean) - Default=False. When set to True (with reuse_base_map=True), the land/ocean/lakes fills and the reference
+        layers are rendered once to a raster for each region, projection, figure size, dpi and style and drawn as images in
+        the layering of the vector map (i.e. the fills below the weather field and the borders above it). Only the weather field and the annotations stay vector,
+        which greatly reduces the time to save graphics with dense borders (i.e. counties or zones).
+
+- render_mode (String) - Default='contourf'. How the weather field is drawn.
+    
+        Render modes
+        ------------
+        
+        1) 'contourf' - Filled contours.
+        
+        2) 'pcolormesh' - Each grid cell is colored with the discrete colors of the contour levels (BoundaryNorm).
+            Much faster than contourf on the full resolution grid.
+        
+        3) 'imshow' - The grid is resampled onto the pixels of the map and drawn as one image with the discrete colors of the
+            contour levels (BoundaryNorm). The fastest mode. The pixel lookup is cached for each grid, region and figure size.
+
+- coarsen_quality (Integer, Float or None) - Default=None. When set, the weather field is coarsened to the resolution the figure
+        is able to display before it is drawn. The number of grid cells per pixel is computed from the extent, the figure size and the dpi and
+        the field is reduced so about coarsen_quality grid cells remain per pixel (i.e. 1 for one grid cell per pixel, 2 keeps twice the detail).
+        This makes national plots much cheaper with little visible change. The pixel query values are always taken from the full resolution data.
+        When None, the full grid is drawn.
+    
+- coarsen_method (String) - Default='mean'. How the field is coarsened. 'mean' (NaN-aware block averages) or 'stride' (every n-th grid point).
+
+- contour_cache (Boolean) - Default=False. When set to True, the filled contours of the weather field are computed once on the full grid
+        and cached (keyed by the content of the field, the grid and the contour levels). Every later plot of the same field for another
+        region reuses the cached polygons and only draws the ones that overlap its map. This is the fastest way to contour the same field
+        for many regions. The data is not cropped to the region and the field is not coarsened when contour_cache=True.
+
 """
 
+import sys as _sys
 import warnings as _warnings
 _warnings.filterwarnings('ignore')
 import matplotlib as _mpl 
 import firewxpy.calc.calc as _calc
-import matplotlib.pyplot as _plt 
 import matplotlib.colors as _mcolors
 import cartopy.crs as _ccrs 
-import cartopy.feature as _cfeature 
 import metpy.plots as _mpplots
 import numpy as _np
 import pandas as _pd
 
 from dateutil import tz as _tz
 from matplotlib.patheffects import withStroke as _withStroke
-from firewxpy.utils.station_plot_formatting import fix_var_array as _fix_var_array
+from firewxpy.utils.station_plot_formatting import(
+    extract_pixel_queries as _extract_pixel_queries,
+    thin_pixel_queries as _thin_pixel_queries
+)
 from firewxpy.utils.directory import build_directory_branch as _build_directory_branch
 from firewxpy.utils.plot_coords import bounding_box as _bounding_box
+from firewxpy.rtma.suite import render_suite as _render_suite
+from firewxpy.utils.grid_subset import subset_to_region as _subset_to_region
+from firewxpy.utils.field_rendering import render_field as _render_field
+from firewxpy.utils.grid_normalization import(
+    normalized_grid as _normalized_grid,
+    apply_grid_mask as _apply_grid_mask
+)
+from firewxpy.utils.base_map import(
+    open_base_map as _open_base_map,
+    build_base_map as _build_base_map,
+    store_base_map as _store_base_map,
+    close_base_map as _close_base_map,
+    rasterize_base_map as _rasterize_base_map
+)
 from firewxpy.calc.calc import(
-    kelvin_to_fahrenheit as _kelvin_to_fahrenheit, 
-    celsius_to_fahrenheit as _celsius_to_fahrenheit,
-    kelvin_to_celsius as _kelvin_to_celsius
+    convert_units as _convert_units,
+    convert_temperature_fields as _convert_temperature_fields
 )
 from firewxpy.utils.standard import(
     get_timezone_abbreviation as _get_timezone_abbreviation,
     plot_creation_time as _plot_creation_time
 )
-from firewxpy.utils.geometry import(
-    import_shapefile_from_web as _import_shapefile_from_web,
-    import_shapefile_local as _import_shapefile_local,
-    import_geojson_from_web as _import_geojson_from_web,
-    import_geojson_local as _import_geojson_local,
-    get_filename_from_url as _get_filename_from_url
-)
-from wxdata import rtma as _rtma
+from firewxpy.utils.dataset_cache import cached_dataset as _cached_dataset
+from wxdata import rtma as _wxdata_rtma
+
+_rtma = _cached_dataset(_wxdata_rtma)
 
-_local, _utc = _plot_creation_time()
-_timezone = _get_timezone_abbreviation()
 _from_zone = _tz.tzutc()
 _to_zone = _tz.tzlocal()
+
+# The temperature units of a dataset that is shared by every graphic of a suite (see render_suite() and the RTMA watcher).
+# The products that combine a temperature with the wind plot the dataset as it is, so it is converted once before it is shared.
+dataset_units = 'fahrenheit'
+
 _mpl.rcParams['font.weight'] = 'bold'
 
 def _fix_grib_data(ds,
@@ -524,19 +586,14 @@ def _fix_grib_data(ds,
     Fixed lat/lon and var data.     
     """
     
-    lon2d = ds[longitude_key].values
-    lat2d = ds[latitude_key].values
-    vals2d = ds[variable].values  # or your variable
-
-    # If longitudes are 0–360, convert:
-    lon2d = _np.where(lon2d > 180, lon2d - 360, lon2d)
-
-    # Keep only a sane Alaska window
-    mask = (lon2d >= -180) & (lon2d <= -120)
-
-    lon_masked  = _np.where(mask, lon2d,  _np.nan)
-    lat_masked  = _np.where(mask, lat2d,  _np.nan)
-    vals_masked = _np.where(mask, vals2d, _np.nan)
+    # The 0–360 longitudes are converted and a sane Alaska window is kept.
+    # Both only depend on the grid so they are cached for each grid definition.
+    lon_masked, lat_masked, mask = _normalized_grid(ds[longitude_key].values,
+                                                    ds[latitude_key].values,
+                                                    western_limit=-180,
+                                                    eastern_limit=-120)
+    
+    vals_masked = _apply_grid_mask(ds[variable].values, mask)
     
     return lon_masked, lat_masked, vals_masked
 
@@ -692,7 +749,15 @@ def plot_temperature(region='ak',
                      var_key='2m_temperature',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature.
@@ -719,6 +784,8 @@ def plot_temperature(region='ak',
     
     An image of the RTMA Temperature Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -763,15 +830,15 @@ def plot_temperature(region='ak',
     else:
         ds = ds
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds[var_key] = _kelvin_to_fahrenheit(ds[var_key])
-                else:
-                    ds[var_key] = _kelvin_to_celsius(ds[var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds[var_key] = _celsius_to_fahrenheit(ds[var_key])
+            ds = _convert_units(ds, [var_key], convert_to, from_units=convert_from)
+        
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
         
     lon_masked, lat_masked, vals_masked = _fix_grib_data(ds,
                                                          var_key,
@@ -787,233 +854,13 @@ def plot_temperature(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -1021,7 +868,11 @@ def plot_temperature(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -1030,20 +881,20 @@ def plot_temperature(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -1052,7 +903,7 @@ def plot_temperature(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1061,7 +912,7 @@ def plot_temperature(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1078,11 +929,15 @@ def plot_temperature(region='ak',
             zorder=reference_system_textbox_zorder)
         
     
-    vals = _fix_var_array(ds,
-                    var_key,
-                    0,
-                    decimate)
-
+    vals = _extract_pixel_queries(ds,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
     stn = _mpplots.StationPlot(ax, vals[longitude_key], vals[latitude_key],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -1098,8 +953,11 @@ def plot_temperature(region='ak',
                        zorder=pixel_query_value_zorder)
 
   
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1250,7 +1108,15 @@ def plot_dew_point(region='ak',
                      var_key='2m_dew_point',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point.
@@ -1277,6 +1143,8 @@ def plot_dew_point(region='ak',
     
     An image of the RTMA Dew Point Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1321,15 +1189,15 @@ def plot_dew_point(region='ak',
     else:
         ds = ds
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds[var_key] = _kelvin_to_fahrenheit(ds[var_key])
-                else:
-                    ds[var_key] = _kelvin_to_celsius(ds[var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds[var_key] = _celsius_to_fahrenheit(ds[var_key])
+            ds = _convert_units(ds, [var_key], convert_to, from_units=convert_from)
                     
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     lon_masked, lat_masked, vals_masked = _fix_grib_data(ds,
                                                          var_key,
                                                          longitude_key,
@@ -1345,233 +1213,13 @@ def plot_dew_point(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -1579,7 +1227,11 @@ def plot_dew_point(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -1588,20 +1240,20 @@ def plot_dew_point(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -1610,7 +1262,7 @@ def plot_dew_point(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1619,7 +1271,7 @@ def plot_dew_point(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1635,11 +1287,15 @@ def plot_dew_point(region='ak',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    vals = _fix_var_array(ds,
-                    var_key,
-                    0,
-                    decimate)
-
+    vals = _extract_pixel_queries(ds,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
     stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -1654,8 +1310,11 @@ def plot_dew_point(region='ak',
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1805,7 +1464,15 @@ def plot_dew_point_depression(region='ak',
                      var_key='2m_dew_point_depression',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression.
@@ -1832,6 +1499,8 @@ def plot_dew_point_depression(region='ak',
     
     An image of the RTMA Dew Point Depression Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1876,15 +1545,15 @@ def plot_dew_point_depression(region='ak',
     else:
         ds = ds
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds[var_key] = _kelvin_to_fahrenheit(ds[var_key])
-                else:
-                    ds[var_key] = _kelvin_to_celsius(ds[var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds[var_key] = _celsius_to_fahrenheit(ds[var_key])
+            ds = _convert_units(ds, [var_key], convert_to, from_units=convert_from, difference=True)
                     
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     lon_masked, lat_masked, vals_masked = _fix_grib_data(ds,
                                                          var_key,
                                                          longitude_key,
@@ -1900,233 +1569,13 @@ def plot_dew_point_depression(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -2134,7 +1583,11 @@ def plot_dew_point_depression(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2143,20 +1596,20 @@ def plot_dew_point_depression(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2165,7 +1618,7 @@ def plot_dew_point_depression(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2174,7 +1627,7 @@ def plot_dew_point_depression(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2190,11 +1643,15 @@ def plot_dew_point_depression(region='ak',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    vals = _fix_var_array(ds,
-                    var_key,
-                    0,
-                    decimate)
-
+    vals = _extract_pixel_queries(ds,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
     stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -2209,8 +1666,11 @@ def plot_dew_point_depression(region='ak',
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2359,7 +1819,15 @@ def plot_relative_humidity(region='ak',
                      var_key='2m_relative_humidity',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative humidity.
@@ -2386,6 +1854,8 @@ def plot_relative_humidity(region='ak',
     
     An image of the RTMA Relative Humidity Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -2430,6 +1900,13 @@ def plot_relative_humidity(region='ak',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     lon_masked, lat_masked, vals_masked = _fix_grib_data(ds,
                                                          var_key,
                                                          longitude_key,
@@ -2445,233 +1922,13 @@ def plot_relative_humidity(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -2679,7 +1936,11 @@ def plot_relative_humidity(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2688,20 +1949,20 @@ def plot_relative_humidity(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2710,7 +1971,7 @@ def plot_relative_humidity(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2719,7 +1980,7 @@ def plot_relative_humidity(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2736,11 +1997,15 @@ def plot_relative_humidity(region='ak',
             zorder=reference_system_textbox_zorder)
         
         
-    vals = _fix_var_array(ds,
-                    var_key,
-                    0,
-                    decimate)
-
+    vals = _extract_pixel_queries(ds,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
     stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -2756,8 +2021,11 @@ def plot_relative_humidity(region='ak',
                        zorder=pixel_query_value_zorder)
 
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2909,7 +2177,15 @@ def plot_wind_speed(region='ak',
                      barb_length=4.5,
                      barb_width=0.5,
                      barb_color='black',
-                     barb_zorder=7):
+                     barb_zorder=7,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for sustained wind speed.
@@ -2936,6 +2212,8 @@ def plot_wind_speed(region='ak',
     
     An image of the RTMA Wind Speed Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -2980,16 +2258,15 @@ def plot_wind_speed(region='ak',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[var_key] = _calc.mps_to_mph(ds[var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[var_key] = _calc.mph_to_kts(ds[var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
     
@@ -3008,233 +2285,13 @@ def plot_wind_speed(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -3242,7 +2299,11 @@ def plot_wind_speed(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -3251,20 +2312,20 @@ def plot_wind_speed(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3273,7 +2334,7 @@ def plot_wind_speed(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3282,7 +2343,7 @@ def plot_wind_speed(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3300,21 +2361,15 @@ def plot_wind_speed(region='ak',
         
     
         
-    vals = _fix_var_array(ds,
-                    var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [var_key, u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
-
     stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -3330,15 +2385,18 @@ def plot_wind_speed(region='ak',
                             zorder=pixel_query_value_zorder)
 
     else:
-        stn.plot_barb(u_vals[u_var_key], 
-                        v_vals[v_var_key],
+        stn.plot_barb(vals[u_var_key], 
+                        vals[v_var_key],
                         color=barb_color, 
                         length=barb_length, 
                         linewidth=barb_width,
                         zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -3491,7 +2549,15 @@ def plot_wind_gust(region='ak',
                      barb_length=4.5,
                      barb_width=0.5,
                      barb_color='black',
-                     barb_zorder=7):
+                     barb_zorder=7,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for wind gust.
@@ -3518,6 +2584,8 @@ def plot_wind_gust(region='ak',
     
     An image of the RTMA Wind Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -3562,16 +2630,15 @@ def plot_wind_gust(region='ak',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[var_key] = _calc.mps_to_mph(ds[var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[var_key] = _calc.mph_to_kts(ds[var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [var_key], convert_to, from_units='mps')
     else:
         pass
     
@@ -3580,11 +2647,7 @@ def plot_wind_gust(region='ak',
                                                          longitude_key,
                                                          latitude_key)
     
-    ds = _calc.u_v_components(ds,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("wind gust", colors)
@@ -3596,233 +2659,13 @@ def plot_wind_gust(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -3830,7 +2673,11 @@ def plot_wind_gust(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -3839,20 +2686,20 @@ def plot_wind_gust(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3861,7 +2708,7 @@ def plot_wind_gust(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3870,7 +2717,7 @@ def plot_wind_gust(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3888,21 +2735,16 @@ def plot_wind_gust(region='ak',
         
     
         
-    vals = _fix_var_array(ds,
-                    var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [var_key, u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
-
     stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -3918,15 +2760,18 @@ def plot_wind_gust(region='ak',
                             zorder=pixel_query_value_zorder)
 
     else:
-        stn.plot_barb(u_vals[u_var_key], 
-                        v_vals[v_var_key],
+        stn.plot_barb(vals[u_var_key], 
+                        vals[v_var_key],
                         color=barb_color, 
                         length=barb_length, 
                         linewidth=barb_width,
                         zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4092,7 +2937,15 @@ def plot_temperature_and_wind(region='ak',
                      barb_color='black',
                      barb_zorder=7,
                      temp_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature + wind.
@@ -4119,6 +2972,8 @@ def plot_temperature_and_wind(region='ak',
     
     An image of the RTMA Temperature + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -4163,16 +3018,15 @@ def plot_temperature_and_wind(region='ak',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_speed_var_key] = _calc.mps_to_mph(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_speed_var_key] = _calc.mph_to_kts(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
     
@@ -4191,233 +3045,13 @@ def plot_temperature_and_wind(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -4425,7 +3059,11 @@ def plot_temperature_and_wind(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -4434,20 +3072,20 @@ def plot_temperature_and_wind(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4456,7 +3094,7 @@ def plot_temperature_and_wind(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4465,7 +3103,7 @@ def plot_temperature_and_wind(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4483,27 +3121,16 @@ def plot_temperature_and_wind(region='ak',
         
     
         
-    temp_vals = _fix_var_array(ds,
-                    temperature_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [temperature_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    ws_vals = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, temp_vals['longitude'], temp_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -4511,28 +3138,31 @@ def plot_temperature_and_wind(region='ak',
 
 
     stn.plot_parameter(temp_value_loc.upper(), 
-                       temp_vals[temperature_var_key], 
+                       vals[temperature_var_key], 
                        color=temperature_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(speed_value_loc.upper(), 
-                       ws_vals[wind_speed_var_key], 
+                       vals[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4699,7 +3329,15 @@ def plot_temperature_and_gust(region='ak',
                      barb_color='black',
                      barb_zorder=7,
                      temp_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature + gust.
@@ -4726,6 +3364,8 @@ def plot_temperature_and_gust(region='ak',
     
     An image of the RTMA Temperature + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -4770,16 +3410,15 @@ def plot_temperature_and_gust(region='ak',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_gust_var_key] = _calc.mps_to_mph(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_gust_var_key] = _calc.mph_to_kts(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
@@ -4788,11 +3427,7 @@ def plot_temperature_and_gust(region='ak',
                                                          longitude_key,
                                                          latitude_key)
     
-    ds = _calc.u_v_components(ds,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
@@ -4804,233 +3439,13 @@ def plot_temperature_and_gust(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[temperature_var_key],
                 cmap=cmap,
@@ -5038,7 +3453,11 @@ def plot_temperature_and_gust(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -5047,20 +3466,20 @@ def plot_temperature_and_gust(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5069,7 +3488,7 @@ def plot_temperature_and_gust(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5078,7 +3497,7 @@ def plot_temperature_and_gust(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5096,27 +3515,17 @@ def plot_temperature_and_gust(region='ak',
         
     
         
-    temp_vals = _fix_var_array(ds,
-                    temperature_var_key,
-                    0,
-                    decimate)
-    
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [temperature_var_key, u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    wg_vals = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, temp_vals['longitude'], temp_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -5124,28 +3533,31 @@ def plot_temperature_and_gust(region='ak',
 
 
     stn.plot_parameter(temp_value_loc.upper(), 
-                       temp_vals[temperature_var_key], 
+                       vals[temperature_var_key], 
                        color=temperature_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(gust_value_loc.upper(), 
-                       wg_vals[wind_gust_var_key], 
+                       vals[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -5304,7 +3716,15 @@ def plot_relative_humidity_and_wind(region='ak',
                      barb_color='black',
                      barb_zorder=7,
                      rh_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative humidity + wind.
@@ -5331,6 +3751,8 @@ def plot_relative_humidity_and_wind(region='ak',
     
     An image of the RTMA Relative Humidity + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -5375,16 +3797,15 @@ def plot_relative_humidity_and_wind(region='ak',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_speed_var_key] = _calc.mps_to_mph(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_speed_var_key] = _calc.mph_to_kts(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
     
@@ -5403,233 +3824,13 @@ def plot_relative_humidity_and_wind(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -5637,7 +3838,11 @@ def plot_relative_humidity_and_wind(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -5646,20 +3851,20 @@ def plot_relative_humidity_and_wind(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5668,7 +3873,7 @@ def plot_relative_humidity_and_wind(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5677,7 +3882,7 @@ def plot_relative_humidity_and_wind(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5695,27 +3900,16 @@ def plot_relative_humidity_and_wind(region='ak',
         
     
         
-    rh_vals = _fix_var_array(ds,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
-    
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [relative_humidity_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    ws_vals = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, rh_vals['longitude'], rh_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -5723,28 +3917,31 @@ def plot_relative_humidity_and_wind(region='ak',
 
 
     stn.plot_parameter(rh_value_loc.upper(), 
-                       rh_vals[relative_humidity_var_key], 
+                       vals[relative_humidity_var_key], 
                        color=relative_humidity_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(speed_value_loc.upper(), 
-                       ws_vals[wind_speed_var_key], 
+                       vals[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -5905,7 +4102,15 @@ def plot_relative_humidity_and_gust(region='ak',
                      barb_color='black',
                      barb_zorder=7,
                      rh_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative_humidity + gust.
@@ -5932,6 +4137,8 @@ def plot_relative_humidity_and_gust(region='ak',
     
     An image of the RTMA Relative Humidity + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -5976,16 +4183,15 @@ def plot_relative_humidity_and_gust(region='ak',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_gust_var_key] = _calc.mps_to_mph(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_gust_var_key] = _calc.mph_to_kts(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
@@ -5994,11 +4200,7 @@ def plot_relative_humidity_and_gust(region='ak',
                                                          longitude_key,
                                                          latitude_key)
     
-    ds = _calc.u_v_components(ds,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
@@ -6010,233 +4212,13 @@ def plot_relative_humidity_and_gust(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -6244,7 +4226,11 @@ def plot_relative_humidity_and_gust(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -6253,20 +4239,20 @@ def plot_relative_humidity_and_gust(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6275,7 +4261,7 @@ def plot_relative_humidity_and_gust(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6284,7 +4270,7 @@ def plot_relative_humidity_and_gust(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6302,27 +4288,17 @@ def plot_relative_humidity_and_gust(region='ak',
         
     
         
-    rh_vals = _fix_var_array(ds,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
-    
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [relative_humidity_var_key, u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    wg_vals = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, rh_vals['longitude'], rh_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -6330,28 +4306,31 @@ def plot_relative_humidity_and_gust(region='ak',
 
 
     stn.plot_parameter(rh_value_loc.upper(), 
-                       rh_vals[relative_humidity_var_key], 
+                       vals[relative_humidity_var_key], 
                        color=relative_humidity_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(gust_value_loc.upper(), 
-                       wg_vals[wind_gust_var_key], 
+                       vals[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -6510,7 +4489,15 @@ def plot_dew_point_depression_and_wind(region='ak',
                      barb_color='black',
                      barb_zorder=7,
                      dd_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + wind.
@@ -6537,6 +4524,8 @@ def plot_dew_point_depression_and_wind(region='ak',
     
     An image of the RTMA Dew Point Depression + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -6581,16 +4570,15 @@ def plot_dew_point_depression_and_wind(region='ak',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_speed_var_key] = _calc.mps_to_mph(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_speed_var_key] = _calc.mph_to_kts(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
     
@@ -6609,233 +4597,13 @@ def plot_dew_point_depression_and_wind(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -6843,7 +4611,11 @@ def plot_dew_point_depression_and_wind(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -6852,20 +4624,20 @@ def plot_dew_point_depression_and_wind(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6874,7 +4646,7 @@ def plot_dew_point_depression_and_wind(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6883,7 +4655,7 @@ def plot_dew_point_depression_and_wind(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6901,27 +4673,16 @@ def plot_dew_point_depression_and_wind(region='ak',
         
     
         
-    dd_vals = _fix_var_array(ds,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
-    
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [dew_point_depression_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    ws_vals = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, dd_vals['longitude'], dd_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -6929,28 +4690,31 @@ def plot_dew_point_depression_and_wind(region='ak',
 
 
     stn.plot_parameter(dd_value_loc.upper(), 
-                       dd_vals[dew_point_depression_var_key], 
+                       vals[dew_point_depression_var_key], 
                        color=dew_point_depression_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(speed_value_loc.upper(), 
-                       ws_vals[wind_speed_var_key], 
+                       vals[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -7111,7 +4875,15 @@ def plot_dew_point_depression_and_gust(region='ak',
                      barb_color='black',
                      barb_zorder=7,
                      dd_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + gust.
@@ -7138,6 +4910,8 @@ def plot_dew_point_depression_and_gust(region='ak',
     
     An image of the RTMA Dew Point Depression + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -7182,16 +4956,15 @@ def plot_dew_point_depression_and_gust(region='ak',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_gust_var_key] = _calc.mps_to_mph(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_gust_var_key] = _calc.mph_to_kts(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
@@ -7200,11 +4973,7 @@ def plot_dew_point_depression_and_gust(region='ak',
                                                          longitude_key,
                                                          latitude_key)
     
-    ds = _calc.u_v_components(ds,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -7216,233 +4985,13 @@ def plot_dew_point_depression_and_gust(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -7450,7 +4999,11 @@ def plot_dew_point_depression_and_gust(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -7459,20 +5012,20 @@ def plot_dew_point_depression_and_gust(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7481,7 +5034,7 @@ def plot_dew_point_depression_and_gust(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7490,7 +5043,7 @@ def plot_dew_point_depression_and_gust(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7508,27 +5061,17 @@ def plot_dew_point_depression_and_gust(region='ak',
         
     
         
-    dd_vals = _fix_var_array(ds,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
-    
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [dew_point_depression_var_key, u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    wg_vals = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, dd_vals['longitude'], dd_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -7536,28 +5079,31 @@ def plot_dew_point_depression_and_gust(region='ak',
 
 
     stn.plot_parameter(dd_value_loc.upper(), 
-                       dd_vals[dew_point_depression_var_key], 
+                       vals[dew_point_depression_var_key], 
                        color=dew_point_depression_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(gust_value_loc.upper(), 
-                       wg_vals[wind_gust_var_key], 
+                       vals[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -7716,7 +5262,15 @@ def plot_dew_point_and_wind(region='ak',
                      barb_color='black',
                      barb_zorder=7,
                      dwpt_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + wind.
@@ -7743,6 +5297,8 @@ def plot_dew_point_and_wind(region='ak',
     
     An image of the RTMA Dew Point + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -7787,16 +5343,15 @@ def plot_dew_point_and_wind(region='ak',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_speed_var_key] = _calc.mps_to_mph(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_speed_var_key] = _calc.mph_to_kts(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
     
@@ -7815,233 +5370,13 @@ def plot_dew_point_and_wind(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -8049,7 +5384,11 @@ def plot_dew_point_and_wind(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -8058,20 +5397,20 @@ def plot_dew_point_and_wind(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8080,7 +5419,7 @@ def plot_dew_point_and_wind(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8089,7 +5428,7 @@ def plot_dew_point_and_wind(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8107,27 +5446,16 @@ def plot_dew_point_and_wind(region='ak',
         
     
         
-    dwpt_vals = _fix_var_array(ds,
-                    dew_point_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [dew_point_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    ws_vals = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, dwpt_vals['longitude'], dwpt_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -8135,28 +5463,31 @@ def plot_dew_point_and_wind(region='ak',
 
 
     stn.plot_parameter(dwpt_value_loc.upper(), 
-                       dwpt_vals[dew_point_var_key], 
+                       vals[dew_point_var_key], 
                        color=dew_point_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(speed_value_loc.upper(), 
-                       ws_vals[wind_speed_var_key], 
+                       vals[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -8317,7 +5648,15 @@ def plot_dew_point_and_gust(region='ak',
                      barb_color='black',
                      barb_zorder=7,
                      dwpt_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + gust.
@@ -8344,6 +5683,8 @@ def plot_dew_point_and_gust(region='ak',
     
     An image of the RTMA Dew Point + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -8388,16 +5729,15 @@ def plot_dew_point_and_gust(region='ak',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_gust_var_key] = _calc.mps_to_mph(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_gust_var_key] = _calc.mph_to_kts(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
@@ -8406,11 +5746,7 @@ def plot_dew_point_and_gust(region='ak',
                                                          longitude_key,
                                                          latitude_key)
     
-    ds = _calc.u_v_components(ds,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -8422,233 +5758,13 @@ def plot_dew_point_and_gust(region='ak',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -8656,7 +5772,11 @@ def plot_dew_point_and_gust(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -8665,20 +5785,20 @@ def plot_dew_point_and_gust(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8687,7 +5807,7 @@ def plot_dew_point_and_gust(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8696,7 +5816,7 @@ def plot_dew_point_and_gust(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8714,27 +5834,17 @@ def plot_dew_point_and_gust(region='ak',
         
     
         
-    dwpt_vals = _fix_var_array(ds,
-                    dew_point_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [dew_point_var_key, u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    wg_vals = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, dwpt_vals['longitude'], dwpt_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -8742,29 +5852,112 @@ def plot_dew_point_and_gust(region='ak',
 
 
     stn.plot_parameter(dwpt_value_loc.upper(), 
-                       dwpt_vals[dew_point_var_key], 
+                       vals[dew_point_var_key], 
                        color=dew_point_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(gust_value_loc.upper(), 
-                       wg_vals[wind_gust_var_key], 
+                       vals[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
-        
\ No newline at end of file
+
+def render_suite(products=None,
+                 regions=None,
+                 reference_systems=['States & Counties'],
+                 ds=None,
+                 product_kwargs=None,
+                 notifications='off',
+                 workers=1,
+                 **kwargs):
+    
+    """
+    This function renders a suite of RTMA Alaska graphics (products x regions x reference systems) in one call.
+    
+    The data is downloaded and decoded once and the cartographic reference layers are loaded once for the whole suite.
+    
+    Required Arguments: None
+    
+    Optional Arguments:
+    
+    1) products (List or None) - Default=None. The products to render. The product names are the plot function names 
+        without 'plot_' (i.e. ['temperature', 'relative_humidity_and_wind']). When None, all 14 products are rendered.
+        
+    2) regions (List or None) - Default=None. The regions to render (i.e. ['ca', 'oscc', 'nv']). When None, the default region is used.
+    
+    3) reference_systems (List or dict) - Default=['States & Counties']. The reference systems to render.
+        
+        Built-in reference systems
+        --------------------------
+        
+        1) 'States & Counties'
+        2) 'States Only'
+        3) 'GACC Boundaries'
+        4) 'Predictive Services Areas'
+        5) 'NWS CWA'
+        6) 'NWS Public Zones'
+        7) 'NWS Fire Weather Zones'
+        8) 'CalFire Boundaries'
+        
+        Custom reference systems are passed as a dictionary of {name: {'show_states':True, 'show_counties':False, ...}}.
+    
+    4) ds (xarray.array or None) - Default=None. The RTMA dataset passed into every plot function.
+        When None, the data is downloaded and decoded once and shared by every graphic.
+    
+    5) product_kwargs (dict or None) - Default=None. Keyword arguments that only apply to some products
+        (i.e. {'temperature':{'decimate':100}}).
+    
+    6) notifications (String) - Default='off'. When set to 'on', the time of each graphic is printed.
+    
+    7) workers (Integer or None) - Default=1. The number of processes the graphics are spread over. When None, one process per CPU is used.
+        When workers > 1, the data is downloaded and decoded once in this process and shared with the workers through memory-mapped files.
+        On Windows/macOS, call this function under if __name__ == '__main__':.
+    
+    8) **kwargs - Keyword arguments passed into every plot function that accepts them (i.e. figure_x_length, proxies, decimate).
+    
+    Returns
+    -------
+    
+    A list of dictionaries (one per graphic) with the product, region, reference_system, seconds, error and worker keys.
+    The error is None when the graphic was saved.   
+    """
+    
+    if workers != 1 and ds is None:
+        ds = _rtma(model='ak rtma',
+                   proxies=kwargs.get('proxies', None),
+                   clear_recycle_bin=kwargs.get('clear_recycle_bin', False),
+                   clear_data=kwargs.get('clear_data', True),
+                   convert_temperature=False,
+                   chunk_size=kwargs.get('chunk_size', 8192),
+                   notifications=notifications,
+                   custom_directory=kwargs.get('custom_data_directory', None))
+        ds = _convert_temperature_fields(ds, dataset_units)
+        
+    return _render_suite(_sys.modules[__name__],
+                         products=products,
+                         regions=regions,
+                         reference_systems=reference_systems,
+                         datasets={'ds':ds},
+                         product_kwargs=product_kwargs,
+                         notifications=notifications,
+                         workers=workers,
+                         **kwargs)
@@ -29,7 +29,9 @@ Arguments and Settings
         'afg' - NWS Fairbanks
     
 - hours (Integer) - Default=24. The amount of hours between the current and comparison. Defaults to a 24 hour
-        comparison. 
+        comparison. The comparison analysis is read from the local RTMA archive (FireWxPy Cache/RTMA Archive) when it was
+        archived by an earlier run so only the current analysis is downloaded. Otherwise the comparison analysis is downloaded
+        on its own and archived (see firewxpy.utils.set_rtma_archive_policy()).
         
 - show_states (Boolean) - Default=True. When set to True, U.S. state borders are shown. 
     
@@ -176,8 +178,9 @@ Arguments and Settings
         of the geometries in the custom geojson.
         
 - refresh_cartographic_files (Boolean) - Default=True. Users that have automated pipelines set up for shapefiles. Having this set to
-        True allows the client to delete and re-download the shapefiles with each run of the script. This is useful for shapefiles
-        that have frequent geometry updates.
+        True re-validates the shapefiles with the server (ETag/Last-Modified) once the freshness window expires and only deletes and 
+        re-downloads the shapefiles when they changed on the server. The freshness window (default 24 hours) is shared across all calls 
+        and processes and is set with firewxpy.utils.set_refresh_policy(ttl=seconds). When set to False, the shapefiles are only downloaded once.
         
 - reference_system (String) - Default='States & Counties'. The name of the borders overlaid onto the map.
     
@@ -320,7 +323,8 @@ Arguments and Settings
         
 - ds2 (xarray.array or None) - Default=None. If the user is downloading, processing and plotting the data within the function,
         keep this set as None. If the user wishes to create a medley of plots it is recommended to download the data outside of this
-        function and pass in the data by setting ds2=ds2. This is the comparison dataset.  
+        function and pass in the data by setting ds2=ds2. This is the comparison dataset. The differences (ds1 - ds2) are computed
+        once per pair of datasets and variable and reused by every product and region (see firewxpy.utils.comparison_difference()).
             
 - western_bound (Float or Integer) - Default=-125. When region is set to 'custom' the user defines the bounds of the plot in 
         latitude and longitude coordinates.
@@ -452,47 +456,115 @@ Arguments and Settings
 
 - dwpt_value_loc (String) - Default='NW'. The location of dew point on the station plot in the form of compass directions.
 
+- crop_to_region (Boolean) - Default=True. When set to True, the data is cropped to the region plus a small halo before it is contoured
+        and before the pixel query values are built. This significantly speeds up plots of smaller regions (i.e. States or GACCs).
+        Set to False to contour the full grid.
+
+- pixel_query_spacing (Integer, Float or None) - Default=None. When set to a number of pixels, the pixel queries are thinned on the screen
+        so the values/barbs keep this minimum spacing regardless of the map projection and region. This keeps the number of 
+        station plot values predictable and speeds up drawing. decimate then only selects the candidate grid points 
+        (i.e. decimate=1 makes every grid point a candidate). The selected points are cached for each grid, region and figure size.
+        When None, the pixel queries are only thinned by decimate.
+
+- reuse_base_map (Boolean) - Default=True. When set to True, the scaffold of the map (the figure, the extent, the coastlines/land/ocean/lakes
+        and the reference layers) is built once for each region, projection, figure size and reference layer style and is reused by every later
+        plot with the same settings. Only the contours, colorbar, titles and station plot are drawn for each product.
+        The templates are not pyplot figures, so they are never shown (i.e. in a notebook) or left open in pyplot.
+        Set to False to build a new figure for every plot.
+
+- rasterize_base_map (Boolean) - Default=False. When set to True (with reuse_base_map=True), the land/ocean/lakes fills and the reference
+        layers are rendered once to a raster for each region, projection, figure size, dpi and style and drawn as images in
+        the layering of the vector map (i.e. the fills below the weather field and the borders above it). Only the weather field and the annotations stay vector,
+        which greatly reduces the time to save graphics with dense borders (i.e. counties or zones).
+
+- render_mode (String) - Default='contourf'. How the weather field is drawn.
+    
+        Render modes
+        ------------
+        
+        1) 'contourf' - Filled contours.
+        
+        2) 'pcolormesh' - Each grid cell is colored with the discrete colors of the contour levels (BoundaryNorm).
+            Much faster than contourf on the full resolution grid.
+        
+        3) 'imshow' - The grid is resampled onto the pixels of the map and drawn as one image with the discrete colors of the
+            contour levels (BoundaryNorm). The fastest mode. The pixel lookup is cached for each grid, region and figure size.
+
+- coarsen_quality (Integer, Float or None) - Default=None. When set, the weather field is coarsened to the resolution the figure
+        is able to display before it is drawn. The number of grid cells per pixel is computed from the extent, the figure size and the dpi and
+        the field is reduced so about coarsen_quality grid cells remain per pixel (i.e. 1 for one grid cell per pixel, 2 keeps twice the detail).
+        This makes national plots much cheaper with little visible change. The pixel query values are always taken from the full resolution data.
+        When None, the full grid is drawn.
+    
+- coarsen_method (String) - Default='mean'. How the field is coarsened. 'mean' (NaN-aware block averages) or 'stride' (every n-th grid point).
+
+- contour_cache (Boolean) - Default=False. When set to True, the filled contours of the weather field are computed once on the full grid
+        and cached (keyed by the content of the field, the grid and the contour levels). Every later plot of the same field for another
+        region reuses the cached polygons and only draws the ones that overlap its map. This is the fastest way to contour the same field
+        for many regions. The data is not cropped to the region and the field is not coarsened when contour_cache=True.
+
 """
 
+import sys as _sys
 import warnings as _warnings
 _warnings.filterwarnings('ignore')
 import matplotlib as _mpl 
 import firewxpy.calc.calc as _calc
-import matplotlib.pyplot as _plt 
 import matplotlib.colors as _mcolors
 import cartopy.crs as _ccrs 
-import cartopy.feature as _cfeature 
 import metpy.plots as _mpplots
 import numpy as _np
 import pandas as _pd
 
 from dateutil import tz as _tz
 from matplotlib.patheffects import withStroke as _withStroke
-from firewxpy.utils.station_plot_formatting import fix_var_array as _fix_var_array
+from firewxpy.utils.station_plot_formatting import(
+    extract_pixel_queries as _extract_pixel_queries,
+    thin_pixel_queries as _thin_pixel_queries
+)
 from firewxpy.utils.directory import build_directory_branch as _build_directory_branch
 from firewxpy.utils.plot_coords import bounding_box as _bounding_box
+from firewxpy.rtma.suite import render_suite as _render_suite
+from firewxpy.utils.grid_subset import subset_to_region as _subset_to_region
+from firewxpy.utils.field_rendering import render_field as _render_field
+from firewxpy.utils.grid_normalization import(
+    normalized_grid as _normalized_grid,
+    apply_grid_mask as _apply_grid_mask
+)
+from firewxpy.utils.base_map import(
+    open_base_map as _open_base_map,
+    build_base_map as _build_base_map,
+    store_base_map as _store_base_map,
+    close_base_map as _close_base_map,
+    rasterize_base_map as _rasterize_base_map
+)
 from firewxpy.calc.calc import(
-    kelvin_to_fahrenheit as _kelvin_to_fahrenheit, 
-    celsius_to_fahrenheit as _celsius_to_fahrenheit,
-    kelvin_to_celsius as _kelvin_to_celsius
+    convert_units as _convert_units,
+    convert_temperature_fields as _convert_temperature_fields
 )
 from firewxpy.utils.standard import(
     get_timezone_abbreviation as _get_timezone_abbreviation,
     plot_creation_time as _plot_creation_time
 )
-from firewxpy.utils.geometry import(
-    import_shapefile_from_web as _import_shapefile_from_web,
-    import_shapefile_local as _import_shapefile_local,
-    import_geojson_from_web as _import_geojson_from_web,
-    import_geojson_local as _import_geojson_local,
-    get_filename_from_url as _get_filename_from_url
+from firewxpy.utils.dataset_cache import cached_dataset as _cached_dataset
+from firewxpy.utils.rtma_archive import archived_comparison as _archived_comparison
+from firewxpy.rtma.fetch import fetch_analysis as _fetch_analysis
+from firewxpy.utils.comparison_cache import comparison_difference as _comparison_difference
+from wxdata import(
+    rtma as _wxdata_rtma,
+    rtma_comparison as _wxdata_rtma_comparison
 )
-from wxdata import rtma_comparison as _rtma_comparison
 
-_local, _utc = _plot_creation_time()
-_timezone = _get_timezone_abbreviation()
+_rtma = _cached_dataset(_wxdata_rtma)
+_rtma_comparison = _cached_dataset(_archived_comparison(_wxdata_rtma_comparison, _rtma, _fetch_analysis))
+
 _from_zone = _tz.tzutc()
 _to_zone = _tz.tzlocal()
+
+# The temperature units of a dataset that is shared by every graphic of a suite (see render_suite() and the RTMA watcher).
+# The products that combine a temperature with the wind plot the dataset as it is, so it is converted once before it is shared.
+dataset_units = 'fahrenheit'
+
 _mpl.rcParams['font.weight'] = 'bold'
 
 def _fix_grib_data(ds,
@@ -521,19 +593,14 @@ def _fix_grib_data(ds,
     Fixed lat/lon and var data.     
     """
     
-    lon2d = ds[longitude_key].values
-    lat2d = ds[latitude_key].values
-    vals2d = ds[variable].values  # or your variable
-
-    # If longitudes are 0–360, convert:
-    lon2d = _np.where(lon2d > 180, lon2d - 360, lon2d)
-
-    # Keep only a sane Alaska window
-    mask = (lon2d >= -180) & (lon2d <= -120)
-
-    lon_masked  = _np.where(mask, lon2d,  _np.nan)
-    lat_masked  = _np.where(mask, lat2d,  _np.nan)
-    vals_masked = _np.where(mask, vals2d, _np.nan)
+    # The 0–360 longitudes are converted and a sane Alaska window is kept.
+    # Both only depend on the grid so they are cached for each grid definition.
+    lon_masked, lat_masked, mask = _normalized_grid(ds[longitude_key].values,
+                                                    ds[latitude_key].values,
+                                                    western_limit=-180,
+                                                    eastern_limit=-120)
+    
+    vals_masked = _apply_grid_mask(ds[variable].values, mask)
     
     return lon_masked, lat_masked, vals_masked
 
@@ -681,7 +748,15 @@ def plot_temperature(region='ak',
                      var_key='2m_temperature',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature.
@@ -708,6 +783,8 @@ def plot_temperature(region='ak',
     
     An image of the RTMA Temperature Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -754,27 +831,33 @@ def plot_temperature(region='ak',
         ds1 = ds1
         ds2 = ds2
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _kelvin_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_fahrenheit(ds2[var_key])
-                else:
-                    ds1[var_key] = _kelvin_to_celsius(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_celsius(ds2[var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _celsius_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _celsius_to_fahrenheit(ds2[var_key])
-        
-        
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+            ds1 = _convert_units(ds1, [var_key], convert_to, from_units=convert_from)
+            ds2 = _convert_units(ds2, [var_key], convert_to, from_units=convert_from)
+        
+        
+    diff = _comparison_difference(ds1, ds2, [var_key], time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          var_key,
                                                          longitude_key,
                                                          latitude_key)
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                        var_key,
-                                        longitude_key,
-                                        latitude_key)
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
     else:
@@ -790,241 +873,25 @@ def plot_temperature(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -1033,20 +900,20 @@ def plot_temperature(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -1055,7 +922,7 @@ def plot_temperature(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1064,7 +931,7 @@ def plot_temperature(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1081,17 +948,16 @@ def plot_temperature(region='ak',
             zorder=reference_system_textbox_zorder)
         
     
-    vals_1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    vals_2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, vals_1[longitude_key], vals_1[latitude_key],
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
+    stn = _mpplots.StationPlot(ax, vals[longitude_key], vals[latitude_key],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -1099,15 +965,18 @@ def plot_temperature(region='ak',
 
 
     stn.plot_parameter('C', 
-                       (vals_1[var_key] - vals_2[var_key]), 
+                       vals[var_key], 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
   
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1258,7 +1127,15 @@ def plot_dew_point(region='ak',
                      var_key='2m_dew_point',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point.
@@ -1285,6 +1162,8 @@ def plot_dew_point(region='ak',
     
     An image of the RTMA Dew Point Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1331,27 +1210,32 @@ def plot_dew_point(region='ak',
         ds1 = ds1
         ds2= ds2
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _kelvin_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_fahrenheit(ds2[var_key])
-                else:
-                    ds1[var_key] = _kelvin_to_celsius(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_celsius(ds2[var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _celsius_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _celsius_to_fahrenheit(ds2[var_key])
+            ds1 = _convert_units(ds1, [var_key], convert_to, from_units=convert_from)
+            ds2 = _convert_units(ds2, [var_key], convert_to, from_units=convert_from)
                     
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    diff = _comparison_difference(ds1, ds2, [var_key], time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          var_key,
                                                          longitude_key,
                                                          latitude_key)
-    
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                    var_key,
-                                    longitude_key,
-                                    latitude_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -1368,241 +1252,25 @@ def plot_dew_point(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -1611,20 +1279,20 @@ def plot_dew_point(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -1633,7 +1301,7 @@ def plot_dew_point(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1642,7 +1310,7 @@ def plot_dew_point(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1658,17 +1326,16 @@ def plot_dew_point(region='ak',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    vals_1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    vals_2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -1676,14 +1343,17 @@ def plot_dew_point(region='ak',
 
 
     stn.plot_parameter('C', 
-                       (vals_1[var_key] - vals_2[var_key]), 
+                       vals[var_key], 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1833,7 +1503,15 @@ def plot_dew_point_depression(region='ak',
                      var_key='2m_dew_point_depression',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression.
@@ -1860,6 +1538,8 @@ def plot_dew_point_depression(region='ak',
     
     An image of the RTMA Dew Point Depression Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1906,27 +1586,32 @@ def plot_dew_point_depression(region='ak',
         ds1 = ds1
         ds2 = ds2
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _kelvin_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_fahrenheit(ds2[var_key])
-                else:
-                    ds1[var_key] = _kelvin_to_celsius(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_celsius(ds2[var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _celsius_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _celsius_to_fahrenheit(ds2[var_key])
+            ds1 = _convert_units(ds1, [var_key], convert_to, from_units=convert_from, difference=True)
+            ds2 = _convert_units(ds2, [var_key], convert_to, from_units=convert_from, difference=True)
                     
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    diff = _comparison_difference(ds1, ds2, [var_key], time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          var_key,
                                                          longitude_key,
                                                          latitude_key)
-    
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                    var_key,
-                                    longitude_key,
-                                    latitude_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -1943,241 +1628,25 @@ def plot_dew_point_depression(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2186,20 +1655,20 @@ def plot_dew_point_depression(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2208,7 +1677,7 @@ def plot_dew_point_depression(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2217,7 +1686,7 @@ def plot_dew_point_depression(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2233,17 +1702,16 @@ def plot_dew_point_depression(region='ak',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    vals_1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    vals_2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -2251,14 +1719,17 @@ def plot_dew_point_depression(region='ak',
 
 
     stn.plot_parameter('C', 
-                       (vals_1[var_key] - vals_2[var_key]), 
+                       vals[var_key], 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2407,7 +1878,15 @@ def plot_relative_humidity(region='ak',
                      var_key='2m_relative_humidity',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative humidity.
@@ -2434,6 +1913,8 @@ def plot_relative_humidity(region='ak',
     
     An image of the RTMA Relative Humidity Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -2480,15 +1961,29 @@ def plot_relative_humidity(region='ak',
         ds1 = ds1
         ds2 = ds2
         
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    diff = _comparison_difference(ds1, ds2, [var_key], time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          var_key,
                                                          longitude_key,
                                                          latitude_key)
-    
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                    var_key,
-                                    longitude_key,
-                                    latitude_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
@@ -2505,241 +2000,25 @@ def plot_relative_humidity(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2748,20 +2027,20 @@ def plot_relative_humidity(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2770,7 +2049,7 @@ def plot_relative_humidity(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2779,7 +2058,7 @@ def plot_relative_humidity(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2796,17 +2075,16 @@ def plot_relative_humidity(region='ak',
             zorder=reference_system_textbox_zorder)
         
         
-    vals_1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    vals_2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -2814,15 +2092,18 @@ def plot_relative_humidity(region='ak',
 
 
     stn.plot_parameter('C', 
-                       (vals_1[var_key] - vals_2[var_key]), 
+                       vals[var_key], 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2984,7 +2265,15 @@ def plot_wind_speed(region='ak',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for sustained wind speed.
@@ -3011,6 +2300,8 @@ def plot_wind_speed(region='ak',
     
     An image of the RTMA Wind Speed Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -3057,34 +2348,40 @@ def plot_wind_speed(region='ak',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [var_key],
+                                  to_units=convert_to if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[var_key] = _calc.mps_to_mph(ds1[var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[var_key] = _calc.mps_to_mph(ds2[var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[var_key] = _calc.mph_to_kts(ds1[var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[var_key] = _calc.mph_to_kts(ds2[var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [var_key, u_var_key, v_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          var_key,
                                                          longitude_key,
                                                          latitude_key)
-    
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                    var_key,
-                                    longitude_key,
-                                    latitude_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("wind speed", colors)
@@ -3101,241 +2398,25 @@ def plot_wind_speed(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -3344,16 +2425,16 @@ def plot_wind_speed(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3361,7 +2442,7 @@ def plot_wind_speed(region='ak',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3370,7 +2451,7 @@ def plot_wind_speed(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3379,7 +2460,7 @@ def plot_wind_speed(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3397,36 +2478,33 @@ def plot_wind_speed(region='ak',
         
     
         
-    vals_1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    vals_2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
-
     stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -3441,23 +2519,23 @@ def plot_wind_speed(region='ak',
 
     if pixel_query_type != 'barbs':
         stn1.plot_parameter('C', 
-                            (vals_1[var_key] - vals_2[var_key]), 
+                            diffs[var_key], 
                             color=pixel_query_value_fontcolor, 
                             path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                         foreground=pixel_query_value_foreground)], 
                             zorder=pixel_query_value_zorder)
 
     else:
-        stn1.plot_barb(u_vals_1[u_var_key], 
-                        v_vals_1[v_var_key],
+        stn1.plot_barb(vals_1[u_var_key], 
+                        vals_1[v_var_key],
                         color=current_barb_color, 
                         length=current_barb_length, 
                         linewidth=current_barb_width,
                         zorder=current_barb_zorder,
                         label=label1)
         
-        stn2.plot_barb(u_vals_2[u_var_key], 
-                        v_vals_2[v_var_key],
+        stn2.plot_barb(vals_2[u_var_key], 
+                        vals_2[v_var_key],
                         color=comparison_barb_color, 
                         length=comparison_barb_length, 
                         linewidth=comparison_barb_width,
@@ -3467,8 +2545,11 @@ def plot_wind_speed(region='ak',
         leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
         leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -3631,7 +2712,15 @@ def plot_wind_gust(region='ak',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for wind gust.
@@ -3658,6 +2747,8 @@ def plot_wind_gust(region='ak',
     
     An image of the RTMA Wind Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -3704,46 +2795,42 @@ def plot_wind_gust(region='ak',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [var_key],
+                                  to_units=convert_to if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[var_key] = _calc.mps_to_mph(ds1[var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[var_key] = _calc.mps_to_mph(ds2[var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[var_key] = _calc.mph_to_kts(ds1[var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[var_key] = _calc.mph_to_kts(ds2[var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [var_key], convert_to, from_units='mps')
     else:
         pass
     
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          var_key,
                                                          longitude_key,
                                                          latitude_key)
     
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                    var_key,
-                                    longitude_key,
-                                    latitude_key)
-    
-    ds1 = _calc.u_v_components(ds1,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            var_key)
-    
-    ds2 = _calc.u_v_components(ds2,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("wind gust", colors)
@@ -3760,241 +2847,25 @@ def plot_wind_gust(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -4003,16 +2874,16 @@ def plot_wind_gust(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4020,7 +2891,7 @@ def plot_wind_gust(region='ak',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4029,7 +2900,7 @@ def plot_wind_gust(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4038,7 +2909,7 @@ def plot_wind_gust(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4056,36 +2927,35 @@ def plot_wind_gust(region='ak',
         
     
         
-    vals_1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [var_key, u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    vals_2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [var_key, u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
+    
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
-
     stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -4100,23 +2970,23 @@ def plot_wind_gust(region='ak',
 
     if pixel_query_type != 'barbs':
         stn1.plot_parameter('C', 
-                            (vals_1[var_key] - vals_2[var_key]), 
+                            diffs[var_key], 
                             color=pixel_query_value_fontcolor, 
                             path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                         foreground=pixel_query_value_foreground)], 
                             zorder=pixel_query_value_zorder)
 
     else:
-        stn1.plot_barb(u_vals_1[u_var_key], 
-                        v_vals_1[v_var_key],
+        stn1.plot_barb(vals_1[u_var_key], 
+                        vals_1[v_var_key],
                         color=current_barb_color, 
                         length=current_barb_length, 
                         linewidth=current_barb_width,
                         zorder=current_barb_zorder,
                         label=label1)
         
-        stn2.plot_barb(u_vals_2[u_var_key], 
-                        v_vals_2[v_var_key],
+        stn2.plot_barb(vals_2[u_var_key], 
+                        vals_2[v_var_key],
                         color=comparison_barb_color, 
                         length=comparison_barb_length, 
                         linewidth=comparison_barb_width,
@@ -4126,8 +2996,11 @@ def plot_wind_gust(region='ak',
         leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
         leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4293,7 +3166,15 @@ def plot_temperature_and_wind(region='ak',
                      barb_legend_y_position=0,
                      barb_legend_zorder=10,
                      temp_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature + wind.
@@ -4320,6 +3201,8 @@ def plot_temperature_and_wind(region='ak',
     
     An image of the RTMA Temperature + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -4366,34 +3249,40 @@ def plot_temperature_and_wind(region='ak',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [temperature_var_key, wind_speed_var_key],
+                                  to_units={wind_speed_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_speed_var_key] = _calc.mps_to_mph(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mps_to_mph(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_speed_var_key] = _calc.mph_to_kts(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mph_to_kts(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          temperature_var_key,
                                                          longitude_key,
                                                          latitude_key)
-    
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                        temperature_var_key,
-                                        longitude_key,
-                                        latitude_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
@@ -4410,241 +3299,25 @@ def plot_temperature_and_wind(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -4653,16 +3326,16 @@ def plot_temperature_and_wind(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4670,7 +3343,7 @@ def plot_temperature_and_wind(region='ak',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4679,7 +3352,7 @@ def plot_temperature_and_wind(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4688,7 +3361,7 @@ def plot_temperature_and_wind(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4706,53 +3379,40 @@ def plot_temperature_and_wind(region='ak',
         
     
         
-    temp_vals_1 = _fix_var_array(ds1,
-                    temperature_var_key,
-                    0,
-                    decimate)
-    
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [temperature_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    ws_vals_1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    temp_vals_2 = _fix_var_array(ds2,
-                    temperature_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    ws_vals_2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, temp_vals_1['longitude'], temp_vals_1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, temp_vals_2['longitude'], temp_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -4760,29 +3420,29 @@ def plot_temperature_and_wind(region='ak',
 
 
     stn1.plot_parameter(temp_value_loc.upper(), 
-                       (temp_vals_1[temperature_var_key] - temp_vals_2[temperature_var_key]), 
+                       diffs[temperature_var_key], 
                        color=temperature_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (ws_vals_1[wind_speed_var_key] - ws_vals_2[wind_speed_var_key]), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                        v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                        vals_1[v_var_key],
                         color=current_barb_color, 
                         length=current_barb_length, 
                         linewidth=current_barb_width,
                         zorder=current_barb_zorder,
                         label=label1)
         
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                        v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                        vals_2[v_var_key],
                         color=comparison_barb_color, 
                         length=comparison_barb_length, 
                         linewidth=comparison_barb_width,
@@ -4792,8 +3452,11 @@ def plot_temperature_and_wind(region='ak',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4960,7 +3623,15 @@ def plot_temperature_and_gust(region='ak',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature + gust.
@@ -4987,6 +3658,8 @@ def plot_temperature_and_gust(region='ak',
     
     An image of the RTMA Temperature + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -5033,46 +3706,42 @@ def plot_temperature_and_gust(region='ak',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [temperature_var_key, wind_gust_var_key],
+                                  to_units={wind_gust_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_gust_var_key] = _calc.mps_to_mph(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mps_to_mph(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_gust_var_key] = _calc.mph_to_kts(ds2[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mph_to_kts(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_gust_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          temperature_var_key,
                                                          longitude_key,
                                                          latitude_key)
     
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                        temperature_var_key,
-                                        longitude_key,
-                                        latitude_key)
-    
-    ds1 = _calc.u_v_components(ds1,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
-    
-    ds2 = _calc.u_v_components(ds2,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
@@ -5089,241 +3758,25 @@ def plot_temperature_and_gust(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -5332,16 +3785,16 @@ def plot_temperature_and_gust(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5349,7 +3802,7 @@ def plot_temperature_and_gust(region='ak',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5358,7 +3811,7 @@ def plot_temperature_and_gust(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5367,7 +3820,7 @@ def plot_temperature_and_gust(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5385,53 +3838,42 @@ def plot_temperature_and_gust(region='ak',
         
     
         
-    temp_vals_1 = _fix_var_array(ds1,
-                    temperature_var_key,
-                    0,
-                    decimate)
-    
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [temperature_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    wg_vals_1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    temp_vals_2 = _fix_var_array(ds2,
-                    temperature_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    wg_vals_2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, temp_vals_1['longitude'], temp_vals_1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, temp_vals_2['longitude'], temp_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -5439,29 +3881,29 @@ def plot_temperature_and_gust(region='ak',
 
 
     stn1.plot_parameter(temp_value_loc.upper(), 
-                       (temp_vals_1[temperature_var_key] - temp_vals_2[temperature_var_key]), 
+                       diffs[temperature_var_key], 
                        color=temperature_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (wg_vals_1[wind_gust_var_key] - wg_vals_2[wind_gust_var_key]), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                    v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                    vals_1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                    v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                    vals_2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -5471,8 +3913,11 @@ def plot_temperature_and_gust(region='ak',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -5639,7 +4084,15 @@ def plot_relative_humidity_and_wind(region='ak',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative humidity + wind.
@@ -5666,6 +4119,8 @@ def plot_relative_humidity_and_wind(region='ak',
     
     An image of the RTMA Relative Humidity + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -5712,34 +4167,40 @@ def plot_relative_humidity_and_wind(region='ak',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [relative_humidity_var_key, wind_speed_var_key],
+                                  to_units={wind_speed_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_speed_var_key] = _calc.mps_to_mph(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mps_to_mph(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_speed_var_key] = _calc.mph_to_kts(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mph_to_kts(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          relative_humidity_var_key,
                                                          longitude_key,
                                                          latitude_key)
-    
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                        relative_humidity_var_key,
-                                        longitude_key,
-                                        latitude_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
@@ -5756,241 +4217,25 @@ def plot_relative_humidity_and_wind(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -5999,16 +4244,16 @@ def plot_relative_humidity_and_wind(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6016,7 +4261,7 @@ def plot_relative_humidity_and_wind(region='ak',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6025,7 +4270,7 @@ def plot_relative_humidity_and_wind(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6034,7 +4279,7 @@ def plot_relative_humidity_and_wind(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6052,53 +4297,40 @@ def plot_relative_humidity_and_wind(region='ak',
         
     
         
-    rh_vals_1 = _fix_var_array(ds1,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
-    
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [relative_humidity_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    ws_vals_1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    rh_vals_2 = _fix_var_array(ds2,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    ws_vals_2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, rh_vals_1['longitude'], rh_vals_1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, rh_vals_2['longitude'], rh_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -6106,29 +4338,29 @@ def plot_relative_humidity_and_wind(region='ak',
 
 
     stn1.plot_parameter(rh_value_loc.upper(), 
-                       (rh_vals_1[relative_humidity_var_key] - rh_vals_2[relative_humidity_var_key]), 
+                       diffs[relative_humidity_var_key], 
                        color=relative_humidity_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (ws_vals_1[wind_speed_var_key] - ws_vals_2[wind_speed_var_key]), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                    v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                    vals_1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                    v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                    vals_2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -6138,8 +4370,11 @@ def plot_relative_humidity_and_wind(region='ak',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -6308,7 +4543,15 @@ def plot_relative_humidity_and_gust(region='ak',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative_humidity + gust.
@@ -6335,6 +4578,8 @@ def plot_relative_humidity_and_gust(region='ak',
     
     An image of the RTMA Relative Humidity + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -6381,46 +4626,42 @@ def plot_relative_humidity_and_gust(region='ak',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [relative_humidity_var_key, wind_gust_var_key],
+                                  to_units={wind_gust_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_gust_var_key] = _calc.mps_to_mph(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mps_to_mph(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_gust_var_key] = _calc.mph_to_kts(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mph_to_kts(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_gust_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          relative_humidity_var_key,
                                                          longitude_key,
                                                          latitude_key)
     
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                        relative_humidity_var_key,
-                                        longitude_key,
-                                        latitude_key)
-    
-    ds1 = _calc.u_v_components(ds1,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
-    
-    ds2 = _calc.u_v_components(ds2,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
@@ -6437,241 +4678,25 @@ def plot_relative_humidity_and_gust(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -6680,16 +4705,16 @@ def plot_relative_humidity_and_gust(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6697,7 +4722,7 @@ def plot_relative_humidity_and_gust(region='ak',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6706,7 +4731,7 @@ def plot_relative_humidity_and_gust(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6715,7 +4740,7 @@ def plot_relative_humidity_and_gust(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6733,53 +4758,42 @@ def plot_relative_humidity_and_gust(region='ak',
         
     
         
-    rh_vals_1 = _fix_var_array(ds1,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
-    
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [relative_humidity_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    wg_vals_1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    rh_vals_2 = _fix_var_array(ds2,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    wg_vals_2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, rh_vals_1['longitude'], rh_vals_1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, rh_vals_2['longitude'], rh_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -6787,29 +4801,29 @@ def plot_relative_humidity_and_gust(region='ak',
 
 
     stn1.plot_parameter(rh_value_loc.upper(), 
-                       (rh_vals_1[relative_humidity_var_key] - rh_vals_2[relative_humidity_var_key]), 
+                       diffs[relative_humidity_var_key], 
                        color=relative_humidity_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (wg_vals_1[wind_gust_var_key] - wg_vals_2[wind_gust_var_key]), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                    v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                    vals_1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                    v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                    vals_2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -6819,8 +4833,11 @@ def plot_relative_humidity_and_gust(region='ak',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -6989,7 +5006,15 @@ def plot_dew_point_depression_and_wind(region='ak',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + wind.
@@ -7016,6 +5041,8 @@ def plot_dew_point_depression_and_wind(region='ak',
     
     An image of the RTMA Dew Point Depression + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -7062,34 +5089,40 @@ def plot_dew_point_depression_and_wind(region='ak',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [dew_point_depression_var_key, wind_speed_var_key],
+                                  to_units={wind_speed_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_speed_var_key] = _calc.mps_to_mph(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mps_to_mph(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_speed_var_key] = _calc.mph_to_kts(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mph_to_kts(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          dew_point_depression_var_key,
                                                          longitude_key,
                                                          latitude_key)
-    
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                        dew_point_depression_var_key,
-                                        longitude_key,
-                                        latitude_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -7106,241 +5139,25 @@ def plot_dew_point_depression_and_wind(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -7349,16 +5166,16 @@ def plot_dew_point_depression_and_wind(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7366,7 +5183,7 @@ def plot_dew_point_depression_and_wind(region='ak',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7375,7 +5192,7 @@ def plot_dew_point_depression_and_wind(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7384,7 +5201,7 @@ def plot_dew_point_depression_and_wind(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7402,53 +5219,40 @@ def plot_dew_point_depression_and_wind(region='ak',
         
     
         
-    dd_vals_1 = _fix_var_array(ds1,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [dew_point_depression_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    ws_vals_1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    dd_vals_2 = _fix_var_array(ds2,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    ws_vals_2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, dd_vals_1['longitude'], dd_vals_1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, dd_vals_2['longitude'], dd_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -7456,29 +5260,29 @@ def plot_dew_point_depression_and_wind(region='ak',
 
 
     stn1.plot_parameter(dd_value_loc.upper(), 
-                       (dd_vals_1[dew_point_depression_var_key] - dd_vals_2[dew_point_depression_var_key]), 
+                       diffs[dew_point_depression_var_key], 
                        color=dew_point_depression_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (ws_vals_1[wind_speed_var_key] - ws_vals_2[wind_speed_var_key]), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                    v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                    vals_1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                    v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                    vals_2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -7488,8 +5292,11 @@ def plot_dew_point_depression_and_wind(region='ak',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -7660,7 +5467,15 @@ def plot_dew_point_depression_and_gust(region='ak',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + gust.
@@ -7687,6 +5502,8 @@ def plot_dew_point_depression_and_gust(region='ak',
     
     An image of the RTMA Dew Point Depression + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -7733,46 +5550,42 @@ def plot_dew_point_depression_and_gust(region='ak',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [dew_point_depression_var_key, wind_gust_var_key],
+                                  to_units={wind_gust_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_gust_var_key] = _calc.mps_to_mph(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mps_to_mph(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_gust_var_key] = _calc.mph_to_kts(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mph_to_kts(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_gust_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          dew_point_depression_var_key,
                                                          longitude_key,
                                                          latitude_key)
     
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                        dew_point_depression_var_key,
-                                        longitude_key,
-                                        latitude_key)
-    
-    ds1 = _calc.u_v_components(ds1,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
-    
-    ds2 = _calc.u_v_components(ds2,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -7789,241 +5602,25 @@ def plot_dew_point_depression_and_gust(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -8032,16 +5629,16 @@ def plot_dew_point_depression_and_gust(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8049,7 +5646,7 @@ def plot_dew_point_depression_and_gust(region='ak',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8058,7 +5655,7 @@ def plot_dew_point_depression_and_gust(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8067,7 +5664,7 @@ def plot_dew_point_depression_and_gust(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8085,53 +5682,42 @@ def plot_dew_point_depression_and_gust(region='ak',
         
     
         
-    dd_vals_1 = _fix_var_array(ds1,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [dew_point_depression_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    wg_vals_1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    dd_vals_2 = _fix_var_array(ds2,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    wg_vals_2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, dd_vals_1['longitude'], dd_vals_1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, dd_vals_2['longitude'], dd_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -8139,29 +5725,29 @@ def plot_dew_point_depression_and_gust(region='ak',
 
 
     stn1.plot_parameter(dd_value_loc.upper(), 
-                       (dd_vals_1[dew_point_depression_var_key] - dd_vals_2[dew_point_depression_var_key]), 
+                       diffs[dew_point_depression_var_key], 
                        color=dew_point_depression_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (wg_vals_1[wind_gust_var_key] - wg_vals_2[wind_gust_var_key]), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                    v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                    vals_1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                    v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                    vals_2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -8171,8 +5757,11 @@ def plot_dew_point_depression_and_gust(region='ak',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -8341,7 +5930,15 @@ def plot_dew_point_and_wind(region='ak',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + wind.
@@ -8368,6 +5965,8 @@ def plot_dew_point_and_wind(region='ak',
     
     An image of the RTMA Dew Point + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -8414,34 +6013,40 @@ def plot_dew_point_and_wind(region='ak',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [dew_point_var_key, wind_speed_var_key],
+                                  to_units={wind_speed_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_speed_var_key] = _calc.mps_to_mph(ds2[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mps_to_mph(ds1[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-        else:
-            ds1[wind_speed_var_key] = _calc.mph_to_kts(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mph_to_kts(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    lon_masked_1, lat_masked_1, vals_masked_1 = _fix_grib_data(ds1,
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          dew_point_var_key,
                                                          longitude_key,
                                                          latitude_key)
-    
-    _, _, vals_masked_2 = _fix_grib_data(ds2,
-                                        dew_point_var_key,
-                                        longitude_key,
-                                        latitude_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -8458,241 +6063,25 @@ def plot_dew_point_and_wind(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked_1,
-                lat_masked_1,
-                (vals_masked_1 - vals_masked_2),
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
+                lat_masked,
+                vals_masked,
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -8701,16 +6090,16 @@ def plot_dew_point_and_wind(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8718,7 +6107,7 @@ def plot_dew_point_and_wind(region='ak',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8727,7 +6116,7 @@ def plot_dew_point_and_wind(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8736,7 +6125,7 @@ def plot_dew_point_and_wind(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8754,53 +6143,40 @@ def plot_dew_point_and_wind(region='ak',
         
     
         
-    dwpt_vals_1 = _fix_var_array(ds1,
-                    dew_point_var_key,
-                    0,
-                    decimate)
-    
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [dew_point_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    ws_vals_1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    dwpt_vals_2 = _fix_var_array(ds2,
-                    dew_point_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    ws_vals_2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, dwpt_vals_1['longitude'], dwpt_vals_1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, dwpt_vals_2['longitude'], dwpt_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -8808,29 +6184,29 @@ def plot_dew_point_and_wind(region='ak',
 
 
     stn1.plot_parameter(dwpt_value_loc.upper(), 
-                       (dwpt_vals_1[dew_point_var_key] - dwpt_vals_2[dew_point_var_key]), 
+                       diffs[dew_point_var_key], 
                        color=dew_point_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (ws_vals_1[wind_speed_var_key] - ws_vals_2[wind_speed_var_key]), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                    v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                    vals_1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                    v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                    vals_2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -8840,8 +6216,11 @@ def plot_dew_point_and_wind(region='ak',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -9012,7 +6391,15 @@ def plot_dew_point_and_gust(region='ak',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + gust.
@@ -9039,6 +6426,8 @@ def plot_dew_point_and_gust(region='ak',
     
     An image of the RTMA Dew Point + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -9070,8 +6459,8 @@ def plot_dew_point_and_gust(region='ak',
                                                                                  southern_bound,
                                                                                  northern_bound)
     
-    if ds is None:
-        ds = _rtma_comparison(model='ak rtma',
+    if ds1 is None and ds2 is None:
+        ds1, ds2 = _rtma_comparison(model='ak rtma',
                    proxies=proxies,
                    clear_recycle_bin=clear_recycle_bin,
                    clear_data=clear_data,
@@ -9079,33 +6468,48 @@ def plot_dew_point_and_gust(region='ak',
                    convert_to='fahrenheit',
                    chunk_size=chunk_size,
                    notifications=notifications,
-                   custom_directory=custom_data_directory)
+                   custom_directory=custom_data_directory,
+                   hours=hours)
     else:
-        ds = ds
+        ds1 = ds1
+        ds2 = ds2
+        
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [dew_point_var_key, wind_gust_var_key],
+                                  to_units={wind_gust_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
         
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_gust_var_key] = _calc.mps_to_mph(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_gust_var_key] = _calc.mph_to_kts(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_gust_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    lon_masked, lat_masked, vals_masked = _fix_grib_data(ds,
+    lon_masked, lat_masked, vals_masked = _fix_grib_data(diff,
                                                          dew_point_var_key,
                                                          longitude_key,
                                                          latitude_key)
     
-    ds = _calc.u_v_components(ds,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -9122,233 +6526,13 @@ def plot_dew_point_and_gust(region='ak',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon_masked,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon_masked,
                 lat_masked,
                 vals_masked,
                 cmap=cmap,
@@ -9356,7 +6540,11 @@ def plot_dew_point_and_gust(region='ak',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -9365,16 +6553,16 @@ def plot_dew_point_and_gust(region='ak',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -9382,7 +6570,7 @@ def plot_dew_point_and_gust(region='ak',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -9391,7 +6579,7 @@ def plot_dew_point_and_gust(region='ak',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -9400,7 +6588,7 @@ def plot_dew_point_and_gust(region='ak',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -9416,53 +6604,42 @@ def plot_dew_point_and_gust(region='ak',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    dwpt_vals_1 = _fix_var_array(ds1,
-                    dew_point_var_key,
-                    0,
-                    decimate)
-    
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
-    
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    wg_vals_1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-    
-    dwpt_vals_2 = _fix_var_array(ds2,
-                    dew_point_var_key,
-                    0,
-                    decimate)
-    
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
-    
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    wg_vals_2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, dwpt_vals_1['longitude'], dwpt_vals_1['latitude'],
+    diffs = _extract_pixel_queries(diff,
+                    [dew_point_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
+    
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
+    
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
+    
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
+    
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
+    
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, dwpt_vals_2['longitude'], dwpt_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -9470,29 +6647,29 @@ def plot_dew_point_and_gust(region='ak',
 
 
     stn1.plot_parameter(dwpt_value_loc.upper(), 
-                       (dwpt_vals_1[dew_point_var_key] - dwpt_vals_2[dew_point_var_key]), 
+                       diffs[dew_point_var_key], 
                        color=dew_point_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (wg_vals_1[wind_gust_var_key] - wg_vals_2[wind_gust_var_key]), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                    v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                    vals_1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                    v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                    vals_2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -9502,9 +6679,97 @@ def plot_dew_point_and_gust(region='ak',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
-        
\ No newline at end of file
+
+def render_suite(products=None,
+                 regions=None,
+                 reference_systems=['States & Counties'],
+                 ds1=None,
+                 ds2=None,
+                 product_kwargs=None,
+                 notifications='off',
+                 workers=1,
+                 **kwargs):
+    
+    """
+    This function renders a suite of RTMA Comparison Alaska graphics (products x regions x reference systems) in one call.
+    
+    The data is downloaded and decoded once and the cartographic reference layers are loaded once for the whole suite.
+    
+    Required Arguments: None
+    
+    Optional Arguments:
+    
+    1) products (List or None) - Default=None. The products to render. The product names are the plot function names 
+        without 'plot_' (i.e. ['temperature', 'relative_humidity_and_wind']). When None, all 14 products are rendered.
+        
+    2) regions (List or None) - Default=None. The regions to render (i.e. ['ca', 'oscc', 'nv']). When None, the default region is used.
+    
+    3) reference_systems (List or dict) - Default=['States & Counties']. The reference systems to render.
+        
+        Built-in reference systems
+        --------------------------
+        
+        1) 'States & Counties'
+        2) 'States Only'
+        3) 'GACC Boundaries'
+        4) 'Predictive Services Areas'
+        5) 'NWS CWA'
+        6) 'NWS Public Zones'
+        7) 'NWS Fire Weather Zones'
+        8) 'CalFire Boundaries'
+        
+        Custom reference systems are passed as a dictionary of {name: {'show_states':True, 'show_counties':False, ...}}.
+    
+    4) ds1 (xarray.array or None) - Default=None. The current RTMA dataset passed into every plot function.
+        When ds1 and ds2 are None, the data is downloaded and decoded once and shared by every graphic.
+    
+    5) ds2 (xarray.array or None) - Default=None. The RTMA dataset of the comparison time passed into every plot function.
+    
+    6) product_kwargs (dict or None) - Default=None. Keyword arguments that only apply to some products
+        (i.e. {'temperature':{'decimate':100}}).
+    
+    7) notifications (String) - Default='off'. When set to 'on', the time of each graphic is printed.
+    
+    8) workers (Integer or None) - Default=1. The number of processes the graphics are spread over. When None, one process per CPU is used.
+        When workers > 1, the data is downloaded and decoded once in this process and shared with the workers through memory-mapped files.
+        On Windows/macOS, call this function under if __name__ == '__main__':.
+    
+    9) **kwargs - Keyword arguments passed into every plot function that accepts them (i.e. hours, figure_x_length, proxies).
+    
+    Returns
+    -------
+    
+    A list of dictionaries (one per graphic) with the product, region, reference_system, seconds, error and worker keys.
+    The error is None when the graphic was saved.   
+    """
+    
+    if workers != 1 and ds1 is None and ds2 is None:
+        ds1, ds2 = _rtma_comparison(model='ak rtma',
+                   proxies=kwargs.get('proxies', None),
+                   clear_recycle_bin=kwargs.get('clear_recycle_bin', False),
+                   clear_data=kwargs.get('clear_data', True),
+                   convert_temperature=False,
+                   chunk_size=kwargs.get('chunk_size', 8192),
+                   notifications=notifications,
+                   custom_directory=kwargs.get('custom_data_directory', None),
+                   hours=kwargs.get('hours', 24))
+        ds1 = _convert_temperature_fields(ds1, dataset_units)
+        ds2 = _convert_temperature_fields(ds2, dataset_units)
+        
+    return _render_suite(_sys.modules[__name__],
+                         products=products,
+                         regions=regions,
+                         reference_systems=reference_systems,
+                         datasets={'ds1':ds1, 'ds2':ds2},
+                         product_kwargs=product_kwargs,
+                         notifications=notifications,
+                         workers=workers,
+                         **kwargs)
@@ -1,2 +1,12 @@
-import firewxpy.rtma.conus.rtma as rtma_conus
-import firewxpy.rtma.conus.rtma_comparison as rtma_comparison_conus
\ No newline at end of file
+from firewxpy._lazy import lazy_modules as _lazy_modules
+
+_modules = {
+    'rtma':'firewxpy.rtma.conus.rtma',
+    'rtma_comparison':'firewxpy.rtma.conus.rtma_comparison',
+    'rtma_conus':'firewxpy.rtma.conus.rtma',
+    'rtma_comparison_conus':'firewxpy.rtma.conus.rtma_comparison'
+}
+
+__all__ = list(_modules)
+
+__getattr__, __dir__ = _lazy_modules(globals(), _modules)
@@ -165,8 +165,9 @@ Arguments and Settings
         of the geometries in the custom geojson.
         
 - refresh_cartographic_files (Boolean) - Default=True. Users that have automated pipelines set up for shapefiles. Having this set to
-        True allows the client to delete and re-download the shapefiles with each run of the script. This is useful for shapefiles
-        that have frequent geometry updates.
+        True re-validates the shapefiles with the server (ETag/Last-Modified) once the freshness window expires and only deletes and 
+        re-downloads the shapefiles when they changed on the server. The freshness window (default 24 hours) is shared across all calls 
+        and processes and is set with firewxpy.utils.set_refresh_policy(ttl=seconds). When set to False, the shapefiles are only downloaded once.
         
 - reference_system (String) - Default='States & Counties'. The name of the borders overlaid onto the map.
     
@@ -447,48 +448,105 @@ Arguments and Settings
 
 - dwpt_value_loc (String) - Default='NW'. The location of dew point on the station plot in the form of compass directions.
 
+- crop_to_region (Boolean) - Default=True. When set to True, the data is cropped to the region plus a small halo before it is contoured
+        and before the pixel query values are built. This significantly speeds up plots of smaller regions (i.e. States or GACCs).
+        Set to False to contour the full grid.
+
+- pixel_query_spacing (Integer, Float or None) - Default=None. When set to a number of pixels, the pixel queries are thinned on the screen
+        so the values/barbs keep this minimum spacing regardless of the map projection and region. This keeps the number of 
+        station plot values predictable and speeds up drawing. decimate then only selects the candidate grid points 
+        (i.e. decimate=1 makes every grid point a candidate). The selected points are cached for each grid, region and figure size.
+        When None, the pixel queries are only thinned by decimate.
+
+- reuse_base_map (Boolean) - Default=True. When set to True, the scaffold of the map (the figure, the extent, the coastlines/land/ocean/lakes
+        and the reference layers) is built once for each region, projection, figure size and reference layer style and is reused by every later
+        plot with the same settings. Only the contours, colorbar, titles and station plot are drawn for each product.
+        The templates are not pyplot figures, so they are never shown (i.e. in a notebook) or left open in pyplot.
+        Set to False to build a new figure for every plot.
+
+- rasterize_base_map (Boolean) - Default=False. When set to True (with reuse_base_map=True), the land/ocean/lakes fills and the reference
+        layers are rendered once to a raster for each region, projection, figure size, dpi and style and drawn as images in
+        the layering of the vector map (i.e. the fills below the weather field and the borders above it). Only the weather field and the annotations stay vector,
+        which greatly reduces the time to save graphics with dense borders (i.e. counties or zones).
+
+- render_mode (String) - Default='contourf'. How the weather field is drawn.
+    
+        Render modes
+        ------------
+        
+        1) 'contourf' - Filled contours.
+        
+        2) 'pcolormesh' - Each grid cell is colored with the discrete colors of the contour levels (BoundaryNorm).
+            Much faster than contourf on the full resolution grid.
+        
+        3) 'imshow' - The grid is resampled onto the pixels of the map and drawn as one image with the discrete colors of the
+            contour levels (BoundaryNorm). The fastest mode. The pixel lookup is cached for each grid, region and figure size.
+
+- coarsen_quality (Integer, Float or None) - Default=None. When set, the weather field is coarsened to the resolution the figure
+        is able to display before it is drawn. The number of grid cells per pixel is computed from the extent, the figure size and the dpi and
+        the field is reduced so about coarsen_quality grid cells remain per pixel (i.e. 1 for one grid cell per pixel, 2 keeps twice the detail).
+        This makes national plots much cheaper with little visible change. The pixel query values are always taken from the full resolution data.
+        When None, the full grid is drawn.
+    
+- coarsen_method (String) - Default='mean'. How the field is coarsened. 'mean' (NaN-aware block averages) or 'stride' (every n-th grid point).
+
+- contour_cache (Boolean) - Default=False. When set to True, the filled contours of the weather field are computed once on the full grid
+        and cached (keyed by the content of the field, the grid and the contour levels). Every later plot of the same field for another
+        region reuses the cached polygons and only draws the ones that overlap its map. This is the fastest way to contour the same field
+        for many regions. The data is not cropped to the region and the field is not coarsened when contour_cache=True.
+
 """
 
 
+import sys as _sys
 import warnings as _warnings
 _warnings.filterwarnings('ignore')
 import matplotlib as _mpl 
 import firewxpy.calc.calc as _calc
-import matplotlib.pyplot as _plt 
 import matplotlib.colors as _mcolors
 import cartopy.crs as _ccrs 
-import cartopy.feature as _cfeature 
 import metpy.plots as _mpplots
 import numpy as _np
 import pandas as _pd
 
 from dateutil import tz as _tz
 from matplotlib.patheffects import withStroke as _withStroke
-from firewxpy.utils.station_plot_formatting import fix_var_array as _fix_var_array
+from firewxpy.utils.station_plot_formatting import(
+    extract_pixel_queries as _extract_pixel_queries,
+    thin_pixel_queries as _thin_pixel_queries
+)
 from firewxpy.utils.directory import build_directory_branch as _build_directory_branch
 from firewxpy.utils.plot_coords import bounding_box as _bounding_box
+from firewxpy.rtma.suite import render_suite as _render_suite
+from firewxpy.utils.grid_subset import subset_to_region as _subset_to_region
+from firewxpy.utils.field_rendering import render_field as _render_field
+from firewxpy.utils.base_map import(
+    open_base_map as _open_base_map,
+    build_base_map as _build_base_map,
+    store_base_map as _store_base_map,
+    close_base_map as _close_base_map,
+    rasterize_base_map as _rasterize_base_map
+)
 from firewxpy.calc.calc import(
-    kelvin_to_fahrenheit as _kelvin_to_fahrenheit, 
-    celsius_to_fahrenheit as _celsius_to_fahrenheit,
-    kelvin_to_celsius as _kelvin_to_celsius
+    convert_units as _convert_units,
+    convert_temperature_fields as _convert_temperature_fields
 )
 from firewxpy.utils.standard import(
     get_timezone_abbreviation as _get_timezone_abbreviation,
     plot_creation_time as _plot_creation_time
 )
-from firewxpy.utils.geometry import(
-    import_shapefile_from_web as _import_shapefile_from_web,
-    import_shapefile_local as _import_shapefile_local,
-    import_geojson_from_web as _import_geojson_from_web,
-    import_geojson_local as _import_geojson_local,
-    get_filename_from_url as _get_filename_from_url
-)
-from wxdata import rtma as _rtma
+from firewxpy.utils.dataset_cache import cached_dataset as _cached_dataset
+from wxdata import rtma as _wxdata_rtma
+
+_rtma = _cached_dataset(_wxdata_rtma)
 
-_local, _utc = _plot_creation_time()
-_timezone = _get_timezone_abbreviation()
 _from_zone = _tz.tzutc()
 _to_zone = _tz.tzlocal()
+
+# The temperature units of a dataset that is shared by every graphic of a suite (see render_suite() and the RTMA watcher).
+# The products that combine a temperature with the wind plot the dataset as it is, so it is converted once before it is shared.
+dataset_units = 'fahrenheit'
+
 _mpl.rcParams['font.weight'] = 'bold'
 
 def plot_temperature(region='conus',
@@ -643,7 +701,15 @@ def plot_temperature(region='conus',
                      var_key='2m_temperature',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature.
@@ -670,6 +736,8 @@ def plot_temperature(region='conus',
     
     An image of the RTMA Temperature Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -713,14 +781,14 @@ def plot_temperature(region='conus',
     else:
         ds = ds
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds[var_key] = _kelvin_to_fahrenheit(ds[var_key])
-                else:
-                    ds[var_key] = _kelvin_to_celsius(ds[var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds[var_key] = _celsius_to_fahrenheit(ds[var_key])
+            ds = _convert_units(ds, [var_key], convert_to, from_units=convert_from)
+        
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
@@ -732,233 +800,13 @@ def plot_temperature(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[var_key],
                 cmap=cmap,
@@ -966,7 +814,11 @@ def plot_temperature(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -975,20 +827,20 @@ def plot_temperature(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -997,7 +849,7 @@ def plot_temperature(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1006,7 +858,7 @@ def plot_temperature(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1023,11 +875,15 @@ def plot_temperature(region='conus',
             zorder=reference_system_textbox_zorder)
         
     
-    vals = _fix_var_array(ds,
-                    var_key,
-                    0,
-                    decimate)
-
+    vals = _extract_pixel_queries(ds,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
     stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -1043,8 +899,11 @@ def plot_temperature(region='conus',
                        zorder=pixel_query_value_zorder)
 
   
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1195,7 +1054,15 @@ def plot_dew_point(region='conus',
                      dwpt_var_key='2m_dew_point',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point.
@@ -1222,6 +1089,8 @@ def plot_dew_point(region='conus',
     
     An image of the RTMA Dew Point Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1265,14 +1134,14 @@ def plot_dew_point(region='conus',
     else:
         ds = ds
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds[dwpt_var_key] = _kelvin_to_fahrenheit(ds[dwpt_var_key])
-                else:
-                    ds[dwpt_var_key] = _kelvin_to_celsius(ds[dwpt_var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds[dwpt_var_key] = _celsius_to_fahrenheit(ds[dwpt_var_key])
+            ds = _convert_units(ds, [dwpt_var_key], convert_to, from_units=convert_from)
+        
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -1284,233 +1153,13 @@ def plot_dew_point(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[dwpt_var_key],
                 cmap=cmap,
@@ -1518,7 +1167,11 @@ def plot_dew_point(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -1527,20 +1180,20 @@ def plot_dew_point(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -1549,7 +1202,7 @@ def plot_dew_point(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1558,7 +1211,7 @@ def plot_dew_point(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1574,11 +1227,15 @@ def plot_dew_point(region='conus',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    vals = _fix_var_array(ds,
-                    dwpt_var_key,
-                    0,
-                    decimate)
-
+    vals = _extract_pixel_queries(ds,
+                    [dwpt_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
     stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -1593,8 +1250,11 @@ def plot_dew_point(region='conus',
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1744,7 +1404,15 @@ def plot_dew_point_depression(region='conus',
                      dd_var_key='2m_dew_point_depression',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression.
@@ -1771,6 +1439,8 @@ def plot_dew_point_depression(region='conus',
     
     An image of the RTMA Dew Point Depression Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1814,14 +1484,14 @@ def plot_dew_point_depression(region='conus',
     else:
         ds = ds
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds[dd_var_key] = _kelvin_to_fahrenheit(ds[dd_var_key])
-                else:
-                    ds[dd_var_key] = _kelvin_to_celsius(ds[dd_var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds[dd_var_key] = _celsius_to_fahrenheit(ds[dd_var_key])
+            ds = _convert_units(ds, [dd_var_key], convert_to, from_units=convert_from, difference=True)
+        
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -1833,233 +1503,13 @@ def plot_dew_point_depression(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[dd_var_key],
                 cmap=cmap,
@@ -2067,7 +1517,11 @@ def plot_dew_point_depression(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2076,20 +1530,20 @@ def plot_dew_point_depression(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2098,7 +1552,7 @@ def plot_dew_point_depression(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2107,7 +1561,7 @@ def plot_dew_point_depression(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2123,11 +1577,15 @@ def plot_dew_point_depression(region='conus',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    vals = _fix_var_array(ds,
-                    dd_var_key,
-                    0,
-                    decimate)
-
+    vals = _extract_pixel_queries(ds,
+                    [dd_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
     stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -2142,8 +1600,11 @@ def plot_dew_point_depression(region='conus',
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2292,7 +1753,15 @@ def plot_relative_humidity(region='conus',
                      rh_var_key='2m_relative_humidity',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative humidity.
@@ -2319,6 +1788,8 @@ def plot_relative_humidity(region='conus',
     
     An image of the RTMA Relative Humidity Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -2362,6 +1833,13 @@ def plot_relative_humidity(region='conus',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
     else:
@@ -2372,233 +1850,13 @@ def plot_relative_humidity(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[rh_var_key],
                 cmap=cmap,
@@ -2606,7 +1864,11 @@ def plot_relative_humidity(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2615,20 +1877,20 @@ def plot_relative_humidity(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2637,7 +1899,7 @@ def plot_relative_humidity(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2646,7 +1908,7 @@ def plot_relative_humidity(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2663,11 +1925,15 @@ def plot_relative_humidity(region='conus',
             zorder=reference_system_textbox_zorder)
         
         
-    vals = _fix_var_array(ds,
-                    rh_var_key,
-                    0,
-                    decimate)
-
+    vals = _extract_pixel_queries(ds,
+                    [rh_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
     stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -2683,8 +1949,11 @@ def plot_relative_humidity(region='conus',
                        zorder=pixel_query_value_zorder)
 
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2836,7 +2105,15 @@ def plot_wind_speed(region='conus',
                      barb_length=4.5,
                      barb_width=0.5,
                      barb_color='black',
-                     barb_zorder=7):
+                     barb_zorder=7,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for sustained wind speed.
@@ -2863,6 +2140,8 @@ def plot_wind_speed(region='conus',
     
     An image of the RTMA Wind Speed Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -2906,16 +2185,15 @@ def plot_wind_speed(region='conus',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_speed_var_key] = _calc.mps_to_mph(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_speed_var_key] = _calc.mph_to_kts(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
         
@@ -2929,233 +2207,13 @@ def plot_wind_speed(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[wind_speed_var_key],
                 cmap=cmap,
@@ -3163,7 +2221,11 @@ def plot_wind_speed(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -3172,20 +2234,20 @@ def plot_wind_speed(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3194,7 +2256,7 @@ def plot_wind_speed(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3203,7 +2265,7 @@ def plot_wind_speed(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3221,21 +2283,15 @@ def plot_wind_speed(region='conus',
         
     
         
-    vals = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [wind_speed_var_key, u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
-
     stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -3251,15 +2307,18 @@ def plot_wind_speed(region='conus',
                             zorder=pixel_query_value_zorder)
 
     else:
-        stn.plot_barb(u_vals[u_var_key], 
-                        v_vals[v_var_key],
+        stn.plot_barb(vals[u_var_key], 
+                        vals[v_var_key],
                         color=barb_color, 
                         length=barb_length, 
                         linewidth=barb_width,
                         zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -3412,7 +2471,15 @@ def plot_wind_gust(region='conus',
                      barb_length=4.5,
                      barb_width=0.5,
                      barb_color='black',
-                     barb_zorder=7):
+                     barb_zorder=7,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for wind gust.
@@ -3439,6 +2506,8 @@ def plot_wind_gust(region='conus',
     
     An image of the RTMA Wind Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -3482,24 +2551,19 @@ def plot_wind_gust(region='conus',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_gust_var_key] = _calc.mps_to_mph(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_gust_var_key] = _calc.mph_to_kts(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    ds = _calc.u_v_components(ds,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("wind gust", colors)
@@ -3511,233 +2575,13 @@ def plot_wind_gust(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[wind_gust_var_key],
                 cmap=cmap,
@@ -3745,7 +2589,11 @@ def plot_wind_gust(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -3754,20 +2602,20 @@ def plot_wind_gust(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3776,7 +2624,7 @@ def plot_wind_gust(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3785,7 +2633,7 @@ def plot_wind_gust(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3803,21 +2651,16 @@ def plot_wind_gust(region='conus',
         
     
         
-    vals = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [wind_gust_var_key, u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
-
     stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -3833,15 +2676,18 @@ def plot_wind_gust(region='conus',
                             zorder=pixel_query_value_zorder)
 
     else:
-        stn.plot_barb(u_vals[u_var_key], 
-                        v_vals[v_var_key],
+        stn.plot_barb(vals[u_var_key], 
+                        vals[v_var_key],
                         color=barb_color, 
                         length=barb_length, 
                         linewidth=barb_width,
                         zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4007,7 +2853,15 @@ def plot_temperature_and_wind(region='conus',
                      barb_color='black',
                      barb_zorder=7,
                      temp_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature + wind.
@@ -4034,6 +2888,8 @@ def plot_temperature_and_wind(region='conus',
     
     An image of the RTMA Temperature + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -4077,16 +2933,15 @@ def plot_temperature_and_wind(region='conus',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_speed_var_key] = _calc.mps_to_mph(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_speed_var_key] = _calc.mph_to_kts(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
         
@@ -4100,233 +2955,13 @@ def plot_temperature_and_wind(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[temperature_var_key],
                 cmap=cmap,
@@ -4334,7 +2969,11 @@ def plot_temperature_and_wind(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -4343,20 +2982,20 @@ def plot_temperature_and_wind(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4365,7 +3004,7 @@ def plot_temperature_and_wind(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4374,7 +3013,7 @@ def plot_temperature_and_wind(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4392,27 +3031,16 @@ def plot_temperature_and_wind(region='conus',
         
     
         
-    temp_vals = _fix_var_array(ds,
-                    temperature_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [temperature_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    ws_vals = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, temp_vals['longitude'], temp_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -4420,28 +3048,31 @@ def plot_temperature_and_wind(region='conus',
 
 
     stn.plot_parameter(temp_value_loc.upper(), 
-                       temp_vals[temperature_var_key], 
+                       vals[temperature_var_key], 
                        color=temperature_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(speed_value_loc.upper(), 
-                       ws_vals[wind_speed_var_key], 
+                       vals[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4608,7 +3239,15 @@ def plot_temperature_and_gust(region='conus',
                      barb_color='black',
                      barb_zorder=7,
                      temp_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature + gust.
@@ -4635,6 +3274,8 @@ def plot_temperature_and_gust(region='conus',
     
     An image of the RTMA Temperature + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -4678,24 +3319,19 @@ def plot_temperature_and_gust(region='conus',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_gust_var_key] = _calc.mps_to_mph(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_gust_var_key] = _calc.mph_to_kts(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    ds = _calc.u_v_components(ds,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
@@ -4707,233 +3343,13 @@ def plot_temperature_and_gust(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[temperature_var_key],
                 cmap=cmap,
@@ -4941,7 +3357,11 @@ def plot_temperature_and_gust(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -4950,20 +3370,20 @@ def plot_temperature_and_gust(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4972,7 +3392,7 @@ def plot_temperature_and_gust(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4981,7 +3401,7 @@ def plot_temperature_and_gust(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4999,27 +3419,17 @@ def plot_temperature_and_gust(region='conus',
         
     
         
-    temp_vals = _fix_var_array(ds,
-                    temperature_var_key,
-                    0,
-                    decimate)
-    
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [temperature_var_key, u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    wg_vals = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, temp_vals['longitude'], temp_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -5027,28 +3437,31 @@ def plot_temperature_and_gust(region='conus',
 
 
     stn.plot_parameter(temp_value_loc.upper(), 
-                       temp_vals[temperature_var_key], 
+                       vals[temperature_var_key], 
                        color=temperature_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(gust_value_loc.upper(), 
-                       wg_vals[wind_gust_var_key], 
+                       vals[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -5207,7 +3620,15 @@ def plot_relative_humidity_and_wind(region='conus',
                      barb_color='black',
                      barb_zorder=7,
                      rh_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative humidity + wind.
@@ -5234,6 +3655,8 @@ def plot_relative_humidity_and_wind(region='conus',
     
     An image of the RTMA Relative Humidity + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -5277,16 +3700,15 @@ def plot_relative_humidity_and_wind(region='conus',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_speed_var_key] = _calc.mps_to_mph(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_speed_var_key] = _calc.mph_to_kts(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
         
@@ -5300,233 +3722,13 @@ def plot_relative_humidity_and_wind(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[relative_humidity_var_key],
                 cmap=cmap,
@@ -5534,7 +3736,11 @@ def plot_relative_humidity_and_wind(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -5543,20 +3749,20 @@ def plot_relative_humidity_and_wind(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5565,7 +3771,7 @@ def plot_relative_humidity_and_wind(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5574,7 +3780,7 @@ def plot_relative_humidity_and_wind(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5592,27 +3798,16 @@ def plot_relative_humidity_and_wind(region='conus',
         
     
         
-    rh_vals = _fix_var_array(ds,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
-    
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [relative_humidity_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    ws_vals = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, rh_vals['longitude'], rh_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -5620,28 +3815,31 @@ def plot_relative_humidity_and_wind(region='conus',
 
 
     stn.plot_parameter(rh_value_loc.upper(), 
-                       rh_vals[relative_humidity_var_key], 
+                       vals[relative_humidity_var_key], 
                        color=relative_humidity_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(speed_value_loc.upper(), 
-                       ws_vals[wind_speed_var_key], 
+                       vals[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -5802,7 +4000,15 @@ def plot_relative_humidity_and_gust(region='conus',
                      barb_color='black',
                      barb_zorder=7,
                      rh_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative_humidity + gust.
@@ -5829,6 +4035,8 @@ def plot_relative_humidity_and_gust(region='conus',
     
     An image of the RTMA Relative Humidity + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -5872,24 +4080,19 @@ def plot_relative_humidity_and_gust(region='conus',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_gust_var_key] = _calc.mps_to_mph(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_gust_var_key] = _calc.mph_to_kts(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    ds = _calc.u_v_components(ds,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
@@ -5901,233 +4104,13 @@ def plot_relative_humidity_and_gust(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[relative_humidity_var_key],
                 cmap=cmap,
@@ -6135,7 +4118,11 @@ def plot_relative_humidity_and_gust(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -6144,20 +4131,20 @@ def plot_relative_humidity_and_gust(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6166,7 +4153,7 @@ def plot_relative_humidity_and_gust(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6175,7 +4162,7 @@ def plot_relative_humidity_and_gust(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6193,27 +4180,17 @@ def plot_relative_humidity_and_gust(region='conus',
         
     
         
-    rh_vals = _fix_var_array(ds,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
-    
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [relative_humidity_var_key, u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    wg_vals = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, rh_vals['longitude'], rh_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -6221,28 +4198,31 @@ def plot_relative_humidity_and_gust(region='conus',
 
 
     stn.plot_parameter(rh_value_loc.upper(), 
-                       rh_vals[relative_humidity_var_key], 
+                       vals[relative_humidity_var_key], 
                        color=relative_humidity_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(gust_value_loc.upper(), 
-                       wg_vals[wind_gust_var_key], 
+                       vals[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -6401,7 +4381,15 @@ def plot_dew_point_depression_and_wind(region='conus',
                      barb_color='black',
                      barb_zorder=7,
                      dd_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + wind.
@@ -6428,6 +4416,8 @@ def plot_dew_point_depression_and_wind(region='conus',
     
     An image of the RTMA Dew Point Depression + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -6471,16 +4461,15 @@ def plot_dew_point_depression_and_wind(region='conus',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_speed_var_key] = _calc.mps_to_mph(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_speed_var_key] = _calc.mph_to_kts(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
         
@@ -6494,233 +4483,13 @@ def plot_dew_point_depression_and_wind(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[dew_point_depression_var_key],
                 cmap=cmap,
@@ -6728,7 +4497,11 @@ def plot_dew_point_depression_and_wind(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -6737,20 +4510,20 @@ def plot_dew_point_depression_and_wind(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6759,7 +4532,7 @@ def plot_dew_point_depression_and_wind(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6768,7 +4541,7 @@ def plot_dew_point_depression_and_wind(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6786,27 +4559,16 @@ def plot_dew_point_depression_and_wind(region='conus',
         
     
         
-    dd_vals = _fix_var_array(ds,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
-    
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [dew_point_depression_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    ws_vals = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, dd_vals['longitude'], dd_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -6814,28 +4576,31 @@ def plot_dew_point_depression_and_wind(region='conus',
 
 
     stn.plot_parameter(dd_value_loc.upper(), 
-                       dd_vals[dew_point_depression_var_key], 
+                       vals[dew_point_depression_var_key], 
                        color=dew_point_depression_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(speed_value_loc.upper(), 
-                       ws_vals[wind_speed_var_key], 
+                       vals[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -6996,7 +4761,15 @@ def plot_dew_point_depression_and_gust(region='conus',
                      barb_color='black',
                      barb_zorder=7,
                      dd_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + gust.
@@ -7023,6 +4796,8 @@ def plot_dew_point_depression_and_gust(region='conus',
     
     An image of the RTMA Dew Point Depression + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -7066,24 +4841,19 @@ def plot_dew_point_depression_and_gust(region='conus',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_gust_var_key] = _calc.mps_to_mph(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_gust_var_key] = _calc.mph_to_kts(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    ds = _calc.u_v_components(ds,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -7095,233 +4865,13 @@ def plot_dew_point_depression_and_gust(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[dew_point_depression_var_key],
                 cmap=cmap,
@@ -7329,7 +4879,11 @@ def plot_dew_point_depression_and_gust(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -7338,20 +4892,20 @@ def plot_dew_point_depression_and_gust(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7360,7 +4914,7 @@ def plot_dew_point_depression_and_gust(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7369,7 +4923,7 @@ def plot_dew_point_depression_and_gust(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7387,27 +4941,17 @@ def plot_dew_point_depression_and_gust(region='conus',
         
     
         
-    dd_vals = _fix_var_array(ds,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [dew_point_depression_var_key, u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    wg_vals = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, dd_vals['longitude'], dd_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -7415,28 +4959,31 @@ def plot_dew_point_depression_and_gust(region='conus',
 
 
     stn.plot_parameter(dd_value_loc.upper(), 
-                       dd_vals[dew_point_depression_var_key], 
+                       vals[dew_point_depression_var_key], 
                        color=dew_point_depression_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(gust_value_loc.upper(), 
-                       wg_vals[wind_gust_var_key], 
+                       vals[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -7595,7 +5142,15 @@ def plot_dew_point_and_wind(region='conus',
                      barb_color='black',
                      barb_zorder=7,
                      dwpt_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + wind.
@@ -7622,6 +5177,8 @@ def plot_dew_point_and_wind(region='conus',
     
     An image of the RTMA Dew Point + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -7665,16 +5222,15 @@ def plot_dew_point_and_wind(region='conus',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_speed_var_key] = _calc.mps_to_mph(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_speed_var_key] = _calc.mph_to_kts(ds[wind_speed_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
         
@@ -7688,233 +5244,13 @@ def plot_dew_point_and_wind(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[dew_point_var_key],
                 cmap=cmap,
@@ -7922,7 +5258,11 @@ def plot_dew_point_and_wind(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -7931,20 +5271,20 @@ def plot_dew_point_and_wind(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7953,7 +5293,7 @@ def plot_dew_point_and_wind(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7962,7 +5302,7 @@ def plot_dew_point_and_wind(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7980,27 +5320,16 @@ def plot_dew_point_and_wind(region='conus',
         
     
         
-    dwpt_vals = _fix_var_array(ds,
-                    dew_point_var_key,
-                    0,
-                    decimate)
-    
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [dew_point_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    ws_vals = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, dwpt_vals['longitude'], dwpt_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -8008,28 +5337,31 @@ def plot_dew_point_and_wind(region='conus',
 
 
     stn.plot_parameter(dwpt_value_loc.upper(), 
-                       dwpt_vals[dew_point_var_key], 
+                       vals[dew_point_var_key], 
                        color=dew_point_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(speed_value_loc.upper(), 
-                       ws_vals[wind_speed_var_key], 
+                       vals[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -8190,7 +5522,15 @@ def plot_dew_point_and_gust(region='conus',
                      barb_color='black',
                      barb_zorder=7,
                      dwpt_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + gust.
@@ -8217,6 +5557,8 @@ def plot_dew_point_and_gust(region='conus',
     
     An image of the RTMA Dew Point + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -8260,24 +5602,19 @@ def plot_dew_point_and_gust(region='conus',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds[wind_gust_var_key] = _calc.mps_to_mph(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mps_to_mph(ds[u_var_key])
-            ds[v_var_key] = _calc.mps_to_mph(ds[v_var_key])
-        else:
-            ds[wind_gust_var_key] = _calc.mph_to_kts(ds[wind_gust_var_key])
-            ds[u_var_key] = _calc.mph_to_kts(ds[u_var_key])
-            ds[v_var_key] = _calc.mph_to_kts(ds[v_var_key])
-            
+        ds = _convert_units(ds, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    ds = _calc.u_v_components(ds,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -8289,233 +5626,13 @@ def plot_dew_point_and_gust(region='conus',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds[longitude_key],
                 ds[latitude_key],
                 ds[dew_point_var_key],
                 cmap=cmap,
@@ -8523,7 +5640,11 @@ def plot_dew_point_and_gust(region='conus',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -8532,20 +5653,20 @@ def plot_dew_point_and_gust(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8554,7 +5675,7 @@ def plot_dew_point_and_gust(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8563,7 +5684,7 @@ def plot_dew_point_and_gust(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8581,27 +5702,17 @@ def plot_dew_point_and_gust(region='conus',
         
     
         
-    dwpt_vals = _fix_var_array(ds,
-                    dew_point_var_key,
-                    0,
-                    decimate)
-    
-    u_vals = _fix_var_array(ds,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(ds,
+                    [dew_point_var_key, u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    v_vals = _fix_var_array(ds,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
     
-    wg_vals = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, dwpt_vals['longitude'], dwpt_vals['latitude'],
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -8609,29 +5720,111 @@ def plot_dew_point_and_gust(region='conus',
 
 
     stn.plot_parameter(dwpt_value_loc.upper(), 
-                       dwpt_vals[dew_point_var_key], 
+                       vals[dew_point_var_key], 
                        color=dew_point_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn.plot_parameter(gust_value_loc.upper(), 
-                       wg_vals[wind_gust_var_key], 
+                       vals[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn.plot_barb(u_vals[u_var_key], 
-                    v_vals[v_var_key],
+    stn.plot_barb(vals[u_var_key], 
+                    vals[v_var_key],
                     color=barb_color, 
                     length=barb_length, 
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
-        
\ No newline at end of file
+
+def render_suite(products=None,
+                 regions=None,
+                 reference_systems=['States & Counties'],
+                 ds=None,
+                 product_kwargs=None,
+                 notifications='off',
+                 workers=1,
+                 **kwargs):
+    
+    """
+    This function renders a suite of RTMA CONUS graphics (products x regions x reference systems) in one call.
+    
+    The data is downloaded and decoded once and the cartographic reference layers are loaded once for the whole suite.
+    
+    Required Arguments: None
+    
+    Optional Arguments:
+    
+    1) products (List or None) - Default=None. The products to render. The product names are the plot function names 
+        without 'plot_' (i.e. ['temperature', 'relative_humidity_and_wind']). When None, all 14 products are rendered.
+        
+    2) regions (List or None) - Default=None. The regions to render (i.e. ['ca', 'oscc', 'nv']). When None, the default region is used.
+    
+    3) reference_systems (List or dict) - Default=['States & Counties']. The reference systems to render.
+        
+        Built-in reference systems
+        --------------------------
+        
+        1) 'States & Counties'
+        2) 'States Only'
+        3) 'GACC Boundaries'
+        4) 'Predictive Services Areas'
+        5) 'NWS CWA'
+        6) 'NWS Public Zones'
+        7) 'NWS Fire Weather Zones'
+        8) 'CalFire Boundaries'
+        
+        Custom reference systems are passed as a dictionary of {name: {'show_states':True, 'show_counties':False, ...}}.
+    
+    4) ds (xarray.array or None) - Default=None. The RTMA dataset passed into every plot function.
+        When None, the data is downloaded and decoded once and shared by every graphic.
+    
+    5) product_kwargs (dict or None) - Default=None. Keyword arguments that only apply to some products
+        (i.e. {'temperature':{'decimate':100}}).
+    
+    6) notifications (String) - Default='off'. When set to 'on', the time of each graphic is printed.
+    
+    7) workers (Integer or None) - Default=1. The number of processes the graphics are spread over. When None, one process per CPU is used.
+        When workers > 1, the data is downloaded and decoded once in this process and shared with the workers through memory-mapped files.
+        On Windows/macOS, call this function under if __name__ == '__main__':.
+    
+    8) **kwargs - Keyword arguments passed into every plot function that accepts them (i.e. figure_x_length, proxies, decimate).
+    
+    Returns
+    -------
+    
+    A list of dictionaries (one per graphic) with the product, region, reference_system, seconds, error and worker keys.
+    The error is None when the graphic was saved.   
+    """
+    
+    if workers != 1 and ds is None:
+        ds = _rtma(proxies=kwargs.get('proxies', None),
+                   clear_recycle_bin=kwargs.get('clear_recycle_bin', False),
+                   clear_data=kwargs.get('clear_data', True),
+                   convert_temperature=False,
+                   chunk_size=kwargs.get('chunk_size', 8192),
+                   notifications=notifications,
+                   custom_directory=kwargs.get('custom_data_directory', None))
+        ds = _convert_temperature_fields(ds, dataset_units)
+        
+    return _render_suite(_sys.modules[__name__],
+                         products=products,
+                         regions=regions,
+                         reference_systems=reference_systems,
+                         datasets={'ds':ds},
+                         product_kwargs=product_kwargs,
+                         notifications=notifications,
+                         workers=workers,
+                         **kwargs)
@@ -21,7 +21,9 @@ Arguments and Settings
         If the user wants a completely custom region where they define their own lat/lon bounds, set region='custom'. 
         
 - hours (Integer) - Default=24. The amount of hours between the current and comparison. Defaults to a 24 hour
-        comparison. 
+        comparison. The comparison analysis is read from the local RTMA archive (FireWxPy Cache/RTMA Archive) when it was
+        archived by an earlier run so only the current analysis is downloaded. Otherwise the comparison analysis is downloaded
+        on its own and archived (see firewxpy.utils.set_rtma_archive_policy()).
         
 - show_states (Boolean) - Default=True. When set to True, U.S. state borders are shown. 
     
@@ -168,8 +170,9 @@ Arguments and Settings
         of the geometries in the custom geojson.
         
 - refresh_cartographic_files (Boolean) - Default=True. Users that have automated pipelines set up for shapefiles. Having this set to
-        True allows the client to delete and re-download the shapefiles with each run of the script. This is useful for shapefiles
-        that have frequent geometry updates.
+        True re-validates the shapefiles with the server (ETag/Last-Modified) once the freshness window expires and only deletes and 
+        re-downloads the shapefiles when they changed on the server. The freshness window (default 24 hours) is shared across all calls 
+        and processes and is set with firewxpy.utils.set_refresh_policy(ttl=seconds). When set to False, the shapefiles are only downloaded once.
         
 - reference_system (String) - Default='States & Counties'. The name of the borders overlaid onto the map.
     
@@ -312,7 +315,8 @@ Arguments and Settings
         
 - ds2 (xarray.array or None) - Default=None. If the user is downloading, processing and plotting the data within the function,
         keep this set as None. If the user wishes to create a medley of plots it is recommended to download the data outside of this
-        function and pass in the data by setting ds2=ds2. This is the comparison dataset.  
+        function and pass in the data by setting ds2=ds2. This is the comparison dataset. The differences (ds1 - ds2) are computed
+        once per pair of datasets and variable and reused by every product and region (see firewxpy.utils.comparison_difference()).
             
 - western_bound (Float or Integer) - Default=-125. When region is set to 'custom' the user defines the bounds of the plot in 
         latitude and longitude coordinates.
@@ -474,47 +478,111 @@ Arguments and Settings
 
 - wind_gust_pixel_query_value_fontcolor (String) - Default='purple'. The font color of the wind gust pixel query values.
 
+- crop_to_region (Boolean) - Default=True. When set to True, the data is cropped to the region plus a small halo before it is contoured
+        and before the pixel query values are built. This significantly speeds up plots of smaller regions (i.e. States or GACCs).
+        Set to False to contour the full grid.
+
+- pixel_query_spacing (Integer, Float or None) - Default=None. When set to a number of pixels, the pixel queries are thinned on the screen
+        so the values/barbs keep this minimum spacing regardless of the map projection and region. This keeps the number of 
+        station plot values predictable and speeds up drawing. decimate then only selects the candidate grid points 
+        (i.e. decimate=1 makes every grid point a candidate). The selected points are cached for each grid, region and figure size.
+        When None, the pixel queries are only thinned by decimate.
+
+- reuse_base_map (Boolean) - Default=True. When set to True, the scaffold of the map (the figure, the extent, the coastlines/land/ocean/lakes
+        and the reference layers) is built once for each region, projection, figure size and reference layer style and is reused by every later
+        plot with the same settings. Only the contours, colorbar, titles and station plot are drawn for each product.
+        The templates are not pyplot figures, so they are never shown (i.e. in a notebook) or left open in pyplot.
+        Set to False to build a new figure for every plot.
+
+- rasterize_base_map (Boolean) - Default=False. When set to True (with reuse_base_map=True), the land/ocean/lakes fills and the reference
+        layers are rendered once to a raster for each region, projection, figure size, dpi and style and drawn as images in
+        the layering of the vector map (i.e. the fills below the weather field and the borders above it). Only the weather field and the annotations stay vector,
+        which greatly reduces the time to save graphics with dense borders (i.e. counties or zones).
+
+- render_mode (String) - Default='contourf'. How the weather field is drawn.
+    
+        Render modes
+        ------------
+        
+        1) 'contourf' - Filled contours.
+        
+        2) 'pcolormesh' - Each grid cell is colored with the discrete colors of the contour levels (BoundaryNorm).
+            Much faster than contourf on the full resolution grid.
+        
+        3) 'imshow' - The grid is resampled onto the pixels of the map and drawn as one image with the discrete colors of the
+            contour levels (BoundaryNorm). The fastest mode. The pixel lookup is cached for each grid, region and figure size.
+
+- coarsen_quality (Integer, Float or None) - Default=None. When set, the weather field is coarsened to the resolution the figure
+        is able to display before it is drawn. The number of grid cells per pixel is computed from the extent, the figure size and the dpi and
+        the field is reduced so about coarsen_quality grid cells remain per pixel (i.e. 1 for one grid cell per pixel, 2 keeps twice the detail).
+        This makes national plots much cheaper with little visible change. The pixel query values are always taken from the full resolution data.
+        When None, the full grid is drawn.
+    
+- coarsen_method (String) - Default='mean'. How the field is coarsened. 'mean' (NaN-aware block averages) or 'stride' (every n-th grid point).
+
+- contour_cache (Boolean) - Default=False. When set to True, the filled contours of the weather field are computed once on the full grid
+        and cached (keyed by the content of the field, the grid and the contour levels). Every later plot of the same field for another
+        region reuses the cached polygons and only draws the ones that overlap its map. This is the fastest way to contour the same field
+        for many regions. The data is not cropped to the region and the field is not coarsened when contour_cache=True.
+
 """
 
+import sys as _sys
 import warnings as _warnings
 _warnings.filterwarnings('ignore')
 import matplotlib as _mpl 
 import firewxpy.calc.calc as _calc
-import matplotlib.pyplot as _plt 
 import matplotlib.colors as _mcolors
 import cartopy.crs as _ccrs 
-import cartopy.feature as _cfeature 
 import metpy.plots as _mpplots
 import numpy as _np
 import pandas as _pd
 
 from dateutil import tz as _tz
 from matplotlib.patheffects import withStroke as _withStroke
-from firewxpy.utils.station_plot_formatting import fix_var_array as _fix_var_array
+from firewxpy.utils.station_plot_formatting import(
+    extract_pixel_queries as _extract_pixel_queries,
+    thin_pixel_queries as _thin_pixel_queries
+)
 from firewxpy.utils.directory import build_directory_branch as _build_directory_branch
 from firewxpy.utils.plot_coords import bounding_box as _bounding_box
+from firewxpy.rtma.suite import render_suite as _render_suite
+from firewxpy.utils.grid_subset import subset_to_region as _subset_to_region
+from firewxpy.utils.field_rendering import render_field as _render_field
+from firewxpy.utils.base_map import(
+    open_base_map as _open_base_map,
+    build_base_map as _build_base_map,
+    store_base_map as _store_base_map,
+    close_base_map as _close_base_map,
+    rasterize_base_map as _rasterize_base_map
+)
 from firewxpy.calc.calc import(
-    kelvin_to_fahrenheit as _kelvin_to_fahrenheit, 
-    celsius_to_fahrenheit as _celsius_to_fahrenheit,
-    kelvin_to_celsius as _kelvin_to_celsius
+    convert_units as _convert_units,
+    convert_temperature_fields as _convert_temperature_fields
 )
 from firewxpy.utils.standard import(
     get_timezone_abbreviation as _get_timezone_abbreviation,
     plot_creation_time as _plot_creation_time
 )
-from firewxpy.utils.geometry import(
-    import_shapefile_from_web as _import_shapefile_from_web,
-    import_shapefile_local as _import_shapefile_local,
-    import_geojson_from_web as _import_geojson_from_web,
-    import_geojson_local as _import_geojson_local,
-    get_filename_from_url as _get_filename_from_url
+from firewxpy.utils.dataset_cache import cached_dataset as _cached_dataset
+from firewxpy.utils.rtma_archive import archived_comparison as _archived_comparison
+from firewxpy.rtma.fetch import fetch_analysis as _fetch_analysis
+from firewxpy.utils.comparison_cache import comparison_difference as _comparison_difference
+from wxdata import(
+    rtma as _wxdata_rtma,
+    rtma_comparison as _wxdata_rtma_comparison
 )
-from wxdata import rtma_comparison as _rtma_comparison
 
-_local, _utc = _plot_creation_time()
-_timezone = _get_timezone_abbreviation()
+_rtma = _cached_dataset(_wxdata_rtma)
+_rtma_comparison = _cached_dataset(_archived_comparison(_wxdata_rtma_comparison, _rtma, _fetch_analysis))
+
 _from_zone = _tz.tzutc()
 _to_zone = _tz.tzlocal()
+
+# The temperature units of a dataset that is shared by every graphic of a suite (see render_suite() and the RTMA watcher).
+# The products that combine a temperature with the wind plot the dataset as it is, so it is converted once before it is shared.
+dataset_units = 'fahrenheit'
+
 _mpl.rcParams['font.weight'] = 'bold'
 
 def plot_temperature(region='conus',
@@ -661,7 +729,15 @@ def plot_temperature(region='conus',
                      time_coord_key='time',
                      longitude_key='longitude',
                      latitude_key='latitude',
-                     hours=24):
+                     hours=24,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) Comparison for temperature.
@@ -688,6 +764,8 @@ def plot_temperature(region='conus',
     
     An image of the RTMA Temperature Comparison Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -733,17 +811,27 @@ def plot_temperature(region='conus',
         ds1 = ds1
         ds2 = ds2
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _kelvin_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_fahrenheit(ds2[var_key])
-                else:
-                    ds1[var_key] = _kelvin_to_celsius(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_celsius(ds2[var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _celsius_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _celsius_to_fahrenheit(ds2[var_key])
+            ds1 = _convert_units(ds1, [var_key], convert_to, from_units=convert_from)
+            ds2 = _convert_units(ds2, [var_key], convert_to, from_units=convert_from)
+        
+    diff = _comparison_difference(ds1, ds2, [var_key], time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature change", colors)
@@ -760,241 +848,25 @@ def plot_temperature(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[var_key] - ds2[var_key]),
+                diff[var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -1003,20 +875,20 @@ def plot_temperature(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -1025,7 +897,7 @@ def plot_temperature(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1034,7 +906,7 @@ def plot_temperature(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1051,17 +923,16 @@ def plot_temperature(region='conus',
             zorder=reference_system_textbox_zorder)
         
     
-    vals1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    vals2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, vals1['longitude'], vals1['latitude'],
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -1069,15 +940,18 @@ def plot_temperature(region='conus',
 
 
     stn.plot_parameter('C', 
-                       (vals1[var_key] - vals2[var_key]), 
+                       vals[var_key], 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
   
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1228,7 +1102,15 @@ def plot_dew_point(region='conus',
                      time_coord_key='time',
                      longitude_key='longitude',
                      latitude_key='latitude',
-                     hours=24):
+                     hours=24,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) Comparison for dew point.
@@ -1255,6 +1137,8 @@ def plot_dew_point(region='conus',
     
     An image of the RTMA Dew Point Comparison Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1300,17 +1184,27 @@ def plot_dew_point(region='conus',
         ds1 = ds1
         ds2 = ds2
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _kelvin_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_fahrenheit(ds2[var_key])
-                else:
-                    ds1[var_key] = _kelvin_to_celsius(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_celsius(ds2[var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _celsius_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _celsius_to_fahrenheit(ds2[var_key])
+            ds1 = _convert_units(ds1, [var_key], convert_to, from_units=convert_from)
+            ds2 = _convert_units(ds2, [var_key], convert_to, from_units=convert_from)
+        
+    diff = _comparison_difference(ds1, ds2, [var_key], time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point change", colors)
@@ -1327,241 +1221,25 @@ def plot_dew_point(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[var_key] - ds2[var_key]),
+                diff[var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -1570,20 +1248,20 @@ def plot_dew_point(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -1592,7 +1270,7 @@ def plot_dew_point(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1601,7 +1279,7 @@ def plot_dew_point(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1617,17 +1295,16 @@ def plot_dew_point(region='conus',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    vals1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    vals2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, vals1['longitude'], vals1['latitude'],
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -1635,14 +1312,17 @@ def plot_dew_point(region='conus',
 
 
     stn.plot_parameter('C', 
-                       (vals1[var_key] - vals2[var_key]), 
+                       vals[var_key], 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1792,7 +1472,15 @@ def plot_dew_point_depression(region='conus',
                      time_coord_key='time',
                      longitude_key='longitude',
                      latitude_key='latitude',
-                     hours=24):
+                     hours=24,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) Comparison for dew point depression.
@@ -1819,6 +1507,8 @@ def plot_dew_point_depression(region='conus',
     
     An image of the RTMA Dew Point Depression Comparison Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1864,17 +1554,27 @@ def plot_dew_point_depression(region='conus',
         ds1 = ds1
         ds2 = ds2
         if convert_temperature is True:
-            if convert_from == 'kelvin':
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _kelvin_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_fahrenheit(ds2[var_key])
-                else:
-                    ds1[var_key] = _kelvin_to_celsius(ds1[var_key])
-                    ds2[var_key] = _kelvin_to_celsius(ds2[var_key])
-            else:
-                if convert_to == 'fahrenheit':
-                    ds1[var_key] = _celsius_to_fahrenheit(ds1[var_key])
-                    ds2[var_key] = _celsius_to_fahrenheit(ds2[var_key])
+            ds1 = _convert_units(ds1, [var_key], convert_to, from_units=convert_from, difference=True)
+            ds2 = _convert_units(ds2, [var_key], convert_to, from_units=convert_from, difference=True)
+        
+    diff = _comparison_difference(ds1, ds2, [var_key], time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression change", colors)
@@ -1891,241 +1591,25 @@ def plot_dew_point_depression(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[var_key] - ds2[var_key]),
+                diff[var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2134,20 +1618,20 @@ def plot_dew_point_depression(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2156,7 +1640,7 @@ def plot_dew_point_depression(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2165,7 +1649,7 @@ def plot_dew_point_depression(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2181,17 +1665,16 @@ def plot_dew_point_depression(region='conus',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    vals1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    vals2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, vals1['longitude'], vals1['latitude'],
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -2199,14 +1682,17 @@ def plot_dew_point_depression(region='conus',
 
 
     stn.plot_parameter('C', 
-                       (vals1[var_key] - vals2[var_key]), 
+                       vals[var_key], 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2355,7 +1841,15 @@ def plot_relative_humidity(region='conus',
                      time_coord_key='time',
                      longitude_key='longitude',
                      latitude_key='latitude',
-                     hours=24):
+                     hours=24,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) Comparison for relative humidity.
@@ -2382,6 +1876,8 @@ def plot_relative_humidity(region='conus',
     
     An image of the RTMA Relative Humidity Comparison Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -2427,6 +1923,25 @@ def plot_relative_humidity(region='conus',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1, ds2, [var_key], time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity change", colors)
     else:
@@ -2442,241 +1957,25 @@ def plot_relative_humidity(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[var_key] - ds2[var_key]),
+                diff[var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2685,20 +1984,20 @@ def plot_relative_humidity(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2707,7 +2006,7 @@ def plot_relative_humidity(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2716,7 +2015,7 @@ def plot_relative_humidity(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2733,17 +2032,16 @@ def plot_relative_humidity(region='conus',
             zorder=reference_system_textbox_zorder)
         
         
-    vals1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    vals = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    vals2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
-
-    stn = _mpplots.StationPlot(ax, vals1['longitude'], vals1['latitude'],
+    if pixel_query_spacing is not None:
+        vals = _thin_pixel_queries(ax, vals, pixel_query_spacing, datacrs)
+    
+    stn = _mpplots.StationPlot(ax, vals['longitude'], vals['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -2751,15 +2049,18 @@ def plot_relative_humidity(region='conus',
 
 
     stn.plot_parameter('C', 
-                       (vals1[var_key] - vals2[var_key]), 
+                       vals[var_key], 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2921,7 +2222,15 @@ def plot_wind_speed(region='conus',
                     barb_legend_fontsize=7,
                     barb_legend_x_position=0.825,
                     barb_legend_y_position=0,
-                    barb_legend_zorder=10):
+                    barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) Comparison for sustained wind speed.
@@ -2948,6 +2257,8 @@ def plot_wind_speed(region='conus',
     
     An image of the RTMA Wind Speed Comparison Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -2993,22 +2304,33 @@ def plot_wind_speed(region='conus',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [var_key],
+                                  to_units=convert_to if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[var_key] = _calc.mps_to_mph(ds1[var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[var_key] = _calc.mps_to_mph(ds2[var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[var_key] = _calc.mph_to_kts(ds1[var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[var_key] = _calc.mph_to_kts(ds2[var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [var_key, u_var_key, v_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
         
@@ -3027,241 +2349,25 @@ def plot_wind_speed(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[var_key] - ds2[var_key]),
+                diff[var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -3270,16 +2376,16 @@ def plot_wind_speed(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3287,7 +2393,7 @@ def plot_wind_speed(region='conus',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3296,7 +2402,7 @@ def plot_wind_speed(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3305,7 +2411,7 @@ def plot_wind_speed(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3321,35 +2427,32 @@ def plot_wind_speed(region='conus',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    vals1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    vals2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    u_vals1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals1 = _thin_pixel_queries(ax, vals1, pixel_query_spacing, datacrs)
     
-    u_vals2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals2 = _thin_pixel_queries(ax, vals2, pixel_query_spacing, datacrs)
     
     if pixel_query_type != 'barbs':
         stn = _mpplots.StationPlot(ax, vals1['longitude'], vals1['latitude'],
@@ -3359,7 +2462,7 @@ def plot_wind_speed(region='conus',
                                 clip_on=True)
 
         stn.plot_parameter('C', 
-                            (vals1[var_key] - vals2[var_key]), 
+                            diffs[var_key], 
                             color=pixel_query_value_fontcolor, 
                             path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                         foreground=pixel_query_value_foreground)], 
@@ -3380,16 +2483,16 @@ def plot_wind_speed(region='conus',
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
         
-        stn1.plot_barb(u_vals1[u_var_key], 
-                        v_vals1[v_var_key],
+        stn1.plot_barb(vals1[u_var_key], 
+                        vals1[v_var_key],
                         color=current_barb_color, 
                         length=current_barb_length, 
                         linewidth=current_barb_width,
                         zorder=current_barb_zorder,
                         label=label1)
         
-        stn2.plot_barb(u_vals2[u_var_key], 
-                        v_vals2[v_var_key],
+        stn2.plot_barb(vals2[u_var_key], 
+                        vals2[v_var_key],
                         color=comparison_barb_color, 
                         length=comparison_barb_length, 
                         linewidth=comparison_barb_width,
@@ -3399,8 +2502,11 @@ def plot_wind_speed(region='conus',
         leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
         leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -3563,7 +2669,15 @@ def plot_wind_gust(region='conus',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) Comparison for wind gust.
@@ -3590,6 +2704,8 @@ def plot_wind_gust(region='conus',
     
     An image of the RTMA Wind Gust Comparison Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -3635,36 +2751,37 @@ def plot_wind_gust(region='conus',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [var_key],
+                                  to_units=convert_to if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[var_key] = _calc.mps_to_mph(ds1[var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[var_key] = _calc.mps_to_mph(ds2[var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[var_key] = _calc.mph_to_kts(ds1[var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[var_key] = _calc.mph_to_kts(ds2[var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [var_key], convert_to, from_units='mps')
     else:
         pass
     
-    ds1 = _calc.u_v_components(ds1,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            var_key)
-    
-    ds2 = _calc.u_v_components(ds2,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("wind gust change", colors)
@@ -3681,241 +2798,25 @@ def plot_wind_gust(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[var_key] - ds2[var_key]),
+                diff[var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -3924,16 +2825,16 @@ def plot_wind_gust(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3941,7 +2842,7 @@ def plot_wind_gust(region='conus',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3950,7 +2851,7 @@ def plot_wind_gust(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3959,7 +2860,7 @@ def plot_wind_gust(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3975,35 +2876,34 @@ def plot_wind_gust(region='conus',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    vals1 = _fix_var_array(ds1,
-                    var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    vals2 = _fix_var_array(ds2,
-                    var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    u_vals1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals1 = _extract_pixel_queries(ds1,
+                    [var_key, u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    v_vals1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals1 = _thin_pixel_queries(ax, vals1, pixel_query_spacing, datacrs)
     
-    u_vals2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals2 = _extract_pixel_queries(ds2,
+                    [var_key, u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    v_vals2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals2 = _thin_pixel_queries(ax, vals2, pixel_query_spacing, datacrs)
     
     if pixel_query_type != 'barbs':
         stn = _mpplots.StationPlot(ax, vals1['longitude'], vals1['latitude'],
@@ -4013,7 +2913,7 @@ def plot_wind_gust(region='conus',
                                 clip_on=True)
 
         stn.plot_parameter('C', 
-                            (vals1[var_key] - vals2[var_key]), 
+                            diffs[var_key], 
                             color=pixel_query_value_fontcolor, 
                             path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                         foreground=pixel_query_value_foreground)], 
@@ -4034,16 +2934,16 @@ def plot_wind_gust(region='conus',
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
         
-        stn1.plot_barb(u_vals1[u_var_key], 
-                        v_vals1[v_var_key],
+        stn1.plot_barb(vals1[u_var_key], 
+                        vals1[v_var_key],
                         color=current_barb_color, 
                         length=current_barb_length, 
                         linewidth=current_barb_width,
                         zorder=current_barb_zorder,
                         label=label1)
         
-        stn2.plot_barb(u_vals2[u_var_key], 
-                        v_vals2[v_var_key],
+        stn2.plot_barb(vals2[u_var_key], 
+                        vals2[v_var_key],
                         color=comparison_barb_color, 
                         length=comparison_barb_length, 
                         linewidth=comparison_barb_width,
@@ -4053,8 +2953,11 @@ def plot_wind_gust(region='conus',
         leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
         leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4220,7 +3123,15 @@ def plot_temperature_and_wind(region='conus',
                     barb_legend_fontsize=7,
                     barb_legend_x_position=0.825,
                     barb_legend_y_position=0,
-                    barb_legend_zorder=10):
+                    barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) Comparison for temperature + wind.
@@ -4247,6 +3158,8 @@ def plot_temperature_and_wind(region='conus',
     
     An image of the RTMA Comparison Temperature + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -4292,22 +3205,33 @@ def plot_temperature_and_wind(region='conus',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [temperature_var_key, wind_speed_var_key],
+                                  to_units={wind_speed_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_speed_var_key] = _calc.mps_to_mph(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mps_to_mph(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_speed_var_key] = _calc.mph_to_kts(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mph_to_kts(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
         
@@ -4326,241 +3250,25 @@ def plot_temperature_and_wind(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[temperature_var_key] - ds2[temperature_var_key]),
+                diff[temperature_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -4569,16 +3277,16 @@ def plot_temperature_and_wind(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4586,7 +3294,7 @@ def plot_temperature_and_wind(region='conus',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4595,7 +3303,7 @@ def plot_temperature_and_wind(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4604,7 +3312,7 @@ def plot_temperature_and_wind(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4620,53 +3328,40 @@ def plot_temperature_and_wind(region='conus',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    temp_vals1 = _fix_var_array(ds1,
-                    temperature_var_key,
-                    0,
-                    decimate)
-    
-    u_vals1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
-    
-    v_vals1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    ws_vals1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-    
-    temp_vals2 = _fix_var_array(ds2,
-                    temperature_var_key,
-                    0,
-                    decimate)
-    
-    u_vals2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
-    
-    v_vals2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    ws_vals2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, temp_vals1['longitude'], temp_vals1['latitude'],
+    diffs = _extract_pixel_queries(diff,
+                    [temperature_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
+    
+    vals1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        vals1 = _thin_pixel_queries(ax, vals1, pixel_query_spacing, datacrs)
+    
+    vals2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        vals2 = _thin_pixel_queries(ax, vals2, pixel_query_spacing, datacrs)
+    
+    stn1 = _mpplots.StationPlot(ax, vals1['longitude'], vals1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, temp_vals2['longitude'], temp_vals2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals2['longitude'], vals2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -4674,29 +3369,29 @@ def plot_temperature_and_wind(region='conus',
 
 
     stn1.plot_parameter(temp_value_loc.upper(), 
-                       (temp_vals1[temperature_var_key] - temp_vals2[temperature_var_key]), 
+                       diffs[temperature_var_key], 
                        color=temperature_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (ws_vals1[wind_speed_var_key] - ws_vals2[wind_speed_var_key]), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals1[u_var_key], 
-                    v_vals1[v_var_key],
+    stn1.plot_barb(vals1[u_var_key], 
+                    vals1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals2[u_var_key], 
-                    v_vals2[v_var_key],
+    stn2.plot_barb(vals2[u_var_key], 
+                    vals2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -4706,8 +3401,11 @@ def plot_temperature_and_wind(region='conus',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4874,7 +3572,15 @@ def plot_temperature_and_gust(region='conus',
                     barb_legend_fontsize=7,
                     barb_legend_x_position=0.825,
                     barb_legend_y_position=0,
-                    barb_legend_zorder=10):
+                    barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature + gust.
@@ -4901,6 +3607,8 @@ def plot_temperature_and_gust(region='conus',
     
     An image of the RTMA Temperature + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -4946,36 +3654,37 @@ def plot_temperature_and_gust(region='conus',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [temperature_var_key, wind_gust_var_key],
+                                  to_units={wind_gust_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_gust_var_key] = _calc.mps_to_mph(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mps_to_mph(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_gust_var_key] = _calc.mph_to_kts(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mph_to_kts(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_gust_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    ds1 = _calc.u_v_components(ds1,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
-    
-    ds2 = _calc.u_v_components(ds2,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature change", colors)
@@ -4992,241 +3701,25 @@ def plot_temperature_and_gust(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[temperature_var_key] - ds2[temperature_var_key]),
+                diff[temperature_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -5235,16 +3728,16 @@ def plot_temperature_and_gust(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5252,7 +3745,7 @@ def plot_temperature_and_gust(region='conus',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5261,7 +3754,7 @@ def plot_temperature_and_gust(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5270,7 +3763,7 @@ def plot_temperature_and_gust(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5286,53 +3779,42 @@ def plot_temperature_and_gust(region='conus',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    temp_vals1 = _fix_var_array(ds1,
-                    temperature_var_key,
-                    0,
-                    decimate)
-    
-    u_vals1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
-    
-    v_vals1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    wg_vals1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-    
-    temp_vals2 = _fix_var_array(ds2,
-                    temperature_var_key,
-                    0,
-                    decimate)
-    
-    u_vals2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
-    
-    v_vals2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    wg_vals2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, temp_vals1['longitude'], temp_vals1['latitude'],
+    diffs = _extract_pixel_queries(diff,
+                    [temperature_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
+    
+    vals1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
+    
+    if pixel_query_spacing is not None:
+        vals1 = _thin_pixel_queries(ax, vals1, pixel_query_spacing, datacrs)
+    
+    vals2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
+    
+    if pixel_query_spacing is not None:
+        vals2 = _thin_pixel_queries(ax, vals2, pixel_query_spacing, datacrs)
+    
+    stn1 = _mpplots.StationPlot(ax, vals1['longitude'], vals1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, temp_vals2['longitude'], temp_vals2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals2['longitude'], vals2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -5340,29 +3822,29 @@ def plot_temperature_and_gust(region='conus',
 
 
     stn1.plot_parameter(temp_value_loc.upper(), 
-                       (temp_vals1[temperature_var_key] - temp_vals2[temperature_var_key]), 
+                       diffs[temperature_var_key], 
                        color=temperature_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (wg_vals1[wind_gust_var_key] - wg_vals2[wind_gust_var_key]), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals1[u_var_key], 
-                    v_vals1[v_var_key],
+    stn1.plot_barb(vals1[u_var_key], 
+                    vals1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals2[u_var_key], 
-                    v_vals2[v_var_key],
+    stn2.plot_barb(vals2[u_var_key], 
+                    vals2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -5372,8 +3854,11 @@ def plot_temperature_and_gust(region='conus',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -5540,7 +4025,15 @@ def plot_relative_humidity_and_wind(region='conus',
                     barb_legend_fontsize=7,
                     barb_legend_x_position=0.825,
                     barb_legend_y_position=0,
-                    barb_legend_zorder=10):
+                    barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative humidity + wind.
@@ -5567,6 +4060,8 @@ def plot_relative_humidity_and_wind(region='conus',
     
     An image of the RTMA Relative Humidity + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -5612,22 +4107,33 @@ def plot_relative_humidity_and_wind(region='conus',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [relative_humidity_var_key, wind_speed_var_key],
+                                  to_units={wind_speed_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_speed_var_key] = _calc.mps_to_mph(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mps_to_mph(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_speed_var_key] = _calc.mph_to_kts(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mph_to_kts(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
         
@@ -5646,241 +4152,25 @@ def plot_relative_humidity_and_wind(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[relative_humidity_var_key] - ds2[relative_humidity_var_key]),
+                diff[relative_humidity_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -5889,16 +4179,16 @@ def plot_relative_humidity_and_wind(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5906,7 +4196,7 @@ def plot_relative_humidity_and_wind(region='conus',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5915,7 +4205,7 @@ def plot_relative_humidity_and_wind(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5924,7 +4214,7 @@ def plot_relative_humidity_and_wind(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5942,53 +4232,40 @@ def plot_relative_humidity_and_wind(region='conus',
         
     
         
-    rh_vals1 = _fix_var_array(ds1,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
-    
-    u_vals1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [relative_humidity_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    ws_vals1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
+    vals1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    rh_vals2 = _fix_var_array(ds2,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals1 = _thin_pixel_queries(ax, vals1, pixel_query_spacing, datacrs)
     
-    u_vals2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals2 = _thin_pixel_queries(ax, vals2, pixel_query_spacing, datacrs)
     
-    ws_vals2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, rh_vals1['longitude'], rh_vals1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals1['longitude'], vals1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, rh_vals2['longitude'], rh_vals2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals2['longitude'], vals2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -5996,29 +4273,29 @@ def plot_relative_humidity_and_wind(region='conus',
 
 
     stn1.plot_parameter(rh_value_loc.upper(), 
-                       (rh_vals1[relative_humidity_var_key] - rh_vals2[relative_humidity_var_key]), 
+                       diffs[relative_humidity_var_key], 
                        color=relative_humidity_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (ws_vals1[wind_speed_var_key] - ws_vals2[wind_speed_var_key]), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals1[u_var_key], 
-                    v_vals1[v_var_key],
+    stn1.plot_barb(vals1[u_var_key], 
+                    vals1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals2[u_var_key], 
-                    v_vals2[v_var_key],
+    stn2.plot_barb(vals2[u_var_key], 
+                    vals2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -6028,8 +4305,11 @@ def plot_relative_humidity_and_wind(region='conus',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -6200,7 +4480,15 @@ def plot_relative_humidity_and_gust(region='conus',
                     barb_legend_fontsize=7,
                     barb_legend_x_position=0.825,
                     barb_legend_y_position=0,
-                    barb_legend_zorder=10):
+                    barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative_humidity + gust.
@@ -6227,6 +4515,8 @@ def plot_relative_humidity_and_gust(region='conus',
     
     An image of the RTMA Relative Humidity + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -6272,36 +4562,37 @@ def plot_relative_humidity_and_gust(region='conus',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [relative_humidity_var_key, wind_gust_var_key],
+                                  to_units={wind_gust_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_gust_var_key] = _calc.mps_to_mph(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mps_to_mph(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_gust_var_key] = _calc.mph_to_kts(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mph_to_kts(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_gust_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    ds1 = _calc.u_v_components(ds1,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
-    
-    ds2 = _calc.u_v_components(ds2,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity change", colors)
@@ -6318,241 +4609,25 @@ def plot_relative_humidity_and_gust(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[relative_humidity_var_key] - ds2[relative_humidity_var_key]),
+                diff[relative_humidity_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -6561,16 +4636,16 @@ def plot_relative_humidity_and_gust(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6578,7 +4653,7 @@ def plot_relative_humidity_and_gust(region='conus',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6587,7 +4662,7 @@ def plot_relative_humidity_and_gust(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6596,7 +4671,7 @@ def plot_relative_humidity_and_gust(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6614,53 +4689,42 @@ def plot_relative_humidity_and_gust(region='conus',
         
     
         
-    rh_vals1 = _fix_var_array(ds1,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [relative_humidity_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    v_vals1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    vals1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    wg_vals1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals1 = _thin_pixel_queries(ax, vals1, pixel_query_spacing, datacrs)
     
-    rh_vals2 = _fix_var_array(ds2,
-                    relative_humidity_var_key,
-                    0,
-                    decimate)
+    vals2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    u_vals2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals2 = _thin_pixel_queries(ax, vals2, pixel_query_spacing, datacrs)
     
-    v_vals2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    wg_vals2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, rh_vals1['longitude'], rh_vals1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals1['longitude'], vals1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, rh_vals2['longitude'], rh_vals2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals2['longitude'], vals2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -6668,29 +4732,29 @@ def plot_relative_humidity_and_gust(region='conus',
 
 
     stn1.plot_parameter(rh_value_loc.upper(), 
-                       (rh_vals1[relative_humidity_var_key] - rh_vals2[relative_humidity_var_key]), 
+                       diffs[relative_humidity_var_key], 
                        color=relative_humidity_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (wg_vals1[wind_gust_var_key] - wg_vals2[wind_gust_var_key]), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals1[u_var_key], 
-                    v_vals1[v_var_key],
+    stn1.plot_barb(vals1[u_var_key], 
+                    vals1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals2[u_var_key], 
-                    v_vals2[v_var_key],
+    stn2.plot_barb(vals2[u_var_key], 
+                    vals2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -6700,8 +4764,11 @@ def plot_relative_humidity_and_gust(region='conus',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -6870,7 +4937,15 @@ def plot_dew_point_depression_and_wind(region='conus',
                     barb_legend_fontsize=7,
                     barb_legend_x_position=0.825,
                     barb_legend_y_position=0,
-                    barb_legend_zorder=10):
+                    barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + wind.
@@ -6897,6 +4972,8 @@ def plot_dew_point_depression_and_wind(region='conus',
     
     An image of the RTMA Dew Point Depression + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -6942,22 +5019,33 @@ def plot_dew_point_depression_and_wind(region='conus',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [dew_point_depression_var_key, wind_speed_var_key],
+                                  to_units={wind_speed_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_speed_var_key] = _calc.mps_to_mph(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mps_to_mph(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_speed_var_key] = _calc.mph_to_kts(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mph_to_kts(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
         
@@ -6976,241 +5064,25 @@ def plot_dew_point_depression_and_wind(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[dew_point_depression_var_key] - ds2[dew_point_depression_var_key]),
+                diff[dew_point_depression_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -7219,16 +5091,16 @@ def plot_dew_point_depression_and_wind(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7236,7 +5108,7 @@ def plot_dew_point_depression_and_wind(region='conus',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7245,7 +5117,7 @@ def plot_dew_point_depression_and_wind(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7254,7 +5126,7 @@ def plot_dew_point_depression_and_wind(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7272,53 +5144,40 @@ def plot_dew_point_depression_and_wind(region='conus',
         
     
         
-    dd_vals_1 = _fix_var_array(ds1,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [dew_point_depression_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    ws_vals_1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    dd_vals_2 = _fix_var_array(ds2,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    ws_vals_2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, dd_vals_1['longitude'], dd_vals_1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, dd_vals_2['longitude'], dd_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -7326,29 +5185,29 @@ def plot_dew_point_depression_and_wind(region='conus',
 
 
     stn1.plot_parameter(dd_value_loc.upper(), 
-                       (dd_vals_1[dew_point_depression_var_key] - dd_vals_2[dew_point_depression_var_key]), 
+                       diffs[dew_point_depression_var_key], 
                        color=dew_point_depression_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (ws_vals_1[wind_speed_var_key] - ws_vals_2[wind_speed_var_key]), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                    v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                    vals_1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                    v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                    vals_2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -7358,8 +5217,11 @@ def plot_dew_point_depression_and_wind(region='conus',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -7530,7 +5392,15 @@ def plot_dew_point_depression_and_gust(region='conus',
                     barb_legend_fontsize=7,
                     barb_legend_x_position=0.825,
                     barb_legend_y_position=0,
-                    barb_legend_zorder=10):
+                    barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + gust.
@@ -7557,6 +5427,8 @@ def plot_dew_point_depression_and_gust(region='conus',
     
     An image of the RTMA Dew Point Depression + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -7602,36 +5474,37 @@ def plot_dew_point_depression_and_gust(region='conus',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [dew_point_depression_var_key, wind_gust_var_key],
+                                  to_units={wind_gust_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_gust_var_key] = _calc.mps_to_mph(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mps_to_mph(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_gust_var_key] = _calc.mph_to_kts(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mph_to_kts(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_gust_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    ds1 = _calc.u_v_components(ds1,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
-    
-    ds2 = _calc.u_v_components(ds2,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression change", colors)
@@ -7648,241 +5521,25 @@ def plot_dew_point_depression_and_gust(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[dew_point_depression_var_key] - ds2[dew_point_depression_var_key]),
+                diff[dew_point_depression_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -7891,16 +5548,16 @@ def plot_dew_point_depression_and_gust(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7908,7 +5565,7 @@ def plot_dew_point_depression_and_gust(region='conus',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7917,7 +5574,7 @@ def plot_dew_point_depression_and_gust(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7926,7 +5583,7 @@ def plot_dew_point_depression_and_gust(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7944,53 +5601,42 @@ def plot_dew_point_depression_and_gust(region='conus',
         
     
         
-    dd_vals_1 = _fix_var_array(ds1,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [dew_point_depression_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    wg_vals_1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    dd_vals_2 = _fix_var_array(ds2,
-                    dew_point_depression_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
-    
-    wg_vals_2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, dd_vals_1['longitude'], dd_vals_1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, dd_vals_2['longitude'], dd_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -7998,29 +5644,29 @@ def plot_dew_point_depression_and_gust(region='conus',
 
 
     stn1.plot_parameter(dd_value_loc.upper(), 
-                       (dd_vals_1[dew_point_depression_var_key] - dd_vals_2[dew_point_depression_var_key]), 
+                       diffs[dew_point_depression_var_key], 
                        color=dew_point_depression_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (wg_vals_1[wind_gust_var_key] - wg_vals_2[wind_gust_var_key]), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                    v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                    vals_1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                    v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                    vals_2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -8030,8 +5676,11 @@ def plot_dew_point_depression_and_gust(region='conus',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -8200,7 +5849,15 @@ def plot_dew_point_and_wind(region='conus',
                     barb_legend_fontsize=7,
                     barb_legend_x_position=0.825,
                     barb_legend_y_position=0,
-                    barb_legend_zorder=10):
+                    barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + wind.
@@ -8227,6 +5884,8 @@ def plot_dew_point_and_wind(region='conus',
     
     An image of the RTMA Dew Point + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -8272,22 +5931,33 @@ def plot_dew_point_and_wind(region='conus',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [dew_point_var_key, wind_speed_var_key],
+                                  to_units={wind_speed_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_speed_var_key] = _calc.mps_to_mph(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mps_to_mph(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_speed_var_key] = _calc.mph_to_kts(ds1[wind_speed_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_speed_var_key] = _calc.mph_to_kts(ds2[wind_speed_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_speed_var_key, u_var_key, v_var_key], convert_to, from_units='mps')
     else:
         pass
         
@@ -8306,241 +5976,25 @@ def plot_dew_point_and_wind(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[dew_point_var_key] - ds2[dew_point_var_key]),
+                diff[dew_point_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -8549,16 +6003,16 @@ def plot_dew_point_and_wind(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8566,7 +6020,7 @@ def plot_dew_point_and_wind(region='conus',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8575,7 +6029,7 @@ def plot_dew_point_and_wind(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8584,7 +6038,7 @@ def plot_dew_point_and_wind(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8602,53 +6056,40 @@ def plot_dew_point_and_wind(region='conus',
         
     
         
-    dwpt_vals_1 = _fix_var_array(ds1,
-                    dew_point_var_key,
-                    0,
-                    decimate)
-    
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [dew_point_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    ws_vals_1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    dwpt_vals_2 = _fix_var_array(ds2,
-                    dew_point_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    ws_vals_2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, dwpt_vals_1['longitude'], dwpt_vals_1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, dwpt_vals_2['longitude'], dwpt_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -8656,29 +6097,29 @@ def plot_dew_point_and_wind(region='conus',
 
 
     stn1.plot_parameter(dwpt_value_loc.upper(), 
-                       (dwpt_vals_1[dew_point_var_key] - dwpt_vals_2[dew_point_var_key]), 
+                       diffs[dew_point_var_key], 
                        color=dew_point_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (ws_vals_1[wind_speed_var_key] - ws_vals_2[wind_speed_var_key]), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                    v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                    vals_1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                    v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                    vals_2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -8688,8 +6129,11 @@ def plot_dew_point_and_wind(region='conus',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -8860,7 +6304,15 @@ def plot_dew_point_and_gust(region='conus',
                     barb_legend_fontsize=7,
                     barb_legend_x_position=0.825,
                     barb_legend_y_position=0,
-                    barb_legend_zorder=10):
+                    barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + gust.
@@ -8887,6 +6339,8 @@ def plot_dew_point_and_gust(region='conus',
     
     An image of the RTMA Dew Point + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -8932,36 +6386,37 @@ def plot_dew_point_and_gust(region='conus',
         ds1 = ds1
         ds2 = ds2
         
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [dew_point_var_key, wind_gust_var_key],
+                                  to_units={wind_gust_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
-        if convert_to == 'mph':
-            ds1[wind_gust_var_key] = _calc.mps_to_mph(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mps_to_mph(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mps_to_mph(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mps_to_mph(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mps_to_mph(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mps_to_mph(ds2[v_var_key])
-        else:
-            ds1[wind_gust_var_key] = _calc.mph_to_kts(ds1[wind_gust_var_key])
-            ds1[u_var_key] = _calc.mph_to_kts(ds1[u_var_key])
-            ds1[v_var_key] = _calc.mph_to_kts(ds1[v_var_key])
-            ds2[wind_gust_var_key] = _calc.mph_to_kts(ds2[wind_gust_var_key])
-            ds2[u_var_key] = _calc.mph_to_kts(ds2[u_var_key])
-            ds2[v_var_key] = _calc.mph_to_kts(ds2[v_var_key])
-            
+        ds1 = _convert_units(ds1, [wind_gust_var_key], convert_to, from_units='mps')
+        ds2 = _convert_units(ds2, [wind_gust_var_key], convert_to, from_units='mps')
     else:
         pass
     
-    ds1 = _calc.u_v_components(ds1,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
-    
-    ds2 = _calc.u_v_components(ds2,
-                            u_var_key,
-                            v_var_key,
-                            wind_direction_var_key,
-                            wind_gust_var_key)
+    wind_component_keys = (u_var_key, v_var_key, wind_direction_var_key, wind_gust_var_key)
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point change", colors)
@@ -8978,241 +6433,25 @@ def plot_dew_point_and_gust(region='conus',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(ds1[longitude_key],
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                ds1[longitude_key],
                 ds1[latitude_key],
-                (ds1[dew_point_var_key] - ds2[dew_point_var_key]),
+                diff[dew_point_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -9221,16 +6460,16 @@ def plot_dew_point_and_gust(region='conus',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -9238,7 +6477,7 @@ def plot_dew_point_and_gust(region='conus',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -9247,7 +6486,7 @@ def plot_dew_point_and_gust(region='conus',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -9256,7 +6495,7 @@ def plot_dew_point_and_gust(region='conus',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -9274,53 +6513,42 @@ def plot_dew_point_and_gust(region='conus',
         
     
         
-    dwpt_vals_1 = _fix_var_array(ds1,
-                    dew_point_var_key,
-                    0,
-                    decimate)
-    
-    u_vals_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    0,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [dew_point_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    v_vals_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    wg_vals_1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
+    vals_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    dwpt_vals_2 = _fix_var_array(ds2,
-                    dew_point_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_1 = _thin_pixel_queries(ax, vals_1, pixel_query_spacing, datacrs)
     
-    u_vals_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    0,
-                    decimate)
+    vals_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key,
+                    wind_components=wind_component_keys)
     
-    v_vals_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    0,
-                    decimate)
+    if pixel_query_spacing is not None:
+        vals_2 = _thin_pixel_queries(ax, vals_2, pixel_query_spacing, datacrs)
     
-    wg_vals_2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    0,
-                    decimate)
-
-    stn1 = _mpplots.StationPlot(ax, dwpt_vals_1['longitude'], dwpt_vals_1['latitude'],
+    stn1 = _mpplots.StationPlot(ax, vals_1['longitude'], vals_1['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
                                 clip_on=True)
     
-    stn2 = _mpplots.StationPlot(ax, dwpt_vals_2['longitude'], dwpt_vals_2['latitude'],
+    stn2 = _mpplots.StationPlot(ax, vals_2['longitude'], vals_2['latitude'],
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -9328,29 +6556,29 @@ def plot_dew_point_and_gust(region='conus',
 
 
     stn1.plot_parameter(dwpt_value_loc.upper(), 
-                       (dwpt_vals_1[dew_point_var_key] - dwpt_vals_2[dew_point_var_key]), 
+                       diffs[dew_point_var_key], 
                        color=dew_point_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (wg_vals_1[wind_gust_var_key] - wg_vals_2[wind_gust_var_key]), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
-    stn1.plot_barb(u_vals_1[u_var_key], 
-                    v_vals_1[v_var_key],
+    stn1.plot_barb(vals_1[u_var_key], 
+                    vals_1[v_var_key],
                     color=current_barb_color, 
                     length=current_barb_length, 
                     linewidth=current_barb_width,
                     zorder=current_barb_zorder,
                     label=label1)
     
-    stn2.plot_barb(u_vals_2[u_var_key], 
-                    v_vals_2[v_var_key],
+    stn2.plot_barb(vals_2[u_var_key], 
+                    vals_2[v_var_key],
                     color=comparison_barb_color, 
                     length=comparison_barb_length, 
                     linewidth=comparison_barb_width,
@@ -9360,9 +6588,96 @@ def plot_dew_point_and_gust(region='conus',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
-        
\ No newline at end of file
+
+def render_suite(products=None,
+                 regions=None,
+                 reference_systems=['States & Counties'],
+                 ds1=None,
+                 ds2=None,
+                 product_kwargs=None,
+                 notifications='off',
+                 workers=1,
+                 **kwargs):
+    
+    """
+    This function renders a suite of RTMA Comparison CONUS graphics (products x regions x reference systems) in one call.
+    
+    The data is downloaded and decoded once and the cartographic reference layers are loaded once for the whole suite.
+    
+    Required Arguments: None
+    
+    Optional Arguments:
+    
+    1) products (List or None) - Default=None. The products to render. The product names are the plot function names 
+        without 'plot_' (i.e. ['temperature', 'relative_humidity_and_wind']). When None, all 14 products are rendered.
+        
+    2) regions (List or None) - Default=None. The regions to render (i.e. ['ca', 'oscc', 'nv']). When None, the default region is used.
+    
+    3) reference_systems (List or dict) - Default=['States & Counties']. The reference systems to render.
+        
+        Built-in reference systems
+        --------------------------
+        
+        1) 'States & Counties'
+        2) 'States Only'
+        3) 'GACC Boundaries'
+        4) 'Predictive Services Areas'
+        5) 'NWS CWA'
+        6) 'NWS Public Zones'
+        7) 'NWS Fire Weather Zones'
+        8) 'CalFire Boundaries'
+        
+        Custom reference systems are passed as a dictionary of {name: {'show_states':True, 'show_counties':False, ...}}.
+    
+    4) ds1 (xarray.array or None) - Default=None. The current RTMA dataset passed into every plot function.
+        When ds1 and ds2 are None, the data is downloaded and decoded once and shared by every graphic.
+    
+    5) ds2 (xarray.array or None) - Default=None. The RTMA dataset of the comparison time passed into every plot function.
+    
+    6) product_kwargs (dict or None) - Default=None. Keyword arguments that only apply to some products
+        (i.e. {'temperature':{'decimate':100}}).
+    
+    7) notifications (String) - Default='off'. When set to 'on', the time of each graphic is printed.
+    
+    8) workers (Integer or None) - Default=1. The number of processes the graphics are spread over. When None, one process per CPU is used.
+        When workers > 1, the data is downloaded and decoded once in this process and shared with the workers through memory-mapped files.
+        On Windows/macOS, call this function under if __name__ == '__main__':.
+    
+    9) **kwargs - Keyword arguments passed into every plot function that accepts them (i.e. hours, figure_x_length, proxies).
+    
+    Returns
+    -------
+    
+    A list of dictionaries (one per graphic) with the product, region, reference_system, seconds, error and worker keys.
+    The error is None when the graphic was saved.   
+    """
+    
+    if workers != 1 and ds1 is None and ds2 is None:
+        ds1, ds2 = _rtma_comparison(proxies=kwargs.get('proxies', None),
+                   clear_recycle_bin=kwargs.get('clear_recycle_bin', False),
+                   clear_data=kwargs.get('clear_data', True),
+                   convert_temperature=False,
+                   chunk_size=kwargs.get('chunk_size', 8192),
+                   notifications=notifications,
+                   custom_directory=kwargs.get('custom_data_directory', None),
+                   hours=kwargs.get('hours', 24))
+        ds1 = _convert_temperature_fields(ds1, dataset_units)
+        ds2 = _convert_temperature_fields(ds2, dataset_units)
+        
+    return _render_suite(_sys.modules[__name__],
+                         products=products,
+                         regions=regions,
+                         reference_systems=reference_systems,
+                         datasets={'ds1':ds1, 'ds2':ds2},
+                         product_kwargs=product_kwargs,
+                         notifications=notifications,
+                         workers=workers,
+                         **kwargs)
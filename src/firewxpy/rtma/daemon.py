@@ -0,0 +1,635 @@
+"""
+This file hosts the render daemon: a long-running process that renders suites of RTMA graphics on request.
+
+Launching a new Python process for every batch of graphics pays for the imports, the cartographic reference layers and the
+decoded data every time. The daemon accepts render jobs (module, products, regions and options) over a local HTTP endpoint
+and renders them in a pool of worker processes that live as long as the daemon. Each worker keeps its imports, decoded
+datasets (dataset cache), reference layers (geometry cache), region windows (grid index) and base map templates warm between
+jobs, so only the first job of each region pays the setup cost.
+
+Jobs are handled concurrently (one job per worker at a time since matplotlib is not thread-safe) and every graphic of a job
+is stamped with the creation time of the job (see firewxpy.utils.standard.creation_time()). When a worker dies (i.e. it runs
+out of memory), the jobs that were queued or running in the pool are marked failed and the pool is started again.
+
+Endpoints:
+
+    POST /jobs         - Submits a job (JSON). Returns the job ID. When "wait" is true, the response is sent once the job is done.
+    GET  /jobs         - Lists the jobs.
+    GET  /jobs/<id>    - Returns the status and results of a job.
+    GET  /health       - Returns the status of the daemon.
+
+The daemon can be started from the command line:
+
+    python -m firewxpy.rtma.daemon --port 8765 --workers 2 --preload rtma_conus rtma_comparison_conus
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os as _os
+import json as _json
+import uuid as _uuid
+import argparse as _argparse
+import threading as _threading
+import importlib as _importlib
+import multiprocessing as _multiprocessing
+import urllib.request as _request
+import urllib.error as _error
+
+from collections import OrderedDict as _OrderedDict
+from datetime import datetime as _datetime, timezone as _timezone
+from http.server import(
+    ThreadingHTTPServer as _ThreadingHTTPServer,
+    BaseHTTPRequestHandler as _BaseHTTPRequestHandler
+)
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool as _BrokenProcessPool
+
+# The RTMA modules a job may render (the names of the modules in the firewxpy package).
+modules = {
+    'rtma_conus':'firewxpy.rtma.conus.rtma',
+    'rtma_comparison_conus':'firewxpy.rtma.conus.rtma_comparison',
+    'rtma_alaska':'firewxpy.rtma.alaska.rtma',
+    'rtma_comparison_alaska':'firewxpy.rtma.alaska.rtma_comparison',
+    'rtma_hawaii':'firewxpy.rtma.hawaii.rtma',
+    'rtma_comparison_hawaii':'firewxpy.rtma.hawaii.rtma_comparison'
+}
+
+# The keys of a job.
+_job_keys = [
+    'module',
+    'products',
+    'regions',
+    'reference_systems',
+    'product_kwargs',
+    'kwargs',
+    'notifications'
+]
+
+default_url = 'http://127.0.0.1:8765'
+
+def _now():
+
+    """
+    This function returns the current UTC time as an ISO 8601 string.
+    """
+
+    return _datetime.now(_timezone.utc).isoformat(timespec='seconds')
+
+def _validate_job(job):
+
+    """
+    This function checks a job and fills in its defaults.
+    """
+
+    if not isinstance(job, dict):
+        raise ValueError("A job must be a JSON object.")
+
+    unknown = [k for k in job if k not in _job_keys + ['wait', 'timeout']]
+    if unknown:
+        raise ValueError(f"Unknown job keys: {unknown}. Valid keys: {_job_keys + ['wait', 'timeout']}")
+
+    module = job.get('module')
+    if module not in modules:
+        raise ValueError(f"Unknown module '{module}'. Valid modules: {list(modules.keys())}")
+
+    for key in ('products', 'regions'):
+        if job.get(key) is not None and (not isinstance(job[key], list) or not all(isinstance(v, str) for v in job[key])):
+            raise ValueError(f"{key} must be a list of strings or null.")
+
+    for key in ('product_kwargs', 'kwargs'):
+        if job.get(key) is not None and not isinstance(job[key], dict):
+            raise ValueError(f"{key} must be an object or null.")
+
+    if 'workers' in (job.get('kwargs') or {}):
+        raise ValueError("workers is set when the daemon is started.")
+
+    return {
+        'module':module,
+        'products':job.get('products'),
+        'regions':job.get('regions'),
+        'reference_systems':job.get('reference_systems') or ['States & Counties'],
+        'product_kwargs':job.get('product_kwargs') or {},
+        'kwargs':job.get('kwargs') or {},
+        'notifications':job.get('notifications', 'off')
+    }
+
+def _init_worker(preload):
+
+    """
+    This function initializes a worker process of the daemon and imports the modules in {preload} (the module paths).
+    """
+
+    import matplotlib as _mpl
+
+    _mpl.use('Agg')
+
+    for module_name in preload:
+        _importlib.import_module(module_name)
+
+def _ready():
+
+    """
+    This function returns the process ID of a worker once it is initialized.
+    """
+
+    return _os.getpid()
+
+def _run_job(job,
+             module_name):
+
+    """
+    This function renders a job in a worker process.
+
+    Every graphic of the job is stamped with the creation time of the job.
+    """
+
+    from firewxpy.rtma.suite import render_suite as _render_suite
+    from firewxpy.utils.standard import creation_time as _creation_time
+
+    module = _importlib.import_module(module_name)
+
+    with _creation_time() as (local, utc):
+        results = _render_suite(module,
+                                products=job['products'],
+                                regions=job['regions'],
+                                reference_systems=job['reference_systems'],
+                                product_kwargs=job['product_kwargs'],
+                                notifications=job['notifications'],
+                                workers=1,
+                                **job['kwargs'])
+
+    return {
+        'created':utc.isoformat(timespec='seconds'),
+        'worker':_os.getpid(),
+        'results':results
+    }
+
+def _record(entry):
+
+    """
+    This function returns the JSON record of a job.
+    """
+
+    future = entry['future']
+
+    record = {
+        'id':entry['id'],
+        'submitted':entry['submitted'],
+        'job':entry['job']
+    }
+
+    if future.done() is False:
+        record['status'] = 'running' if future.running() else 'queued'
+        return record
+
+    try:
+        record.update(future.result())
+        failed = [r for r in record['results'] if r['error'] is not None]
+        record['status'] = 'failed' if failed and len(failed) == len(record['results']) else 'done'
+    except _BrokenProcessPool as e:
+        record['status'] = 'failed'
+        record['error'] = "BrokenProcessPool: A worker process terminated abruptly while the job was queued or running. Submit the job again."
+    except Exception as e:
+        record['status'] = 'failed'
+        record['error'] = f"{type(e).__name__}: {e}"
+
+    return record
+
+def submit(daemon,
+           job):
+
+    """
+    This function submits a job to a daemon started in this process.
+
+    Required Arguments:
+
+    1) daemon (firewxpy.rtma.daemon.RenderDaemon) - The daemon returned by start_render_daemon().
+
+    2) job (dict) - The job: {'module':'rtma_conus', 'products':[...], 'regions':[...], 'reference_systems':[...],
+        'product_kwargs':{...}, 'kwargs':{...}, 'notifications':'off'}. Only 'module' is required.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The ID of the job.
+    """
+
+    job = _validate_job(job)
+    job_id = _uuid.uuid4().hex
+
+    with daemon.lock:
+        try:
+            future = daemon.pool.submit(_run_job, job, modules[job['module']])
+        except _BrokenProcessPool as e:
+            # A worker died: the jobs of the broken pool already failed. The pool is started again for this job.
+            _restart_pool(daemon)
+            future = daemon.pool.submit(_run_job, job, modules[job['module']])
+
+        daemon.jobs[job_id] = {
+            'id':job_id,
+            'submitted':_now(),
+            'job':job,
+            'future':future
+        }
+
+        finished = [k for k, v in daemon.jobs.items() if v['future'].done()]
+        for k in finished[:max(len(daemon.jobs) - daemon.max_jobs, 0)]:
+            del daemon.jobs[k]
+
+    return job_id
+
+def status(daemon,
+           job_id,
+           wait=False,
+           timeout=None):
+
+    """
+    This function returns the status and results of a job of a daemon started in this process.
+
+    Required Arguments:
+
+    1) daemon (firewxpy.rtma.daemon.RenderDaemon) - The daemon returned by start_render_daemon().
+
+    2) job_id (String) - The ID of the job.
+
+    Optional Arguments:
+
+    1) wait (Boolean) - Default=False. When set to True, this function returns once the job is done.
+
+    2) timeout (Float or None) - Default=None. The maximum number of seconds to wait.
+
+    Returns
+    -------
+
+    A dictionary with the id, submitted, job and status ('queued', 'running', 'done' or 'failed') keys and, once the job is
+    done, the created (the creation time of the graphics), worker and results (see firewxpy.rtma.suite.render_suite()) keys.
+    None when the job is unknown.
+    """
+
+    with daemon.lock:
+        entry = daemon.jobs.get(job_id)
+
+    if entry is None:
+        return None
+
+    if wait is True:
+        try:
+            entry['future'].exception(timeout=timeout)
+        except Exception as e:
+            pass
+
+    return _record(entry)
+
+class _Handler(_BaseHTTPRequestHandler):
+
+    """
+    The HTTP request handler of the render daemon ({self.server} is the daemon).
+    """
+
+    def _send(self, code, body):
+
+        data = _json.dumps(body, default=str).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+
+        daemon = self.server
+
+        path = self.path.rstrip('/')
+
+        if path == '/health':
+            with daemon.lock:
+                records = [_record(entry) for entry in daemon.jobs.values()]
+            counts = {s:sum(r['status'] == s for r in records) for s in ('queued', 'running', 'done', 'failed')}
+            self._send(200, {'status':'ok', 'pid':_os.getpid(), 'workers':daemon.workers, 'restarts':daemon.restarts, 'jobs':counts})
+
+        elif path == '/jobs':
+            with daemon.lock:
+                records = [_record(entry) for entry in daemon.jobs.values()]
+            self._send(200, [{k:r[k] for k in ('id', 'submitted', 'status')} for r in records])
+
+        elif path.startswith('/jobs/'):
+            record = status(daemon, path[6:])
+            if record is None:
+                self._send(404, {'error':f"Unknown job '{path[6:]}'."})
+            else:
+                self._send(200, record)
+
+        else:
+            self._send(404, {'error':f"Unknown endpoint '{self.path}'."})
+
+    def do_POST(self):
+
+        daemon = self.server
+
+        if self.path.rstrip('/') != '/jobs':
+            self._send(404, {'error':f"Unknown endpoint '{self.path}'."})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            job = _json.loads(self.rfile.read(length) or b'{}')
+            job_id = submit(daemon, job)
+        except ValueError as e:
+            self._send(400, {'error':str(e)})
+            return
+        except RuntimeError as e:
+            self._send(503, {'error':str(e)})
+            return
+
+        if job.get('wait') is True:
+            self._send(200, status(daemon, job_id, wait=True, timeout=job.get('timeout')))
+        else:
+            self._send(202, {'id':job_id, 'status':'queued'})
+
+    def log_message(self, format, *args):
+
+        daemon = self.server
+
+        if daemon.notifications == 'on':
+            super().log_message(format, *args)
+
+class RenderDaemon(_ThreadingHTTPServer):
+
+    """
+    The HTTP server of the render daemon. It holds the pool of worker processes and the jobs.
+    """
+
+    daemon_threads = True
+
+def _start_pool(daemon):
+
+    """
+    This function starts the pool of worker processes of a daemon.
+    """
+
+    # The workers are spawned (not forked) since the daemon serves requests from several threads.
+    daemon.pool = _ProcessPoolExecutor(max_workers=daemon.workers,
+                                       mp_context=_multiprocessing.get_context('spawn'),
+                                       initializer=_init_worker,
+                                       initargs=([modules[name] for name in daemon.preload],))
+
+    # The pool only starts a new worker when no worker is idle, so every worker is started (and warmed) up front.
+    for i in range(daemon.workers):
+        daemon.pool.submit(_ready)
+
+def _restart_pool(daemon):
+
+    """
+    This function replaces the broken pool of a daemon (a worker process died) with a new pool.
+    """
+
+    daemon.pool.shutdown(wait=False, cancel_futures=True)
+    daemon.restarts += 1
+
+    if daemon.notifications == 'on':
+        print(f"Alert: A worker process of the FireWxPy render daemon terminated abruptly. Restarting the pool ({daemon.restarts}).")
+
+    _start_pool(daemon)
+
+def start_render_daemon(host='127.0.0.1',
+                        port=8765,
+                        workers=1,
+                        preload=None,
+                        max_jobs=256,
+                        notifications='off',
+                        block=True):
+
+    """
+    This function starts the render daemon.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) host (String) - Default='127.0.0.1'. The address the daemon listens on. Keep the default so only local processes can
+        submit jobs.
+
+    2) port (Integer) - Default=8765. The port the daemon listens on. When 0, a free port is picked
+        (see daemon.server_address).
+
+    3) workers (Integer) - Default=1. The number of worker processes. Each worker renders one job at a time, so this is the
+        number of jobs that are rendered concurrently.
+
+    4) preload (List or None) - Default=None. The modules imported by every worker when it starts
+        (i.e. ['rtma_conus', 'rtma_comparison_conus']) so the first job does not pay for the imports.
+
+    5) max_jobs (Integer) - Default=256. The number of finished jobs whose results are kept.
+
+    6) notifications (String) - Default='off'. When set to 'on', the requests are logged.
+
+    7) block (Boolean) - Default=True. When set to True, the daemon serves until it is interrupted (Ctrl+C). When set to False,
+        the daemon serves from a background thread and is returned (stop it with stop_render_daemon()).
+
+    Returns
+    -------
+
+    The daemon (firewxpy.rtma.daemon.RenderDaemon).
+    """
+
+    if preload is None:
+        preload = []
+
+    for name in preload:
+        if name not in modules:
+            raise ValueError(f"Unknown module '{name}'. Valid modules: {list(modules.keys())}")
+
+    daemon = RenderDaemon((host, port), _Handler)
+
+    daemon.workers = workers
+    daemon.preload = list(preload)
+    daemon.max_jobs = max_jobs
+    daemon.notifications = notifications
+    daemon.jobs = _OrderedDict()
+    daemon.lock = _threading.Lock()
+    daemon.restarts = 0
+
+    _start_pool(daemon)
+
+    if notifications == 'on':
+        print(f"FireWxPy render daemon listening on http://{daemon.server_address[0]}:{daemon.server_address[1]} with {workers} worker(s).")
+
+    if block is False:
+        daemon.thread = _threading.Thread(target=daemon.serve_forever, daemon=True)
+        daemon.thread.start()
+        return daemon
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_render_daemon(daemon, serving=False)
+
+    return daemon
+
+def stop_render_daemon(daemon,
+                       cancel_jobs=True,
+                       serving=True):
+
+    """
+    This function stops a render daemon started with block=False.
+
+    Required Arguments:
+
+    1) daemon (firewxpy.rtma.daemon.RenderDaemon) - The daemon returned by start_render_daemon().
+
+    Optional Arguments:
+
+    1) cancel_jobs (Boolean) - Default=True. When set to True, the queued jobs are cancelled. Otherwise they are rendered first.
+
+    2) serving (Boolean) - Default=True. Whether the daemon is serving from a background thread.
+
+    Returns
+    -------
+
+    None
+    """
+
+    if serving is True:
+        daemon.shutdown()
+    daemon.server_close()
+    daemon.pool.shutdown(wait=True, cancel_futures=cancel_jobs)
+
+def _request_json(url,
+                  data=None,
+                  timeout=None):
+
+    """
+    This function sends a request to a daemon and returns the decoded JSON response.
+    """
+
+    if data is not None:
+        data = _json.dumps(data).encode('utf-8')
+
+    req = _request.Request(url,
+                           data=data,
+                           headers={'Content-Type':'application/json'},
+                           method='POST' if data is not None else 'GET')
+
+    try:
+        with _request.urlopen(req, timeout=timeout) as response:
+            return _json.loads(response.read())
+    except _error.HTTPError as e:
+        try:
+            message = _json.loads(e.read()).get('error', e.reason)
+        except Exception:
+            message = e.reason
+        if e.code == 404:
+            raise KeyError(message)
+        raise ValueError(message)
+
+def submit_render_job(module,
+                      products=None,
+                      regions=None,
+                      reference_systems=['States & Counties'],
+                      product_kwargs=None,
+                      notifications='off',
+                      url=default_url,
+                      wait=False,
+                      timeout=None,
+                      **kwargs):
+
+    """
+    This function submits a render job to a running render daemon.
+
+    Required Arguments:
+
+    1) module (String) - The RTMA module (i.e. 'rtma_conus' or 'rtma_comparison_alaska').
+
+    Optional Arguments:
+
+    1) products (List or None) - Default=None. The products to render (i.e. ['temperature', 'relative_humidity_and_wind']).
+        When None, every product of the module is rendered.
+
+    2) regions (List or None) - Default=None. The regions to render. When None, the default region of the module is used.
+
+    3) reference_systems (List or dict) - Default=['States & Counties']. See firewxpy.rtma.suite.render_suite().
+
+    4) product_kwargs (dict or None) - Default=None. Keyword arguments that only apply to some products
+        (i.e. {'temperature':{'decimate':100}}).
+
+    5) notifications (String) - Default='off'. Passed into render_suite() in the worker.
+
+    6) url (String) - Default='http://127.0.0.1:8765'. The URL of the daemon.
+
+    7) wait (Boolean) - Default=False. When set to True, this function returns once the job is done.
+
+    8) timeout (Float or None) - Default=None. The maximum number of seconds to wait for the daemon.
+
+    9) **kwargs - Keyword arguments passed into every plot function that accepts them (they must be JSON serializable).
+
+    Returns
+    -------
+
+    When wait=False, the ID of the job. When wait=True, the record of the job (see render_job_status()).
+    """
+
+    job = {
+        'module':module,
+        'products':products,
+        'regions':regions,
+        'reference_systems':reference_systems,
+        'product_kwargs':product_kwargs,
+        'kwargs':kwargs,
+        'notifications':notifications,
+        'wait':wait,
+        'timeout':timeout
+    }
+
+    response = _request_json(f"{url.rstrip('/')}/jobs", data=job)
+
+    if wait is True:
+        return response
+
+    return response['id']
+
+def render_job_status(job_id,
+                      url=default_url,
+                      timeout=None):
+
+    """
+    This function returns the status and results of a job of a running render daemon.
+
+    Required Arguments:
+
+    1) job_id (String) - The ID returned by submit_render_job().
+
+    Optional Arguments:
+
+    1) url (String) - Default='http://127.0.0.1:8765'. The URL of the daemon.
+
+    2) timeout (Float or None) - Default=None. The maximum number of seconds to wait for the daemon.
+
+    Returns
+    -------
+
+    A dictionary with the id, submitted, job and status ('queued', 'running', 'done' or 'failed') keys and, once the job is
+    done, the created (the creation time of the graphics), worker and results (see firewxpy.rtma.suite.render_suite()) keys.
+    """
+
+    return _request_json(f"{url.rstrip('/')}/jobs/{job_id}", timeout=timeout)
+
+if __name__ == '__main__':
+
+    parser = _argparse.ArgumentParser(description='Run the FireWxPy render daemon.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--preload', nargs='*', default=[])
+    parser.add_argument('--max-jobs', type=int, default=256)
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args()
+
+    start_render_daemon(host=args.host,
+                        port=args.port,
+                        workers=args.workers,
+                        preload=args.preload,
+                        max_jobs=args.max_jobs,
+                        notifications='off' if args.quiet else 'on')
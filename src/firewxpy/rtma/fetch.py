@@ -0,0 +1,224 @@
+"""
+This file hosts the clients that download and decode the RTMA analysis of a given cycle.
+
+The WxData RTMA clients only return the latest analysis (and the analysis a number of hours before it). The RTMA watcher
+and the local RTMA archive of the comparison products need a single analysis of a known cycle instead, so these clients
+download it directly from the data server. The data server is a URL prefix with the same layout as NCEP/NOMADS
+(i.e. {server}/rtma2p5.20261017/rtma2p5.t11z.2dvaranl_ndfd.grb2_wexp) so a mirror or a local stand-in server can be used.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os as _os
+import pandas as _pd
+
+from firewxpy.utils.directory import cache_directory as _cache_directory
+from firewxpy.calc.calc import convert_temperature_fields as _convert_temperature_fields
+
+nomads_server = 'https://nomads.ncep.noaa.gov/pub/data/nccf/com/rtma/prod/'
+
+# The RTMA model, server directory, file name and modules of each domain.
+domains = {
+    'conus':{
+        'model':'rtma',
+        'directory':'rtma2p5',
+        'file':'2dvaranl_ndfd.grb2_wexp',
+        'module':'firewxpy.rtma.conus.rtma',
+        'comparison_module':'firewxpy.rtma.conus.rtma_comparison'
+    },
+    'alaska':{
+        'model':'ak rtma',
+        'directory':'akrtma',
+        'file':'2dvaranl_ndfd_3p0.grb2',
+        'module':'firewxpy.rtma.alaska.rtma',
+        'comparison_module':'firewxpy.rtma.alaska.rtma_comparison'
+    },
+    'hawaii':{
+        'model':'hi rtma',
+        'directory':'hirtma',
+        'file':'2dvaranl_ndfd.grb2',
+        'module':'firewxpy.rtma.hawaii.rtma',
+        'comparison_module':'firewxpy.rtma.hawaii.rtma_comparison'
+    }
+}
+
+
+def domain_settings(domain):
+
+    """
+    This function returns the settings of a domain.
+
+    Required Arguments:
+
+    1) domain (String) - 'conus', 'alaska' or 'hawaii'.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The dictionary of the domain in domains. An unknown domain raises a ValueError.
+    """
+
+    try:
+        return domains[domain.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown domain '{domain}'. Valid domains: {list(domains.keys())}")
+
+def cycle_url(domain,
+              cycle,
+              server=nomads_server):
+
+    """
+    This function returns the URL of the RTMA analysis of a cycle.
+
+    Required Arguments:
+
+    1) domain (String) - 'conus', 'alaska' or 'hawaii'.
+
+    2) cycle (pandas.Timestamp or datetime.datetime) - The analysis time (UTC).
+
+    Optional Arguments:
+
+    1) server (String) - Default=NCEP/NOMADS. The URL prefix of the data server.
+
+    Returns
+    -------
+
+    The URL of the GRIB file.
+    """
+
+    settings = domain_settings(domain)
+    cycle = _pd.Timestamp(cycle)
+
+    return f"{server.rstrip('/')}/{settings['directory']}.{cycle.strftime('%Y%m%d')}/{settings['directory']}.t{cycle.strftime('%H')}z.{settings['file']}"
+
+def fetch_cycle(domain,
+                cycle,
+                server=nomads_server,
+                proxies=None,
+                chunk_size=8192,
+                notifications='off'):
+
+    """
+    This function downloads and decodes the RTMA analysis of a cycle.
+
+    The temperatures are kept in kelvin as decoded. The RTMA watcher (firewxpy.rtma.watcher.poll_rtma()) converts them once
+    into the units the plot functions of the domain expect from a shared dataset (see dataset_units in the RTMA modules).
+
+    Required Arguments:
+
+    1) domain (String) - 'conus', 'alaska' or 'hawaii'.
+
+    2) cycle (pandas.Timestamp or datetime.datetime) - The analysis time (UTC).
+
+    Optional Arguments:
+
+    1) server (String) - Default=NCEP/NOMADS. The URL prefix of the data server.
+
+    2) proxies (dict or None) - Default=None. The proxies of the requests.
+
+    3) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB file.
+
+    4) notifications (String) - Default='off'. Notification when the file is downloaded.
+
+    Returns
+    -------
+
+    The RTMA analysis as an xarray.array with the WxData variable keys (i.e. '2m_temperature').
+    """
+
+    from wxdata.client.client import get_gridded_data as _get_gridded_data
+    from wxdata.post_processors.rtma_post_processing import process_rtma_data as _process_rtma_data
+    from wxdata.calc.derived_fields import rtma_derived_fields as _rtma_derived_fields
+
+    settings = domain_settings(domain)
+    cycle = _pd.Timestamp(cycle)
+    path = _cache_directory(f"RTMA Downloads/{domain.upper()}")
+    filename = f"{settings['directory']}.{cycle.strftime('%Y%m%d%H')}.grib2"
+
+    # Only the current download is kept.
+    for f in _os.listdir(path):
+        if f != filename:
+            try:
+                _os.remove(f"{path}/{f}")
+            except OSError:
+                pass
+
+    if _os.path.exists(f"{path}/{filename}") is False:
+        _get_gridded_data(cycle_url(domain, cycle, server),
+                          path,
+                          filename,
+                          proxies=proxies,
+                          chunk_size=chunk_size,
+                          notifications=notifications)
+
+    ds = _process_rtma_data(path,
+                            filename,
+                            settings['model'])
+
+    ds = _rtma_derived_fields(ds,
+                              False,
+                              'kelvin')
+
+    return ds.load()
+
+def fetch_analysis(cycle,
+                   model='rtma',
+                   cat='analysis',
+                   proxies=None,
+                   convert_temperature=True,
+                   convert_to='fahrenheit',
+                   chunk_size=8192,
+                   notifications='off',
+                   **kwargs):
+
+    """
+    This function downloads and decodes the RTMA analysis of a cycle in the temperature units of the WxData RTMA clients.
+
+    The comparison products use it when the comparison analysis is not in the local RTMA archive so only that analysis is
+    downloaded (see firewxpy.utils.rtma_archive.archived_comparison()).
+
+    Required Arguments:
+
+    1) cycle (pandas.Timestamp or datetime.datetime) - The analysis time (UTC).
+
+    Optional Arguments:
+
+    1) model (String) - Default='rtma'. The RTMA model ('rtma', 'ak rtma' or 'hi rtma').
+
+    2) cat (String) - Default='analysis'. The RTMA category. Only 'analysis' is supported.
+
+    3) proxies (dict or None) - Default=None. The proxies of the requests.
+
+    4) convert_temperature (Boolean) - Default=True. When set to False, the temperatures are kept in kelvin.
+
+    5) convert_to (String) - Default='fahrenheit'. The temperature units ('fahrenheit' or 'celsius').
+
+    6) chunk_size (Integer) - Default=8192. The size of the chunks when writing the GRIB file.
+
+    7) notifications (String) - Default='off'. Notification when the file is downloaded.
+
+    Every other argument of the WxData RTMA clients is ignored.
+
+    Returns
+    -------
+
+    The RTMA analysis as an xarray.array or None when the model or category is not supported.
+    """
+
+    domain = next((d for d, settings in domains.items() if settings['model'] == str(model).lower()), None)
+
+    if domain is None or str(cat).lower() != 'analysis':
+        return None
+
+    ds = fetch_cycle(domain,
+                     cycle,
+                     proxies=proxies,
+                     chunk_size=chunk_size,
+                     notifications=notifications)
+
+    if convert_temperature is True:
+        ds = _convert_temperature_fields(ds, str(convert_to).lower())
+
+    return ds
@@ -1,2 +1,12 @@
-import firewxpy.rtma.hawaii.rtma as rtma_hawaii
-import firewxpy.rtma.hawaii.rtma_comparison as rtma_hawaii_comparison
\ No newline at end of file
+from firewxpy._lazy import lazy_modules as _lazy_modules
+
+_modules = {
+    'rtma':'firewxpy.rtma.hawaii.rtma',
+    'rtma_comparison':'firewxpy.rtma.hawaii.rtma_comparison',
+    'rtma_hawaii':'firewxpy.rtma.hawaii.rtma',
+    'rtma_hawaii_comparison':'firewxpy.rtma.hawaii.rtma_comparison'
+}
+
+__all__ = list(_modules)
+
+__getattr__, __dir__ = _lazy_modules(globals(), _modules)
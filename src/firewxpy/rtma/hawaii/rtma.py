@@ -165,8 +165,9 @@ Arguments and Settings
         of the geometries in the custom geojson.
         
 - refresh_cartographic_files (Boolean) - Default=True. Users that have automated pipelines set up for shapefiles. Having this set to
-        True allows the client to delete and re-download the shapefiles with each run of the script. This is useful for shapefiles
-        that have frequent geometry updates.
+        True re-validates the shapefiles with the server (ETag/Last-Modified) once the freshness window expires and only deletes and 
+        re-downloads the shapefiles when they changed on the server. The freshness window (default 24 hours) is shared across all calls 
+        and processes and is set with firewxpy.utils.set_refresh_policy(ttl=seconds). When set to False, the shapefiles are only downloaded once.
         
 - reference_system (String) - Default='States & Counties'. The name of the borders overlaid onto the map.
     
@@ -453,67 +454,110 @@ For Temperature & Wind/Gust, Dew Point & Wind/Gust & Dew Point Depression & Wind
 
 - convert_speed_to (String) - Convert the wind speed/gust from m/s to either mph or kts.
 
+- crop_to_region (Boolean) - Default=True. When set to True, the data is cropped to the region plus a small halo before it is contoured
+        and before the pixel query values are built. This significantly speeds up plots of smaller regions (i.e. States or GACCs).
+        Set to False to contour the full grid.
+
+- pixel_query_spacing (Integer, Float or None) - Default=None. When set to a number of pixels, the pixel queries are thinned on the screen
+        so the values/barbs keep this minimum spacing regardless of the map projection and region. This keeps the number of 
+        station plot values predictable and speeds up drawing. decimate then only selects the candidate grid points 
+        (i.e. decimate=1 makes every grid point a candidate). The selected points are cached for each grid, region and figure size.
+        When None, the pixel queries are only thinned by decimate.
+
+- reuse_base_map (Boolean) - Default=True. When set to True, the scaffold of the map (the figure, the extent, the coastlines/land/ocean/lakes
+        and the reference layers) is built once for each region, projection, figure size and reference layer style and is reused by every later
+        plot with the same settings. Only the contours, colorbar, titles and station plot are drawn for each product.
+        The templates are not pyplot figures, so they are never shown (i.e. in a notebook) or left open in pyplot.
+        Set to False to build a new figure for every plot.
+
+- rasterize_base_map (Boolean) - Default=False. When set to True (with reuse_base_map=True), the land/ocean/lakes fills and the reference
+        layers are rendered once to a raster for each region, projection, figure size, dpi and style and drawn as images in
+        the layering of the vector map (i.e. the fills below the weather field and the borders above it). Only the weather field and the annotations stay vector,
+        which greatly reduces the time to save graphics with dense borders (i.e. counties or zones).
+
+- render_mode (String) - Default='contourf'. How the weather field is drawn.
+    
+        Render modes
+        ------------
+        
+        1) 'contourf' - Filled contours.
+        
+        2) 'pcolormesh' - Each grid cell is colored with the discrete colors of the contour levels (BoundaryNorm).
+            Much faster than contourf on the full resolution grid.
+        
+        3) 'imshow' - The grid is resampled onto the pixels of the map and drawn as one image with the discrete colors of the
+            contour levels (BoundaryNorm). The fastest mode. The pixel lookup is cached for each grid, region and figure size.
+
+- coarsen_quality (Integer, Float or None) - Default=None. When set, the weather field is coarsened to the resolution the figure
+        is able to display before it is drawn. The number of grid cells per pixel is computed from the extent, the figure size and the dpi and
+        the field is reduced so about coarsen_quality grid cells remain per pixel (i.e. 1 for one grid cell per pixel, 2 keeps twice the detail).
+        This makes national plots much cheaper with little visible change. The pixel query values are always taken from the full resolution data.
+        When None, the full grid is drawn.
+    
+- coarsen_method (String) - Default='mean'. How the field is coarsened. 'mean' (NaN-aware block averages) or 'stride' (every n-th grid point).
+
+- contour_cache (Boolean) - Default=False. When set to True, the filled contours of the weather field are computed once on the full grid
+        and cached (keyed by the content of the field, the grid and the contour levels). Every later plot of the same field for another
+        region reuses the cached polygons and only draws the ones that overlap its map. This is the fastest way to contour the same field
+        for many regions. The data is not cropped to the region and the field is not coarsened when contour_cache=True.
+
 """
 
+import sys as _sys
 import warnings as _warnings
 _warnings.filterwarnings('ignore')
 import matplotlib as _mpl 
 import firewxpy.calc.calc as _calc
-import matplotlib.pyplot as _plt 
 import matplotlib.colors as _mcolors
 import cartopy.crs as _ccrs 
-import cartopy.feature as _cfeature 
 import metpy.plots as _mpplots
 import numpy as _np
 import pandas as _pd
 
 from dateutil import tz as _tz
 from matplotlib.patheffects import withStroke as _withStroke
-from firewxpy.utils.station_plot_formatting import fix_var_array_rtma_hawaii as _fix_var_array
+from firewxpy.utils.station_plot_formatting import(
+    extract_pixel_queries as _extract_pixel_queries,
+    thin_pixel_queries as _thin_pixel_queries
+)
 from firewxpy.utils.directory import build_directory_branch as _build_directory_branch
 from firewxpy.utils.plot_coords import bounding_box as _bounding_box
+from firewxpy.rtma.suite import render_suite as _render_suite
+from firewxpy.utils.grid_subset import subset_to_region as _subset_to_region
+from firewxpy.utils.field_rendering import render_field as _render_field
+from firewxpy.utils.grid_coordinates import grid_coordinates as _grid_coordinates
+from firewxpy.utils.base_map import(
+    open_base_map as _open_base_map,
+    build_base_map as _build_base_map,
+    store_base_map as _store_base_map,
+    close_base_map as _close_base_map,
+    rasterize_base_map as _rasterize_base_map
+)
+from firewxpy.calc.calc import(
+    kelvin_to_fahrenheit as _kelvin_to_fahrenheit,
+    kelvin_to_celsius as _kelvin_to_celsius,
+    mps_to_mph as _mps_to_mph,
+    mps_to_kts as _mps_to_kts,
+    wind_components as _wind_components,
+    convert_temperature_fields as _convert_temperature_fields
+)
 from firewxpy.utils.standard import(
     get_timezone_abbreviation as _get_timezone_abbreviation,
     plot_creation_time as _plot_creation_time
 )
-from firewxpy.utils.geometry import(
-    import_shapefile_from_web as _import_shapefile_from_web,
-    import_shapefile_local as _import_shapefile_local,
-    import_geojson_from_web as _import_geojson_from_web,
-    import_geojson_local as _import_geojson_local,
-    get_filename_from_url as _get_filename_from_url
-)
-from wxdata import rtma as _rtma
+from firewxpy.utils.dataset_cache import cached_dataset as _cached_dataset
+from wxdata import rtma as _wxdata_rtma
+
+_rtma = _cached_dataset(_wxdata_rtma)
 
-_local, _utc = _plot_creation_time()
-_timezone = _get_timezone_abbreviation()
 _from_zone = _tz.tzutc()
 _to_zone = _tz.tzlocal()
-_mpl.rcParams['font.weight'] = 'bold'
 
-def _kelvin_to_fahrenheit(kelvin):
-    celsius = kelvin - 273.15
-    fahrenheit = (celsius * (9/5)) + 32
-    return fahrenheit
+# The temperature units of a dataset that is shared by every graphic of a suite (see render_suite() and the RTMA watcher).
+# Every product of this module converts the temperatures it plots from kelvin.
+dataset_units = 'kelvin'
 
-def _kelvin_to_celsius(kelvin):
-    celsius = kelvin - 273.15
-    return celsius
-    
-def _ms_to_mph(ms):
-    return ms * 2.23694
-
-def _ms_to_kts(ms):
-    return ms * 1.94384
-
-def _u_v_components(wind_speed,
-                    wind_direction):
-    rad_dir = _np.deg2rad(wind_direction)
-    u = -wind_speed * _np.sin(rad_dir)
-    v = -wind_speed * _np.cos(rad_dir)
-    
-    return u, v
-    
+_mpl.rcParams['font.weight'] = 'bold'
 
 def plot_temperature(region='hi',
                      show_states=True,
@@ -667,7 +711,15 @@ def plot_temperature(region='hi',
                      var_key='2m_temperature',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature.
@@ -694,6 +746,8 @@ def plot_temperature(region='hi',
     
     An image of the RTMA Temperature Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -738,6 +792,13 @@ def plot_temperature(region='hi',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_temperature is True:
         if convert_from == 'kelvin':
             if convert_to == 'fahrenheit':
@@ -750,7 +811,7 @@ def plot_temperature(region='hi',
         vals = ds[var_key]
         
         
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
     
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
@@ -762,233 +823,13 @@ def plot_temperature(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 vals,
                 cmap=cmap,
@@ -996,7 +837,11 @@ def plot_temperature(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -1005,20 +850,20 @@ def plot_temperature(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -1027,7 +872,7 @@ def plot_temperature(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1036,7 +881,7 @@ def plot_temperature(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1053,9 +898,18 @@ def plot_temperature(region='hi',
             zorder=reference_system_textbox_zorder)
         
     
-    lats_1d, lons_1d, vals_1d = _fix_var_array(ds,
-                    var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
+    
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    vals_1d = queries[var_key]
     
     if convert_temperature is True:
         if convert_from == 'kelvin':
@@ -1081,8 +935,11 @@ def plot_temperature(region='hi',
                        zorder=pixel_query_value_zorder)
 
   
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1233,7 +1090,15 @@ def plot_dew_point(region='hi',
                      var_key='2m_dew_point',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point.
@@ -1260,6 +1125,8 @@ def plot_dew_point(region='hi',
     
     An image of the RTMA Dew Point Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1304,6 +1171,13 @@ def plot_dew_point(region='hi',
     else:
         ds = ds
 
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_temperature is True:
         if convert_from == 'kelvin':
             if convert_to == 'fahrenheit':
@@ -1315,7 +1189,7 @@ def plot_dew_point(region='hi',
     else:
         vals = ds[var_key]    
                         
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -1327,233 +1201,13 @@ def plot_dew_point(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 vals,
                 cmap=cmap,
@@ -1561,7 +1215,11 @@ def plot_dew_point(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -1570,20 +1228,20 @@ def plot_dew_point(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -1592,7 +1250,7 @@ def plot_dew_point(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1601,7 +1259,7 @@ def plot_dew_point(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1617,9 +1275,18 @@ def plot_dew_point(region='hi',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    lats_1d, lons_1d, vals_1d = _fix_var_array(ds,
-                    var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
+    
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    vals_1d = queries[var_key]
     
     if convert_temperature is True:
         if convert_from == 'kelvin':
@@ -1644,8 +1311,11 @@ def plot_dew_point(region='hi',
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1795,7 +1465,15 @@ def plot_dew_point_depression(region='hi',
                      dew_point_var_key='2m_dew_point',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression.
@@ -1822,6 +1500,8 @@ def plot_dew_point_depression(region='hi',
     
     An image of the RTMA Dew Point Depression Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1866,6 +1546,13 @@ def plot_dew_point_depression(region='hi',
     else:
         ds = ds
 
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_temperature is True:
         if convert_to == 'fahrenheit':
             t = _kelvin_to_fahrenheit(ds[temperature_var_key])
@@ -1878,7 +1565,7 @@ def plot_dew_point_depression(region='hi',
     else:
         vals = ds[temperature_var_key] - ds[dew_point_var_key]
                     
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -1890,233 +1577,13 @@ def plot_dew_point_depression(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 vals,
                 cmap=cmap,
@@ -2124,7 +1591,11 @@ def plot_dew_point_depression(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2133,20 +1604,20 @@ def plot_dew_point_depression(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2155,7 +1626,7 @@ def plot_dew_point_depression(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2164,7 +1635,7 @@ def plot_dew_point_depression(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2180,13 +1651,19 @@ def plot_dew_point_depression(region='hi',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    lats_1d, lons_1d, temp_1d = _fix_var_array(ds,
-                    temperature_var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [temperature_var_key, dew_point_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, dwpt_1d = _fix_var_array(ds,
-                    dew_point_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
+    
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    temp_1d = queries[temperature_var_key]
+    dwpt_1d = queries[dew_point_var_key]
     
     if convert_temperature == True:
         if convert_to == 'fahrenheit':
@@ -2216,8 +1693,11 @@ def plot_dew_point_depression(region='hi',
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2366,7 +1846,15 @@ def plot_relative_humidity(region='hi',
                      var_key='2m_relative_humidity',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative humidity.
@@ -2393,6 +1881,8 @@ def plot_relative_humidity(region='hi',
     
     An image of the RTMA Relative Humidity Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -2437,7 +1927,14 @@ def plot_relative_humidity(region='hi',
     else:
         ds = ds
         
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
@@ -2449,233 +1946,13 @@ def plot_relative_humidity(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 ds[var_key],
                 cmap=cmap,
@@ -2683,7 +1960,11 @@ def plot_relative_humidity(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2692,20 +1973,20 @@ def plot_relative_humidity(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2714,7 +1995,7 @@ def plot_relative_humidity(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2723,7 +2004,7 @@ def plot_relative_humidity(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2740,10 +2021,19 @@ def plot_relative_humidity(region='hi',
             zorder=reference_system_textbox_zorder)
         
         
-    lats_1d, lons_1d, vals_1d = _fix_var_array(ds,
-                                                var_key,
-                                                decimate)
-
+    queries = _extract_pixel_queries(ds,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
+    
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    vals_1d = queries[var_key]
+    
     stn = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -2759,8 +2049,11 @@ def plot_relative_humidity(region='hi',
                        zorder=pixel_query_value_zorder)
 
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2912,7 +2205,15 @@ def plot_wind_speed(region='hi',
                      barb_length=4.5,
                      barb_width=0.5,
                      barb_color='black',
-                     barb_zorder=7):
+                     barb_zorder=7,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for sustained wind speed.
@@ -2939,6 +2240,8 @@ def plot_wind_speed(region='hi',
     
     An image of the RTMA Wind Speed Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -2983,15 +2286,22 @@ def plot_wind_speed(region='hi',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
         if convert_to == 'mph':
-            speed_vals = _ms_to_mph(ds[var_key])
+            speed_vals = _mps_to_mph(ds[var_key])
         else:
-            speed_vals = _ms_to_kts(ds[var_key])
+            speed_vals = _mps_to_kts(ds[var_key])
     else:
         speed_vals = ds[var_key]
     
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("wind speed", colors)
@@ -3003,233 +2313,13 @@ def plot_wind_speed(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 speed_vals,
                 cmap=cmap,
@@ -3237,7 +2327,11 @@ def plot_wind_speed(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -3246,20 +2340,20 @@ def plot_wind_speed(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3268,7 +2362,7 @@ def plot_wind_speed(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3277,7 +2371,7 @@ def plot_wind_speed(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3295,27 +2389,30 @@ def plot_wind_speed(region='hi',
         
     
         
-    lats_1d, lons_1d, vals_1d = _fix_var_array(ds,
-                    var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [var_key, u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, u_1d = _fix_var_array(ds,
-                    u_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
     
-    _, _, v_1d = _fix_var_array(ds,
-                    v_var_key,
-                    decimate)
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    vals_1d = queries[var_key]
+    u_1d = queries[u_var_key]
+    v_1d = queries[v_var_key]
     
     if convert_wind_speed == True:
         if convert_to == 'mph':
-            vals_1d = _ms_to_mph(vals_1d)
-            u_1d = _ms_to_mph(u_1d)
-            v_1d = _ms_to_mph(v_1d)
+            vals_1d = _mps_to_mph(vals_1d)
+            u_1d = _mps_to_mph(u_1d)
+            v_1d = _mps_to_mph(v_1d)
         else:
-            vals_1d = _ms_to_kts(vals_1d)
-            u_1d = _ms_to_kts(u_1d)
-            v_1d = _ms_to_kts(v_1d)
+            vals_1d = _mps_to_kts(vals_1d)
+            u_1d = _mps_to_kts(u_1d)
+            v_1d = _mps_to_kts(v_1d)
     else:
         vals_1d = vals_1d
         u_1d = u_1d
@@ -3343,8 +2440,11 @@ def plot_wind_speed(region='hi',
                         linewidth=barb_width,
                         zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -3495,7 +2595,15 @@ def plot_wind_gust(region='hi',
                      barb_length=4.5,
                      barb_width=0.5,
                      barb_color='black',
-                     barb_zorder=7):
+                     barb_zorder=7,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for wind gust.
@@ -3522,6 +2630,8 @@ def plot_wind_gust(region='hi',
     
     An image of the RTMA Wind Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -3566,18 +2676,23 @@ def plot_wind_gust(region='hi',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_wind_speed == True:
         if convert_to == 'mph':
-            speed_vals = _ms_to_mph(ds[var_key])
+            speed_vals = _mps_to_mph(ds[var_key])
         else:
-            speed_vals = _ms_to_kts(ds[var_key])
+            speed_vals = _mps_to_kts(ds[var_key])
     else:
         speed_vals = ds[var_key]
     
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
     
-    u, v = _u_v_components(speed_vals,
-                                     ds[wind_direction_var_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("wind gust", colors)
@@ -3589,233 +2704,13 @@ def plot_wind_gust(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 speed_vals,
                 cmap=cmap,
@@ -3823,7 +2718,11 @@ def plot_wind_gust(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -3832,20 +2731,20 @@ def plot_wind_gust(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3854,7 +2753,7 @@ def plot_wind_gust(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3863,7 +2762,7 @@ def plot_wind_gust(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3881,26 +2780,32 @@ def plot_wind_gust(region='hi',
         
     
         
-    lats_1d, lons_1d, gust_1d = _fix_var_array(ds,
-                    var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
     
-    _, _, dir_1d = _fix_var_array(ds,
-                    wind_direction_var_key,
-                    decimate)
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    gust_1d = queries[var_key]
+    dir_1d = queries[wind_direction_var_key]
     
-    u_1d, v_1d = _u_v_components(gust_1d,
+    u_1d, v_1d = _wind_components(gust_1d,
                                      dir_1d)
     
     if convert_wind_speed == True:
         if convert_to == 'mph':
-            speed_vals = _ms_to_mph(gust_1d)
-            u = _ms_to_mph(u_1d)
-            v = _ms_to_mph(v_1d)
+            speed_vals = _mps_to_mph(gust_1d)
+            u = _mps_to_mph(u_1d)
+            v = _mps_to_mph(v_1d)
         else:
-            speed_vals = _ms_to_kts(gust_1d)
-            u = _ms_to_kts(u_1d)
-            v = _ms_to_kts(v_1d)
+            speed_vals = _mps_to_kts(gust_1d)
+            u = _mps_to_kts(u_1d)
+            v = _mps_to_kts(v_1d)
 
     stn = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
@@ -3924,8 +2829,11 @@ def plot_wind_gust(region='hi',
                         linewidth=barb_width,
                         zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4094,7 +3002,15 @@ def plot_temperature_and_wind(region='hi',
                      barb_color='black',
                      barb_zorder=7,
                      temp_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature + wind.
@@ -4121,6 +3037,8 @@ def plot_temperature_and_wind(region='hi',
     
     An image of the RTMA Temperature + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -4166,6 +3084,13 @@ def plot_temperature_and_wind(region='hi',
         ds = ds
         
     
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_temperature is True:
         if convert_temp_to == 'fahrenheit':
             vals = _kelvin_to_fahrenheit(ds[temperature_var_key])
@@ -4174,7 +3099,7 @@ def plot_temperature_and_wind(region='hi',
     else:
         vals = ds[temperature_var_key]
     
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
@@ -4186,233 +3111,13 @@ def plot_temperature_and_wind(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 vals,
                 cmap=cmap,
@@ -4420,7 +3125,11 @@ def plot_temperature_and_wind(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -4429,20 +3138,20 @@ def plot_temperature_and_wind(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4451,7 +3160,7 @@ def plot_temperature_and_wind(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4460,7 +3169,7 @@ def plot_temperature_and_wind(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4476,34 +3185,32 @@ def plot_temperature_and_wind(region='hi',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    lats_1d, lons_1d, temp_1d = _fix_var_array(ds,
-                    temperature_var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [temperature_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, u_1d = _fix_var_array(ds,
-                    u_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
     
-    _, _, v_1d = _fix_var_array(ds,
-                    v_var_key,
-                    decimate)
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    temp_1d = queries[temperature_var_key]
+    u_1d = queries[u_var_key]
+    v_1d = queries[v_var_key]
+    ws_1d = queries[wind_speed_var_key]
     
-    _, _, ws_1d = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    decimate)
-    
-    u, v = _u_v_components(speed_vals,
-                                     ds[wind_direction_var_key])
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals = _ms_to_mph(ws_1d)
-            u = _ms_to_mph(u_1d)
-            v = _ms_to_mph(v_1d)
+            speed_vals = _mps_to_mph(ws_1d)
+            u = _mps_to_mph(u_1d)
+            v = _mps_to_mph(v_1d)
         else:
-            speed_vals = _ms_to_kts(ws_1d)
-            u = _ms_to_kts(u_1d)
-            v = _ms_to_kts(v_1d)
+            speed_vals = _mps_to_kts(ws_1d)
+            u = _mps_to_kts(u_1d)
+            v = _mps_to_kts(v_1d)
     else:
         speed_vals = ws_1d
         u = u_1d
@@ -4545,8 +3252,11 @@ def plot_temperature_and_wind(region='hi',
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4713,7 +3423,15 @@ def plot_temperature_and_gust(region='hi',
                      barb_color='black',
                      barb_zorder=7,
                      temp_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature + gust.
@@ -4740,6 +3458,8 @@ def plot_temperature_and_gust(region='hi',
     
     An image of the RTMA Temperature + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -4784,6 +3504,13 @@ def plot_temperature_and_gust(region='hi',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_temperature is True:
         if convert_temp_to == 'fahrenheit':
             vals = _kelvin_to_fahrenheit(ds[temperature_var_key])
@@ -4792,7 +3519,7 @@ def plot_temperature_and_gust(region='hi',
     else:
         vals = ds[temperature_var_key]
     
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
             
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
@@ -4804,233 +3531,13 @@ def plot_temperature_and_gust(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 vals,
                 cmap=cmap,
@@ -5038,7 +3545,11 @@ def plot_temperature_and_gust(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -5047,20 +3558,20 @@ def plot_temperature_and_gust(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5069,7 +3580,7 @@ def plot_temperature_and_gust(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5078,7 +3589,7 @@ def plot_temperature_and_gust(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5096,30 +3607,33 @@ def plot_temperature_and_gust(region='hi',
         
     
         
-    lats_1d, lons_1d, temp_1d = _fix_var_array(ds,
-                    temperature_var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [temperature_var_key, wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, wg_1d = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
     
-    _, _, dir_1d = _fix_var_array(ds,
-                    wind_direction_var_key,
-                    decimate)
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    temp_1d = queries[temperature_var_key]
+    wg_1d = queries[wind_gust_var_key]
+    dir_1d = queries[wind_direction_var_key]
     
-    u_1d, v_1d = _u_v_components(wg_1d,
+    u_1d, v_1d = _wind_components(wg_1d,
                                      dir_1d)
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals = _ms_to_mph(wg_1d)
-            u = _ms_to_mph(u_1d)
-            v = _ms_to_mph(v_1d)
+            speed_vals = _mps_to_mph(wg_1d)
+            u = _mps_to_mph(u_1d)
+            v = _mps_to_mph(v_1d)
         else:
-            speed_vals = _ms_to_kts(wg_1d)
-            u = _ms_to_kts(u_1d)
-            v = _ms_to_kts(v_1d)
+            speed_vals = _mps_to_kts(wg_1d)
+            u = _mps_to_kts(u_1d)
+            v = _mps_to_kts(v_1d)
     else:
         speed_vals = wg_1d
         u = u_1d
@@ -5161,8 +3675,11 @@ def plot_temperature_and_gust(region='hi',
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -5321,7 +3838,15 @@ def plot_relative_humidity_and_wind(region='hi',
                      barb_color='black',
                      barb_zorder=7,
                      rh_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative humidity + wind.
@@ -5348,6 +3873,8 @@ def plot_relative_humidity_and_wind(region='hi',
     
     An image of the RTMA Relative Humidity + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -5392,7 +3919,14 @@ def plot_relative_humidity_and_wind(region='hi',
     else:
         ds = ds
     
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
@@ -5404,233 +3938,13 @@ def plot_relative_humidity_and_wind(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 ds[relative_humidity_var_key],
                 cmap=cmap,
@@ -5638,7 +3952,11 @@ def plot_relative_humidity_and_wind(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -5647,20 +3965,20 @@ def plot_relative_humidity_and_wind(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5669,7 +3987,7 @@ def plot_relative_humidity_and_wind(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5678,7 +3996,7 @@ def plot_relative_humidity_and_wind(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5696,31 +4014,31 @@ def plot_relative_humidity_and_wind(region='hi',
         
     
         
-    lats_1d, lons_1d, vals_1d = _fix_var_array(ds,
-                    relative_humidity_var_key,
-                    decimate)
-    
-    _, _, u_1d = _fix_var_array(ds,
-                    u_var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [relative_humidity_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, v_1d = _fix_var_array(ds,
-                    v_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
     
-    _, _, ws_1d = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    decimate)
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    vals_1d = queries[relative_humidity_var_key]
+    u_1d = queries[u_var_key]
+    v_1d = queries[v_var_key]
+    ws_1d = queries[wind_speed_var_key]
     
     if convert_wind_speed == True:
         if convert_to == 'mph':
-            speed_vals = _ms_to_mph(ws_1d)
-            u = _ms_to_mph(u_1d)
-            v = _ms_to_mph(v_1d)
+            speed_vals = _mps_to_mph(ws_1d)
+            u = _mps_to_mph(u_1d)
+            v = _mps_to_mph(v_1d)
         else:
-            speed_vals = _ms_to_kts(ws_1d)
-            u = _ms_to_kts(u_1d)
-            v = _ms_to_kts(v_1d)
+            speed_vals = _mps_to_kts(ws_1d)
+            u = _mps_to_kts(u_1d)
+            v = _mps_to_kts(v_1d)
             
     else:
         speed_vals = ws_1d
@@ -5755,8 +4073,11 @@ def plot_relative_humidity_and_wind(region='hi',
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -5915,7 +4236,15 @@ def plot_relative_humidity_and_gust(region='hi',
                      barb_color='black',
                      barb_zorder=7,
                      rh_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative_humidity + gust.
@@ -5942,6 +4271,8 @@ def plot_relative_humidity_and_gust(region='hi',
     
     An image of the RTMA Relative Humidity + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -5986,7 +4317,14 @@ def plot_relative_humidity_and_gust(region='hi',
     else:
         ds = ds
     
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
@@ -5998,233 +4336,13 @@ def plot_relative_humidity_and_gust(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 ds[relative_humidity_var_key],
                 cmap=cmap,
@@ -6232,7 +4350,11 @@ def plot_relative_humidity_and_gust(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -6241,20 +4363,20 @@ def plot_relative_humidity_and_gust(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6263,7 +4385,7 @@ def plot_relative_humidity_and_gust(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6272,7 +4394,7 @@ def plot_relative_humidity_and_gust(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6290,30 +4412,33 @@ def plot_relative_humidity_and_gust(region='hi',
         
     
         
-    lats_1d, lons_1d, rh_1d = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [relative_humidity_var_key, wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, wg_1d = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
     
-    _, _, dir_1d = _fix_var_array(ds,
-                    wind_direction_var_key,
-                    decimate)
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    rh_1d = queries[relative_humidity_var_key]
+    wg_1d = queries[wind_gust_var_key]
+    dir_1d = queries[wind_direction_var_key]
     
-    u_1d, v_1d = _u_v_components(wg_1d,
+    u_1d, v_1d = _wind_components(wg_1d,
                                      dir_1d)
     
     if convert_wind_speed == True:
         if convert_to == 'mph':
-            speed_vals = _ms_to_mph(wg_1d)
-            u = _ms_to_mph(u_1d)
-            v = _ms_to_mph(v_1d)
+            speed_vals = _mps_to_mph(wg_1d)
+            u = _mps_to_mph(u_1d)
+            v = _mps_to_mph(v_1d)
         else:
-            speed_vals = _ms_to_kts(wg_1d)
-            u = _ms_to_kts(u_1d)
-            v = _ms_to_kts(v_1d)
+            speed_vals = _mps_to_kts(wg_1d)
+            u = _mps_to_kts(u_1d)
+            v = _mps_to_kts(v_1d)
     else:
         speed_vals = wg_1d
         u = u_1d
@@ -6347,8 +4472,11 @@ def plot_relative_humidity_and_gust(region='hi',
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -6510,7 +4638,15 @@ def plot_dew_point_depression_and_wind(region='hi',
                      barb_color='black',
                      barb_zorder=7,
                      dd_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + wind.
@@ -6537,6 +4673,8 @@ def plot_dew_point_depression_and_wind(region='hi',
     
     An image of the RTMA Dew Point Depression + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -6582,6 +4720,13 @@ def plot_dew_point_depression_and_wind(region='hi',
         ds = ds
         
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_temperature is True:
         if convert_temp_to == 'fahrenheit':
             t = _kelvin_to_fahrenheit(ds[temperature_var_key])
@@ -6595,7 +4740,7 @@ def plot_dew_point_depression_and_wind(region='hi',
         vals = ds[temperature_var_key] - ds[dew_point_var_key]
         
     
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -6607,233 +4752,13 @@ def plot_dew_point_depression_and_wind(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 vals,
                 cmap=cmap,
@@ -6841,7 +4766,11 @@ def plot_dew_point_depression_and_wind(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -6850,20 +4779,20 @@ def plot_dew_point_depression_and_wind(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6872,7 +4801,7 @@ def plot_dew_point_depression_and_wind(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6881,7 +4810,7 @@ def plot_dew_point_depression_and_wind(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6899,35 +4828,32 @@ def plot_dew_point_depression_and_wind(region='hi',
         
     
         
-    lats_1d, lons_1d, temp_1d = _fix_var_array(ds,
-                    temperature_var_key,
-                    decimate)
-    
-    _, _, dwpt_1d = _fix_var_array(ds,
-                    dew_point_var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [temperature_var_key, dew_point_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, u_1d = _fix_var_array(ds,
-                    u_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
     
-    _, _, v_1d = _fix_var_array(ds,
-                    v_var_key,
-                    decimate)
-    
-    _, _, ws_1d = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    decimate)
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    temp_1d = queries[temperature_var_key]
+    dwpt_1d = queries[dew_point_var_key]
+    u_1d = queries[u_var_key]
+    v_1d = queries[v_var_key]
+    ws_1d = queries[wind_speed_var_key]
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals = _ms_to_mph(ws_1d)
-            u = _ms_to_mph(u_1d)
-            v = _ms_to_mph(v_1d)
+            speed_vals = _mps_to_mph(ws_1d)
+            u = _mps_to_mph(u_1d)
+            v = _mps_to_mph(v_1d)
         else:
-            speed_vals = _ms_to_kts(ws_1d)
-            u = _ms_to_kts(u_1d)
-            v = _ms_to_kts(v_1d)
+            speed_vals = _mps_to_kts(ws_1d)
+            u = _mps_to_kts(u_1d)
+            v = _mps_to_kts(v_1d)
     else:
         speed_vals = ws_1d
         u = u_1d
@@ -6973,8 +4899,11 @@ def plot_dew_point_depression_and_wind(region='hi',
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -7136,7 +5065,15 @@ def plot_dew_point_depression_and_gust(region='hi',
                      barb_color='black',
                      barb_zorder=7,
                      dd_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + gust.
@@ -7163,6 +5100,8 @@ def plot_dew_point_depression_and_gust(region='hi',
     
     An image of the RTMA Dew Point Depression + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -7207,6 +5146,13 @@ def plot_dew_point_depression_and_gust(region='hi',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_temperature is True:
         if convert_temp_to == 'fahrenheit':
             t = _kelvin_to_fahrenheit(ds[temperature_var_key])
@@ -7219,7 +5165,7 @@ def plot_dew_point_depression_and_gust(region='hi',
     else:
         vals = ds[temperature_var_key] - ds[dew_point_var_key]
     
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
     
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -7231,233 +5177,13 @@ def plot_dew_point_depression_and_gust(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 vals,
                 cmap=cmap,
@@ -7465,7 +5191,11 @@ def plot_dew_point_depression_and_gust(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -7474,20 +5204,20 @@ def plot_dew_point_depression_and_gust(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7496,7 +5226,7 @@ def plot_dew_point_depression_and_gust(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7505,7 +5235,7 @@ def plot_dew_point_depression_and_gust(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7523,35 +5253,34 @@ def plot_dew_point_depression_and_gust(region='hi',
         
     
         
-    lats_1d, lons_1d, temp_1d = _fix_var_array(ds,
-                    temperature_var_key,
-                    decimate)
-    
-    _, _, dwpt_1d = _fix_var_array(ds,
-                    dew_point_var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [temperature_var_key, dew_point_var_key, wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
     
-    _, _, wg_1d = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    decimate)
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    temp_1d = queries[temperature_var_key]
+    dwpt_1d = queries[dew_point_var_key]
+    wg_1d = queries[wind_gust_var_key]
+    dir_1d = queries[wind_direction_var_key]
     
-    _, _, dir_1d = _fix_var_array(ds,
-                    wind_direction_var_key,
-                    decimate)
-    
-    u_1d, v_1d = _u_v_components(wg_1d,
+    u_1d, v_1d = _wind_components(wg_1d,
                            dir_1d)
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals = _ms_to_mph(wg_1d)
-            u = _ms_to_mph(u_1d)
-            v = _ms_to_mph(v_1d)
+            speed_vals = _mps_to_mph(wg_1d)
+            u = _mps_to_mph(u_1d)
+            v = _mps_to_mph(v_1d)
         else:
-            speed_vals = _ms_to_kts(wg_1d)
-            u = _ms_to_kts(u_1d)
-            v = _ms_to_kts(v_1d)
+            speed_vals = _mps_to_kts(wg_1d)
+            u = _mps_to_kts(u_1d)
+            v = _mps_to_kts(v_1d)
     else:
         speed_vals = wg_1d
         u = u_1d
@@ -7597,8 +5326,11 @@ def plot_dew_point_depression_and_gust(region='hi',
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -7759,7 +5491,15 @@ def plot_dew_point_and_wind(region='hi',
                      barb_color='black',
                      barb_zorder=7,
                      dwpt_value_loc='NW',
-                     speed_value_loc='NE'):
+                     speed_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + wind.
@@ -7786,6 +5526,8 @@ def plot_dew_point_and_wind(region='hi',
     
     An image of the RTMA Dew Point + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -7830,6 +5572,13 @@ def plot_dew_point_and_wind(region='hi',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_temperature is True:
         if convert_temp_to == 'fahrenheit':
             vals = _kelvin_to_fahrenheit(ds[dew_point_var_key])
@@ -7838,7 +5587,7 @@ def plot_dew_point_and_wind(region='hi',
     else:
         vals = ds[dew_point_var_key]
     
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -7850,233 +5599,13 @@ def plot_dew_point_and_wind(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 vals,
                 cmap=cmap,
@@ -8084,7 +5613,11 @@ def plot_dew_point_and_wind(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -8093,20 +5626,20 @@ def plot_dew_point_and_wind(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8115,7 +5648,7 @@ def plot_dew_point_and_wind(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8124,7 +5657,7 @@ def plot_dew_point_and_wind(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8142,31 +5675,31 @@ def plot_dew_point_and_wind(region='hi',
         
 
     
-    lats_1d, lons_1d, dwpt_1d = _fix_var_array(ds,
-                    dew_point_var_key,
-                    decimate)
+    queries = _extract_pixel_queries(ds,
+                    [dew_point_var_key, u_var_key, v_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, u_1d = _fix_var_array(ds,
-                    u_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
     
-    _, _, v_1d = _fix_var_array(ds,
-                    v_var_key,
-                    decimate)
-    
-    _, _, ws_1d = _fix_var_array(ds,
-                    wind_speed_var_key,
-                    decimate)
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    dwpt_1d = queries[dew_point_var_key]
+    u_1d = queries[u_var_key]
+    v_1d = queries[v_var_key]
+    ws_1d = queries[wind_speed_var_key]
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals = _ms_to_mph(ws_1d)
-            u = _ms_to_mph(u_1d)
-            v = _ms_to_mph(v_1d)
+            speed_vals = _mps_to_mph(ws_1d)
+            u = _mps_to_mph(u_1d)
+            v = _mps_to_mph(v_1d)
         else:
-            speed_vals = _ms_to_kts(ws_1d)
-            u = _ms_to_kts(u_1d)
-            v = _ms_to_kts(v_1d)
+            speed_vals = _mps_to_kts(ws_1d)
+            u = _mps_to_kts(u_1d)
+            v = _mps_to_kts(v_1d)
     else:
         speed_vals = ws_1d
         u = u_1d
@@ -8208,8 +5741,11 @@ def plot_dew_point_and_wind(region='hi',
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -8370,7 +5906,15 @@ def plot_dew_point_and_gust(region='hi',
                      barb_color='black',
                      barb_zorder=7,
                      dwpt_value_loc='NW',
-                     gust_value_loc='NE'):
+                     gust_value_loc='NE',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + gust.
@@ -8397,6 +5941,8 @@ def plot_dew_point_and_gust(region='hi',
     
     An image of the RTMA Dew Point + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -8441,6 +5987,13 @@ def plot_dew_point_and_gust(region='hi',
     else:
         ds = ds
         
+    if crop_to_region is True and contour_cache is False:
+        ds = _subset_to_region(ds,
+                               [western_bound, eastern_bound, southern_bound, northern_bound],
+                               longitude_key,
+                               latitude_key,
+                               mapcrs=mapcrs)
+        
     if convert_temperature is True:
         if convert_temp_to == 'fahrenheit':
             vals = _kelvin_to_fahrenheit(ds[dew_point_var_key])
@@ -8449,7 +6002,7 @@ def plot_dew_point_and_gust(region='hi',
     else:
         vals = ds[dew_point_var_key]
     
-    lon2d, lat2d = _np.meshgrid(ds[longitude_key], ds[latitude_key])
+    lon2d, lat2d = _grid_coordinates(ds[longitude_key], ds[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -8461,233 +6014,13 @@ def plot_dew_point_and_gust(region='hi',
     time = valid_time.astimezone(_to_zone)
     time_utc = time.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
                 vals,
                 cmap=cmap,
@@ -8695,7 +6028,11 @@ def plot_dew_point_and_gust(region='hi',
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -8704,20 +6041,20 @@ def plot_dew_point_and_gust(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid: {time.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid: {time_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8726,7 +6063,7 @@ def plot_dew_point_and_gust(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8735,7 +6072,7 @@ def plot_dew_point_and_gust(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8752,31 +6089,33 @@ def plot_dew_point_and_gust(region='hi',
             zorder=reference_system_textbox_zorder)
         
     
-    lats_1d, lons_1d, dwpt_1d = _fix_var_array(ds,
-                    dew_point_var_key,
-                    decimate)
-    
+    queries = _extract_pixel_queries(ds,
+                    [dew_point_var_key, wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, wg_1d = _fix_var_array(ds,
-                    wind_gust_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries = _thin_pixel_queries(ax, queries, pixel_query_spacing, datacrs)
     
-    _, _, dir_1d = _fix_var_array(ds,
-                    wind_direction_var_key,
-                    decimate)
+    lats_1d = queries['latitude']
+    lons_1d = queries['longitude']
+    dwpt_1d = queries[dew_point_var_key]
+    wg_1d = queries[wind_gust_var_key]
+    dir_1d = queries[wind_direction_var_key]
     
-    u_1d, v_1d = _u_v_components(wg_1d,
+    u_1d, v_1d = _wind_components(wg_1d,
                            dir_1d)
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals = _ms_to_mph(wg_1d)
-            u = _ms_to_mph(u_1d)
-            v = _ms_to_mph(v_1d)
+            speed_vals = _mps_to_mph(wg_1d)
+            u = _mps_to_mph(u_1d)
+            v = _mps_to_mph(v_1d)
         else:
-            speed_vals = _ms_to_kts(wg_1d)
-            u = _ms_to_kts(u_1d)
-            v = _ms_to_kts(v_1d)
+            speed_vals = _mps_to_kts(wg_1d)
+            u = _mps_to_kts(u_1d)
+            v = _mps_to_kts(v_1d)
     else:
         speed_vals = wg_1d
         u = u_1d
@@ -8818,9 +6157,92 @@ def plot_dew_point_and_gust(region='hi',
                     linewidth=barb_width,
                     zorder=barb_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
-        
\ No newline at end of file
+
+def render_suite(products=None,
+                 regions=None,
+                 reference_systems=['States & Counties'],
+                 ds=None,
+                 product_kwargs=None,
+                 notifications='off',
+                 workers=1,
+                 **kwargs):
+    
+    """
+    This function renders a suite of RTMA Hawaii graphics (products x regions x reference systems) in one call.
+    
+    The data is downloaded and decoded once and the cartographic reference layers are loaded once for the whole suite.
+    
+    Required Arguments: None
+    
+    Optional Arguments:
+    
+    1) products (List or None) - Default=None. The products to render. The product names are the plot function names 
+        without 'plot_' (i.e. ['temperature', 'relative_humidity_and_wind']). When None, all 14 products are rendered.
+        
+    2) regions (List or None) - Default=None. The regions to render (i.e. ['ca', 'oscc', 'nv']). When None, the default region is used.
+    
+    3) reference_systems (List or dict) - Default=['States & Counties']. The reference systems to render.
+        
+        Built-in reference systems
+        --------------------------
+        
+        1) 'States & Counties'
+        2) 'States Only'
+        3) 'GACC Boundaries'
+        4) 'Predictive Services Areas'
+        5) 'NWS CWA'
+        6) 'NWS Public Zones'
+        7) 'NWS Fire Weather Zones'
+        8) 'CalFire Boundaries'
+        
+        Custom reference systems are passed as a dictionary of {name: {'show_states':True, 'show_counties':False, ...}}.
+    
+    4) ds (xarray.array or None) - Default=None. The RTMA dataset passed into every plot function.
+        When None, the data is downloaded and decoded once and shared by every graphic.
+    
+    5) product_kwargs (dict or None) - Default=None. Keyword arguments that only apply to some products
+        (i.e. {'temperature':{'decimate':100}}).
+    
+    6) notifications (String) - Default='off'. When set to 'on', the time of each graphic is printed.
+    
+    7) workers (Integer or None) - Default=1. The number of processes the graphics are spread over. When None, one process per CPU is used.
+        When workers > 1, the data is downloaded and decoded once in this process and shared with the workers through memory-mapped files.
+        On Windows/macOS, call this function under if __name__ == '__main__':.
+    
+    8) **kwargs - Keyword arguments passed into every plot function that accepts them (i.e. figure_x_length, proxies, decimate).
+    
+    Returns
+    -------
+    
+    A list of dictionaries (one per graphic) with the product, region, reference_system, seconds, error and worker keys.
+    The error is None when the graphic was saved.   
+    """
+    
+    if workers != 1 and ds is None:
+        ds = _rtma(model='hi rtma',
+                   proxies=kwargs.get('proxies', None),
+                   clear_recycle_bin=kwargs.get('clear_recycle_bin', False),
+                   clear_data=kwargs.get('clear_data', True),
+                   convert_temperature=False,
+                   chunk_size=kwargs.get('chunk_size', 8192),
+                   notifications=notifications,
+                   custom_directory=kwargs.get('custom_data_directory', None))
+        ds = _convert_temperature_fields(ds, dataset_units)
+        
+    return _render_suite(_sys.modules[__name__],
+                         products=products,
+                         regions=regions,
+                         reference_systems=reference_systems,
+                         datasets={'ds':ds},
+                         product_kwargs=product_kwargs,
+                         notifications=notifications,
+                         workers=workers,
+                         **kwargs)
@@ -21,7 +21,9 @@ Arguments and Settings
         If the user wants a completely custom region where they define their own lat/lon bounds, set region='custom'. 
         
 - hours (Integer) - Default=24. The amount of hours between the current and comparison. Defaults to a 24 hour
-        comparison. 
+        comparison. The comparison analysis is read from the local RTMA archive (FireWxPy Cache/RTMA Archive) when it was
+        archived by an earlier run so only the current analysis is downloaded. Otherwise the comparison analysis is downloaded
+        on its own and archived (see firewxpy.utils.set_rtma_archive_policy()).
         
 - show_states (Boolean) - Default=True. When set to True, U.S. state borders are shown. 
     
@@ -168,8 +170,9 @@ Arguments and Settings
         of the geometries in the custom geojson.
         
 - refresh_cartographic_files (Boolean) - Default=True. Users that have automated pipelines set up for shapefiles. Having this set to
-        True allows the client to delete and re-download the shapefiles with each run of the script. This is useful for shapefiles
-        that have frequent geometry updates.
+        True re-validates the shapefiles with the server (ETag/Last-Modified) once the freshness window expires and only deletes and 
+        re-downloads the shapefiles when they changed on the server. The freshness window (default 24 hours) is shared across all calls 
+        and processes and is set with firewxpy.utils.set_refresh_policy(ttl=seconds). When set to False, the shapefiles are only downloaded once.
         
 - reference_system (String) - Default='States & Counties'. The name of the borders overlaid onto the map.
     
@@ -312,7 +315,8 @@ Arguments and Settings
         
 - ds2 (xarray.array or None) - Default=None. If the user is downloading, processing and plotting the data within the function,
         keep this set as None. If the user wishes to create a medley of plots it is recommended to download the data outside of this
-        function and pass in the data by setting ds2=ds2. This is the comparison dataset.  
+        function and pass in the data by setting ds2=ds2. This is the comparison dataset. The differences (ds1 - ds2) are computed
+        once per pair of datasets and variable and reused by every product and region (see firewxpy.utils.comparison_difference()).
             
 - western_bound (Float or Integer) - Default=-125. When region is set to 'custom' the user defines the bounds of the plot in 
         latitude and longitude coordinates.
@@ -450,67 +454,115 @@ For Temperature & Wind/Gust, Dew Point & Wind/Gust & Dew Point Depression & Wind
 
 - convert_speed_to (String) - Convert the wind speed/gust from m/s to either mph or kts.
 
+- crop_to_region (Boolean) - Default=True. When set to True, the data is cropped to the region plus a small halo before it is contoured
+        and before the pixel query values are built. This significantly speeds up plots of smaller regions (i.e. States or GACCs).
+        Set to False to contour the full grid.
+
+- pixel_query_spacing (Integer, Float or None) - Default=None. When set to a number of pixels, the pixel queries are thinned on the screen
+        so the values/barbs keep this minimum spacing regardless of the map projection and region. This keeps the number of 
+        station plot values predictable and speeds up drawing. decimate then only selects the candidate grid points 
+        (i.e. decimate=1 makes every grid point a candidate). The selected points are cached for each grid, region and figure size.
+        When None, the pixel queries are only thinned by decimate.
+
+- reuse_base_map (Boolean) - Default=True. When set to True, the scaffold of the map (the figure, the extent, the coastlines/land/ocean/lakes
+        and the reference layers) is built once for each region, projection, figure size and reference layer style and is reused by every later
+        plot with the same settings. Only the contours, colorbar, titles and station plot are drawn for each product.
+        The templates are not pyplot figures, so they are never shown (i.e. in a notebook) or left open in pyplot.
+        Set to False to build a new figure for every plot.
+
+- rasterize_base_map (Boolean) - Default=False. When set to True (with reuse_base_map=True), the land/ocean/lakes fills and the reference
+        layers are rendered once to a raster for each region, projection, figure size, dpi and style and drawn as images in
+        the layering of the vector map (i.e. the fills below the weather field and the borders above it). Only the weather field and the annotations stay vector,
+        which greatly reduces the time to save graphics with dense borders (i.e. counties or zones).
+
+- render_mode (String) - Default='contourf'. How the weather field is drawn.
+    
+        Render modes
+        ------------
+        
+        1) 'contourf' - Filled contours.
+        
+        2) 'pcolormesh' - Each grid cell is colored with the discrete colors of the contour levels (BoundaryNorm).
+            Much faster than contourf on the full resolution grid.
+        
+        3) 'imshow' - The grid is resampled onto the pixels of the map and drawn as one image with the discrete colors of the
+            contour levels (BoundaryNorm). The fastest mode. The pixel lookup is cached for each grid, region and figure size.
+
+- coarsen_quality (Integer, Float or None) - Default=None. When set, the weather field is coarsened to the resolution the figure
+        is able to display before it is drawn. The number of grid cells per pixel is computed from the extent, the figure size and the dpi and
+        the field is reduced so about coarsen_quality grid cells remain per pixel (i.e. 1 for one grid cell per pixel, 2 keeps twice the detail).
+        This makes national plots much cheaper with little visible change. The pixel query values are always taken from the full resolution data.
+        When None, the full grid is drawn.
+    
+- coarsen_method (String) - Default='mean'. How the field is coarsened. 'mean' (NaN-aware block averages) or 'stride' (every n-th grid point).
+
+- contour_cache (Boolean) - Default=False. When set to True, the filled contours of the weather field are computed once on the full grid
+        and cached (keyed by the content of the field, the grid and the contour levels). Every later plot of the same field for another
+        region reuses the cached polygons and only draws the ones that overlap its map. This is the fastest way to contour the same field
+        for many regions. The data is not cropped to the region and the field is not coarsened when contour_cache=True.
+
 """
 
+import sys as _sys
 import warnings as _warnings
 _warnings.filterwarnings('ignore')
 import matplotlib as _mpl 
 import firewxpy.calc.calc as _calc
-import matplotlib.pyplot as _plt 
 import matplotlib.colors as _mcolors
 import cartopy.crs as _ccrs 
-import cartopy.feature as _cfeature 
 import metpy.plots as _mpplots
 import numpy as _np
 import pandas as _pd
 
 from dateutil import tz as _tz
 from matplotlib.patheffects import withStroke as _withStroke
-from firewxpy.utils.station_plot_formatting import fix_var_array_rtma_hawaii as _fix_var_array
+from firewxpy.utils.station_plot_formatting import(
+    extract_pixel_queries as _extract_pixel_queries,
+    thin_pixel_queries as _thin_pixel_queries
+)
 from firewxpy.utils.directory import build_directory_branch as _build_directory_branch
 from firewxpy.utils.plot_coords import bounding_box as _bounding_box
+from firewxpy.rtma.suite import render_suite as _render_suite
+from firewxpy.utils.grid_subset import subset_to_region as _subset_to_region
+from firewxpy.utils.field_rendering import render_field as _render_field
+from firewxpy.utils.grid_coordinates import grid_coordinates as _grid_coordinates
+from firewxpy.utils.base_map import(
+    open_base_map as _open_base_map,
+    build_base_map as _build_base_map,
+    store_base_map as _store_base_map,
+    close_base_map as _close_base_map,
+    rasterize_base_map as _rasterize_base_map
+)
+from firewxpy.calc.calc import(
+    mps_to_mph as _mps_to_mph,
+    mps_to_kts as _mps_to_kts,
+    wind_components as _wind_components,
+    convert_temperature_fields as _convert_temperature_fields
+)
 from firewxpy.utils.standard import(
     get_timezone_abbreviation as _get_timezone_abbreviation,
     plot_creation_time as _plot_creation_time
 )
-from firewxpy.utils.geometry import(
-    import_shapefile_from_web as _import_shapefile_from_web,
-    import_shapefile_local as _import_shapefile_local,
-    import_geojson_from_web as _import_geojson_from_web,
-    import_geojson_local as _import_geojson_local,
-    get_filename_from_url as _get_filename_from_url
+from firewxpy.utils.dataset_cache import cached_dataset as _cached_dataset
+from firewxpy.utils.rtma_archive import archived_comparison as _archived_comparison
+from firewxpy.rtma.fetch import fetch_analysis as _fetch_analysis
+from firewxpy.utils.comparison_cache import comparison_difference as _comparison_difference
+from wxdata import(
+    rtma as _wxdata_rtma,
+    rtma_comparison as _wxdata_rtma_comparison
 )
-from wxdata import rtma_comparison as _rtma_comparison
 
-_local, _utc = _plot_creation_time()
-_timezone = _get_timezone_abbreviation()
+_rtma = _cached_dataset(_wxdata_rtma)
+_rtma_comparison = _cached_dataset(_archived_comparison(_wxdata_rtma_comparison, _rtma, _fetch_analysis))
+
 _from_zone = _tz.tzutc()
 _to_zone = _tz.tzlocal()
-_mpl.rcParams['font.weight'] = 'bold'
 
-def _kelvin_to_fahrenheit(kelvin):
-    celsius = kelvin - 273.15
-    fahrenheit = (celsius * (9/5)) + 32
-    return fahrenheit
-
-def _kelvin_to_celsius(kelvin):
-    celsius = kelvin - 273.15
-    return celsius
-    
-def _ms_to_mph(ms):
-    return ms * 2.23694
+# The temperature units of a dataset that is shared by every graphic of a suite (see render_suite() and the RTMA watcher).
+# Every product of this module converts the temperatures it plots from kelvin.
+dataset_units = 'kelvin'
 
-def _ms_to_kts(ms):
-    return ms * 1.94384
-
-def _u_v_components(wind_speed,
-                    wind_direction):
-    rad_dir = _np.deg2rad(wind_direction)
-    u = -wind_speed * _np.sin(rad_dir)
-    v = -wind_speed * _np.cos(rad_dir)
-    
-    return u, v
-    
+_mpl.rcParams['font.weight'] = 'bold'
 
 def plot_temperature(region='hi',
                      hours=24,
@@ -656,7 +708,15 @@ def plot_temperature(region='hi',
                      var_key='2m_temperature',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature.
@@ -683,6 +743,8 @@ def plot_temperature(region='hi',
     
     An image of the RTMA Temperature Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -729,23 +791,31 @@ def plot_temperature(region='hi',
         ds1 = ds1
         ds2 = ds2
         
-    if convert_temperature is True:
-        if convert_from == 'kelvin':
-            if convert_to == 'fahrenheit':
-                vals_1 = _kelvin_to_fahrenheit(ds1[var_key])
-                vals_2 = _kelvin_to_fahrenheit(ds2[var_key])
-            else:
-                vals_1 = _kelvin_to_celsius(ds1[var_key])
-                vals_2 = _kelvin_to_celsius(ds2[var_key])
-        else:
-            vals_1 = ds1[var_key]
-            vals_2 = ds2[var_key]
-    else:
-        vals_1 = ds1[var_key]
-        vals_2 = ds2[var_key]
-        
-        
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [var_key],
+                                  to_units=convert_to if convert_temperature is True and convert_from == 'kelvin' else None,
+                                  from_units='kelvin',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
     
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
@@ -762,241 +832,25 @@ def plot_temperature(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (vals_1 - vals_2),
+                diff[var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -1005,20 +859,20 @@ def plot_temperature(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -1027,7 +881,7 @@ def plot_temperature(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1036,7 +890,7 @@ def plot_temperature(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1053,26 +907,19 @@ def plot_temperature(region='hi',
             zorder=reference_system_textbox_zorder)
         
     
-    lats_1d_1, lons_1d_1, vals_1d_1 = _fix_var_array(ds1,
-                    var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, vals_1d_2 = _fix_var_array(ds2,
-                    var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    if convert_temperature is True:
-        if convert_from == 'kelvin':
-            if convert_to == 'fahrenheit':
-                vals_1d_1 = _kelvin_to_fahrenheit(vals_1d_1)
-                vals_1d_2 = _kelvin_to_fahrenheit(vals_1d_2)
-            else:
-                vals_1d_1 = _kelvin_to_celsius(vals_1d_1)
-                vals_1d_2 = _kelvin_to_celsius(vals_1d_2)
-        else:
-            pass
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
 
-    stn = _mpplots.StationPlot(ax, lons_1d_1, lats_1d_1,
+    stn = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
                                 zorder=pixel_query_value_zorder, 
@@ -1080,15 +927,18 @@ def plot_temperature(region='hi',
 
 
     stn.plot_parameter('C', 
-                       (vals_1d_1 - vals_1d_2), 
+                       diffs[var_key], 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
   
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1239,7 +1089,15 @@ def plot_dew_point(region='hi',
                      var_key='2m_dew_point',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point.
@@ -1266,6 +1124,8 @@ def plot_dew_point(region='hi',
     
     An image of the RTMA Dew Point Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1312,22 +1172,31 @@ def plot_dew_point(region='hi',
         ds1 = ds1
         ds2 = ds2
 
-    if convert_temperature is True:
-        if convert_from == 'kelvin':
-            if convert_to == 'fahrenheit':
-                vals_1 = _kelvin_to_fahrenheit(ds1[var_key])
-                vals_2 = _kelvin_to_fahrenheit(ds2[var_key])
-            else:
-                vals_1 = _kelvin_to_celsius(ds1[var_key])
-                vals_2 = _kelvin_to_celsius(ds2[var_key])
-        else:
-            vals_1 = ds1[var_key]
-            vals_2 = ds2[var_key]
-    else:
-        vals_1 = ds1[var_key]
-        vals_2 = ds2[var_key]   
-                        
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [var_key],
+                                  to_units=convert_to if convert_temperature is True and convert_from == 'kelvin' else None,
+                                  from_units='kelvin',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -1344,241 +1213,25 @@ def plot_dew_point(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (vals_1 - vals_2),
+                diff[var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -1587,20 +1240,20 @@ def plot_dew_point(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -1609,7 +1262,7 @@ def plot_dew_point(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1618,7 +1271,7 @@ def plot_dew_point(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -1634,24 +1287,17 @@ def plot_dew_point(region='hi',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    lats_1d, lons_1d, vals_1d_1 = _fix_var_array(ds1,
-                    var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, vals_1d_2 = _fix_var_array(ds2,
-                    var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    if convert_temperature is True:
-        if convert_from == 'kelvin':
-            if convert_to == 'fahrenheit':
-                vals_1d_1 = _kelvin_to_fahrenheit(vals_1d_1)
-                vals_1d_2 = _kelvin_to_fahrenheit(vals_1d_2)
-            else:
-                vals_1d_1 = _kelvin_to_celsius(vals_1d_1)
-                vals_1d_2 = _kelvin_to_celsius(vals_1d_2)
-        else:
-            pass
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
 
     stn = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
@@ -1661,14 +1307,17 @@ def plot_dew_point(region='hi',
 
 
     stn.plot_parameter('C', 
-                       (vals_1d_1 - vals_1d_2), 
+                       diffs[var_key], 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -1818,7 +1467,15 @@ def plot_dew_point_depression(region='hi',
                      dew_point_var_key='2m_dew_point',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression.
@@ -1845,6 +1502,8 @@ def plot_dew_point_depression(region='hi',
     
     An image of the RTMA Dew Point Depression Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -1891,28 +1550,31 @@ def plot_dew_point_depression(region='hi',
         ds1 = ds1
         ds2 = ds2
 
-    if convert_temperature is True:
-        if convert_to == 'fahrenheit':
-            t1 = _kelvin_to_fahrenheit(ds1[temperature_var_key])
-            d1 = _kelvin_to_fahrenheit(ds1[dew_point_var_key])
-            vals_1 = t1 - d1
-            
-            t2 = _kelvin_to_fahrenheit(ds2[temperature_var_key])
-            d2 = _kelvin_to_fahrenheit(ds2[dew_point_var_key])
-            vals_2 = t2 - d2
-        else:
-            t1 = _kelvin_to_celsius(ds1[temperature_var_key])
-            d1 = _kelvin_to_celsius(ds1[dew_point_var_key])
-            vals_1 = t1 - d1
-            
-            t2 = _kelvin_to_celsius(ds2[temperature_var_key])
-            d2 = _kelvin_to_celsius(ds2[dew_point_var_key])
-            vals_2 = t2 - d2
-    else:
-        vals_1 = ds1[temperature_var_key] - ds1[dew_point_var_key]
-        vals_2 = ds2[temperature_var_key] - ds2[dew_point_var_key]
-                    
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [temperature_var_key, dew_point_var_key],
+                                  to_units=convert_to if convert_temperature is True else None,
+                                  from_units='kelvin',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -1929,241 +1591,25 @@ def plot_dew_point_depression(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (vals_1 - vals_2),
+                (diff[temperature_var_key] - diff[dew_point_var_key]),
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2172,20 +1618,20 @@ def plot_dew_point_depression(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2194,7 +1640,7 @@ def plot_dew_point_depression(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2203,7 +1649,7 @@ def plot_dew_point_depression(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2219,47 +1665,17 @@ def plot_dew_point_depression(region='hi',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    lats_1d, lons_1d, temp_1d_1 = _fix_var_array(ds1,
-                    temperature_var_key,
-                    decimate)
-    
-    _, _, dwpt_1d_1 = _fix_var_array(ds1,
-                    dew_point_var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [temperature_var_key, dew_point_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, temp_1d_2 = _fix_var_array(ds2,
-                    temperature_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    _, _, dwpt_1d_2 = _fix_var_array(ds2,
-                    dew_point_var_key,
-                    decimate)
-    
-    if convert_temperature == True:
-        if convert_to == 'fahrenheit':
-            temp_1d_1 = _kelvin_to_fahrenheit(temp_1d_1)
-            dwpt_1d_1 = _kelvin_to_fahrenheit(dwpt_1d_1)
-            dd_1d_1 = temp_1d_1 - dwpt_1d_1
-            
-            temp_1d_2 = _kelvin_to_fahrenheit(temp_1d_2)
-            dwpt_1d_2 = _kelvin_to_fahrenheit(dwpt_1d_2)
-            dd_1d_2 = temp_1d_2 - dwpt_1d_2
-        else:
-            temp_1d_1 = _kelvin_to_celsius(temp_1d_1)
-            dwpt_1d_1 = _kelvin_to_celsius(dwpt_1d_1)
-            dd_1d_1 = temp_1d_1 - dwpt_1d_1
-            
-            temp_1d_2 = _kelvin_to_celsius(temp_1d_2)
-            dwpt_1d_2 = _kelvin_to_celsius(dwpt_1d_2)
-            dd_1d_2 = temp_1d_2 - dwpt_1d_2
-    else:
-        temp_1d_1 = temp_1d_1
-        dwpt_1d_1 = dwpt_1d_1
-        dd_1d_1 = temp_1d_1 - dwpt_1d_1
-        
-        temp_1d_2 = temp_1d_2
-        dwpt_1d_2 = dwpt_1d_2
-        dd_1d_2 = temp_1d_2 - dwpt_1d_2
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
 
     stn = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
@@ -2269,14 +1685,17 @@ def plot_dew_point_depression(region='hi',
 
 
     stn.plot_parameter('C', 
-                       (dd_1d_1 - dd_1d_2), 
+                       (diffs[temperature_var_key] - diffs[dew_point_var_key]), 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2425,7 +1844,15 @@ def plot_relative_humidity(region='hi',
                      var_key='2m_relative_humidity',
                      time_coord_key='time',
                      longitude_key='longitude',
-                     latitude_key='latitude'):
+                     latitude_key='latitude',
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative humidity.
@@ -2452,6 +1879,8 @@ def plot_relative_humidity(region='hi',
     
     An image of the RTMA Relative Humidity Analysis specified to the user's needs saved to {path}    
     """    
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -2498,7 +1927,26 @@ def plot_relative_humidity(region='hi',
         ds1 = ds1
         ds2 = ds2
         
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+    diff = _comparison_difference(ds1, ds2, [var_key], time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
@@ -2515,241 +1963,25 @@ def plot_relative_humidity(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (ds1[var_key] - ds2[var_key]),
+                diff[var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -2758,20 +1990,20 @@ def plot_relative_humidity(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
                 loc='right')
     else:
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -2780,7 +2012,7 @@ def plot_relative_humidity(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2789,7 +2021,7 @@ def plot_relative_humidity(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -2806,13 +2038,17 @@ def plot_relative_humidity(region='hi',
             zorder=reference_system_textbox_zorder)
         
         
-    lats_1d, lons_1d, vals_1d_1 = _fix_var_array(ds1,
-                                                var_key,
-                                                decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    _, _, vals_1d_2 = _fix_var_array(ds2,
-                                    var_key,
-                                    decimate)
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
 
     stn = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
@@ -2822,15 +2058,18 @@ def plot_relative_humidity(region='hi',
 
 
     stn.plot_parameter('C', 
-                       (vals_1d_1 - vals_1d_2), 
+                       diffs[var_key], 
                        color=pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
 
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -2992,7 +2231,15 @@ def plot_wind_speed(region='hi',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for sustained wind speed.
@@ -3019,6 +2266,8 @@ def plot_wind_speed(region='hi',
     
     An image of the RTMA Wind Speed Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -3065,18 +2314,31 @@ def plot_wind_speed(region='hi',
         ds1 = ds1
         ds2 = ds2
         
-    if convert_wind_speed == True:
-        if convert_to == 'mph':
-            speed_vals_1 = _ms_to_mph(ds1[var_key])
-            speed_vals_2 = _ms_to_mph(ds2[var_key])
-        else:
-            speed_vals_1 = _ms_to_kts(ds1[var_key])
-            speed_vals_2 = _ms_to_kts(ds2[var_key])
-    else:
-        speed_vals_1 = ds1[var_key]
-        speed_vals_2 = ds2[var_key]
-    
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [var_key],
+                                  to_units=convert_to if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("wind speed", colors)
@@ -3093,241 +2355,25 @@ def plot_wind_speed(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (speed_vals_1 - speed_vals_2),
+                diff[var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -3336,16 +2382,16 @@ def plot_wind_speed(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3353,7 +2399,7 @@ def plot_wind_speed(region='hi',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3362,7 +2408,7 @@ def plot_wind_speed(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3371,7 +2417,7 @@ def plot_wind_speed(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -3389,52 +2435,52 @@ def plot_wind_speed(region='hi',
         
     
         
-    lats_1d, lons_1d, vals_1d_1 = _fix_var_array(ds1,
-                    var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    _, _, u_1d_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    decimate)
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
     
-    _, _, v_1d_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    decimate)
+    queries_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, vals_1d_2 = _fix_var_array(ds2,
-                    var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_1 = _thin_pixel_queries(ax, queries_1, pixel_query_spacing, datacrs)
     
-    _, _, u_1d_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    decimate)
+    queries_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, v_1d_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_2 = _thin_pixel_queries(ax, queries_2, pixel_query_spacing, datacrs)
     
     if convert_wind_speed == True:
         if convert_to == 'mph':
-            vals_1d_1 = _ms_to_mph(vals_1d_1)
-            u_1d_1 = _ms_to_mph(u_1d_1)
-            v_1d_1 = _ms_to_mph(v_1d_1)
-            vals_1d_2 = _ms_to_mph(vals_1d_2)
-            u_1d_2 = _ms_to_mph(u_1d_2)
-            v_1d_2 = _ms_to_mph(v_1d_2)
+            u_1 = _mps_to_mph(queries_1[u_var_key])
+            v_1 = _mps_to_mph(queries_1[v_var_key])
+            u_2 = _mps_to_mph(queries_2[u_var_key])
+            v_2 = _mps_to_mph(queries_2[v_var_key])
         else:
-            vals_1d_1 = _ms_to_kts(vals_1d_1)
-            u_1d_1 = _ms_to_kts(u_1d_1)
-            v_1d_1 = _ms_to_kts(v_1d_1)
-            vals_1d_2 = _ms_to_kts(vals_1d_2)
-            u_1d_2 = _ms_to_kts(u_1d_2)
-            v_1d_2 = _ms_to_kts(v_1d_2)
+            u_1 = _mps_to_kts(queries_1[u_var_key])
+            v_1 = _mps_to_kts(queries_1[v_var_key])
+            u_2 = _mps_to_kts(queries_2[u_var_key])
+            v_2 = _mps_to_kts(queries_2[v_var_key])
     else:
-        vals_1d_1 = vals_1d_1
-        u_1d_1 = u_1d_1
-        v_1d_1 = v_1d_1
-        vals_1d_2 = vals_1d_2
-        u_1d_2 = u_1d_2
-        v_1d_2 = v_1d_2
+        u_1 = queries_1[u_var_key]
+        v_1 = queries_1[v_var_key]
+        u_2 = queries_2[u_var_key]
+        v_2 = queries_2[v_var_key]
 
     stn1 = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
@@ -3450,23 +2496,23 @@ def plot_wind_speed(region='hi',
 
     if pixel_query_type != 'barbs':
         stn1.plot_parameter('C', 
-                            (vals_1d_1 - vals_1d_2), 
+                            diffs[var_key], 
                             color=pixel_query_value_fontcolor, 
                             path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                         foreground=pixel_query_value_foreground)], 
                             zorder=pixel_query_value_zorder)
 
     else:
-        stn1.plot_barb(u_1d_1, 
-                        v_1d_1,
+        stn1.plot_barb(u_1, 
+                        v_1,
                         color=current_barb_color, 
                         length=current_barb_length, 
                         linewidth=current_barb_width,
                         zorder=current_barb_zorder,
                         label=label1)
         
-        stn2.plot_barb(u_1d_2, 
-                        v_1d_2,
+        stn2.plot_barb(u_2, 
+                        v_2,
                         color=comparison_barb_color, 
                         length=comparison_barb_length, 
                         linewidth=comparison_barb_width,
@@ -3476,8 +2522,11 @@ def plot_wind_speed(region='hi',
         leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
         leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -3638,7 +2687,15 @@ def plot_wind_gust(region='hi',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for wind gust.
@@ -3665,6 +2722,8 @@ def plot_wind_gust(region='hi',
     
     An image of the RTMA Wind Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -3711,18 +2770,31 @@ def plot_wind_gust(region='hi',
         ds1 = ds1
         ds2 = ds2
         
-    if convert_wind_speed == True:
-        if convert_to == 'mph':
-            speed_vals_1 = _ms_to_mph(ds1[var_key])
-            speed_vals_2 = _ms_to_mph(ds2[var_key])
-        else:
-            speed_vals_1 = _ms_to_kts(ds1[var_key])
-            speed_vals_2 = _ms_to_kts(ds2[var_key])
-    else:
-        speed_vals_1 = ds1[var_key]
-        speed_vals_2 = ds2[var_key]
-    
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [var_key],
+                                  to_units=convert_to if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("wind gust", colors)
@@ -3739,241 +2811,25 @@ def plot_wind_gust(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (speed_vals_1 - speed_vals_2),
+                diff[var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -3982,16 +2838,16 @@ def plot_wind_gust(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -3999,7 +2855,7 @@ def plot_wind_gust(region='hi',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4008,7 +2864,7 @@ def plot_wind_gust(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4017,7 +2873,7 @@ def plot_wind_gust(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4033,50 +2889,58 @@ def plot_wind_gust(region='hi',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    lats_1d, lons_1d, gust_1d_1 = _fix_var_array(ds1,
-                    var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    _, _, dir_1d_1 = _fix_var_array(ds1,
-                    wind_direction_var_key,
-                    decimate)
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
     
-    u_1d_1, v_1d_1 = _u_v_components(gust_1d_1,
-                                     dir_1d_1)
+    queries_1 = _extract_pixel_queries(ds1,
+                    [var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, gust_1d_2 = _fix_var_array(ds2,
-                    var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_1 = _thin_pixel_queries(ax, queries_1, pixel_query_spacing, datacrs)
     
-    _, _, dir_1d_2 = _fix_var_array(ds2,
-                    wind_direction_var_key,
-                    decimate)
+    u_1d_1, v_1d_1 = _wind_components(queries_1[var_key],
+                                     queries_1[wind_direction_var_key])
     
-    u_1d_2, v_1d_2 = _u_v_components(gust_1d_2,
-                                     dir_1d_2)
+    queries_2 = _extract_pixel_queries(ds2,
+                    [var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        queries_2 = _thin_pixel_queries(ax, queries_2, pixel_query_spacing, datacrs)
+    
+    u_1d_2, v_1d_2 = _wind_components(queries_2[var_key],
+                                     queries_2[wind_direction_var_key])
     
     if convert_wind_speed == True:
         if convert_to == 'mph':
-            vals_1d_1 = _ms_to_mph(gust_1d_1)
-            u_1d_1 = _ms_to_mph(u_1d_1)
-            v_1d_1 = _ms_to_mph(v_1d_1)
-            vals_1d_2 = _ms_to_mph(gust_1d_2)
-            u_1d_2 = _ms_to_mph(u_1d_2)
-            v_1d_2 = _ms_to_mph(v_1d_2)
+            u_1 = _mps_to_mph(u_1d_1)
+            v_1 = _mps_to_mph(v_1d_1)
+            u_2 = _mps_to_mph(u_1d_2)
+            v_2 = _mps_to_mph(v_1d_2)
         else:
-            vals_1d_1 = _ms_to_kts(gust_1d_1)
-            u_1d_1 = _ms_to_kts(u_1d_1)
-            v_1d_1 = _ms_to_kts(v_1d_1)
-            vals_1d_2 = _ms_to_kts(gust_1d_2)
-            u_1d_2 = _ms_to_kts(u_1d_2)
-            v_1d_2 = _ms_to_kts(v_1d_2)
+            u_1 = _mps_to_kts(u_1d_1)
+            v_1 = _mps_to_kts(v_1d_1)
+            u_2 = _mps_to_kts(u_1d_2)
+            v_2 = _mps_to_kts(v_1d_2)
     else:
-        vals_1d_1 = gust_1d_1
-        u_1d_1 = u_1d_1
-        v_1d_1 = v_1d_1
-        vals_1d_2 = gust_1d_2
-        u_1d_2 = u_1d_2
-        v_1d_2 = v_1d_2
+        u_1 = u_1d_1
+        v_1 = v_1d_1
+        u_2 = u_1d_2
+        v_2 = v_1d_2
 
     stn1 = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
@@ -4092,23 +2956,23 @@ def plot_wind_gust(region='hi',
 
     if pixel_query_type != 'barbs':
         stn1.plot_parameter('C', 
-                            (vals_1d_1 - vals_1d_2), 
+                            diffs[var_key], 
                             color=pixel_query_value_fontcolor, 
                             path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                         foreground=pixel_query_value_foreground)], 
                             zorder=pixel_query_value_zorder)
 
     else:
-        stn1.plot_barb(u_1d_1, 
-                        v_1d_1,
+        stn1.plot_barb(u_1, 
+                        v_1,
                         color=current_barb_color, 
                         length=current_barb_length, 
                         linewidth=current_barb_width,
                         zorder=current_barb_zorder,
                         label=label1)
         
-        stn2.plot_barb(u_1d_2, 
-                        v_1d_2,
+        stn2.plot_barb(u_2, 
+                        v_2,
                         color=comparison_barb_color, 
                         length=comparison_barb_length, 
                         linewidth=comparison_barb_width,
@@ -4118,8 +2982,11 @@ def plot_wind_gust(region='hi',
         leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
         leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4287,7 +3154,15 @@ def plot_temperature_and_wind(region='hi',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature + wind.
@@ -4314,6 +3189,8 @@ def plot_temperature_and_wind(region='hi',
     
     An image of the RTMA Temperature + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -4361,18 +3238,37 @@ def plot_temperature_and_wind(region='hi',
         ds2 = ds2
         
     
+    diff_units = {}
     if convert_temperature is True:
-        if convert_temp_to == 'fahrenheit':
-            vals_1 = _kelvin_to_fahrenheit(ds1[temperature_var_key])
-            vals_2 = _kelvin_to_fahrenheit(ds2[temperature_var_key])
-        else:
-            vals_1 = _kelvin_to_celsius(ds1[temperature_var_key])
-            vals_2 = _kelvin_to_celsius(ds2[temperature_var_key])
-    else:
-        vals_1 = ds1[temperature_var_key]
-        vals_2 = ds2[temperature_var_key]
-    
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+        diff_units[temperature_var_key] = convert_temp_to
+    if convert_wind_speed == True:
+        diff_units[wind_speed_var_key] = convert_speed_to
+        
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [temperature_var_key, wind_speed_var_key],
+                                  to_units=diff_units,
+                                  from_units={temperature_var_key:'kelvin', wind_speed_var_key:'mps'},
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
@@ -4389,241 +3285,25 @@ def plot_temperature_and_wind(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (vals_1 - vals_2),
+                diff[temperature_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -4632,16 +3312,16 @@ def plot_temperature_and_wind(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4649,7 +3329,7 @@ def plot_temperature_and_wind(region='hi',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -4658,7 +3338,7 @@ def plot_temperature_and_wind(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4667,7 +3347,7 @@ def plot_temperature_and_wind(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -4683,69 +3363,52 @@ def plot_temperature_and_wind(region='hi',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    lats_1d, lons_1d, temp_1d_1 = _fix_var_array(ds1,
-                    temperature_var_key,
-                    decimate)
-    
-    _, _, u_1d_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [temperature_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, v_1d_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    _, _, ws_1d_1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    decimate)
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
     
-    _, _, temp_1d_2 = _fix_var_array(ds2,
-                    temperature_var_key,
-                    decimate)
+    queries_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, u_1d_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_1 = _thin_pixel_queries(ax, queries_1, pixel_query_spacing, datacrs)
     
-    _, _, v_1d_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    decimate)
+    queries_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, ws_1d_2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    decimate)
-
+    if pixel_query_spacing is not None:
+        queries_2 = _thin_pixel_queries(ax, queries_2, pixel_query_spacing, datacrs)
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals_1 = _ms_to_mph(ws_1d_1)
-            u_1 = _ms_to_mph(u_1d_1)
-            v_1 = _ms_to_mph(v_1d_1)
-            speed_vals_2 = _ms_to_mph(ws_1d_2)
-            u_2 = _ms_to_mph(u_1d_2)
-            v_2 = _ms_to_mph(v_1d_2)
+            u_1 = _mps_to_mph(queries_1[u_var_key])
+            v_1 = _mps_to_mph(queries_1[v_var_key])
+            u_2 = _mps_to_mph(queries_2[u_var_key])
+            v_2 = _mps_to_mph(queries_2[v_var_key])
         else:
-            speed_vals_2 = _ms_to_kts(ws_1d_2)
-            u_2 = _ms_to_kts(u_1d_2)
-            v_2 = _ms_to_kts(v_1d_2)
+            u_1 = _mps_to_kts(queries_1[u_var_key])
+            v_1 = _mps_to_kts(queries_1[v_var_key])
+            u_2 = _mps_to_kts(queries_2[u_var_key])
+            v_2 = _mps_to_kts(queries_2[v_var_key])
     else:
-        speed_vals_1 = ws_1d_1
-        u_1 = u_1d_1
-        v_1 = v_1d_1
-        speed_vals_2 = ws_1d_2
-        u_1d_2 = u_1d_2
-        v_2 = v_1d_2
-        
-    if convert_temperature == True:
-        if convert_temp_to == 'fahrenheit':
-            temp_1d_1 = _kelvin_to_fahrenheit(temp_1d_1)
-            temp_1d_2 = _kelvin_to_fahrenheit(temp_1d_2)
-        else:
-            temp_1d_1 = _kelvin_to_celsius(temp_1d_1)
-            temp_1d_2 = _kelvin_to_celsius(temp_1d_2)
-            
-    else:
-        pass
+        u_1 = queries_1[u_var_key]
+        v_1 = queries_1[v_var_key]
+        u_2 = queries_2[u_var_key]
+        v_2 = queries_2[v_var_key]
 
     stn1 = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
@@ -4761,14 +3424,14 @@ def plot_temperature_and_wind(region='hi',
 
 
     stn1.plot_parameter(temp_value_loc.upper(), 
-                       (temp_1d_1 - temp_1d_2), 
+                       diffs[temperature_var_key], 
                        color=temperature_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (speed_vals_1 - speed_vals_2), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
@@ -4793,8 +3456,11 @@ def plot_temperature_and_wind(region='hi',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -4961,7 +3627,15 @@ def plot_temperature_and_gust(region='hi',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for temperature + gust.
@@ -4988,6 +3662,8 @@ def plot_temperature_and_gust(region='hi',
     
     An image of the RTMA Temperature + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -5034,18 +3710,37 @@ def plot_temperature_and_gust(region='hi',
         ds1 = ds1
         ds2 = ds2
         
+    diff_units = {}
     if convert_temperature is True:
-        if convert_temp_to == 'fahrenheit':
-            vals_1 = _kelvin_to_fahrenheit(ds1[temperature_var_key])
-            vals_2 = _kelvin_to_fahrenheit(ds2[temperature_var_key])
-        else:
-            vals_1 = _kelvin_to_celsius(ds1[temperature_var_key])
-            vals_2 = _kelvin_to_celsius(ds2[temperature_var_key])
-    else:
-        vals_1 = ds1[temperature_var_key]
-        vals_2 = ds2[temperature_var_key]
-    
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+        diff_units[temperature_var_key] = convert_temp_to
+    if convert_wind_speed == True:
+        diff_units[wind_gust_var_key] = convert_speed_to
+        
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [temperature_var_key, wind_gust_var_key],
+                                  to_units=diff_units,
+                                  from_units={temperature_var_key:'kelvin', wind_gust_var_key:'mps'},
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
             
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("temperature", colors)
@@ -5062,241 +3757,25 @@ def plot_temperature_and_gust(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (vals_1 - vals_2),
+                diff[temperature_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -5305,16 +3784,16 @@ def plot_temperature_and_gust(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5322,7 +3801,7 @@ def plot_temperature_and_gust(region='hi',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5331,7 +3810,7 @@ def plot_temperature_and_gust(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5340,7 +3819,7 @@ def plot_temperature_and_gust(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -5358,69 +3837,58 @@ def plot_temperature_and_gust(region='hi',
         
     
         
-    lats_1d, lons_1d, temp_1d_1 = _fix_var_array(ds1,
-                    temperature_var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [temperature_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, wg_1d_1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    _, _, dir_1d_1 = _fix_var_array(ds1,
-                    wind_direction_var_key,
-                    decimate)
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
     
-    u_1d_1, v_1d_1 = _u_v_components(wg_1d_1,
-                                     dir_1d_1)
+    queries_1 = _extract_pixel_queries(ds1,
+                    [wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, temp_1d_2 = _fix_var_array(ds2,
-                    temperature_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_1 = _thin_pixel_queries(ax, queries_1, pixel_query_spacing, datacrs)
     
-    _, _, wg_1d_2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    decimate)
+    u_1d_1, v_1d_1 = _wind_components(queries_1[wind_gust_var_key],
+                                     queries_1[wind_direction_var_key])
     
-    _, _, dir_1d_2 = _fix_var_array(ds2,
-                    wind_direction_var_key,
-                    decimate)
+    queries_2 = _extract_pixel_queries(ds2,
+                    [wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_1d_2, v_1d_2 = _u_v_components(wg_1d_2,
-                                     dir_1d_2)
+    if pixel_query_spacing is not None:
+        queries_2 = _thin_pixel_queries(ax, queries_2, pixel_query_spacing, datacrs)
+    
+    u_1d_2, v_1d_2 = _wind_components(queries_2[wind_gust_var_key],
+                                     queries_2[wind_direction_var_key])
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals_1 = _ms_to_mph(wg_1d_1)
-            u_1 = _ms_to_mph(u_1d_1)
-            v_1 = _ms_to_mph(v_1d_1)
-            speed_vals_2 = _ms_to_mph(wg_1d_2)
-            u_2 = _ms_to_mph(u_1d_2)
-            v_2 = _ms_to_mph(v_1d_2)
+            u_1 = _mps_to_mph(u_1d_1)
+            v_1 = _mps_to_mph(v_1d_1)
+            u_2 = _mps_to_mph(u_1d_2)
+            v_2 = _mps_to_mph(v_1d_2)
         else:
-            speed_vals_1 = _ms_to_kts(wg_1d_1)
-            u_1 = _ms_to_kts(u_1d_1)
-            v_1 = _ms_to_kts(v_1d_1)
-            speed_vals_2 = _ms_to_kts(wg_1d_2)
-            u_2 = _ms_to_kts(u_1d_2)
-            v_2 = _ms_to_kts(v_1d_2)
+            u_1 = _mps_to_kts(u_1d_1)
+            v_1 = _mps_to_kts(v_1d_1)
+            u_2 = _mps_to_kts(u_1d_2)
+            v_2 = _mps_to_kts(v_1d_2)
     else:
-        speed_vals_1 = wg_1d_1
         u_1 = u_1d_1
         v_1 = v_1d_1
-        speed_vals_2 = wg_1d_2
         u_2 = u_1d_2
         v_2 = v_1d_2
-        
-    if convert_temperature == True:
-        if convert_temp_to == 'fahrenheit':
-            temp_1d_1 = _kelvin_to_fahrenheit(temp_1d_1)
-            temp_1d_2 = _kelvin_to_fahrenheit(temp_1d_2)
-        else:
-            temp_1d_1 = _kelvin_to_celsius(temp_1d_1)
-            temp_1d_2 = _kelvin_to_celsius(temp_1d_2)
-            
-    else:
-        pass
 
     stn1 = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
@@ -5436,14 +3904,14 @@ def plot_temperature_and_gust(region='hi',
 
 
     stn1.plot_parameter(temp_value_loc.upper(), 
-                       (temp_1d_1 - temp_1d_2), 
+                       diffs[temperature_var_key], 
                        color=temperature_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (speed_vals_1 - speed_vals_2), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
@@ -5468,8 +3936,11 @@ def plot_temperature_and_gust(region='hi',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -5636,7 +4107,15 @@ def plot_relative_humidity_and_wind(region='hi',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative humidity + wind.
@@ -5663,6 +4142,8 @@ def plot_relative_humidity_and_wind(region='hi',
     
     An image of the RTMA Relative Humidity + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -5709,7 +4190,31 @@ def plot_relative_humidity_and_wind(region='hi',
         ds1 = ds1
         ds2 = ds2
     
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [relative_humidity_var_key, wind_speed_var_key],
+                                  to_units={wind_speed_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
@@ -5726,241 +4231,25 @@ def plot_relative_humidity_and_wind(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (ds1[relative_humidity_var_key] - ds2[relative_humidity_var_key]),
+                diff[relative_humidity_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -5969,16 +4258,16 @@ def plot_relative_humidity_and_wind(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5986,7 +4275,7 @@ def plot_relative_humidity_and_wind(region='hi',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -5995,7 +4284,7 @@ def plot_relative_humidity_and_wind(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6004,7 +4293,7 @@ def plot_relative_humidity_and_wind(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6020,58 +4309,52 @@ def plot_relative_humidity_and_wind(region='hi',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    lats_1d, lons_1d, rh_1d_1 = _fix_var_array(ds1,
-                    relative_humidity_var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [relative_humidity_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, u_1d_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    _, _, v_1d_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    decimate)
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
     
-    _, _, ws_1d_1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    decimate)
+    queries_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, rh_1d_2 = _fix_var_array(ds2,
-                    relative_humidity_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_1 = _thin_pixel_queries(ax, queries_1, pixel_query_spacing, datacrs)
     
-    _, _, u_1d_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    decimate)
+    queries_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, v_1d_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    decimate)
-    
-    _, _, ws_1d_2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    decimate)
-
+    if pixel_query_spacing is not None:
+        queries_2 = _thin_pixel_queries(ax, queries_2, pixel_query_spacing, datacrs)
     
     if convert_wind_speed == True:
         if convert_to == 'mph':
-            speed_vals_1 = _ms_to_mph(ws_1d_1)
-            u_1 = _ms_to_mph(u_1d_1)
-            v_1 = _ms_to_mph(v_1d_1)
-            speed_vals_2 = _ms_to_mph(ws_1d_2)
-            u_2 = _ms_to_mph(u_1d_2)
-            v_2 = _ms_to_mph(v_1d_2)
+            u_1 = _mps_to_mph(queries_1[u_var_key])
+            v_1 = _mps_to_mph(queries_1[v_var_key])
+            u_2 = _mps_to_mph(queries_2[u_var_key])
+            v_2 = _mps_to_mph(queries_2[v_var_key])
         else:
-            speed_vals_2 = _ms_to_kts(ws_1d_2)
-            u_2 = _ms_to_kts(u_1d_2)
-            v_2 = _ms_to_kts(v_1d_2)
+            u_1 = _mps_to_kts(queries_1[u_var_key])
+            v_1 = _mps_to_kts(queries_1[v_var_key])
+            u_2 = _mps_to_kts(queries_2[u_var_key])
+            v_2 = _mps_to_kts(queries_2[v_var_key])
     else:
-        speed_vals_1 = ws_1d_1
-        u_1 = u_1d_1
-        v_1 = v_1d_1
-        speed_vals_2 = ws_1d_2
-        u_1d_2 = u_1d_2
-        v_2 = v_1d_2
+        u_1 = queries_1[u_var_key]
+        v_1 = queries_1[v_var_key]
+        u_2 = queries_2[u_var_key]
+        v_2 = queries_2[v_var_key]
 
     stn1 = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
@@ -6087,14 +4370,14 @@ def plot_relative_humidity_and_wind(region='hi',
 
 
     stn1.plot_parameter(rh_value_loc.upper(), 
-                       (rh_1d_1 - rh_1d_2), 
+                       diffs[relative_humidity_var_key], 
                        color=relative_humidity_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (speed_vals_1 - speed_vals_2), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
@@ -6119,8 +4402,11 @@ def plot_relative_humidity_and_wind(region='hi',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -6287,7 +4573,15 @@ def plot_relative_humidity_and_gust(region='hi',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for relative_humidity + gust.
@@ -6314,6 +4608,8 @@ def plot_relative_humidity_and_gust(region='hi',
     
     An image of the RTMA Relative Humidity + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -6360,7 +4656,31 @@ def plot_relative_humidity_and_gust(region='hi',
         ds1 = ds1
         ds2 = ds2
     
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [relative_humidity_var_key, wind_gust_var_key],
+                                  to_units={wind_gust_var_key:convert_to} if convert_wind_speed == True else None,
+                                  from_units='mps',
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("relative humidity", colors)
@@ -6377,241 +4697,25 @@ def plot_relative_humidity_and_gust(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (ds1[relative_humidity_var_key] - ds2[relative_humidity_var_key]),
+                diff[relative_humidity_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -6620,16 +4724,16 @@ def plot_relative_humidity_and_gust(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6637,7 +4741,7 @@ def plot_relative_humidity_and_gust(region='hi',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -6646,7 +4750,7 @@ def plot_relative_humidity_and_gust(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6655,7 +4759,7 @@ def plot_relative_humidity_and_gust(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -6673,56 +4777,56 @@ def plot_relative_humidity_and_gust(region='hi',
         
     
         
-    lats_1d, lons_1d, rh_1d_1 = _fix_var_array(ds1,
-                    relative_humidity_var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [relative_humidity_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    _, _, wg_1d_1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    decimate)
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
     
-    _, _, dir_1d_1 = _fix_var_array(ds1,
-                    wind_direction_var_key,
-                    decimate)
+    queries_1 = _extract_pixel_queries(ds1,
+                    [wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_1d_1, v_1d_1 = _u_v_components(wg_1d_1,
-                                     dir_1d_1)
+    if pixel_query_spacing is not None:
+        queries_1 = _thin_pixel_queries(ax, queries_1, pixel_query_spacing, datacrs)
     
-    _, _, rh_1d_2 = _fix_var_array(ds2,
-                    relative_humidity_var_key,
-                    decimate)
+    u_1d_1, v_1d_1 = _wind_components(queries_1[wind_gust_var_key],
+                                     queries_1[wind_direction_var_key])
     
-    _, _, wg_1d_2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    decimate)
+    queries_2 = _extract_pixel_queries(ds2,
+                    [wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, dir_1d_2 = _fix_var_array(ds2,
-                    wind_direction_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_2 = _thin_pixel_queries(ax, queries_2, pixel_query_spacing, datacrs)
     
-    u_1d_2, v_1d_2 = _u_v_components(wg_1d_2,
-                                     dir_1d_2)
+    u_1d_2, v_1d_2 = _wind_components(queries_2[wind_gust_var_key],
+                                     queries_2[wind_direction_var_key])
     
     if convert_wind_speed == True:
         if convert_to == 'mph':
-            speed_vals_1 = _ms_to_mph(wg_1d_1)
-            u_1 = _ms_to_mph(u_1d_1)
-            v_1 = _ms_to_mph(v_1d_1)
-            speed_vals_2 = _ms_to_mph(wg_1d_2)
-            u_2 = _ms_to_mph(u_1d_2)
-            v_2 = _ms_to_mph(v_1d_2)
+            u_1 = _mps_to_mph(u_1d_1)
+            v_1 = _mps_to_mph(v_1d_1)
+            u_2 = _mps_to_mph(u_1d_2)
+            v_2 = _mps_to_mph(v_1d_2)
         else:
-            speed_vals_1 = _ms_to_kts(wg_1d_1)
-            u_1 = _ms_to_kts(u_1d_1)
-            v_1 = _ms_to_kts(v_1d_1)
-            speed_vals_2 = _ms_to_kts(wg_1d_2)
-            u_2 = _ms_to_kts(u_1d_2)
-            v_2 = _ms_to_kts(v_1d_2)
+            u_1 = _mps_to_kts(u_1d_1)
+            v_1 = _mps_to_kts(v_1d_1)
+            u_2 = _mps_to_kts(u_1d_2)
+            v_2 = _mps_to_kts(v_1d_2)
     else:
-        speed_vals_1 = wg_1d_1
         u_1 = u_1d_1
         v_1 = v_1d_1
-        speed_vals_2 = wg_1d_2
         u_2 = u_1d_2
         v_2 = v_1d_2
 
@@ -6740,14 +4844,14 @@ def plot_relative_humidity_and_gust(region='hi',
 
 
     stn1.plot_parameter(rh_value_loc.upper(), 
-                       (rh_1d_1 - rh_1d_2), 
+                       diffs[relative_humidity_var_key], 
                        color=relative_humidity_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (speed_vals_1 - speed_vals_2), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
@@ -6772,8 +4876,11 @@ def plot_relative_humidity_and_gust(region='hi',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -6945,7 +5052,15 @@ def plot_dew_point_depression_and_wind(region='hi',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + wind.
@@ -6972,6 +5087,8 @@ def plot_dew_point_depression_and_wind(region='hi',
     
     An image of the RTMA Dew Point Depression + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -7018,29 +5135,38 @@ def plot_dew_point_depression_and_wind(region='hi',
         ds1 = ds1
         ds2 = ds2
         
+    diff_units = {}
     if convert_temperature is True:
-        if convert_temp_to == 'fahrenheit':
-            t1 = _kelvin_to_fahrenheit(ds1[temperature_var_key])
-            d1 = _kelvin_to_fahrenheit(ds1[dew_point_var_key])
-            vals_1 = t1 - d1
-            
-            t2 = _kelvin_to_fahrenheit(ds2[temperature_var_key])
-            d2 = _kelvin_to_fahrenheit(ds2[dew_point_var_key])
-            vals_2 = t2 - d2
-        else:
-            t1 = _kelvin_to_celsius(ds1[temperature_var_key])
-            d1 = _kelvin_to_celsius(ds1[dew_point_var_key])
-            vals_1 = t1 - d1
-            
-            t2 = _kelvin_to_celsius(ds2[temperature_var_key])
-            d2 = _kelvin_to_celsius(ds2[dew_point_var_key])
-            vals_2 = t2 - d2
-    else:
-        vals_1 = ds1[temperature_var_key] - ds1[dew_point_var_key]
-        vals_2 = ds2[temperature_var_key] - ds2[dew_point_var_key]
-        
-    
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+        diff_units[temperature_var_key] = convert_temp_to
+        diff_units[dew_point_var_key] = convert_temp_to
+    if convert_wind_speed == True:
+        diff_units[wind_speed_var_key] = convert_speed_to
+        
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [temperature_var_key, dew_point_var_key, wind_speed_var_key],
+                                  to_units=diff_units,
+                                  from_units={temperature_var_key:'kelvin', dew_point_var_key:'kelvin', wind_speed_var_key:'mps'},
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -7057,241 +5183,25 @@ def plot_dew_point_depression_and_wind(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (vals_1 - vals_2),
+                (diff[temperature_var_key] - diff[dew_point_var_key]),
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -7300,16 +5210,16 @@ def plot_dew_point_depression_and_wind(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7317,7 +5227,7 @@ def plot_dew_point_depression_and_wind(region='hi',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -7326,7 +5236,7 @@ def plot_dew_point_depression_and_wind(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7335,7 +5245,7 @@ def plot_dew_point_depression_and_wind(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -7353,87 +5263,53 @@ def plot_dew_point_depression_and_wind(region='hi',
         
     
         
-    lats_1d, lons_1d, temp_1d_1 = _fix_var_array(ds1,
-                    temperature_var_key,
-                    decimate)
-    
-    _, _, dwpt_1d_1 = _fix_var_array(ds1,
-                    dew_point_var_key,
-                    decimate)
-    
-    _, _, u_1d_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [temperature_var_key, dew_point_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, v_1d_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    _, _, ws_1d_1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    decimate)
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
     
-    _, _, temp_1d_2 = _fix_var_array(ds2,
-                    temperature_var_key,
-                    decimate)
+    queries_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, dwpt_1d_2 = _fix_var_array(ds2,
-                    dew_point_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_1 = _thin_pixel_queries(ax, queries_1, pixel_query_spacing, datacrs)
     
-    _, _, u_1d_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    decimate)
+    queries_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, v_1d_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    decimate)
-    
-    _, _, ws_1d_2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_2 = _thin_pixel_queries(ax, queries_2, pixel_query_spacing, datacrs)
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals_1 = _ms_to_mph(ws_1d_1)
-            u_1 = _ms_to_mph(u_1d_1)
-            v_1 = _ms_to_mph(v_1d_1)
-            speed_vals_2 = _ms_to_mph(ws_1d_2)
-            u_2 = _ms_to_mph(u_1d_2)
-            v_2 = _ms_to_mph(v_1d_2)
-        else:
-            speed_vals_1 = _ms_to_kts(ws_1d_1)
-            u_1 = _ms_to_kts(u_1d_1)
-            v_1 = _ms_to_kts(v_1d_1)
-            speed_vals_2 = _ms_to_kts(ws_1d_2)
-            u_2 = _ms_to_kts(u_1d_2)
-            v_2 = _ms_to_kts(v_1d_2)
-    else:
-        speed_vals_1 = ws_1d_1
-        u_1 = u_1d_1
-        v_1 = v_1d_1
-        speed_vals_2 = ws_1d_2
-        u_2 = u_1d_2
-        v_2 = v_1d_2
-        
-    if convert_temperature == True:
-        if convert_temp_to == 'fahrenheit':
-            temp_1d_1 = _kelvin_to_fahrenheit(temp_1d_1)
-            dwpt_1d_1 = _kelvin_to_fahrenheit(dwpt_1d_1)
-            temp_1d_2 = _kelvin_to_fahrenheit(temp_1d_2)
-            dwpt_1d_2 = _kelvin_to_fahrenheit(dwpt_1d_2)
+            u_1 = _mps_to_mph(queries_1[u_var_key])
+            v_1 = _mps_to_mph(queries_1[v_var_key])
+            u_2 = _mps_to_mph(queries_2[u_var_key])
+            v_2 = _mps_to_mph(queries_2[v_var_key])
         else:
-            temp_1d_1 = _kelvin_to_celsius(temp_1d_1)
-            dwpt_1d_1 = _kelvin_to_celsius(dwpt_1d_1)
-            temp_1d_2 = _kelvin_to_celsius(temp_1d_2)
-            dwpt_1d_2 = _kelvin_to_celsius(dwpt_1d_2)
-            
+            u_1 = _mps_to_kts(queries_1[u_var_key])
+            v_1 = _mps_to_kts(queries_1[v_var_key])
+            u_2 = _mps_to_kts(queries_2[u_var_key])
+            v_2 = _mps_to_kts(queries_2[v_var_key])
     else:
-        pass
-    
-    dd_1d_1 = temp_1d_1 - dwpt_1d_1
-    dd_1d_2 = temp_1d_2 - dwpt_1d_2
-    
+        u_1 = queries_1[u_var_key]
+        v_1 = queries_1[v_var_key]
+        u_2 = queries_2[u_var_key]
+        v_2 = queries_2[v_var_key]
+
     stn1 = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -7448,14 +5324,14 @@ def plot_dew_point_depression_and_wind(region='hi',
 
 
     stn1.plot_parameter(dd_value_loc.upper(), 
-                       (dd_1d_1 - dd_1d_2), 
+                       (diffs[temperature_var_key] - diffs[dew_point_var_key]), 
                        color=dew_point_depression_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (speed_vals_1 - speed_vals_2), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
@@ -7480,8 +5356,11 @@ def plot_dew_point_depression_and_wind(region='hi',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -7653,7 +5532,15 @@ def plot_dew_point_depression_and_gust(region='hi',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point depression + gust.
@@ -7680,6 +5567,8 @@ def plot_dew_point_depression_and_gust(region='hi',
     
     An image of the RTMA Dew Point Depression + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -7726,28 +5615,38 @@ def plot_dew_point_depression_and_gust(region='hi',
         ds1 = ds1
         ds2 = ds2
         
+    diff_units = {}
     if convert_temperature is True:
-        if convert_temp_to == 'fahrenheit':
-            t1 = _kelvin_to_fahrenheit(ds1[temperature_var_key])
-            d1 = _kelvin_to_fahrenheit(ds1[dew_point_var_key])
-            vals_1 = t1 - d1
-            
-            t2 = _kelvin_to_fahrenheit(ds2[temperature_var_key])
-            d2 = _kelvin_to_fahrenheit(ds2[dew_point_var_key])
-            vals_2 = t2 - d2
-        else:
-            t1 = _kelvin_to_celsius(ds1[temperature_var_key])
-            d1 = _kelvin_to_celsius(ds1[dew_point_var_key])
-            vals_1 = t1 - d1
-            
-            t2 = _kelvin_to_celsius(ds2[temperature_var_key])
-            d2 = _kelvin_to_celsius(ds2[dew_point_var_key])
-            vals_2 = t2 - d2
-    else:
-        vals_1 = ds1[temperature_var_key] - ds1[dew_point_var_key]
-        vals_2 = ds2[temperature_var_key] - ds2[dew_point_var_key]
-    
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+        diff_units[temperature_var_key] = convert_temp_to
+        diff_units[dew_point_var_key] = convert_temp_to
+    if convert_wind_speed == True:
+        diff_units[wind_gust_var_key] = convert_speed_to
+        
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [temperature_var_key, dew_point_var_key, wind_gust_var_key],
+                                  to_units=diff_units,
+                                  from_units={temperature_var_key:'kelvin', dew_point_var_key:'kelvin', wind_gust_var_key:'mps'},
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
     
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point depression", colors)
@@ -7764,241 +5663,25 @@ def plot_dew_point_depression_and_gust(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (vals_1 - vals_2),
+                (diff[temperature_var_key] - diff[dew_point_var_key]),
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -8007,16 +5690,16 @@ def plot_dew_point_depression_and_gust(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8024,7 +5707,7 @@ def plot_dew_point_depression_and_gust(region='hi',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8033,7 +5716,7 @@ def plot_dew_point_depression_and_gust(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8042,7 +5725,7 @@ def plot_dew_point_depression_and_gust(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8060,86 +5743,59 @@ def plot_dew_point_depression_and_gust(region='hi',
         
     
         
-    lats_1d, lons_1d, temp_1d_1 = _fix_var_array(ds1,
-                    temperature_var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [temperature_var_key, dew_point_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, dwpt_1d_1 = _fix_var_array(ds1,
-                    dew_point_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
     
-    _, _, wg_1d_1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    decimate)
+    queries_1 = _extract_pixel_queries(ds1,
+                    [wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, dir_1d_1 = _fix_var_array(ds1,
-                    wind_direction_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_1 = _thin_pixel_queries(ax, queries_1, pixel_query_spacing, datacrs)
     
-    u_1d_1, v_1d_1 = _u_v_components(wg_1d_1,
-                           dir_1d_1)
+    u_1d_1, v_1d_1 = _wind_components(queries_1[wind_gust_var_key],
+                                     queries_1[wind_direction_var_key])
     
-    _, _, temp_1d_2 = _fix_var_array(ds2,
-                    temperature_var_key,
-                    decimate)
+    queries_2 = _extract_pixel_queries(ds2,
+                    [wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, dwpt_1d_2 = _fix_var_array(ds2,
-                    dew_point_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_2 = _thin_pixel_queries(ax, queries_2, pixel_query_spacing, datacrs)
     
-    
-    _, _, wg_1d_2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    decimate)
-    
-    _, _, dir_1d_2 = _fix_var_array(ds2,
-                    wind_direction_var_key,
-                    decimate)
-    
-    u_1d_2, v_1d_2 = _u_v_components(wg_1d_2,
-                           dir_1d_2)
+    u_1d_2, v_1d_2 = _wind_components(queries_2[wind_gust_var_key],
+                                     queries_2[wind_direction_var_key])
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals_1 = _ms_to_mph(wg_1d_1)
-            u_1 = _ms_to_mph(u_1d_1)
-            v_1 = _ms_to_mph(v_1d_1)
-            speed_vals_2 = _ms_to_mph(wg_1d_2)
-            u_2 = _ms_to_mph(u_1d_2)
-            v_2 = _ms_to_mph(v_1d_2)
+            u_1 = _mps_to_mph(u_1d_1)
+            v_1 = _mps_to_mph(v_1d_1)
+            u_2 = _mps_to_mph(u_1d_2)
+            v_2 = _mps_to_mph(v_1d_2)
         else:
-            speed_vals_1 = _ms_to_kts(wg_1d_1)
-            u_1 = _ms_to_kts(u_1d_1)
-            v_1 = _ms_to_kts(v_1d_1)
-            speed_vals_2 = _ms_to_kts(wg_1d_2)
-            u_2 = _ms_to_kts(u_1d_2)
-            v_2 = _ms_to_kts(v_1d_2)
+            u_1 = _mps_to_kts(u_1d_1)
+            v_1 = _mps_to_kts(v_1d_1)
+            u_2 = _mps_to_kts(u_1d_2)
+            v_2 = _mps_to_kts(v_1d_2)
     else:
-        speed_vals_1 = wg_1d_1
         u_1 = u_1d_1
         v_1 = v_1d_1
-        speed_vals_2 = wg_1d_2
         u_2 = u_1d_2
         v_2 = v_1d_2
-    if convert_temperature == True:
-        if convert_temp_to == 'fahrenheit':
-            temp_1d_1 = _kelvin_to_fahrenheit(temp_1d_1)
-            dwpt_1d_1 = _kelvin_to_fahrenheit(dwpt_1d_1)
-            temp_1d_2 = _kelvin_to_fahrenheit(temp_1d_2)
-            dwpt_1d_2 = _kelvin_to_fahrenheit(dwpt_1d_2)
-        else:
-            temp_1d_1 = _kelvin_to_celsius(temp_1d_1)
-            dwpt_1d_1 = _kelvin_to_celsius(dwpt_1d_1)
-            temp_1d_2 = _kelvin_to_celsius(temp_1d_2)
-            dwpt_1d_2 = _kelvin_to_celsius(dwpt_1d_2)
-            
-    else:
-        pass
-    
-    dd_1d_1 = temp_1d_1 - dwpt_1d_1
-    dd_1d_2 = temp_1d_2 - dwpt_1d_2
-    
+
     stn1 = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
                                 fontsize=pixel_query_value_fontsize, 
@@ -8154,14 +5810,14 @@ def plot_dew_point_depression_and_gust(region='hi',
 
 
     stn1.plot_parameter(dd_value_loc.upper(), 
-                       (dd_1d_1 - dd_1d_2), 
+                       (diffs[temperature_var_key] - diffs[dew_point_var_key]), 
                        color=dew_point_depression_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (speed_vals_1 - speed_vals_2), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
@@ -8186,8 +5842,11 @@ def plot_dew_point_depression_and_gust(region='hi',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -8358,7 +6017,15 @@ def plot_dew_point_and_wind(region='hi',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + wind.
@@ -8385,6 +6052,8 @@ def plot_dew_point_and_wind(region='hi',
     
     An image of the RTMA Dew Point + Wind Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -8431,18 +6100,37 @@ def plot_dew_point_and_wind(region='hi',
         ds1 = ds1
         ds2 = ds2
         
+    diff_units = {}
     if convert_temperature is True:
-        if convert_temp_to == 'fahrenheit':
-            vals_1 = _kelvin_to_fahrenheit(ds1[dew_point_var_key])
-            vals_2 = _kelvin_to_fahrenheit(ds2[dew_point_var_key])
-        else:
-            vals_1 = _kelvin_to_celsius(ds1[dew_point_var_key])
-            vals_2 = _kelvin_to_celsius(ds2[dew_point_var_key])
-    else:
-        vals_1 = ds1[dew_point_var_key]
-        vals_2 = ds2[dew_point_var_key]
-    
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+        diff_units[dew_point_var_key] = convert_temp_to
+    if convert_wind_speed == True:
+        diff_units[wind_speed_var_key] = convert_speed_to
+        
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [dew_point_var_key, wind_speed_var_key],
+                                  to_units=diff_units,
+                                  from_units={dew_point_var_key:'kelvin', wind_speed_var_key:'mps'},
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -8459,241 +6147,25 @@ def plot_dew_point_and_wind(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (vals_1 - vals_2),
+                diff[dew_point_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -8702,16 +6174,16 @@ def plot_dew_point_and_wind(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8719,7 +6191,7 @@ def plot_dew_point_and_wind(region='hi',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -8728,7 +6200,7 @@ def plot_dew_point_and_wind(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8737,7 +6209,7 @@ def plot_dew_point_and_wind(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -8754,69 +6226,52 @@ def plot_dew_point_and_wind(region='hi',
             zorder=reference_system_textbox_zorder)
         
 
-    lats_1d, lons_1d, dwpt_1d_1 = _fix_var_array(ds1,
-                    dew_point_var_key,
-                    decimate)
-    
-    _, _, u_1d_1 = _fix_var_array(ds1,
-                    u_var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [dew_point_var_key, wind_speed_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, v_1d_1 = _fix_var_array(ds1,
-                    v_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    _, _, ws_1d_1 = _fix_var_array(ds1,
-                    wind_speed_var_key,
-                    decimate)
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
     
-    _, _, dwpt_1d_2 = _fix_var_array(ds2,
-                    dew_point_var_key,
-                    decimate)
+    queries_1 = _extract_pixel_queries(ds1,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, u_1d_2 = _fix_var_array(ds2,
-                    u_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_1 = _thin_pixel_queries(ax, queries_1, pixel_query_spacing, datacrs)
     
-    _, _, v_1d_2 = _fix_var_array(ds2,
-                    v_var_key,
-                    decimate)
+    queries_2 = _extract_pixel_queries(ds2,
+                    [u_var_key, v_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, ws_1d_2 = _fix_var_array(ds2,
-                    wind_speed_var_key,
-                    decimate)
-
+    if pixel_query_spacing is not None:
+        queries_2 = _thin_pixel_queries(ax, queries_2, pixel_query_spacing, datacrs)
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals_1 = _ms_to_mph(ws_1d_1)
-            u_1 = _ms_to_mph(u_1d_1)
-            v_1 = _ms_to_mph(v_1d_1)
-            speed_vals_2 = _ms_to_mph(ws_1d_2)
-            u_2 = _ms_to_mph(u_1d_2)
-            v_2 = _ms_to_mph(v_1d_2)
+            u_1 = _mps_to_mph(queries_1[u_var_key])
+            v_1 = _mps_to_mph(queries_1[v_var_key])
+            u_2 = _mps_to_mph(queries_2[u_var_key])
+            v_2 = _mps_to_mph(queries_2[v_var_key])
         else:
-            speed_vals_2 = _ms_to_kts(ws_1d_2)
-            u_2 = _ms_to_kts(u_1d_2)
-            v_2 = _ms_to_kts(v_1d_2)
+            u_1 = _mps_to_kts(queries_1[u_var_key])
+            v_1 = _mps_to_kts(queries_1[v_var_key])
+            u_2 = _mps_to_kts(queries_2[u_var_key])
+            v_2 = _mps_to_kts(queries_2[v_var_key])
     else:
-        speed_vals_1 = ws_1d_1
-        u_1 = u_1d_1
-        v_1 = v_1d_1
-        speed_vals_2 = ws_1d_2
-        u_1d_2 = u_1d_2
-        v_2 = v_1d_2
-        
-    if convert_temperature == True:
-        if convert_temp_to == 'fahrenheit':
-            dwpt_1d_1 = _kelvin_to_fahrenheit(dwpt_1d_1)
-            dwpt_1d_2 = _kelvin_to_fahrenheit(dwpt_1d_2)
-        else:
-            dwpt_1d_1 = _kelvin_to_celsius(dwpt_1d_1)
-            dwpt_1d_2 = _kelvin_to_celsius(dwpt_1d_2)
-            
-    else:
-        pass
+        u_1 = queries_1[u_var_key]
+        v_1 = queries_1[v_var_key]
+        u_2 = queries_2[u_var_key]
+        v_2 = queries_2[v_var_key]
 
     stn1 = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
@@ -8832,14 +6287,14 @@ def plot_dew_point_and_wind(region='hi',
 
 
     stn1.plot_parameter(dwpt_value_loc.upper(), 
-                       (dwpt_1d_1 - dwpt_1d_2), 
+                       diffs[dew_point_var_key], 
                        color=dew_point_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(speed_value_loc.upper(), 
-                       (speed_vals_1 - speed_vals_2), 
+                       diffs[wind_speed_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
@@ -8864,8 +6319,11 @@ def plot_dew_point_and_wind(region='hi',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
@@ -9036,7 +6494,15 @@ def plot_dew_point_and_gust(region='hi',
                      barb_legend_fontsize=7,
                      barb_legend_x_position=0.825,
                      barb_legend_y_position=0,
-                     barb_legend_zorder=10):
+                     barb_legend_zorder=10,
+                     crop_to_region=True,
+                     pixel_query_spacing=None,
+                     reuse_base_map=True,
+                     rasterize_base_map=False,
+                     render_mode='contourf',
+                     coarsen_quality=None,
+                     coarsen_method='mean',
+                     contour_cache=False):
     
     """
     This function plots the latest Real Time Mesoscale Analysis (RTMA) for dew point + gust.
@@ -9063,6 +6529,8 @@ def plot_dew_point_and_gust(region='hi',
     
     An image of the RTMA Dew Point + Gust Analysis specified to the user's needs saved to {path}    
     """
+    local, utc = _plot_creation_time()
+    timezone = _get_timezone_abbreviation()
     
     _build_directory_branch(f"{path}/{region.upper()}/{reference_system.upper()}")
     
@@ -9109,18 +6577,37 @@ def plot_dew_point_and_gust(region='hi',
         ds1 = ds1
         ds2 = ds2
         
+    diff_units = {}
     if convert_temperature is True:
-        if convert_temp_to == 'fahrenheit':
-            vals_1 = _kelvin_to_fahrenheit(ds1[dew_point_var_key])
-            vals_2 = _kelvin_to_fahrenheit(ds2[dew_point_var_key])
-        else:
-            vals_1 = _kelvin_to_celsius(ds1[dew_point_var_key])
-            vals_2 = _kelvin_to_celsius(ds2[dew_point_var_key])
-    else:
-        vals_1 = ds1[dew_point_var_key]
-        vals_2 = ds2[dew_point_var_key]
-    
-    lon2d, lat2d = _np.meshgrid(ds1[longitude_key], ds1[latitude_key])
+        diff_units[dew_point_var_key] = convert_temp_to
+    if convert_wind_speed == True:
+        diff_units[wind_gust_var_key] = convert_speed_to
+        
+    diff = _comparison_difference(ds1,
+                                  ds2,
+                                  [dew_point_var_key, wind_gust_var_key],
+                                  to_units=diff_units,
+                                  from_units={dew_point_var_key:'kelvin', wind_gust_var_key:'mps'},
+                                  time_coord_key=time_coord_key)
+
+    if crop_to_region is True and contour_cache is False:
+        ds1 = _subset_to_region(ds1,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        ds2 = _subset_to_region(ds2,
+                                [western_bound, eastern_bound, southern_bound, northern_bound],
+                                longitude_key,
+                                latitude_key,
+                                mapcrs=mapcrs)
+        diff = _subset_to_region(diff,
+                                 [western_bound, eastern_bound, southern_bound, northern_bound],
+                                 longitude_key,
+                                 latitude_key,
+                                 mapcrs=mapcrs)
+        
+    lon2d, lat2d = _grid_coordinates(ds1[longitude_key], ds1[latitude_key])
         
     if colormap == 'custom':
         cmap = _mcolors.LinearSegmentedColormap.from_list("dew point", colors)
@@ -9137,241 +6624,25 @@ def plot_dew_point_and_gust(region='hi',
     time2 = valid_time2.astimezone(_to_zone)
     time2_utc = time2.astimezone(_from_zone)
     
-    fig = _plt.figure(figsize=(figure_x_length, figure_y_length))
-    fig.set_facecolor(facecolor)
-    
-    ax = fig.add_subplot(1,1,1, projection=mapcrs)
-    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
-    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
-    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
-    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
-    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
-    if show_rivers is True:
-        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
-    if show_states is True:
-        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
-                                            f"Cartographic Files/US States",
-                                            f"US_States_Territories.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            state_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(states, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=state_border_color, 
-                          linewidth=state_border_linewidth, 
-                          zorder=state_border_zorder)
-    
-    if show_counties is True:
-        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
-                                            f"Cartographic Files/US Counties",
-                                            f"US_Counties.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            county_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(counties, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=county_border_color, 
-                          linewidth=county_border_linewidth, 
-                          zorder=county_border_zorder)
-        
-    if show_gacc_boundaries is True:
-        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
-                                            f"Cartographic Files/GACC Boundaries",
-                                            f"GACC_Boundaries_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            gacc_border_color,
-                                            datacrs)
-        
-        ax.add_geometries(gacc, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=gacc_border_color, 
-                          linewidth=gacc_border_linewidth, 
-                          zorder=gacc_border_zorder)
-    
-    if show_predictive_services_areas is True:
-        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
-                                            f"Cartographic Files/PSA Boundaries",
-                                            f"PSA_Boundaries.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            predictive_services_areas_color,
-                                            datacrs)
-        
-        ax.add_geometries(psa, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=predictive_services_areas_color, 
-                          linewidth=predictive_services_areas_linewidth, 
-                          zorder=predictive_services_areas_zorder)
-        
-    if show_nws_public_zones is True:
-        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Public Zones",
-                                            f"NWS_Public_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_public_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(pz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_public_zones_color, 
-                          linewidth=nws_public_zones_linewidth, 
-                          zorder=nws_public_zones_zorder)
-        
-    if show_nws_fire_weather_zones is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
-                                            f"Cartographic Files/NWS Fire Weather Zones",
-                                            f"NWS_Fire_Weather_Zones_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_fire_weather_zones_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_fire_weather_zones_color, 
-                          linewidth=nws_fire_weather_zones_linewidth, 
-                          zorder=nws_fire_weather_zones_zorder)
-        
-    if show_nws_cwa is True:
-        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
-                                            f"Cartographic Files/NWS CWAs",
-                                            f"NWS_CWA_2026.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            nws_cwa_color,
-                                            datacrs)
-        
-        ax.add_geometries(fwz, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=nws_cwa_color, 
-                          linewidth=nws_cwa_linewidth, 
-                          zorder=nws_cwa_zorder)
-        
-    if show_calfire_boundaries is True:
-        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
-                                            f"Cartographic Files/CalFire",
-                                            f"CalFire_Administrative_Units.zip",
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            '.zip',
-                                            calfire_boundary_color,
-                                            datacrs,
-                                            convert_crs=True,
-                                            convert_to='EPSG:4326')
-        
-        ax.add_geometries(calfire, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=calfire_boundary_color, 
-                          linewidth=calfire_boundary_linewidth, 
-                          zorder=calfire_boundary_zorder)
-        
-    if custom_shapefile_url is not None:
-        
-        fname = _get_filename_from_url(custom_shapefile_url)
-        
-        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
-                                            f"Cartographic Files/{custom_shapefile_folder_name}",
-                                            fname,
-                                            proxies,
-                                            chunk_size,
-                                            notifications,
-                                            refresh_cartographic_files,
-                                            custom_shapefile_file_extension,
-                                            custom_shapefile_color,
-                                            convert_crs=convert_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_shape, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_color, 
-                          linewidth=custom_shapefile_linewidth, 
-                          zorder=custom_shapefile_zorder)
-        
-    if custom_geojson_url is not None:
-        
-        custom_json = _import_geojson_from_web(custom_geojson_url,
-                                                f"Cartographic Files/{custom_geojson_folder_name}", 
-                                                custom_geojson_filename, 
-                                                proxies, 
-                                                chunk_size,
-                                                notifications, 
-                                                refresh_cartographic_files)
-        
-        ax.add_geometries(custom_json, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_color, 
-                          linewidth=custom_geojson_linewidth, 
-                          zorder=custom_geojson_zorder)
-        
-    if custom_shapefile_local_path is not None:
-        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
-                                                            custom_shapefile_local_color,
-                                                            convert_crs=convert_local_custom_shapefile_crs)
-        
-        ax.add_geometries(custom_local_shapefile, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_shapefile_local_color, 
-                          linewidth=custom_shapefile_local_linewidth, 
-                          zorder=custom_shapefile_local_zorder)
-        
-    if custom_geojson_local_path is not None:
-        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
-        
-        ax.add_geometries(custom_local_geojson, 
-                          crs=datacrs, 
-                          facecolor='none', 
-                          edgecolor=custom_geojson_local_color, 
-                          linewidth=custom_geojson_local_linewidth, 
-                          zorder=custom_geojson_local_zorder)
-    
-    cs = ax.contourf(lon2d,
+    fig, ax, base_map_key = _open_base_map(locals(), reuse_base_map)
+    if fig is None:
+        fig, ax = _build_base_map(**locals())
+        _store_base_map(base_map_key, fig, ax)
+    
+    cs = _render_field(ax,
+                lon2d,
                 lat2d,
-                (vals_1 - vals_2),
+                diff[dew_point_var_key],
                 cmap=cmap,
                 levels=levels,
                 transform=datacrs,
                 alpha=contourf_alpha,
                 zorder=contourf_zorder,
-                extend='both')
+                extend='both',
+                render_mode=render_mode,
+                coarsen_quality=coarsen_quality,
+                coarsen_method=coarsen_method,
+                contour_cache=contour_cache)
     
     fig.colorbar(cs, 
                 shrink=colorbar_shrink, 
@@ -9380,16 +6651,16 @@ def plot_dew_point_and_gust(region='hi',
                 ticks=ticks,
                 aspect=colorbar_aspect)
     
-    _plt.title(f"{primary_title_text}", 
+    ax.set_title(f"{primary_title_text}", 
                fontsize=primary_title_fontsize, 
                fontweight='bold',
                bbox=primary_title_box,
                loc='left')
     
     if local_time is True:
-        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {_timezone}"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {_timezone}",
+        label1 = f"{time1.strftime('%m/%d/%Y %H:00')} {timezone}"
+        label2 = f"{time2.strftime('%m/%d/%Y %H:00')} {timezone}"
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1.strftime('%m/%d/%Y %H:00')} - {time2.strftime('%m/%d/%Y %H:00')} {timezone}",
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -9397,7 +6668,7 @@ def plot_dew_point_and_gust(region='hi',
     else:
         label1 = f"{time1_utc.strftime('%m/%d/%Y %H:00')} UTC"
         label2 = f"{time2_utc.strftime('%m/%d/%Y %H:00')} UTC"
-        _plt.title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
+        ax.set_title(f"Valid [Current Time - Comparison Time]\n{time1_utc.strftime('%m/%d/%Y %H:00')} - {time2_utc.strftime('%m/%d/%Y %H:00')} UTC", 
                 fontsize=secondary_title_fontsize, 
                 fontweight='bold',
                 bbox=secondary_title_box,
@@ -9406,7 +6677,7 @@ def plot_dew_point_and_gust(region='hi',
     if signature_text_new_lines is False:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')} | Data Source: NCEP/NOMADS | Created: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -9415,7 +6686,7 @@ def plot_dew_point_and_gust(region='hi',
     else:
         ax.text(signature_textbox_x_position, 
                 signature_textbox_y_position,
-                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {_utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {_local.strftime('%m/%d/%Y %H:%M')} {_timezone} - {_utc.strftime('%m/%d/%Y %H:%M')} UTC",
+                f"Plot Created With FireWxPy (C) Eric J. Drewitz 2024 - {utc.strftime('%Y')}\nData Source: NCEP/NOMADS\nCreated: {local.strftime('%m/%d/%Y %H:%M')} {timezone} - {utc.strftime('%m/%d/%Y %H:%M')} UTC",
                 fontsize=signature_fontsize,
                 fontweight='bold',
                 bbox=signature_box,
@@ -9431,69 +6702,58 @@ def plot_dew_point_and_gust(region='hi',
             transform=ax.transAxes,
             zorder=reference_system_textbox_zorder)
         
-    lats_1d, lons_1d, dwpt_1d_1 = _fix_var_array(ds1,
-                    dew_point_var_key,
-                    decimate)
+    diffs = _extract_pixel_queries(diff,
+                    [dew_point_var_key, wind_gust_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
+    
+    if pixel_query_spacing is not None:
+        diffs = _thin_pixel_queries(ax, diffs, pixel_query_spacing, datacrs)
     
-    _, _, wg_1d_1 = _fix_var_array(ds1,
-                    wind_gust_var_key,
-                    decimate)
+    lats_1d = diffs['latitude']
+    lons_1d = diffs['longitude']
     
-    _, _, dir_1d_1 = _fix_var_array(ds1,
-                    wind_direction_var_key,
-                    decimate)
+    queries_1 = _extract_pixel_queries(ds1,
+                    [wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    u_1d_1, v_1d_1 = _u_v_components(wg_1d_1,
-                                     dir_1d_1)
+    if pixel_query_spacing is not None:
+        queries_1 = _thin_pixel_queries(ax, queries_1, pixel_query_spacing, datacrs)
     
-    _, _, dwpt_1d_2 = _fix_var_array(ds2,
-                    dew_point_var_key,
-                    decimate)
+    u_1d_1, v_1d_1 = _wind_components(queries_1[wind_gust_var_key],
+                                     queries_1[wind_direction_var_key])
     
-    _, _, wg_1d_2 = _fix_var_array(ds2,
-                    wind_gust_var_key,
-                    decimate)
+    queries_2 = _extract_pixel_queries(ds2,
+                    [wind_gust_var_key, wind_direction_var_key],
+                    decimate,
+                    longitude_key,
+                    latitude_key)
     
-    _, _, dir_1d_2 = _fix_var_array(ds2,
-                    wind_direction_var_key,
-                    decimate)
+    if pixel_query_spacing is not None:
+        queries_2 = _thin_pixel_queries(ax, queries_2, pixel_query_spacing, datacrs)
     
-    u_1d_2, v_1d_2 = _u_v_components(wg_1d_2,
-                                     dir_1d_2)
+    u_1d_2, v_1d_2 = _wind_components(queries_2[wind_gust_var_key],
+                                     queries_2[wind_direction_var_key])
     
     if convert_wind_speed == True:
         if convert_speed_to == 'mph':
-            speed_vals_1 = _ms_to_mph(wg_1d_1)
-            u_1 = _ms_to_mph(u_1d_1)
-            v_1 = _ms_to_mph(v_1d_1)
-            speed_vals_2 = _ms_to_mph(wg_1d_2)
-            u_2 = _ms_to_mph(u_1d_2)
-            v_2 = _ms_to_mph(v_1d_2)
+            u_1 = _mps_to_mph(u_1d_1)
+            v_1 = _mps_to_mph(v_1d_1)
+            u_2 = _mps_to_mph(u_1d_2)
+            v_2 = _mps_to_mph(v_1d_2)
         else:
-            speed_vals_1 = _ms_to_kts(wg_1d_1)
-            u_1 = _ms_to_kts(u_1d_1)
-            v_1 = _ms_to_kts(v_1d_1)
-            speed_vals_2 = _ms_to_kts(wg_1d_2)
-            u_2 = _ms_to_kts(u_1d_2)
-            v_2 = _ms_to_kts(v_1d_2)
+            u_1 = _mps_to_kts(u_1d_1)
+            v_1 = _mps_to_kts(v_1d_1)
+            u_2 = _mps_to_kts(u_1d_2)
+            v_2 = _mps_to_kts(v_1d_2)
     else:
-        speed_vals_1 = wg_1d_1
         u_1 = u_1d_1
         v_1 = v_1d_1
-        speed_vals_2 = wg_1d_2
         u_2 = u_1d_2
         v_2 = v_1d_2
-        
-    if convert_temperature == True:
-        if convert_temp_to == 'fahrenheit':
-            dwpt_1d_1 = _kelvin_to_fahrenheit(dwpt_1d_1)
-            dwpt_1d_2 = _kelvin_to_fahrenheit(dwpt_1d_2)
-        else:
-            dwpt_1d_1 = _kelvin_to_celsius(dwpt_1d_1)
-            dwpt_1d_2 = _kelvin_to_celsius(dwpt_1d_2)
-            
-    else:
-        pass
 
     stn1 = _mpplots.StationPlot(ax, lons_1d, lats_1d,
                                 transform=datacrs, 
@@ -9509,14 +6769,14 @@ def plot_dew_point_and_gust(region='hi',
 
 
     stn1.plot_parameter(dwpt_value_loc.upper(), 
-                       (dwpt_1d_1 - dwpt_1d_2), 
+                       diffs[dew_point_var_key], 
                        color=dew_point_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
                        zorder=pixel_query_value_zorder)
     
     stn1.plot_parameter(gust_value_loc.upper(), 
-                       (speed_vals_1 - speed_vals_2), 
+                       diffs[wind_gust_var_key], 
                        color= wind_speed_pixel_query_value_fontcolor, 
                        path_effects=[_withStroke(linewidth=pixel_query_stroke_linewidth, 
                                                  foreground=pixel_query_value_foreground)], 
@@ -9541,9 +6801,97 @@ def plot_dew_point_and_gust(region='hi',
     leg = ax.legend(loc=(barb_legend_x_position, barb_legend_y_position), prop={'size': barb_legend_fontsize})
     leg.set_zorder(barb_legend_zorder)
 
+    if rasterize_base_map is True:
+        _rasterize_base_map(fig, ax)
+        
     fig.savefig(f"{path}/{region.upper()}/{reference_system.upper()}/{filename}", bbox_inches='tight')
-    _plt.close(fig)
+    _close_base_map(fig)
     if notifications == 'on':
         print(f"{filename} saved to {path}/{region.upper()}")
         
-        
\ No newline at end of file
+
+def render_suite(products=None,
+                 regions=None,
+                 reference_systems=['States & Counties'],
+                 ds1=None,
+                 ds2=None,
+                 product_kwargs=None,
+                 notifications='off',
+                 workers=1,
+                 **kwargs):
+    
+    """
+    This function renders a suite of RTMA Comparison Hawaii graphics (products x regions x reference systems) in one call.
+    
+    The data is downloaded and decoded once and the cartographic reference layers are loaded once for the whole suite.
+    
+    Required Arguments: None
+    
+    Optional Arguments:
+    
+    1) products (List or None) - Default=None. The products to render. The product names are the plot function names 
+        without 'plot_' (i.e. ['temperature', 'relative_humidity_and_wind']). When None, all 14 products are rendered.
+        
+    2) regions (List or None) - Default=None. The regions to render (i.e. ['ca', 'oscc', 'nv']). When None, the default region is used.
+    
+    3) reference_systems (List or dict) - Default=['States & Counties']. The reference systems to render.
+        
+        Built-in reference systems
+        --------------------------
+        
+        1) 'States & Counties'
+        2) 'States Only'
+        3) 'GACC Boundaries'
+        4) 'Predictive Services Areas'
+        5) 'NWS CWA'
+        6) 'NWS Public Zones'
+        7) 'NWS Fire Weather Zones'
+        8) 'CalFire Boundaries'
+        
+        Custom reference systems are passed as a dictionary of {name: {'show_states':True, 'show_counties':False, ...}}.
+    
+    4) ds1 (xarray.array or None) - Default=None. The current RTMA dataset passed into every plot function.
+        When ds1 and ds2 are None, the data is downloaded and decoded once and shared by every graphic.
+    
+    5) ds2 (xarray.array or None) - Default=None. The RTMA dataset of the comparison time passed into every plot function.
+    
+    6) product_kwargs (dict or None) - Default=None. Keyword arguments that only apply to some products
+        (i.e. {'temperature':{'decimate':100}}).
+    
+    7) notifications (String) - Default='off'. When set to 'on', the time of each graphic is printed.
+    
+    8) workers (Integer or None) - Default=1. The number of processes the graphics are spread over. When None, one process per CPU is used.
+        When workers > 1, the data is downloaded and decoded once in this process and shared with the workers through memory-mapped files.
+        On Windows/macOS, call this function under if __name__ == '__main__':.
+    
+    9) **kwargs - Keyword arguments passed into every plot function that accepts them (i.e. hours, figure_x_length, proxies).
+    
+    Returns
+    -------
+    
+    A list of dictionaries (one per graphic) with the product, region, reference_system, seconds, error and worker keys.
+    The error is None when the graphic was saved.   
+    """
+    
+    if workers != 1 and ds1 is None and ds2 is None:
+        ds1, ds2 = _rtma_comparison(model='hi rtma',
+                   proxies=kwargs.get('proxies', None),
+                   clear_recycle_bin=kwargs.get('clear_recycle_bin', False),
+                   clear_data=kwargs.get('clear_data', True),
+                   convert_temperature=False,
+                   chunk_size=kwargs.get('chunk_size', 8192),
+                   notifications=notifications,
+                   custom_directory=kwargs.get('custom_data_directory', None),
+                   hours=kwargs.get('hours', 24))
+        ds1 = _convert_temperature_fields(ds1, dataset_units)
+        ds2 = _convert_temperature_fields(ds2, dataset_units)
+        
+    return _render_suite(_sys.modules[__name__],
+                         products=products,
+                         regions=regions,
+                         reference_systems=reference_systems,
+                         datasets={'ds1':ds1, 'ds2':ds2},
+                         product_kwargs=product_kwargs,
+                         notifications=notifications,
+                         workers=workers,
+                         **kwargs)
@@ -0,0 +1,554 @@
+"""
+This file hosts the batch renderer that creates a full suite of RTMA graphics (products x regions x reference systems) in one call.
+
+The data is downloaded and decoded once and shared by every graphic in the suite through the in-process dataset cache.
+The cartographic reference layers are shared through the geometry cache and the region windows through the grid index,
+so only the first graphic of each region pays the setup cost.
+
+When workers > 1, the graphics are spread over a pool of processes. The decoded datasets are written once to memory-mapped
+files (in shared memory when /dev/shm is available) that every worker maps without copying, and each worker loads the
+reference layers and region windows of the suite into its caches once when it starts.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os as _os
+import time as _time
+import shutil as _shutil
+import inspect as _inspect
+import tempfile as _tempfile
+import numpy as _np
+import xarray as _xr
+
+from concurrent.futures import(
+    ProcessPoolExecutor as _ProcessPoolExecutor,
+    as_completed as _as_completed
+)
+from firewxpy.utils.dataset_cache import hold_datasets as _hold_datasets
+from firewxpy.utils.region_layers import precompute_region_layers as _precompute_region_layers
+from firewxpy.utils.grid_index import precompute_region_windows as _precompute_region_windows
+
+# The layers that make up each built-in reference system.
+_layers = [
+    'show_states',
+    'show_counties',
+    'show_gacc_boundaries',
+    'show_predictive_services_areas',
+    'show_nws_public_zones',
+    'show_nws_fire_weather_zones',
+    'show_nws_cwa',
+    'show_calfire_boundaries'
+]
+
+# The reference layer (see firewxpy.utils.region_layers.cartographic_layers) drawn by each setting.
+_layer_names = {
+    'show_states':'states',
+    'show_counties':'counties',
+    'show_gacc_boundaries':'gacc',
+    'show_predictive_services_areas':'psa',
+    'show_nws_public_zones':'nws public zones',
+    'show_nws_fire_weather_zones':'nws fire weather zones',
+    'show_nws_cwa':'nws cwa',
+    'show_calfire_boundaries':'calfire'
+}
+
+# The state of a worker process of the parallel renderer.
+_worker = {}
+
+def _reference_system(*layers):
+
+    """
+    This function returns the layer settings of a reference system that shows only {layers}.
+    """
+
+    return {layer:(layer in layers) for layer in _layers}
+
+reference_systems = {
+
+    'States & Counties':_reference_system('show_states', 'show_counties'),
+    'States Only':_reference_system('show_states'),
+    'GACC Boundaries':_reference_system('show_states', 'show_gacc_boundaries'),
+    'Predictive Services Areas':_reference_system('show_states', 'show_gacc_boundaries', 'show_predictive_services_areas'),
+    'NWS CWA':_reference_system('show_states', 'show_nws_cwa'),
+    'NWS Public Zones':_reference_system('show_states', 'show_nws_public_zones'),
+    'NWS Fire Weather Zones':_reference_system('show_states', 'show_nws_fire_weather_zones'),
+    'CalFire Boundaries':_reference_system('show_states', 'show_calfire_boundaries')
+}
+
+def product_names(module):
+
+    """
+    This function returns the names of the products a module can render.
+
+    Required Arguments:
+
+    1) module (module) - The RTMA module (i.e. firewxpy.rtma_conus).
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A list of product names (i.e. 'temperature', 'temperature_and_wind').
+    """
+
+    return [name[5:] for name, function in _inspect.getmembers(module, _inspect.isfunction)
+            if name.startswith('plot_') and function.__module__ == module.__name__]
+
+def _resolve_reference_systems(systems):
+
+    """
+    This function returns a dictionary of {name: layer settings} for the requested reference systems.
+    """
+
+    if isinstance(systems, dict):
+        return systems
+
+    resolved = {}
+    for name in systems:
+        try:
+            resolved[name] = reference_systems[name]
+        except KeyError:
+            raise ValueError(f"Unknown reference system '{name}'. Valid reference systems: {list(reference_systems.keys())} or pass a dictionary of {{name: {{'show_states':True, ...}}}}.")
+
+    return resolved
+
+def jobs(module,
+         products=None,
+         regions=None,
+         reference_systems=['States & Counties']):
+
+    """
+    This function expands the products, regions and reference systems of a suite into the list of graphics to render.
+
+    Required Arguments:
+
+    1) module (module) - The RTMA module (i.e. firewxpy.rtma_conus).
+
+    Optional Arguments:
+
+    1) products (List or None) - Default=None. The products to render (i.e. ['temperature', 'relative_humidity_and_wind']).
+        When None, every product of the module is rendered.
+
+    2) regions (List or None) - Default=None. The regions to render. When None, the default region of the module is used.
+
+    3) reference_systems (List or dict) - Default=['States & Counties']. The names of the reference systems in
+        firewxpy.rtma.suite.reference_systems or a dictionary of {name: {'show_states':True, 'show_counties':False, ...}}.
+
+    Returns
+    -------
+
+    A list of (product, region, reference_system, layer settings) tuples.
+    """
+
+    if products is None:
+        products = product_names(module)
+    else:
+        products = [p[5:] if p.startswith('plot_') else p for p in products]
+
+    for product in products:
+        if hasattr(module, f"plot_{product}") is False:
+            raise ValueError(f"Unknown product '{product}'. Valid products: {product_names(module)}")
+
+    if regions is None:
+        regions = [_inspect.signature(getattr(module, f"plot_{products[0]}")).parameters['region'].default]
+
+    systems = _resolve_reference_systems(reference_systems)
+
+    return [(product, region, name, layers) for region in regions for name, layers in systems.items() for product in products]
+
+def render_job(module,
+               product,
+               region,
+               reference_system,
+               layers,
+               datasets,
+               product_kwargs,
+               kwargs,
+               notifications='off'):
+
+    """
+    This function renders one graphic of a suite.
+
+    Required Arguments:
+
+    1) module (module) - The RTMA module (i.e. firewxpy.rtma_conus).
+
+    2) product (String) - The product (i.e. 'temperature').
+
+    3) region (String) - The region.
+
+    4) reference_system (String) - The name of the reference system.
+
+    5) layers (dict) - The layer settings of the reference system.
+
+    6) datasets (dict) - The datasets passed into the plot function ({'ds':ds} or {'ds1':ds1, 'ds2':ds2}). Values of None
+        let the plot function download the data (shared through the dataset cache).
+
+    7) product_kwargs (dict) - Keyword arguments that only apply to some products ({product: {argument: value}}).
+
+    8) kwargs (dict) - Keyword arguments passed into every plot function that accepts them.
+
+    Optional Arguments:
+
+    1) notifications (String) - Default='off'. Passed into the plot function.
+
+    Returns
+    -------
+
+    A dictionary with the product, region, reference_system, seconds, error (None when the graphic was saved) and
+    worker (the process ID) keys.
+    """
+
+    function = getattr(module, f"plot_{product}")
+    parameters = _inspect.signature(function).parameters
+
+    arguments = {k:v for k, v in kwargs.items() if k in parameters}
+    arguments['notifications'] = notifications
+    arguments.update({k:v for k, v in layers.items() if k in parameters})
+    arguments.update(product_kwargs.get(product, {}))
+    arguments['region'] = region
+    arguments['reference_system'] = reference_system
+
+    for key, ds in datasets.items():
+        arguments[key] = ds.copy(deep=False) if ds is not None else None
+
+    start = _time.perf_counter()
+    try:
+        function(**arguments)
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return {
+        'product':product,
+        'region':region,
+        'reference_system':reference_system,
+        'seconds':_time.perf_counter() - start,
+        'error':error,
+        'worker':_os.getpid()
+    }
+
+def _argument(module,
+              product,
+              kwargs,
+              name):
+
+    """
+    This function returns the value of an argument of a plot function (the user setting or the default).
+    """
+
+    if name in kwargs:
+        return kwargs[name]
+
+    return _inspect.signature(getattr(module, f"plot_{product}")).parameters[name].default
+
+def _share_datasets(datasets,
+                    directory):
+
+    """
+    This function writes the arrays of the datasets to .npy files in {directory} so the workers can memory-map them.
+
+    Returns the description of each dataset used by _attach_datasets().
+    """
+
+    spec = {}
+    for key, ds in datasets.items():
+        if ds is None:
+            spec[key] = None
+            continue
+
+        variables = {}
+        for i, (name, var) in enumerate(ds.variables.items()):
+            values = var.values
+            if values.ndim > 0 and values.dtype.kind in 'biufcmM':
+                file_path = f"{directory}/{key}.{i}.npy"
+                _np.save(file_path, values)
+                values = file_path
+            variables[name] = (var.dims, values, var.attrs, name in ds.coords)
+
+        spec[key] = {'variables':variables, 'attrs':ds.attrs}
+
+    return spec
+
+def _attach_datasets(spec):
+
+    """
+    This function rebuilds the datasets written by _share_datasets() on top of memory-mapped arrays.
+
+    The arrays are mapped copy-on-write so a plot function that modifies a dataset never changes the shared copy.
+    """
+
+    datasets = {}
+    for key, description in spec.items():
+        if description is None:
+            datasets[key] = None
+            continue
+
+        data_vars = {}
+        coords = {}
+        for name, (dims, values, attrs, is_coord) in description['variables'].items():
+            if isinstance(values, str):
+                values = _np.load(values, mmap_mode='c')
+            if is_coord:
+                coords[name] = _xr.Variable(dims, values, attrs)
+            else:
+                data_vars[name] = _xr.Variable(dims, values, attrs)
+
+        datasets[key] = _xr.Dataset(data_vars, coords=coords, attrs=description['attrs'])
+
+    return datasets
+
+def _warm_caches(module,
+                 suite,
+                 datasets,
+                 kwargs,
+                 refresh):
+
+    """
+    This function loads the reference layers and region windows used by a suite into the caches of the process.
+    """
+
+    regions = list(dict.fromkeys(region for product, region, name, layers in suite))
+    layers = list(dict.fromkeys(_layer_names[k] for product, region, name, settings in suite
+                                for k, v in settings.items() if v is True and k in _layer_names))
+    product = suite[0][0]
+    mapcrs = _argument(module, product, kwargs, 'mapcrs')
+
+    # A 'custom' region has no named bounding box: its windows are built from the bounds of the jobs.
+    named = [region for region in regions if region != 'custom']
+    extents = list(named)
+    if 'custom' in regions:
+        extents.append([_argument(module, product, kwargs, k) for k in ['western_bound', 'eastern_bound', 'southern_bound', 'northern_bound']])
+
+    if layers and named:
+        try:
+            _precompute_region_layers(regions=named,
+                                      layers=layers,
+                                      figure_size=(_argument(module, product, kwargs, 'figure_x_length'),
+                                                   _argument(module, product, kwargs, 'figure_y_length')),
+                                      proxies=_argument(module, product, kwargs, 'proxies'),
+                                      chunk_size=_argument(module, product, kwargs, 'chunk_size'),
+                                      refresh=refresh,
+                                      mapcrs=mapcrs)
+        except Exception as e:
+            print(f"Alert: Unable to preload the reference layers.\nError Code: {e}")
+
+    for ds in datasets.values():
+        if ds is not None:
+            try:
+                _precompute_region_windows(ds,
+                                           regions=extents,
+                                           longitude_key=_argument(module, product, kwargs, 'longitude_key'),
+                                           latitude_key=_argument(module, product, kwargs, 'latitude_key'),
+                                           mapcrs=mapcrs)
+            except Exception as e:
+                print(f"Alert: Unable to preload the region windows.\nError Code: {e}")
+
+def _init_worker(module_name,
+                 spec,
+                 suite,
+                 product_kwargs,
+                 kwargs,
+                 notifications):
+
+    """
+    This function initializes a worker process of the parallel renderer.
+
+    The shared datasets are mapped and the reference layers and region windows of the suite are loaded from the disk caches
+    (the parent process already downloaded and built them) so every job of the worker starts with warm caches.
+    """
+
+    import importlib as _importlib
+    import matplotlib as _mpl
+
+    _mpl.use('Agg')
+
+    module = _importlib.import_module(module_name)
+    datasets = _attach_datasets(spec)
+
+    _warm_caches(module, suite, datasets, kwargs, False)
+
+    _worker.update({
+        'module':module,
+        'datasets':datasets,
+        'product_kwargs':product_kwargs,
+        'kwargs':kwargs,
+        'notifications':notifications
+    })
+
+def _run_worker_job(job):
+
+    """
+    This function renders one graphic of a suite in a worker process.
+    """
+
+    product, region, reference_system, layers = job
+
+    return render_job(_worker['module'],
+                      product,
+                      region,
+                      reference_system,
+                      layers,
+                      _worker['datasets'],
+                      _worker['product_kwargs'],
+                      _worker['kwargs'],
+                      notifications=_worker['notifications'])
+
+def _render_parallel(module,
+                     suite,
+                     datasets,
+                     product_kwargs,
+                     kwargs,
+                     notifications,
+                     workers):
+
+    """
+    This function renders the graphics of a suite over a pool of processes and returns the results in the order of the suite.
+    """
+
+    if any(ds is None for ds in datasets.values()) or not datasets:
+        raise ValueError("The datasets must be passed in when workers > 1 so they are only decoded once.")
+
+    _warm_caches(module,
+                 suite,
+                 datasets,
+                 kwargs,
+                 _argument(module, suite[0][0], kwargs, 'refresh_cartographic_files'))
+
+    directory = _tempfile.mkdtemp(prefix='FireWxPy Shared Data ',
+                                  dir='/dev/shm' if _os.path.isdir('/dev/shm') else None)
+
+    try:
+        spec = _share_datasets(datasets, directory)
+
+        results = [None] * len(suite)
+        with _ProcessPoolExecutor(max_workers=workers,
+                                  initializer=_init_worker,
+                                  initargs=(module.__name__, spec, suite, product_kwargs, kwargs, notifications)) as pool:
+
+            futures = {pool.submit(_run_worker_job, job):i for i, job in enumerate(suite)}
+            for future in _as_completed(futures):
+                i = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    product, region, reference_system, layers = suite[i]
+                    result = {
+                        'product':product,
+                        'region':region,
+                        'reference_system':reference_system,
+                        'seconds':None,
+                        'error':f"{type(e).__name__}: {e}",
+                        'worker':None
+                    }
+                results[i] = result
+                _notify(result, notifications)
+
+    finally:
+        _shutil.rmtree(directory, ignore_errors=True)
+
+    return results
+
+def _notify(result,
+            notifications):
+
+    """
+    This function prints the time or the error of a graphic.
+    """
+
+    if notifications == 'on':
+        if result['error'] is None:
+            print(f"{result['product']} | {result['region']} | {result['reference_system']}: {round(result['seconds'], 2)} seconds")
+        else:
+            print(f"{result['product']} | {result['region']} | {result['reference_system']}: FAILED - {result['error']}")
+
+def render_suite(module,
+                 products=None,
+                 regions=None,
+                 reference_systems=['States & Counties'],
+                 datasets=None,
+                 product_kwargs=None,
+                 notifications='off',
+                 workers=1,
+                 **kwargs):
+
+    """
+    This function renders a suite of graphics of an RTMA module, downloading and decoding the data only once.
+
+    Required Arguments:
+
+    1) module (module) - The RTMA module (i.e. firewxpy.rtma_conus).
+
+    Optional Arguments:
+
+    1) products (List or None) - Default=None. The products to render (i.e. ['temperature', 'relative_humidity_and_wind']).
+        When None, every product of the module is rendered.
+
+    2) regions (List or None) - Default=None. The regions to render. When None, the default region of the module is used.
+
+    3) reference_systems (List or dict) - Default=['States & Counties']. The names of the reference systems in
+        firewxpy.rtma.suite.reference_systems or a dictionary of {name: {'show_states':True, 'show_counties':False, ...}}.
+
+    4) datasets (dict or None) - Default=None. The datasets passed into every plot function ({'ds':ds} or {'ds1':ds1, 'ds2':ds2}).
+        When None, the data is downloaded once and shared by every graphic.
+
+    5) product_kwargs (dict or None) - Default=None. Keyword arguments that only apply to some products
+        (i.e. {'temperature':{'decimate':100}}).
+
+    6) notifications (String) - Default='off'. When set to 'on', the time of each graphic is printed and the
+        notifications of the plot functions are turned on.
+
+    7) workers (Integer or None) - Default=1. The number of processes the graphics are spread over. When None, one process per CPU is used.
+        When workers > 1, every dataset must be passed in (see datasets). The datasets are shared with the workers through
+        memory-mapped files and each worker loads the reference layers and region windows of the suite once when it starts.
+        On platforms that spawn new processes (Windows/macOS), call this function under if __name__ == '__main__':.
+
+    8) **kwargs - Keyword arguments passed into every plot function that accepts them (i.e. figure_x_length, proxies, decimate).
+
+    Returns
+    -------
+
+    A list of dictionaries (one per graphic, in the order of the suite) with the product, region, reference_system, seconds,
+    error and worker keys.
+    """
+
+    suite = jobs(module,
+                 products=products,
+                 regions=regions,
+                 reference_systems=reference_systems)
+
+    if datasets is None:
+        datasets = {}
+
+    if product_kwargs is None:
+        product_kwargs = {}
+
+    if workers is None:
+        workers = _os.cpu_count() or 1
+
+    if workers > 1 and len(suite) > 1:
+        return _render_parallel(module,
+                                suite,
+                                datasets,
+                                product_kwargs,
+                                kwargs,
+                                notifications,
+                                min(workers, len(suite)))
+
+    results = []
+    with _hold_datasets():
+        for product, region, reference_system, layers in suite:
+            result = render_job(module,
+                                product,
+                                region,
+                                reference_system,
+                                layers,
+                                datasets,
+                                product_kwargs,
+                                kwargs,
+                                notifications=notifications)
+            results.append(result)
+            _notify(result, notifications)
+
+    return results
@@ -0,0 +1,578 @@
+"""
+This file hosts the RTMA watcher: a scheduler entry point that renders the RTMA suites only when a new analysis is available.
+
+Instead of rendering every suite on a fixed schedule (i.e. cron every hour), the watcher polls the data server for the newest
+RTMA cycle of each domain (CONUS, Alaska and Hawaii) with lightweight HEAD requests. When a new cycle is found (or the file of
+the current cycle was re-issued), the analysis is downloaded and decoded once and passed into the RTMA suite and the RTMA
+comparison suite of the domain. The comparison analysis is read from the local RTMA archive when it is archived.
+
+Each graphic is fingerprinted by its inputs (the analysis time, the variables it reads and its settings). A graphic whose
+fingerprint matches the last graphic that was saved is skipped, so a re-issued analysis only re-renders the products whose
+variables changed, and a poll after a partial failure only re-renders the graphics that failed. The cycles and fingerprints
+are kept in FireWxPy Cache/RTMA Watcher/state.json so the state survives restarts.
+
+Optionally, the analysis of the next domain is downloaded while the current domain is rendered (prefetch=True).
+
+The data server is a URL prefix with the same layout as NCEP/NOMADS (i.e. {server}/rtma2p5.20261017/rtma2p5.t11z.2dvaranl_ndfd.grb2_wexp)
+so the watcher can be pointed at a mirror or a local stand-in server.
+
+The watcher can be started from the command line:
+
+    python -m firewxpy.rtma.watcher --domains conus alaska hawaii --poll-interval 120
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os as _os
+import json as _json
+import time as _time
+import hashlib as _hashlib
+import inspect as _inspect
+import argparse as _argparse
+import importlib as _importlib
+import numpy as _np
+import pandas as _pd
+import requests as _requests
+
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from firewxpy.utils.directory import cache_directory as _cache_directory
+from firewxpy.utils.standard import creation_time as _creation_time
+from firewxpy.utils.dataset_cache import hold_datasets as _hold_datasets
+from firewxpy.utils.grid_index import grid_fingerprint as _grid_fingerprint
+from firewxpy.calc.calc import convert_temperature_fields as _convert_temperature_fields
+from firewxpy.utils.rtma_archive import(
+    valid_time as _valid_time,
+    store_analysis as _store_analysis,
+    load_analysis as _load_analysis
+)
+from firewxpy.rtma.suite import(
+    jobs as _jobs,
+    render_job as _render_job
+)
+from firewxpy.rtma.fetch import(
+    nomads_server,
+    domains,
+    cycle_url,
+    fetch_cycle,
+    domain_settings as _domain
+)
+
+# The settings of a suite of a domain.
+_suite_keys = [
+    'products',
+    'regions',
+    'reference_systems',
+    'product_kwargs',
+    'kwargs',
+    'comparison',
+    'comparison_products',
+    'hours'
+]
+
+_settings = {
+    'timeout':30,
+    'max_attempts':3
+}
+
+def latest_cycle(domain,
+                 server=nomads_server,
+                 lookback=4,
+                 proxies=None,
+                 now=None):
+
+    """
+    This function returns the newest RTMA cycle of a domain available on the data server.
+
+    Only HEAD requests are sent, starting with the current hour and stepping back one hour at a time.
+
+    Required Arguments:
+
+    1) domain (String) - 'conus', 'alaska' or 'hawaii'.
+
+    Optional Arguments:
+
+    1) server (String) - Default=NCEP/NOMADS. The URL prefix of the data server.
+
+    2) lookback (Integer) - Default=4. The number of hours before the current hour that are checked.
+
+    3) proxies (dict or None) - Default=None. The proxies of the requests (i.e. {'http':'http://your-proxy-address:port'}).
+
+    4) now (pandas.Timestamp or None) - Default=None. The current UTC time. When None, the clock of the computer is used.
+
+    Returns
+    -------
+
+    1) The analysis time (pandas.Timestamp) or None when no cycle is available.
+
+    2) The signature of the file (the ETag or the Last-Modified and Content-Length headers) used to detect a re-issued file.
+    """
+
+    if now is None:
+        now = _pd.Timestamp.now(tz='UTC').tz_localize(None)
+
+    now = _pd.Timestamp(now).floor('h')
+
+    for i in range(lookback + 1):
+        cycle = now - _pd.Timedelta(hours=i)
+        try:
+            r = _requests.head(cycle_url(domain, cycle, server),
+                               proxies=proxies,
+                               timeout=_settings['timeout'],
+                               allow_redirects=True)
+        except _requests.RequestException as e:
+            continue
+
+        if r.status_code == 200:
+            signature = r.headers.get('ETag') or f"{r.headers.get('Last-Modified')}|{r.headers.get('Content-Length')}"
+            return cycle, signature
+
+    return None, None
+
+def _state_file():
+
+    """
+    This function returns the path of the state of the watcher.
+    """
+
+    return f"{_cache_directory('RTMA Watcher')}/state.json"
+
+def _load_state():
+
+    """
+    This function reads the state of the watcher.
+    """
+
+    try:
+        with open(_state_file(), 'r') as f:
+            state = _json.load(f)
+    except Exception as e:
+        state = {}
+
+    state.setdefault('domains', {})
+    state.setdefault('graphics', {})
+
+    return state
+
+def _save_state(state):
+
+    """
+    This function atomically writes the state of the watcher.
+    """
+
+    file_path = _state_file()
+    tmp_path = f"{file_path}.{_os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        _json.dump(state, f)
+    _os.replace(tmp_path, file_path)
+
+def _variable_keys(module,
+                   product,
+                   arguments):
+
+    """
+    This function returns the variables a product reads (the values of its *_var_key arguments).
+    """
+
+    parameters = _inspect.signature(getattr(module, f"plot_{product}")).parameters
+
+    return sorted({arguments.get(name, p.default) for name, p in parameters.items() if name.endswith('var_key')})
+
+def _digest(ds,
+            var_key,
+            memo):
+
+    """
+    This function returns the digest of the values of a variable. The digests are memoized for the datasets of a poll.
+    """
+
+    key = (id(ds), var_key)
+    if key not in memo:
+        if var_key in ds.variables:
+            memo[key] = _hashlib.sha256(_np.ascontiguousarray(ds[var_key].values).tobytes()).hexdigest()
+        else:
+            memo[key] = None
+
+    return memo[key]
+
+def _fingerprint(module,
+                 product,
+                 region,
+                 reference_system,
+                 layers,
+                 datasets,
+                 product_kwargs,
+                 kwargs,
+                 memo):
+
+    """
+    This function returns the fingerprint of the inputs of a graphic.
+    """
+
+    arguments = dict(kwargs)
+    arguments.update(product_kwargs.get(product, {}))
+
+    parts = [
+        module.__name__,
+        product,
+        region,
+        reference_system,
+        sorted(layers.items()),
+        sorted((k, repr(v)) for k, v in arguments.items())
+    ]
+
+    for name, ds in sorted(datasets.items()):
+        if ds is None:
+            parts.append((name, None))
+            continue
+        if ('grid', id(ds)) not in memo:
+            memo[('grid', id(ds))] = _grid_fingerprint(ds[arguments.get('longitude_key', 'longitude')].values,
+                                                        ds[arguments.get('latitude_key', 'latitude')].values)
+        parts.append((name,
+                      str(_valid_time(ds, arguments.get('time_coord_key', 'time'))),
+                      memo[('grid', id(ds))],
+                      [(v, _digest(ds, v, memo)) for v in _variable_keys(module, product, arguments)]))
+
+    return _hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+def _render_suite(domain,
+                  suite,
+                  module,
+                  datasets,
+                  products,
+                  config,
+                  state,
+                  notifications):
+
+    """
+    This function renders the graphics of a suite whose inputs changed since they were last saved.
+    """
+
+    regions = config.get('regions')
+    reference_systems = config.get('reference_systems', ['States & Counties'])
+    product_kwargs = config.get('product_kwargs') or {}
+    kwargs = config.get('kwargs') or {}
+
+    memo = {}
+    results = []
+    with _hold_datasets():
+        for product, region, reference_system, layers in _jobs(module, products, regions, reference_systems):
+            key = f"{domain}|{suite}|{product}|{region}|{reference_system}"
+            fingerprint = _fingerprint(module, product, region, reference_system, layers, datasets, product_kwargs, kwargs, memo)
+
+            if state['graphics'].get(key) == fingerprint:
+                result = {
+                    'product':product,
+                    'region':region,
+                    'reference_system':reference_system,
+                    'seconds':0,
+                    'error':None,
+                    'skipped':True
+                }
+            else:
+                result = _render_job(module,
+                                     product,
+                                     region,
+                                     reference_system,
+                                     layers,
+                                     datasets,
+                                     product_kwargs,
+                                     kwargs,
+                                     notifications=notifications)
+                result['skipped'] = False
+                if result['error'] is None:
+                    state['graphics'][key] = fingerprint
+                else:
+                    state['graphics'].pop(key, None)
+
+            result['domain'] = domain
+            result['suite'] = suite
+            results.append(result)
+
+            if notifications == 'on':
+                if result['skipped'] is True:
+                    print(f"{domain} | {suite} | {product} | {region} | {reference_system}: unchanged - skipped")
+                elif result['error'] is None:
+                    print(f"{domain} | {suite} | {product} | {region} | {reference_system}: {round(result['seconds'], 2)} seconds")
+                else:
+                    print(f"{domain} | {suite} | {product} | {region} | {reference_system}: FAILED - {result['error']}")
+
+    return results
+
+def _due(state,
+         domain,
+         cycle,
+         signature):
+
+    """
+    This function returns whether the cycle of a domain must be fetched and rendered.
+    """
+
+    entry = state['domains'].get(domain)
+
+    if cycle is None:
+        return False
+
+    if entry is None or _pd.Timestamp(entry['cycle']) < cycle:
+        return True
+
+    if _pd.Timestamp(entry['cycle']) > cycle:
+        return False
+
+    if entry['signature'] != signature:
+        return True
+
+    return entry['complete'] is False and entry['attempts'] < _settings['max_attempts']
+
+def poll_rtma(suites=None,
+              server=nomads_server,
+              lookback=4,
+              prefetch=False,
+              fetch=None,
+              proxies=None,
+              notifications='off'):
+
+    """
+    This function checks the data server once for new RTMA cycles and renders the suites of the domains that have one.
+
+    This is the entry point for a scheduler (i.e. cron every few minutes): nothing is downloaded or rendered unless a new
+    analysis is available.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) suites (dict or None) - Default=None. The suite of each domain: {domain: settings}. When None, every product of
+        every domain is rendered for the default region. The settings are:
+
+        'products' (List or None) - The products of the RTMA suite (i.e. ['temperature', 'relative_humidity_and_wind']).
+            When None, every product is rendered.
+        'regions' (List or None) - The regions. When None, the default region of the domain is used.
+        'reference_systems' (List or dict) - Default=['States & Counties']. See firewxpy.rtma.suite.render_suite().
+        'product_kwargs' (dict) - Keyword arguments that only apply to some products (i.e. {'temperature':{'decimate':100}}).
+        'kwargs' (dict) - Keyword arguments passed into every plot function that accepts them.
+        'comparison' (Boolean) - Default=True. When set to True, the RTMA comparison suite is rendered too.
+        'comparison_products' (List or None) - The products of the RTMA comparison suite. When None, {products} is used.
+        'hours' (Integer) - Default=24. The number of hours between the current and the comparison analysis.
+
+    2) server (String) - Default=NCEP/NOMADS. The URL prefix of the data server (a mirror or a local stand-in server with
+        the same layout).
+
+    3) lookback (Integer) - Default=4. The number of hours before the current hour that are checked for a cycle.
+
+    4) prefetch (Boolean) - Default=False. When set to True, the analysis of the next domain is downloaded while the current
+        domain is rendered.
+
+    5) fetch (function or None) - Default=None. The function that downloads and decodes an analysis:
+        fetch(domain, cycle, server) -> xarray.array (temperatures in kelvin unless their units are recorded by
+        firewxpy.calc.calc.convert_units()). When None, fetch_cycle() is used.
+
+    6) proxies (dict or None) - Default=None. The proxies of the requests.
+
+    7) notifications (String) - Default='off'. When set to 'on', the cycles and the time of each graphic are printed.
+
+    Returns
+    -------
+
+    A dictionary of {domain: {'cycle', 'rendered', 'results'}}. 'rendered' is False when no new analysis was available.
+    'results' holds one dictionary per graphic (see firewxpy.rtma.suite.render_suite()) with the extra domain, suite and
+    skipped keys.
+    """
+
+    if suites is None:
+        suites = {domain:{} for domain in domains}
+
+    for domain, config in suites.items():
+        _domain(domain)
+        unknown = [k for k in config if k not in _suite_keys]
+        if unknown:
+            raise ValueError(f"Unknown suite settings for {domain}: {unknown}. Valid settings: {_suite_keys}")
+
+    if fetch is None:
+        def fetch(domain, cycle, server):
+            return fetch_cycle(domain, cycle, server, proxies=proxies, notifications=notifications)
+
+    state = _load_state()
+    summary = {}
+
+    due = []
+    for domain in suites:
+        cycle, signature = latest_cycle(domain, server, lookback, proxies)
+        if _due(state, domain, cycle, signature):
+            due.append((domain, cycle, signature))
+        else:
+            summary[domain] = {'cycle':None if cycle is None else str(cycle), 'rendered':False, 'results':[]}
+            if notifications == 'on':
+                print(f"{domain}: no new analysis (latest: {cycle}).")
+
+    def _fetch_all(domain, cycle):
+
+        config = suites[domain]
+        model = domains[domain]['model']
+        # The analyses are converted once into the units the plot functions of the domain expect from a shared dataset.
+        units = _importlib.import_module(domains[domain]['module']).dataset_units
+
+        ds = _convert_temperature_fields(fetch(domain, cycle, server), units)
+        _store_analysis(ds, model, 'analysis', units)
+
+        ds2 = None
+        if config.get('comparison', True) is True:
+            comparison_cycle = cycle - _pd.Timedelta(hours=config.get('hours', 24))
+            ds2 = _load_analysis(comparison_cycle, model, 'analysis', units)
+            if ds2 is None:
+                try:
+                    ds2 = _convert_temperature_fields(fetch(domain, comparison_cycle, server), units)
+                    _store_analysis(ds2, model, 'analysis', units)
+                except Exception as e:
+                    if notifications == 'on':
+                        print(f"{domain}: the comparison analysis ({comparison_cycle}) is not available.\nError Code: {e}")
+
+        return ds, ds2
+
+    executor = _ThreadPoolExecutor(max_workers=1) if prefetch is True else None
+    pending = {}
+
+    try:
+        if executor is not None:
+            for domain, cycle, signature in due:
+                pending[domain] = executor.submit(_fetch_all, domain, cycle)
+
+        for domain, cycle, signature in due:
+            config = suites[domain]
+            entry = state['domains'].get(domain)
+            # The attempts only count the retries of the same file.
+            retry = entry is not None and entry['cycle'] == str(cycle) and entry['signature'] == signature
+            attempts = entry['attempts'] + 1 if retry else 1
+
+            if notifications == 'on':
+                print(f"{domain}: new analysis {cycle}.")
+
+            try:
+                ds, ds2 = pending[domain].result() if domain in pending else _fetch_all(domain, cycle)
+            except Exception as e:
+                state['domains'][domain] = {'cycle':str(cycle), 'signature':signature, 'complete':False, 'attempts':attempts}
+                _save_state(state)
+                summary[domain] = {'cycle':str(cycle), 'rendered':False, 'results':[], 'error':f"{type(e).__name__}: {e}"}
+                continue
+
+            results = []
+            with _creation_time():
+                module = _importlib.import_module(domains[domain]['module'])
+                results += _render_suite(domain, 'rtma', module, {'ds':ds}, config.get('products'), config, state, notifications)
+
+                if ds2 is not None:
+                    module = _importlib.import_module(domains[domain]['comparison_module'])
+                    products = config.get('comparison_products') or config.get('products')
+                    results += _render_suite(domain, 'comparison', module, {'ds1':ds, 'ds2':ds2}, products, config, state, notifications)
+
+            complete = all(r['error'] is None for r in results) and (ds2 is not None or config.get('comparison', True) is False)
+            state['domains'][domain] = {'cycle':str(cycle), 'signature':signature, 'complete':complete, 'attempts':attempts}
+            _save_state(state)
+
+            summary[domain] = {'cycle':str(cycle), 'rendered':True, 'results':results}
+
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    return summary
+
+def watch_rtma(suites=None,
+               server=nomads_server,
+               poll_interval=120,
+               max_polls=None,
+               lookback=4,
+               prefetch=False,
+               fetch=None,
+               proxies=None,
+               notifications='off'):
+
+    """
+    This function polls the data server for new RTMA cycles and renders the suites whenever a new analysis is available.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) suites (dict or None) - Default=None. The suite of each domain. See poll_rtma().
+
+    2) server (String) - Default=NCEP/NOMADS. The URL prefix of the data server.
+
+    3) poll_interval (Integer or Float) - Default=120. The number of seconds between the polls.
+
+    4) max_polls (Integer or None) - Default=None. The number of polls before the function returns. When None, the watcher
+        runs until it is interrupted (Ctrl+C).
+
+    5) lookback (Integer) - Default=4. The number of hours before the current hour that are checked for a cycle.
+
+    6) prefetch (Boolean) - Default=False. When set to True, the analysis of the next domain is downloaded while the current
+        domain is rendered.
+
+    7) fetch (function or None) - Default=None. The function that downloads and decodes an analysis. See poll_rtma().
+
+    8) proxies (dict or None) - Default=None. The proxies of the requests.
+
+    9) notifications (String) - Default='off'. When set to 'on', the cycles and the time of each graphic are printed.
+
+    Returns
+    -------
+
+    A list of the summaries returned by poll_rtma() (one per poll).
+    """
+
+    polls = []
+    try:
+        while max_polls is None or len(polls) < max_polls:
+            try:
+                polls.append(poll_rtma(suites=suites,
+                                       server=server,
+                                       lookback=lookback,
+                                       prefetch=prefetch,
+                                       fetch=fetch,
+                                       proxies=proxies,
+                                       notifications=notifications))
+            except ValueError:
+                raise
+            except Exception as e:
+                print(f"Alert: The RTMA poll failed.\nError Code: {e}")
+                polls.append({})
+
+            if max_polls is None or len(polls) < max_polls:
+                _time.sleep(poll_interval)
+
+    except KeyboardInterrupt:
+        pass
+
+    return polls
+
+if __name__ == '__main__':
+
+    import matplotlib as _mpl
+
+    _mpl.use('Agg')
+
+    parser = _argparse.ArgumentParser(description='Render the RTMA suites whenever a new analysis is available.')
+    parser.add_argument('--domains', nargs='*', default=list(domains.keys()))
+    parser.add_argument('--products', nargs='*', default=None)
+    parser.add_argument('--regions', nargs='*', default=None)
+    parser.add_argument('--no-comparison', action='store_true')
+    parser.add_argument('--hours', type=int, default=24)
+    parser.add_argument('--server', default=nomads_server)
+    parser.add_argument('--poll-interval', type=float, default=120)
+    parser.add_argument('--lookback', type=int, default=4)
+    parser.add_argument('--prefetch', action='store_true')
+    parser.add_argument('--once', action='store_true')
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args()
+
+    suites = {domain:{'products':args.products,
+                      'regions':args.regions,
+                      'comparison':args.no_comparison is False,
+                      'hours':args.hours} for domain in args.domains}
+
+    watch_rtma(suites=suites,
+               server=args.server,
+               poll_interval=args.poll_interval,
+               max_polls=1 if args.once else None,
+               lookback=args.lookback,
+               prefetch=args.prefetch,
+               notifications='off' if args.quiet else 'on')
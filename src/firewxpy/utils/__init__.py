@@ -1,6 +1,61 @@
-from firewxpy.utils.unzip import extract_zipped_files
-from firewxpy.utils.directory import build_directory_branch
-from firewxpy.utils.station_plot_formatting import fix_var_array
-from firewxpy.utils.standard import *
-from firewxpy.utils.geometry import *
+# The functions are imported the first time they are accessed (i.e. firewxpy.utils.hold_datasets) so
+# import firewxpy.utils does not import matplotlib or cartopy (see firewxpy._lazy).
+from firewxpy._lazy import lazy_modules as _lazy_modules
 
+_attributes = {
+    'extract_zipped_files':'firewxpy.utils.unzip',
+    'build_directory_branch':'firewxpy.utils.directory',
+
+    'fix_var_array':'firewxpy.utils.station_plot_formatting',
+    'extract_pixel_queries':'firewxpy.utils.station_plot_formatting',
+    'thin_pixel_queries':'firewxpy.utils.station_plot_formatting',
+
+    'get_timezone_abbreviation':'firewxpy.utils.standard',
+    'plot_creation_time':'firewxpy.utils.standard',
+    'creation_time':'firewxpy.utils.standard',
+
+    'get_filename_from_url':'firewxpy.utils.geometry',
+    'import_geojson_from_web':'firewxpy.utils.geometry',
+    'import_geojson_local':'firewxpy.utils.geometry',
+    'import_shapefile_from_web':'firewxpy.utils.geometry',
+    'import_shapefile_local':'firewxpy.utils.geometry',
+
+    'set_geometry_cache_policy':'firewxpy.utils.geometry_cache',
+    'clear_geometry_cache':'firewxpy.utils.geometry_cache',
+
+    'set_dataset_cache_policy':'firewxpy.utils.dataset_cache',
+    'clear_dataset_cache':'firewxpy.utils.dataset_cache',
+    'hold_datasets':'firewxpy.utils.dataset_cache',
+
+    'set_refresh_policy':'firewxpy.utils.cartographic_refresh',
+
+    'precompute_region_layers':'firewxpy.utils.region_layers',
+
+    'precompute_region_windows':'firewxpy.utils.grid_index',
+    'clear_grid_index':'firewxpy.utils.grid_index',
+
+    'set_base_map_policy':'firewxpy.utils.base_map',
+    'clear_base_maps':'firewxpy.utils.base_map',
+
+    'set_rtma_archive_policy':'firewxpy.utils.rtma_archive',
+    'clear_rtma_archive':'firewxpy.utils.rtma_archive',
+
+    'comparison_difference':'firewxpy.utils.comparison_cache',
+    'set_comparison_cache_policy':'firewxpy.utils.comparison_cache',
+    'clear_comparison_cache':'firewxpy.utils.comparison_cache',
+
+    'normalized_grid':'firewxpy.utils.grid_normalization',
+    'apply_grid_mask':'firewxpy.utils.grid_normalization',
+    'clear_grid_normalization':'firewxpy.utils.grid_normalization',
+
+    'grid_coordinates':'firewxpy.utils.grid_coordinates',
+    'set_grid_coordinates_policy':'firewxpy.utils.grid_coordinates',
+    'clear_grid_coordinates':'firewxpy.utils.grid_coordinates',
+
+    'benchmark_import_time':'firewxpy.utils.import_time',
+    'check_import_time':'firewxpy.utils.import_time'
+}
+
+__all__ = list(_attributes)
+
+__getattr__, __dir__ = _lazy_modules(globals(), {}, _attributes)
@@ -0,0 +1,944 @@
+"""
+This file hosts the base map templates shared by the plotting functions.
+
+Building the scaffold of a map (the figure, the GeoAxes, the extent, the COASTLINE/LAND/OCEAN/LAKES features and every
+reference layer) is the most expensive part of a graphic and it is the same for every product of a region. The first
+plot of a region builds the scaffold and stores it as a template keyed by the region, the projection, the figure size,
+the reference layers, their style and the content hash of each reference layer file, so a refreshed shapefile builds a
+new template. Every later plot with the same key reuses the template and only adds its own
+contours, colorbar, titles and station plot, which are removed again once the graphic is saved. The figures are built
+without pyplot so the templates are never shown (i.e. in a notebook) and do not count towards the open pyplot figures.
+
+Optionally, the static layers of a template (the Natural Earth fills and the reference layers) are rendered once to RGBA
+rasters (one for each band of layers drawn between the artists of the plot, i.e. an underlay below the weather field and
+an overlay above it) so savefig no longer redraws thousands of vector borders for every graphic.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os as _os
+import io as _io
+import threading as _threading
+import numpy as _np
+import cartopy.feature as _cfeature
+
+from collections import OrderedDict as _OrderedDict
+from matplotlib.figure import Figure as _Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg as _FigureCanvasAgg
+from cartopy.mpl.feature_artist import FeatureArtist as _FeatureArtist
+from firewxpy.utils.geometry import(
+    import_shapefile_from_web as _import_shapefile_from_web,
+    import_shapefile_local as _import_shapefile_local,
+    import_geojson_from_web as _import_geojson_from_web,
+    import_geojson_local as _import_geojson_local,
+    get_filename_from_url as _get_filename_from_url
+)
+from firewxpy.utils.cartographic_refresh import refresh_file as _refresh_file
+from firewxpy.utils.region_layers import cartographic_layers as _cartographic_layers
+
+# The arguments of the plotting functions that define the scaffold of the map.
+base_map_arguments = [
+    'western_bound',
+    'eastern_bound',
+    'southern_bound',
+    'northern_bound',
+    'mapcrs',
+    'datacrs',
+    'figure_x_length',
+    'figure_y_length',
+    'facecolor',
+    'coastline_linewidth',
+    'costline_zorder',
+    'land_color',
+    'land_zorder',
+    'ocean_color',
+    'ocean_zorder',
+    'lakes_color',
+    'lakes_zorder',
+    'show_rivers',
+    'rivers_color',
+    'rivers_zorder',
+    'show_states',
+    'state_border_color',
+    'state_border_linewidth',
+    'state_border_zorder',
+    'show_counties',
+    'county_border_color',
+    'county_border_linewidth',
+    'county_border_zorder',
+    'show_gacc_boundaries',
+    'gacc_border_color',
+    'gacc_border_linewidth',
+    'gacc_border_zorder',
+    'show_predictive_services_areas',
+    'predictive_services_areas_color',
+    'predictive_services_areas_linewidth',
+    'predictive_services_areas_zorder',
+    'show_nws_public_zones',
+    'nws_public_zones_color',
+    'nws_public_zones_linewidth',
+    'nws_public_zones_zorder',
+    'show_nws_fire_weather_zones',
+    'nws_fire_weather_zones_color',
+    'nws_fire_weather_zones_linewidth',
+    'nws_fire_weather_zones_zorder',
+    'show_nws_cwa',
+    'nws_cwa_color',
+    'nws_cwa_linewidth',
+    'nws_cwa_zorder',
+    'show_calfire_boundaries',
+    'calfire_boundary_color',
+    'calfire_boundary_linewidth',
+    'calfire_boundary_zorder',
+    'custom_shapefile_url',
+    'custom_shapefile_folder_name',
+    'custom_shapefile_file_extension',
+    'custom_shapefile_color',
+    'custom_shapefile_linewidth',
+    'custom_shapefile_zorder',
+    'convert_custom_shapefile_crs',
+    'custom_geojson_url',
+    'custom_geojson_folder_name',
+    'custom_geojson_filename',
+    'custom_geojson_color',
+    'custom_geojson_linewidth',
+    'custom_geojson_zorder',
+    'custom_shapefile_local_path',
+    'custom_shapefile_local_color',
+    'custom_shapefile_local_linewidth',
+    'custom_shapefile_local_zorder',
+    'convert_local_custom_shapefile_crs',
+    'custom_geojson_local_path',
+    'custom_geojson_local_color',
+    'custom_geojson_local_linewidth',
+    'custom_geojson_local_zorder'
+]
+
+# The arguments that show the layers of firewxpy.utils.region_layers.cartographic_layers.
+reference_layers = {
+    'show_states':'states',
+    'show_counties':'counties',
+    'show_gacc_boundaries':'gacc',
+    'show_predictive_services_areas':'psa',
+    'show_nws_public_zones':'nws public zones',
+    'show_nws_fire_weather_zones':'nws fire weather zones',
+    'show_nws_cwa':'nws cwa',
+    'show_calfire_boundaries':'calfire'
+}
+
+_settings = {
+    'max_templates':16
+}
+
+_templates = _OrderedDict()
+_lock = _threading.Lock()
+
+def set_base_map_policy(max_templates=16):
+
+    """
+    This function sets how many base map templates are kept in memory.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) max_templates (Integer) - Default=16. The maximum number of base map templates held in memory. When this is exceeded,
+        the least recently used template is released.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _settings['max_templates'] = max_templates
+        _evict()
+
+def clear_base_maps():
+
+    """
+    This function releases every base map template.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        for template in _templates.values():
+            template['fig'].clear()
+        _templates.clear()
+
+def _evict():
+
+    """
+    This function releases the least recently used templates until the limit set by set_base_map_policy() is met.
+    """
+
+    while len(_templates) > max(_settings['max_templates'], 0):
+        key, template = _templates.popitem(last=False)
+        template['fig'].clear()
+
+def _freeze(value):
+
+    """
+    This function returns a hashable version of an argument.
+    """
+
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+def base_map_key(arguments):
+
+    """
+    This function returns the key of the base map template of a plot.
+
+    Required Arguments:
+
+    1) arguments (dict) - The arguments of the plotting function (i.e. locals()).
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The key of the base map template.
+    """
+
+    key = tuple((name, _freeze(arguments[name])) for name in base_map_arguments if name in arguments)
+
+    return key + (('layer_digests', layer_digests(arguments)),)
+
+def layer_digests(arguments):
+
+    """
+    This function returns the content hash of every reference layer file shown by a plot.
+
+    The files on the web go through the same freshness check as the scaffold (see
+    firewxpy.utils.cartographic_refresh.refresh_file()), so inside of the freshness window only the manifest is read.
+    Local files are identified by their modification time and size.
+
+    Required Arguments:
+
+    1) arguments (dict) - The arguments of the plotting function (i.e. locals()).
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A tuple of (file, hash) pairs. The hash is None when the file is not available (the scaffold raises the error).
+    """
+
+    files = []
+    for name, layer in reference_layers.items():
+        if arguments.get(name) is True:
+            url, path, filename, convert_crs = _cartographic_layers[layer]
+            files.append((url, path, filename))
+
+    if arguments.get('custom_shapefile_url') is not None:
+        files.append((arguments['custom_shapefile_url'],
+                      f"Cartographic Files/{arguments.get('custom_shapefile_folder_name')}",
+                      _get_filename_from_url(arguments['custom_shapefile_url'])))
+
+    if arguments.get('custom_geojson_url') is not None:
+        files.append((arguments['custom_geojson_url'],
+                      f"Cartographic Files/{arguments.get('custom_geojson_folder_name')}",
+                      arguments.get('custom_geojson_filename')))
+
+    digests = []
+    for url, path, filename in files:
+        try:
+            digest, downloaded = _refresh_file(url,
+                                               path,
+                                               filename,
+                                               proxies=arguments.get('proxies'),
+                                               chunk_size=arguments.get('chunk_size', 8192),
+                                               notifications=arguments.get('notifications', 'off'),
+                                               refresh=arguments.get('refresh_cartographic_files', True))
+        except Exception as e:
+            digest = None
+        digests.append((url, digest))
+
+    for name in ['custom_shapefile_local_path', 'custom_geojson_local_path']:
+        file_path = arguments.get(name)
+        if file_path is not None:
+            try:
+                stat = _os.stat(file_path)
+                digests.append((file_path, (stat.st_mtime_ns, stat.st_size)))
+            except OSError as e:
+                digests.append((file_path, None))
+
+    return tuple(digests)
+
+def build_base_map(western_bound,
+                   eastern_bound,
+                   southern_bound,
+                   northern_bound,
+                   mapcrs,
+                   datacrs,
+                   figure_x_length,
+                   figure_y_length,
+                   facecolor,
+                   coastline_linewidth,
+                   costline_zorder,
+                   land_color,
+                   land_zorder,
+                   ocean_color,
+                   ocean_zorder,
+                   lakes_color,
+                   lakes_zorder,
+                   show_rivers,
+                   rivers_color,
+                   rivers_zorder,
+                   show_states,
+                   state_border_color,
+                   state_border_linewidth,
+                   state_border_zorder,
+                   show_counties,
+                   county_border_color,
+                   county_border_linewidth,
+                   county_border_zorder,
+                   show_gacc_boundaries,
+                   gacc_border_color,
+                   gacc_border_linewidth,
+                   gacc_border_zorder,
+                   show_predictive_services_areas,
+                   predictive_services_areas_color,
+                   predictive_services_areas_linewidth,
+                   predictive_services_areas_zorder,
+                   show_nws_public_zones,
+                   nws_public_zones_color,
+                   nws_public_zones_linewidth,
+                   nws_public_zones_zorder,
+                   show_nws_fire_weather_zones,
+                   nws_fire_weather_zones_color,
+                   nws_fire_weather_zones_linewidth,
+                   nws_fire_weather_zones_zorder,
+                   show_nws_cwa,
+                   nws_cwa_color,
+                   nws_cwa_linewidth,
+                   nws_cwa_zorder,
+                   show_calfire_boundaries,
+                   calfire_boundary_color,
+                   calfire_boundary_linewidth,
+                   calfire_boundary_zorder,
+                   custom_shapefile_url,
+                   custom_shapefile_folder_name,
+                   custom_shapefile_file_extension,
+                   custom_shapefile_color,
+                   custom_shapefile_linewidth,
+                   custom_shapefile_zorder,
+                   convert_custom_shapefile_crs,
+                   custom_geojson_url,
+                   custom_geojson_folder_name,
+                   custom_geojson_filename,
+                   custom_geojson_color,
+                   custom_geojson_linewidth,
+                   custom_geojson_zorder,
+                   custom_shapefile_local_path,
+                   custom_shapefile_local_color,
+                   custom_shapefile_local_linewidth,
+                   custom_shapefile_local_zorder,
+                   convert_local_custom_shapefile_crs,
+                   custom_geojson_local_path,
+                   custom_geojson_local_color,
+                   custom_geojson_local_linewidth,
+                   custom_geojson_local_zorder,
+                   proxies,
+                   chunk_size,
+                   notifications,
+                   refresh_cartographic_files,
+                   **arguments):
+
+    """
+    This function builds the scaffold of a map: the figure, the GeoAxes, the extent, the COASTLINE/LAND/OCEAN/LAKES features
+    and every reference layer.
+
+    The figure is not registered with pyplot, so it is never shown by pyplot (i.e. in a notebook) and it is released once
+    it is no longer referenced.
+
+    Required Arguments:
+
+    1) The arguments of the plotting function passed as keywords (i.e. build_base_map(**locals())). Every other
+        argument of the plotting function is ignored.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    1) The figure.
+
+    2) The GeoAxes.
+    """
+
+    fig = _Figure(figsize=(figure_x_length, figure_y_length))
+    _FigureCanvasAgg(fig)
+    fig.set_facecolor(facecolor)
+
+    ax = fig.add_subplot(1,1,1, projection=mapcrs)
+    ax.set_extent([western_bound, eastern_bound, southern_bound, northern_bound], datacrs)
+    ax.add_feature(_cfeature.COASTLINE.with_scale('50m'), linewidth=coastline_linewidth, zorder=costline_zorder)
+    ax.add_feature(_cfeature.LAND, color=land_color, zorder=land_zorder)
+    ax.add_feature(_cfeature.OCEAN, color=ocean_color, zorder=ocean_zorder)
+    ax.add_feature(_cfeature.LAKES, color=lakes_color, zorder=lakes_zorder)
+    if show_rivers is True:
+        ax.add_feature(_cfeature.RIVERS, color=rivers_color, zorder=rivers_zorder)
+    if show_states is True:
+        states = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
+                                            f"Cartographic Files/US States",
+                                            f"US_States_Territories.zip",
+                                            proxies,
+                                            chunk_size,
+                                            notifications,
+                                            refresh_cartographic_files,
+                                            '.zip',
+                                            state_border_color,
+                                            datacrs,
+                                            extent=[western_bound, eastern_bound, southern_bound, northern_bound],
+                                            figure_size=(figure_x_length, figure_y_length),
+                                            mapcrs=mapcrs)
+
+        ax.add_geometries(states,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=state_border_color,
+                          linewidth=state_border_linewidth,
+                          zorder=state_border_zorder)
+
+    if show_counties is True:
+        counties = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
+                                            f"Cartographic Files/US Counties",
+                                            f"US_Counties.zip",
+                                            proxies,
+                                            chunk_size,
+                                            notifications,
+                                            refresh_cartographic_files,
+                                            '.zip',
+                                            county_border_color,
+                                            datacrs,
+                                            extent=[western_bound, eastern_bound, southern_bound, northern_bound],
+                                            figure_size=(figure_x_length, figure_y_length),
+                                            mapcrs=mapcrs)
+
+        ax.add_geometries(counties,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=county_border_color,
+                          linewidth=county_border_linewidth,
+                          zorder=county_border_zorder)
+
+    if show_gacc_boundaries is True:
+        gacc = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
+                                            f"Cartographic Files/GACC Boundaries",
+                                            f"GACC_Boundaries_2026.zip",
+                                            proxies,
+                                            chunk_size,
+                                            notifications,
+                                            refresh_cartographic_files,
+                                            '.zip',
+                                            gacc_border_color,
+                                            datacrs,
+                                            extent=[western_bound, eastern_bound, southern_bound, northern_bound],
+                                            figure_size=(figure_x_length, figure_y_length),
+                                            mapcrs=mapcrs)
+
+        ax.add_geometries(gacc,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=gacc_border_color,
+                          linewidth=gacc_border_linewidth,
+                          zorder=gacc_border_zorder)
+
+    if show_predictive_services_areas is True:
+        psa = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
+                                            f"Cartographic Files/PSA Boundaries",
+                                            f"PSA_Boundaries.zip",
+                                            proxies,
+                                            chunk_size,
+                                            notifications,
+                                            refresh_cartographic_files,
+                                            '.zip',
+                                            predictive_services_areas_color,
+                                            datacrs,
+                                            extent=[western_bound, eastern_bound, southern_bound, northern_bound],
+                                            figure_size=(figure_x_length, figure_y_length),
+                                            mapcrs=mapcrs)
+
+        ax.add_geometries(psa,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=predictive_services_areas_color,
+                          linewidth=predictive_services_areas_linewidth,
+                          zorder=predictive_services_areas_zorder)
+
+    if show_nws_public_zones is True:
+        pz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
+                                            f"Cartographic Files/NWS Public Zones",
+                                            f"NWS_Public_Zones_2026.zip",
+                                            proxies,
+                                            chunk_size,
+                                            notifications,
+                                            refresh_cartographic_files,
+                                            '.zip',
+                                            nws_public_zones_color,
+                                            datacrs,
+                                            extent=[western_bound, eastern_bound, southern_bound, northern_bound],
+                                            figure_size=(figure_x_length, figure_y_length),
+                                            mapcrs=mapcrs)
+
+        ax.add_geometries(pz,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=nws_public_zones_color,
+                          linewidth=nws_public_zones_linewidth,
+                          zorder=nws_public_zones_zorder)
+
+    if show_nws_fire_weather_zones is True:
+        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
+                                            f"Cartographic Files/NWS Fire Weather Zones",
+                                            f"NWS_Fire_Weather_Zones_2026.zip",
+                                            proxies,
+                                            chunk_size,
+                                            notifications,
+                                            refresh_cartographic_files,
+                                            '.zip',
+                                            nws_fire_weather_zones_color,
+                                            datacrs,
+                                            extent=[western_bound, eastern_bound, southern_bound, northern_bound],
+                                            figure_size=(figure_x_length, figure_y_length),
+                                            mapcrs=mapcrs)
+
+        ax.add_geometries(fwz,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=nws_fire_weather_zones_color,
+                          linewidth=nws_fire_weather_zones_linewidth,
+                          zorder=nws_fire_weather_zones_zorder)
+
+    if show_nws_cwa is True:
+        fwz = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
+                                            f"Cartographic Files/NWS CWAs",
+                                            f"NWS_CWA_2026.zip",
+                                            proxies,
+                                            chunk_size,
+                                            notifications,
+                                            refresh_cartographic_files,
+                                            '.zip',
+                                            nws_cwa_color,
+                                            datacrs,
+                                            extent=[western_bound, eastern_bound, southern_bound, northern_bound],
+                                            figure_size=(figure_x_length, figure_y_length),
+                                            mapcrs=mapcrs)
+
+        ax.add_geometries(fwz,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=nws_cwa_color,
+                          linewidth=nws_cwa_linewidth,
+                          zorder=nws_cwa_zorder)
+
+    if show_calfire_boundaries is True:
+        calfire = _import_shapefile_from_web(f"https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
+                                            f"Cartographic Files/CalFire",
+                                            f"CalFire_Administrative_Units.zip",
+                                            proxies,
+                                            chunk_size,
+                                            notifications,
+                                            refresh_cartographic_files,
+                                            '.zip',
+                                            calfire_boundary_color,
+                                            datacrs,
+                                            convert_crs=True,
+                                            convert_to='EPSG:4326',
+                                            extent=[western_bound, eastern_bound, southern_bound, northern_bound],
+                                            figure_size=(figure_x_length, figure_y_length),
+                                            mapcrs=mapcrs)
+
+        ax.add_geometries(calfire,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=calfire_boundary_color,
+                          linewidth=calfire_boundary_linewidth,
+                          zorder=calfire_boundary_zorder)
+
+    if custom_shapefile_url is not None:
+
+        fname = _get_filename_from_url(custom_shapefile_url)
+
+        custom_shape = _import_shapefile_from_web(custom_shapefile_url,
+                                            f"Cartographic Files/{custom_shapefile_folder_name}",
+                                            fname,
+                                            proxies,
+                                            chunk_size,
+                                            notifications,
+                                            refresh_cartographic_files,
+                                            custom_shapefile_file_extension,
+                                            custom_shapefile_color,
+                                            convert_crs=convert_custom_shapefile_crs,
+                                            extent=[western_bound, eastern_bound, southern_bound, northern_bound],
+                                            figure_size=(figure_x_length, figure_y_length),
+                                            mapcrs=mapcrs)
+
+        ax.add_geometries(custom_shape,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=custom_shapefile_color,
+                          linewidth=custom_shapefile_linewidth,
+                          zorder=custom_shapefile_zorder)
+
+    if custom_geojson_url is not None:
+
+        custom_json = _import_geojson_from_web(custom_geojson_url,
+                                                f"Cartographic Files/{custom_geojson_folder_name}",
+                                                custom_geojson_filename,
+                                                proxies,
+                                                chunk_size,
+                                                notifications,
+                                                refresh_cartographic_files)
+
+        ax.add_geometries(custom_json,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=custom_geojson_color,
+                          linewidth=custom_geojson_linewidth,
+                          zorder=custom_geojson_zorder)
+
+    if custom_shapefile_local_path is not None:
+        custom_local_shapefile = _import_shapefile_local(custom_shapefile_local_path,
+                                                            custom_shapefile_local_color,
+                                                            convert_crs=convert_local_custom_shapefile_crs)
+
+        ax.add_geometries(custom_local_shapefile,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=custom_shapefile_local_color,
+                          linewidth=custom_shapefile_local_linewidth,
+                          zorder=custom_shapefile_local_zorder)
+
+    if custom_geojson_local_path is not None:
+        custom_local_geojson = _import_geojson_local(custom_geojson_local_path)
+
+        ax.add_geometries(custom_local_geojson,
+                          crs=datacrs,
+                          facecolor='none',
+                          edgecolor=custom_geojson_local_color,
+                          linewidth=custom_geojson_local_linewidth,
+                          zorder=custom_geojson_local_zorder)
+
+    return fig, ax
+
+def _template_of(fig):
+
+    """
+    This function returns the template a figure belongs to or None.
+    """
+
+    for template in _templates.values():
+        if template['fig'] is fig:
+            return template
+
+    return None
+
+def _reset(template):
+
+    """
+    This function removes everything a plot added on top of a template and restores the layout of the map.
+    """
+
+    fig = template['fig']
+    ax = template['ax']
+
+    for artist in template['hidden']:
+        artist.set_visible(True)
+    template['hidden'] = []
+
+    # The colorbar axes are removed first so the colorbar can still find the contours it belongs to.
+    for artists, baseline in ((fig.get_children, 'figure_artists'), (ax.get_children, 'axes_artists')):
+        for artist in artists():
+            if id(artist) not in template[baseline]:
+                try:
+                    artist.remove()
+                except (NotImplementedError, ValueError, AttributeError):
+                    pass
+
+    for loc in ('left', 'center', 'right'):
+        ax.set_title('', loc=loc)
+
+    ax.set_position(template['position'])
+    ax.set_anchor(template['anchor'])
+    ax.set_xlim(template['xlim'])
+    ax.set_ylim(template['ylim'])
+
+    template['in_use'] = False
+
+def open_base_map(arguments,
+                  reuse=True):
+
+    """
+    This function returns the base map template of a plot when one was already built.
+
+    Required Arguments:
+
+    1) arguments (dict) - The arguments of the plotting function (i.e. locals()).
+
+    Optional Arguments:
+
+    1) reuse (Boolean) - Default=True. When set to False, no template is used and the scaffold is always built.
+
+    Returns
+    -------
+
+    1) The figure or None when the scaffold must be built.
+
+    2) The GeoAxes or None when the scaffold must be built.
+
+    3) The key to pass into store_base_map() once the scaffold is built (None when reuse=False).
+    """
+
+    if reuse is False:
+        return None, None, None
+
+    key = base_map_key(arguments)
+
+    with _lock:
+        template = _templates.get(key)
+
+        if template is None:
+            return None, None, key
+
+        _templates.move_to_end(key)
+
+        if template['in_use'] is True:
+            _reset(template)
+        template['in_use'] = True
+
+    return template['fig'], template['ax'], key
+
+def store_base_map(key,
+                   fig,
+                   ax):
+
+    """
+    This function stores the scaffold of a map as a base map template.
+
+    Required Arguments:
+
+    1) key (Tuple or None) - The key returned by open_base_map(). When None, nothing is stored.
+
+    2) fig (matplotlib.figure.Figure) - The figure.
+
+    3) ax (cartopy.mpl.geoaxes.GeoAxes) - The GeoAxes with the features and reference layers added.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None
+    """
+
+    if key is None:
+        return
+
+    with _lock:
+        _templates[key] = {
+            'fig':fig,
+            'ax':ax,
+            'axes_artists':{id(a) for a in ax.get_children()},
+            'figure_artists':{id(a) for a in fig.get_children()},
+            'position':ax.get_position(original=True),
+            'anchor':ax.get_anchor(),
+            'xlim':ax.get_xlim(),
+            'ylim':ax.get_ylim(),
+            'in_use':True,
+            'hidden':[],
+            'rasters':{}
+        }
+        _templates.move_to_end(key)
+        _evict()
+
+def close_base_map(fig):
+
+    """
+    This function releases the figure of a plot once the graphic is saved.
+
+    When the figure is a base map template, the contours, colorbar, titles and station plot are removed and the template is kept.
+    Otherwise the figure is cleared.
+
+    Required Arguments:
+
+    1) fig (matplotlib.figure.Figure) - The figure.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        template = _template_of(fig)
+        if template is not None:
+            _reset(template)
+            return
+
+    fig.clear()
+
+def _render_layers(fig,
+                   ax,
+                   layers):
+
+    """
+    This function renders only {layers} of a map to an RGBA raster of the GeoAxes.
+
+    Returns the raster and its [x0, x1, y0, y1] extent in the coordinates of the map projection.
+    """
+
+    hidden = [a for a in fig.get_children() + ax.get_children() if a is not ax and a.get_visible() and not any(a is l for l in layers)]
+
+    for artist in hidden:
+        artist.set_visible(False)
+
+    try:
+        buffer = _io.BytesIO()
+        fig.savefig(buffer, format='rgba', dpi=fig.dpi, facecolor=(0, 0, 0, 0))
+        width, height = (int(round(v)) for v in fig.bbox.size)
+        image = _np.frombuffer(buffer.getvalue(), dtype=_np.uint8).reshape(height, width, 4)
+
+        x0, y0, x1, y1 = ax.get_window_extent().extents
+        x0, y0 = int(_np.floor(x0)), int(_np.floor(y0))
+        x1, y1 = int(_np.ceil(x1)), int(_np.ceil(y1))
+        image = image[height - y1:height - y0, x0:x1].copy()
+
+        (left, bottom), (right, top) = ax.transData.inverted().transform([(x0, y0), (x1, y1)])
+
+    finally:
+        for artist in hidden:
+            artist.set_visible(True)
+
+    return image, [left, right, bottom, top]
+
+def _raster_bands(ax,
+                  static):
+
+    """
+    This function splits the static layers into bands that are drawn one after the other with no other artist drawn in between.
+
+    Returns a list of (layers, zorder) where zorder is the zorder of the raster that replaces the band in the draw order
+    (None when no zorder keeps the band in place, i.e. an artist of the plot has the zorder of the band on both sides).
+    """
+
+    # The axes draws its artists sorted by zorder, ties in the order the artists were added.
+    order = sorted([a for a in ax.get_children() if a is not ax.patch and a.get_visible()], key=lambda a: a.get_zorder())
+    static_ids = {id(a) for a in static}
+
+    bands = []
+    for i, artist in enumerate(order):
+        if id(artist) not in static_ids:
+            continue
+        if bands and bands[-1][1] == i:
+            bands[-1][1] = i + 1
+            bands[-1][2].append(artist)
+        else:
+            bands.append([i, i + 1, [artist]])
+
+    rasters = []
+    for start, end, layers in bands:
+        before = order[start - 1].get_zorder() if start > 0 else -_np.inf
+        after = order[end].get_zorder() if end < len(order) else _np.inf
+        top = layers[-1].get_zorder()
+
+        # The raster is added last, so it is drawn after every artist of its zorder: the artists drawn before the band
+        # need a zorder <= the zorder of the raster and the artists drawn after the band a greater zorder.
+        if top < after:
+            zorder = top
+        elif before < after:
+            zorder = before if before > -_np.inf else after - 1
+        else:
+            zorder = None
+
+        rasters.append((layers, zorder))
+
+    return rasters
+
+def rasterize_base_map(fig,
+                       ax):
+
+    """
+    This function replaces the static layers of a base map template with cached RGBA rasters before the graphic is saved.
+
+    The static layers are rendered to one raster per band of layers that are drawn one after the other (i.e. the land/ocean/lakes
+    fills below the weather field and the county and zone borders above it). A band ends at every artist that is not a static
+    layer (i.e. the contours, the station plot or the frame of the map), so the layering of the vector map is kept. The rasters
+    are rendered once for each template, dpi, axes position and layering and are dropped with the template. close_base_map()
+    restores the vector layers.
+
+    Required Arguments:
+
+    1) fig (matplotlib.figure.Figure) - The figure.
+
+    2) ax (cartopy.mpl.geoaxes.GeoAxes) - The GeoAxes.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None. Nothing is done when the figure is not a base map template.
+    """
+
+    with _lock:
+        template = _template_of(fig)
+
+    if template is None:
+        return
+
+    baseline = template['axes_artists']
+    static = [a for a in ax.get_children() if id(a) in baseline and isinstance(a, _FeatureArtist) and a.get_visible()]
+
+    if not static:
+        return
+
+    bands = [(layers, zorder) for layers, zorder in _raster_bands(ax, static) if zorder is not None]
+
+    key = (round(fig.dpi, 3),
+           tuple(_np.round(ax.get_position().bounds, 6)),
+           tuple(_np.round(ax.get_xlim(), 6)),
+           tuple(_np.round(ax.get_ylim(), 6)),
+           tuple((tuple(id(a) for a in layers), zorder) for layers, zorder in bands))
+
+    rasters = template['rasters'].get(key)
+    if rasters is None:
+        rasters = [_render_layers(fig, ax, layers) + (zorder,) for layers, zorder in bands]
+        template['rasters'][key] = rasters
+
+    hidden = [a for layers, zorder in bands for a in layers]
+    for artist in hidden:
+        artist.set_visible(False)
+    template['hidden'] = hidden
+
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+
+    for image, extent, zorder in rasters:
+        ax.imshow(image,
+                  extent=extent,
+                  transform=ax.projection,
+                  origin='upper',
+                  interpolation='nearest',
+                  resample=False,
+                  zorder=zorder)
+
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
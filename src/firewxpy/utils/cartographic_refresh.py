@@ -0,0 +1,273 @@
+"""
+This file hosts the freshness policy for the cartographic files (shapefile archives and GEOJSON files) downloaded from the web.
+
+Instead of deleting and re-downloading every file on each call, each file is fetched at most once per policy window.
+When the window expires, a conditional request (ETag/Last-Modified) is sent to the server and the file is only
+downloaded again if it changed. The state of each file is kept in a manifest on disk so the policy is shared across
+all calls and processes.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os as _os
+import json as _json
+import time as _time
+import shutil as _shutil
+import hashlib as _hashlib
+import requests as _requests
+
+from contextlib import contextmanager as _contextmanager
+from firewxpy.utils.directory import cache_directory as _cache_directory
+
+_settings = {
+    'ttl':86400,
+    'timeout':60,
+    'lock_timeout':600
+}
+
+def set_refresh_policy(ttl=86400,
+                       timeout=60,
+                       lock_timeout=600):
+
+    """
+    This function sets the freshness policy of the cartographic files.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) ttl (Integer or Float) - Default=86400. The number of seconds a downloaded file is considered fresh. Within this
+        window no request is sent to the server. Set to 0 to check the server (conditional request) on every call.
+
+    2) timeout (Integer or Float) - Default=60. The timeout in seconds of the requests sent to the server.
+
+    3) lock_timeout (Integer or Float) - Default=600. The number of seconds after which a lock held by another process
+        downloading the same file is considered stale.
+
+    Returns
+    -------
+
+    None
+    """
+
+    _settings['ttl'] = ttl
+    _settings['timeout'] = timeout
+    _settings['lock_timeout'] = lock_timeout
+
+def _manifest_file(url):
+
+    """
+    This function returns the path of the manifest file for a URL.
+    """
+
+    name = _hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    return f"{_cache_directory('Manifest')}/{name}.json"
+
+def read_manifest(url):
+
+    """
+    This function returns the manifest entry of a cartographic file.
+
+    Required Arguments:
+
+    1) url (String) - The download URL to the file.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A dictionary with the url, path, filename, sha256, etag, last_modified and checked keys or None if the file
+    has never been downloaded.
+    """
+
+    try:
+        with open(_manifest_file(url), 'r') as f:
+            return _json.load(f)
+    except Exception as e:
+        return None
+
+def _write_manifest(url,
+                    entry):
+
+    """
+    This function atomically writes the manifest entry of a cartographic file.
+    """
+
+    file_path = _manifest_file(url)
+    tmp_path = f"{file_path}.{_os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        _json.dump(entry, f)
+    _os.replace(tmp_path, file_path)
+
+@_contextmanager
+def _file_lock(url):
+
+    """
+    This function holds an inter-process lock while a cartographic file is checked or downloaded.
+    """
+
+    lock_path = f"{_manifest_file(url)}.lock"
+    start = _time.time()
+    while True:
+        try:
+            fd = _os.open(lock_path, _os.O_CREAT | _os.O_EXCL | _os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if _time.time() - _os.path.getmtime(lock_path) > _settings['lock_timeout']:
+                    _os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+            if _time.time() - start > _settings['lock_timeout']:
+                raise TimeoutError(f"Timed out waiting for the lock on {url}")
+            _time.sleep(0.1)
+    try:
+        yield
+    finally:
+        _os.close(fd)
+        try:
+            _os.remove(lock_path)
+        except OSError:
+            pass
+
+def _download(url,
+              path,
+              filename,
+              proxies,
+              chunk_size,
+              headers,
+              clean):
+
+    """
+    This function sends a (conditional) request for the file and streams the response to {path}/{filename}.
+
+    Returns the response and the SHA-256 digest of the file (None when the server returns 304 Not Modified).
+    """
+
+    with _requests.get(url,
+                       stream=True,
+                       proxies=proxies,
+                       headers=headers,
+                       timeout=_settings['timeout']) as r:
+
+        if r.status_code == 304:
+            return r, None
+
+        r.raise_for_status()
+
+        if clean is True:
+            try:
+                _shutil.rmtree(f"{path}")
+            except Exception as e:
+                pass
+
+        try:
+            _os.makedirs(f"{path}")
+        except Exception as e:
+            pass
+
+        digest = _hashlib.sha256()
+        tmp_path = f"{path}/{filename}.{_os.getpid()}.part"
+        with open(tmp_path, 'wb') as f:
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+                digest.update(chunk)
+        _os.replace(tmp_path, f"{path}/{filename}")
+
+    return r, digest.hexdigest()
+
+def refresh_file(url,
+                 path,
+                 filename,
+                 proxies=None,
+                 chunk_size=8192,
+                 notifications='off',
+                 refresh=True,
+                 force=False):
+
+    """
+    This function makes sure an up to date copy of a cartographic file is available and returns its content hash.
+
+    Required Arguments:
+
+    1) url (String) - The download URL to the file.
+
+    2) path (String) - The directory where the file is saved to.
+
+    3) filename (String) - The name the user wishes to save the file as.
+
+    Optional Arguments:
+
+    1) proxies (dict or None) - Default=None. The proxy server(s) used for the request.
+
+    2) chunk_size (Integer) - Default=8192. The size of the chunks when writing the file.
+
+    3) notifications (String) - Default='off'. Notification when a file is downloaded and saved to {path}
+
+    4) refresh (Boolean) - Default=True. When set to True, the file is re-validated with the server once the freshness
+        window set by set_refresh_policy() has expired and downloaded again only if it changed on the server. When set to False,
+        the file is only downloaded if it has never been downloaded before.
+
+    5) force (Boolean) - Default=False. When set to True, the file is downloaded regardless of the freshness policy.
+
+    Returns
+    -------
+
+    1) The SHA-256 content hash of the file.
+
+    2) A boolean that is True when a new copy of the file was saved to {path}/{filename}.
+    """
+
+    with _file_lock(url):
+
+        entry = read_manifest(url)
+
+        if force is False and entry is not None:
+            age = _time.time() - entry['checked']
+            if refresh is False or age < _settings['ttl']:
+                return entry['sha256'], False
+
+        headers = {}
+        if force is False and entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            r, digest = _download(url,
+                                  path,
+                                  filename,
+                                  proxies,
+                                  chunk_size,
+                                  headers,
+                                  refresh or force)
+
+        except _requests.exceptions.RequestException as e:
+            if entry is not None and force is False:
+                print(f"Alert: Unable to reach the server for {filename}. Using the local copy.\nError Code: {e}")
+                return entry['sha256'], False
+            raise
+
+        if digest is None:
+            entry['checked'] = _time.time()
+            _write_manifest(url, entry)
+            return entry['sha256'], False
+
+        _write_manifest(url, {
+            'url':url,
+            'path':path,
+            'filename':filename,
+            'sha256':digest,
+            'etag':r.headers.get('ETag'),
+            'last_modified':r.headers.get('Last-Modified'),
+            'checked':_time.time()
+        })
+
+        if notifications == 'on':
+            print(f"Successfully saved {filename} to {path}")
+
+        return digest, True
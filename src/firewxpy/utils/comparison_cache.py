@@ -0,0 +1,239 @@
+"""
+This file hosts the cache of the differences between the current and comparison RTMA analyses.
+
+Every comparison graphic contours the difference of a variable (i.e. ds1['2m_temperature'] - ds2['2m_temperature'])
+and labels its station plot with the same difference. When several products and regions are rendered from the same pair
+of analyses, the difference of each variable is computed once on the full grid and every later plot reads it from this
+cache. The regional plots crop the cached difference instead of differencing the cropped analyses again.
+
+The entries are keyed by the variable, the valid times and units of the two analyses and a checksum of a fixed sample of
+their values, so an analysis that was converted into new arrays (i.e. by convert_units()) still finds its difference while
+a re-issued or modified analysis does not. Only the differences are held in memory (never the analyses) and they are
+read-only.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import hashlib as _hashlib
+import threading as _threading
+import numpy as _np
+import xarray as _xr
+
+from collections import OrderedDict as _OrderedDict
+from firewxpy.calc.calc import(
+    units_attribute as _units_attribute,
+    units_of as _units_of,
+    unit_factors as _unit_factors,
+    normalize_units as _normalize_units
+)
+
+_settings = {
+    'enabled':True,
+    'max_entries':16,
+    'samples':4096
+}
+
+_cache = _OrderedDict()
+_lock = _threading.Lock()
+
+def set_comparison_cache_policy(enabled=True,
+                                max_entries=16):
+
+    """
+    This function sets the policy of the comparison difference cache.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) enabled (Boolean) - Default=True. When set to False, the differences are computed on every call.
+
+    2) max_entries (Integer) - Default=16. The maximum number of differences (one per variable, pair of analyses and units)
+        held in memory. When this is exceeded, the least recently used difference is evicted.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _settings['enabled'] = enabled
+        _settings['max_entries'] = max_entries
+        _evict()
+
+def clear_comparison_cache():
+
+    """
+    This function removes every difference from the comparison difference cache.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _cache.clear()
+
+def _evict():
+
+    """
+    This function drops the least recently used differences beyond max_entries.
+    """
+
+    while len(_cache) > max(_settings['max_entries'], 0):
+        _cache.popitem(last=False)
+
+def _array_key(values):
+
+    """
+    This function returns the checksum of an array from its shape, data type and a fixed sample of its values.
+    """
+
+    index = _np.linspace(0, values.size - 1, min(values.size, _settings['samples'])).astype(_np.int64)
+    sample = _np.ascontiguousarray(values.flat[index])
+
+    return (values.shape,
+            values.dtype.str,
+            _hashlib.blake2b(sample.tobytes(), digest_size=16).hexdigest())
+
+def _valid_time(ds,
+                time_coord_key):
+
+    """
+    This function returns the valid time of an analysis or None when it has no time coordinate.
+    """
+
+    if time_coord_key not in ds.coords:
+        return None
+
+    return str(_np.asarray(ds[time_coord_key].values).ravel()[0])
+
+def _option(option,
+            var_key):
+
+    """
+    This function returns the option of a variable when the option is set per variable in a dictionary.
+    """
+
+    if isinstance(option, dict):
+        return option.get(var_key)
+
+    return option
+
+def _difference(values_1,
+                values_2,
+                scale,
+                dtype):
+
+    """
+    This function computes the read-only difference of two arrays.
+    """
+
+    out = _np.subtract(values_1, values_2, dtype=dtype)
+
+    if scale != 1:
+        _np.multiply(out, scale, out=out)
+
+    out.flags.writeable = False
+
+    return out
+
+def comparison_difference(ds1,
+                          ds2,
+                          var_keys,
+                          to_units=None,
+                          from_units=None,
+                          dtype='float32',
+                          time_coord_key='time'):
+
+    """
+    This function returns the differences (ds1 - ds2) of variables of the current and comparison analyses.
+
+    Each difference is computed only the first time it is requested for the pair of analyses and reused afterwards, so the
+    same difference can be passed into several plots and regions without being computed again.
+
+    Required Arguments:
+
+    1) ds1 (xarray.array) - The current analysis.
+
+    2) ds2 (xarray.array) - The comparison analysis on the same grid as {ds1}.
+
+    3) var_keys (String or List) - The variable key name(s).
+
+    Optional Arguments:
+
+    1) to_units (String, Dictionary or None) - Default=None. The units the differences are converted to (i.e. 'fahrenheit',
+        'celsius', 'mph', 'kts'). A dictionary sets the units of each variable (i.e. {'10m_wind_speed':'mph'}) and the
+        variables missing from it are not converted. When None, the differences are in the units of the analyses.
+        Since the offsets of the units cancel out in a difference, only the scale of the conversion is applied
+        (i.e. a difference of 1 kelvin is a difference of 1.8 degrees fahrenheit).
+
+    2) from_units (String, Dictionary or None) - Default=None. The units of variables that were never converted by
+        firewxpy.calc.calc.convert_units() (i.e. 'kelvin' or 'mps' for the raw RTMA data). Only used with {to_units}.
+
+    3) dtype (String) - Default='float32'. The data type of the differences.
+
+    4) time_coord_key (String) - Default='time'. The time coordinate key name of the analyses.
+
+    Returns
+    -------
+
+    An xarray.Dataset with one variable per key holding the difference on the grid (coordinates) of {ds1}.
+    The values are read-only.
+    """
+
+    if isinstance(var_keys, str):
+        var_keys = [var_keys]
+
+    times = (_valid_time(ds1, time_coord_key), _valid_time(ds2, time_coord_key))
+
+    data_vars = {}
+    for var_key in var_keys:
+        da = ds1[var_key]
+        values_1 = _np.asarray(da.values)
+        values_2 = _np.asarray(ds2[var_key].values)
+
+        if values_1.shape != values_2.shape:
+            raise ValueError(f"The {var_key} arrays of ds1 {values_1.shape} and ds2 {values_2.shape} are not on the same grid.")
+
+        units = _units_of(ds1, var_key, _option(from_units, var_key))
+        source = (units, _units_of(ds2, var_key, _option(from_units, var_key)))
+        target = _option(to_units, var_key)
+        scale = 1.0
+
+        if target is not None:
+            if units is None:
+                raise ValueError(f"The units of {var_key} are unknown. Pass from_units.")
+            scale, _ = _unit_factors(units, target)
+            units = _normalize_units(target)
+
+        key = (var_key, times, source, _array_key(values_1), _array_key(values_2), scale, _np.dtype(dtype).str)
+
+        with _lock:
+            difference = _cache.get(key)
+            if difference is not None:
+                _cache.move_to_end(key)
+
+        if difference is None:
+            difference = _difference(values_1, values_2, scale, dtype)
+            if _settings['enabled'] is True:
+                with _lock:
+                    _cache[key] = difference
+                    _evict()
+
+        attrs = dict(da.attrs)
+        if units is not None:
+            attrs[_units_attribute] = units
+
+        data_vars[var_key] = _xr.DataArray(difference,
+                                           dims=da.dims,
+                                           coords=da.coords,
+                                           attrs=attrs)
+
+    return _xr.Dataset(data_vars)
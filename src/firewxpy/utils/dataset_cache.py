@@ -0,0 +1,297 @@
+"""
+This file hosts the in-process cache for the decoded datasets returned by the WxData clients.
+
+When several plotting functions are called in the same Python session with ds=None, the first call downloads
+and decodes the data and every following call reuses the decoded xarray.array as long as the data source and the
+conversion settings match and the cached entry has not expired.
+
+Each entry records the analysis time of the data it holds. An entry that holds an analysis older than the current
+hourly cycle (the new analysis was not published yet when it was downloaded) is only reused for a short recheck
+interval so the new analysis is picked up as soon as it is published instead of at the end of the hour.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import time as _time
+import inspect as _inspect
+import threading as _threading
+import numpy as _np
+import pandas as _pd
+
+from collections import OrderedDict as _OrderedDict
+from contextlib import contextmanager as _contextmanager
+
+# Arguments that only affect how the data is transferred and stored, not the decoded dataset itself.
+_transport_arguments = [
+    'proxies',
+    'clear_recycle_bin',
+    'clear_data',
+    'chunk_size',
+    'notifications',
+    'custom_directory'
+]
+
+_settings = {
+    'enabled':True,
+    'ttl':3600,
+    'max_entries':4,
+    'recheck':300,
+    'cycle':None
+}
+
+_cache = _OrderedDict()
+_lock = _threading.Lock()
+_key_locks = {}
+
+def set_dataset_cache_policy(enabled=True,
+                             ttl=3600,
+                             max_entries=4,
+                             recheck=300):
+
+    """
+    This function sets the eviction policy of the in-process dataset cache.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) enabled (Boolean) - Default=True. When set to False, every call downloads and decodes a new dataset.
+
+    2) ttl (Integer or Float) - Default=3600. The number of seconds a decoded dataset is kept before it is considered stale.
+
+    3) max_entries (Integer) - Default=4. The maximum number of decoded datasets held in memory. When this is exceeded,
+        the least recently used dataset is evicted.
+
+    4) recheck (Integer or Float) - Default=300. The number of seconds a decoded dataset that holds an analysis older than
+        the current hourly cycle is kept before the data source is checked again for the new analysis.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _settings['enabled'] = enabled
+        _settings['ttl'] = ttl
+        _settings['max_entries'] = max_entries
+        _settings['recheck'] = recheck
+        _evict()
+
+def clear_dataset_cache():
+
+    """
+    This function removes every dataset from the in-process dataset cache.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _cache.clear()
+        _key_locks.clear()
+
+@_contextmanager
+def hold_datasets(max_entries=8):
+
+    """
+    This context manager keeps every decoded dataset in memory while a batch of graphics is rendered.
+
+    Inside of the block the cache is enabled, nothing expires (not even an entry holding an analysis older than
+    the current cycle) and the analysis cycle is frozen at the cycle of the start of the block, so a batch that
+    runs past the top of the hour still reuses the same datasets.
+    The previous policy is restored when the block exits.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) max_entries (Integer) - Default=8. The minimum number of decoded datasets held in memory inside of the block.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        previous = dict(_settings)
+        _settings['enabled'] = True
+        _settings['ttl'] = float('inf')
+        _settings['recheck'] = float('inf')
+        _settings['max_entries'] = max(previous['max_entries'], max_entries)
+        if previous['cycle'] is None:
+            _settings['cycle'] = _time.strftime('%Y%m%d%H', _time.gmtime())
+
+    try:
+        yield
+    finally:
+        with _lock:
+            _settings.update(previous)
+            if previous['enabled'] is False:
+                _cache.clear()
+            _evict()
+
+def _analysis_cycle():
+
+    """
+    This function returns the current hourly analysis cycle in UTC as a YYYYMMDDHH string.
+    While hold_datasets() is active, the cycle at the start of the hold is returned.
+    """
+
+    if _settings['cycle'] is not None:
+        return _settings['cycle']
+
+    return _time.strftime('%Y%m%d%H', _time.gmtime())
+
+def _cache_key(fetch,
+               args,
+               kwargs):
+
+    """
+    This function builds the cache key from the data source and conversion options.
+
+    The analysis cycle is not part of the key: each entry is checked against the analysis time of the data it holds
+    (see _evict()).
+    """
+
+    try:
+        bound = _inspect.signature(fetch).bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+    except (TypeError, ValueError):
+        arguments = dict(kwargs)
+        arguments['args'] = args
+
+    options = tuple(sorted((k, repr(v)) for k, v in arguments.items() if k not in _transport_arguments))
+
+    return (f"{fetch.__module__}.{fetch.__qualname__}", options)
+
+def _valid_cycle(data,
+                 time_coord_key='time'):
+
+    """
+    This function returns the analysis time of the dataset (the first dataset of a tuple) as a YYYYMMDDHH string
+    or None when the dataset has no time coordinate.
+    """
+
+    if isinstance(data, tuple):
+        data = data[0]
+
+    try:
+        times = _np.ravel(data[time_coord_key].values)
+        return _pd.Timestamp(times[0]).strftime('%Y%m%d%H')
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+def _expired(created,
+             cycle,
+             now,
+             current_cycle):
+
+    """
+    This function returns True when an entry is older than the ttl or holds an analysis older than the current cycle
+    and was downloaded more than recheck seconds ago.
+    """
+
+    if now - created > _settings['ttl']:
+        return True
+
+    return cycle is not None and cycle < current_cycle and now - created > _settings['recheck']
+
+def _evict():
+
+    """
+    This function drops expired entries and the least recently used entries beyond max_entries.
+    """
+
+    now = _time.monotonic()
+    current_cycle = _analysis_cycle()
+    for key in [k for k, (created, cycle, _) in _cache.items() if _expired(created, cycle, now, current_cycle)]:
+        del _cache[key]
+
+    while len(_cache) > max(_settings['max_entries'], 0):
+        _cache.popitem(last=False)
+
+def _shallow_copy(data):
+
+    """
+    This function returns a shallow copy of the dataset (or tuple of datasets) so reassigning variables
+    inside of a plotting function never alters the cached entry.
+    """
+
+    if isinstance(data, tuple):
+        return tuple(d.copy(deep=False) for d in data)
+    else:
+        return data.copy(deep=False)
+
+def _load(data):
+
+    """
+    This function loads lazily backed datasets into memory so the cached entry does not depend on files that
+    the WxData client may delete before the next download.
+    """
+
+    if isinstance(data, tuple):
+        return tuple(d.load() for d in data)
+    else:
+        return data.load()
+
+def cached_dataset(fetch):
+
+    """
+    This function wraps a WxData client (i.e. wxdata.rtma) so repeated calls for the same analysis reuse the
+    decoded dataset instead of downloading and decoding the data again.
+
+    Required Arguments:
+
+    1) fetch (function) - The WxData client function that downloads and returns the xarray.array.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A function with the same arguments as {fetch} that returns a shallow copy of the cached xarray.array.
+    """
+
+    def wrapper(*args, **kwargs):
+
+        if _settings['enabled'] is False:
+            return fetch(*args, **kwargs)
+
+        key = _cache_key(fetch, args, kwargs)
+
+        with _lock:
+            _evict()
+            if key in _cache:
+                _cache.move_to_end(key)
+                return _shallow_copy(_cache[key][2])
+            key_lock = _key_locks.setdefault(key, _threading.Lock())
+
+        with key_lock:
+            with _lock:
+                if key in _cache:
+                    _cache.move_to_end(key)
+                    return _shallow_copy(_cache[key][2])
+
+            data = _load(fetch(*args, **kwargs))
+
+            with _lock:
+                _cache[key] = (_time.monotonic(), _valid_cycle(data), data)
+                _key_locks.pop(key, None)
+                _evict()
+
+        return _shallow_copy(data)
+
+    wrapper.__name__ = getattr(fetch, '__name__', 'cached_dataset')
+    wrapper.__doc__ = fetch.__doc__
+    wrapper.__wrapped__ = fetch
+
+    return wrapper
@@ -27,4 +27,26 @@ def build_directory_branch(path):
     try:
         os.makedirs(f"{path}")
     except Exception as e:
-        pass
\ No newline at end of file
+        pass
+def cache_directory(branch):
+    
+    """
+    This function returns a branch of the FireWxPy cache directory and builds the branch if it does not exist already
+    
+    Required Arguments:
+    
+    1) branch (String) - The name of the branch inside of the FireWxPy cache directory. 
+    
+    Optional Arguments: None
+    
+    Returns
+    -------
+    
+    The path to the cache directory branch.     
+    """
+    
+    path = f"FireWxPy Cache/{branch}"
+    
+    build_directory_branch(path)
+    
+    return path
@@ -0,0 +1,619 @@
+"""
+This file hosts the functions that draw the gridded weather field on the map.
+
+Three render modes are supported:
+
+1) 'contourf' - Filled contours (the default look of FireWxPy).
+
+2) 'pcolormesh' - Each grid cell is drawn as a quadrilateral colored with a BoundaryNorm of the contour levels and the colors of
+   the filled contour layers so the discrete look of the filled contours is kept. This works on both the regular (Hawaii) and curvilinear (CONUS/Alaska) grids.
+
+3) 'imshow' - The grid is resampled (nearest neighbor) onto the pixels of the map and drawn as a single image colored with
+   the same BoundaryNorm and colors. The pixel to grid point lookup is computed once for each grid, map projection, extent and image size
+   and is cached so every later product of the region only gathers the values.
+
+Both 'pcolormesh' and 'imshow' skip the contour generation, which is the most expensive step when plotting the fine RTMA grids.
+
+Before the field is drawn, it can be coarsened to the resolution the figure is able to display. The number of grid cells per
+pixel is estimated from the grid spacing in the map projection and the size of a pixel of the GeoAxes, and the field is reduced
+by NaN-aware block averages (or strides) so at most {quality} grid cells remain per pixel.
+
+When the same field is drawn for many regions, the filled contours can be computed once on the full grid and cached
+(keyed by the content of the field, the grid and the levels). Each regional plot then only draws the cached polygons
+that overlap its extent.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import hashlib as _hashlib
+import contourpy as _contourpy
+import numpy as _np
+import matplotlib as _mpl
+import matplotlib.colors as _mcolors
+
+from matplotlib.path import Path as _Path
+
+from collections import OrderedDict as _OrderedDict
+from scipy.spatial import cKDTree as _cKDTree
+from firewxpy.utils.grid_index import grid_fingerprint as _grid_fingerprint
+
+render_modes = [
+    'contourf',
+    'pcolormesh',
+    'imshow'
+]
+
+_pixel_lookups = _OrderedDict()
+_max_lookups = 16
+
+_contour_polygons = _OrderedDict()
+_max_contour_polygons = 8
+
+def boundary_norm(levels,
+                  cmap,
+                  extend='both'):
+
+    """
+    This function returns the colormap and the BoundaryNorm that reproduce the discrete colors of filled contours.
+
+    Filled contours color each layer with the colormap at the middle of the layer (scaled between the first and last levels)
+    and the extended layers with the colors under and over the colormap. The colormap returned holds exactly these colors, one
+    for each layer, so every value is drawn with the color of its contour layer.
+
+    Required Arguments:
+
+    1) levels (numpy.array) - The contour levels.
+
+    2) cmap (matplotlib.colors.Colormap or String) - The colormap.
+
+    Optional Arguments:
+
+    1) extend (String) - Default='both'. The extend setting of the filled contours ('neither', 'min', 'max' or 'both').
+
+    Returns
+    -------
+
+    A matplotlib.colors.ListedColormap and a matplotlib.colors.BoundaryNorm.
+    """
+
+    levels = _np.asarray(levels, dtype=float)
+    cmap = _mpl.colormaps.get_cmap(cmap)
+
+    layers = (levels[:-1] + levels[1:]) / 2
+    if extend in ('both', 'min'):
+        layers = _np.concatenate([[-_np.inf], layers])
+    if extend in ('both', 'max'):
+        layers = _np.concatenate([layers, [_np.inf]])
+
+    colors = cmap(_mcolors.Normalize(levels[0], levels[-1])(layers))
+    listed = _mcolors.ListedColormap(colors, name=cmap.name).with_extremes(bad=cmap.get_bad())
+
+    norm = _mcolors.BoundaryNorm(levels,
+                                 ncolors=listed.N,
+                                 extend=extend)
+
+    return listed, norm
+
+def _fill_coordinates(coords):
+
+    """
+    This function replaces the non-finite coordinates of a 2-D grid (i.e. the masked Alaska longitudes) with the nearest finite
+    coordinate along each row (then each column) so the grid cells can be built. The values at these points are NaN and are not drawn.
+    """
+
+    coords = _np.array(coords, dtype=float)
+
+    for axis in (1, 0):
+        if _np.isfinite(coords).all():
+            break
+
+        moved = _np.moveaxis(coords, axis, -1)
+        finite = _np.isfinite(moved)
+        n = moved.shape[-1]
+
+        forward = _np.where(finite, _np.arange(n), 0)
+        _np.maximum.accumulate(forward, axis=-1, out=forward)
+        backward = _np.where(finite, _np.arange(n), n - 1)
+        backward = _np.minimum.accumulate(backward[..., ::-1], axis=-1)[..., ::-1]
+
+        index = _np.where(_np.take_along_axis(finite, forward, axis=-1), forward, backward)
+        moved = _np.take_along_axis(moved, index, axis=-1)
+        coords = _np.moveaxis(moved, -1, axis)
+
+    return coords
+
+def cells_per_pixel(ax,
+                    lon,
+                    lat,
+                    transform):
+
+    """
+    This function estimates how many grid cells fall within one pixel of the map along each axis of the grid.
+
+    Required Arguments:
+
+    1) ax (cartopy.mpl.geoaxes.GeoAxes) - The GeoAxes (with its extent set).
+
+    2) lon (numpy.array) - The 2-D longitude of the grid.
+
+    3) lat (numpy.array) - The 2-D latitude of the grid.
+
+    4) transform (cartopy.crs) - The coordinate reference system of the data.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    1) The number of grid cells per pixel along the rows (y) of the grid.
+
+    2) The number of grid cells per pixel along the columns (x) of the grid.
+
+    Returns (0, 0) when the grid spacing can not be estimated.
+    """
+
+    ny, nx = lon.shape
+    if ny < 3 or nx < 3:
+        return 0, 0
+
+    j, i = ny // 2, nx // 2
+    rows = _np.arange(max(j - 8, 0), min(j + 9, ny))
+    cols = _np.arange(max(i - 8, 0), min(i + 9, nx))
+
+    xy_x = ax.projection.transform_points(transform, lon[j, cols], lat[j, cols])[:, :2]
+    xy_y = ax.projection.transform_points(transform, lon[rows, i], lat[rows, i])[:, :2]
+
+    dx = _np.nanmedian(_np.hypot(*_np.diff(xy_x, axis=0).T))
+    dy = _np.nanmedian(_np.hypot(*_np.diff(xy_y, axis=0).T))
+
+    width, height = ax.bbox.size
+    xlim = ax.get_xlim()
+    ylim = ax.get_ylim()
+
+    pixel = min(abs(xlim[1] - xlim[0]) / max(width, 1), abs(ylim[1] - ylim[0]) / max(height, 1))
+
+    if not (_np.isfinite(dx) and _np.isfinite(dy)) or dx <= 0 or dy <= 0:
+        return 0, 0
+
+    return pixel / dy, pixel / dx
+
+def _block_reduce(array,
+                  block,
+                  method):
+
+    """
+    This function reduces a 2-D array by {block} x {block} NaN-aware block averages ('mean') or strides ('stride').
+    """
+
+    if method == 'stride':
+        offset = block // 2
+        return array[offset::block, offset::block]
+
+    ny, nx = array.shape
+    pad_y = (-ny) % block
+    pad_x = (-nx) % block
+
+    array = _np.pad(array, ((0, pad_y), (0, pad_x)), constant_values=_np.nan)
+    blocks = array.reshape((ny + pad_y) // block, block, (nx + pad_x) // block, block)
+
+    finite = _np.isfinite(blocks)
+    count = finite.sum(axis=(1, 3))
+    total = _np.where(finite, blocks, 0).sum(axis=(1, 3))
+
+    with _np.errstate(invalid='ignore', divide='ignore'):
+        return _np.where(count > 0, total / count, _np.nan)
+
+def coarsen_to_resolution(ax,
+                          lon,
+                          lat,
+                          values,
+                          transform,
+                          quality=1,
+                          method='mean'):
+
+    """
+    This function coarsens a gridded field to the resolution the map is able to display.
+
+    Required Arguments:
+
+    1) ax (cartopy.mpl.geoaxes.GeoAxes) - The GeoAxes (with its extent set).
+
+    2) lon (numpy.array) - The 2-D longitude of the grid.
+
+    3) lat (numpy.array) - The 2-D latitude of the grid.
+
+    4) values (numpy.array) - The 2-D values.
+
+    5) transform (cartopy.crs) - The coordinate reference system of the data.
+
+    Optional Arguments:
+
+    1) quality (Integer, Float or None) - Default=1. The number of grid cells kept per pixel of the map. Higher values keep more detail.
+        When None, the field is returned unchanged.
+
+    2) method (String) - Default='mean'. 'mean' (NaN-aware block averages) or 'stride' (every n-th grid point).
+
+    Returns
+    -------
+
+    The coarsened lon, lat and values. The inputs are returned unchanged when the grid is not finer than the requested quality.
+    """
+
+    if quality is None:
+        return lon, lat, values
+
+    if method not in ('mean', 'stride'):
+        raise ValueError(f"Unknown coarsen method '{method}'. Valid methods: ['mean', 'stride']")
+
+    cells_y, cells_x = cells_per_pixel(ax, lon, lat, transform)
+    block = int(min(cells_y, cells_x) / quality)
+
+    if block < 2:
+        return lon, lat, values
+
+    return (_block_reduce(lon, block, method),
+            _block_reduce(lat, block, method),
+            _block_reduce(values, block, method))
+
+def _pixel_lookup(ax,
+                  lon,
+                  lat,
+                  transform,
+                  width,
+                  height):
+
+    """
+    This function returns the index of the nearest grid point of every pixel of the map (-1 where the map is outside of the grid).
+    """
+
+    xlim = ax.get_xlim()
+    ylim = ax.get_ylim()
+
+    key = (_grid_fingerprint(lon, lat),
+           ax.projection.proj4_init,
+           transform.proj4_init,
+           tuple(_np.round(xlim, 6)),
+           tuple(_np.round(ylim, 6)),
+           width,
+           height)
+
+    if key in _pixel_lookups:
+        _pixel_lookups.move_to_end(key)
+        return _pixel_lookups[key]
+
+    lon = lon.reshape(-1)
+    lat = lat.reshape(-1)
+
+    points = _np.flatnonzero(_np.isfinite(lon) & _np.isfinite(lat))
+    xy = ax.projection.transform_points(transform, lon[points], lat[points])[:, :2]
+    keep = _np.isfinite(xy).all(axis=1)
+    points = points[keep]
+    xy = xy[keep]
+
+    tree = _cKDTree(xy)
+
+    # The typical grid spacing limits how far a pixel may be from its grid point so the grid is not extended past its edges.
+    sample = xy[::max(xy.shape[0] // 2000, 1)]
+    spacing = _np.median(tree.query(sample, k=2)[0][:, 1])
+
+    x = xlim[0] + (_np.arange(width) + 0.5) * (xlim[1] - xlim[0]) / width
+    y = ylim[0] + (_np.arange(height) + 0.5) * (ylim[1] - ylim[0]) / height
+    x, y = _np.meshgrid(x, y)
+
+    distance, nearest = tree.query(_np.column_stack([x.reshape(-1), y.reshape(-1)]),
+                                   distance_upper_bound=spacing)
+
+    index = _np.full(nearest.shape, -1, dtype=_np.int64)
+    found = _np.isfinite(distance)
+    index[found] = points[nearest[found]]
+    index = index.reshape(height, width)
+
+    _pixel_lookups[key] = index
+    while len(_pixel_lookups) > _max_lookups:
+        _pixel_lookups.popitem(last=False)
+
+    return index
+
+def _field_digest(values):
+
+    """
+    This function returns the content hash of a field.
+    """
+
+    values = _np.ascontiguousarray(values)
+
+    digest = _hashlib.blake2b(digest_size=16)
+    digest.update(str((values.shape, values.dtype.str)).encode('utf-8'))
+    digest.update(values.tobytes())
+
+    return digest.hexdigest()
+
+def contour_polygons(lon,
+                     lat,
+                     values,
+                     levels,
+                     extend='both'):
+
+    """
+    This function returns the filled contour polygons of a field, computing them only the first time the field is seen.
+
+    The polygons are computed with the same contour algorithm and settings matplotlib uses for contourf.
+
+    Required Arguments:
+
+    1) lon (numpy.array) - The 2-D longitude of the grid.
+
+    2) lat (numpy.array) - The 2-D latitude of the grid.
+
+    3) values (numpy.array) - The 2-D values.
+
+    4) levels (numpy.array) - The contour levels.
+
+    Optional Arguments:
+
+    1) extend (String) - Default='both'. The extend setting of the filled contours.
+
+    Returns
+    -------
+
+    A list with one entry per filled layer (in the order of the layers of contourf). Each entry is a tuple of the polygons
+    (a list of (points, codes)) and their [xmin, xmax, ymin, ymax] bounding boxes.
+    """
+
+    levels = _np.asarray(levels, dtype=float)
+
+    key = (_field_digest(values),
+           _grid_fingerprint(lon, lat),
+           levels.tobytes(),
+           extend,
+           _mpl.rcParams['contour.algorithm'],
+           _mpl.rcParams['contour.corner_mask'])
+
+    if key in _contour_polygons:
+        _contour_polygons.move_to_end(key)
+        return _contour_polygons[key]
+
+    bounds = list(levels)
+    if extend in ('both', 'min'):
+        bounds.insert(0, -1e250)
+    if extend in ('both', 'max'):
+        bounds.append(1e250)
+
+    generator = _contourpy.contour_generator(lon,
+                                             lat,
+                                             _np.ma.masked_invalid(values),
+                                             name=_mpl.rcParams['contour.algorithm'],
+                                             corner_mask=_mpl.rcParams['contour.corner_mask'],
+                                             fill_type='OuterCode')
+
+    layers = []
+    for lower, upper in zip(bounds[:-1], bounds[1:]):
+        points, codes = generator.filled(lower, upper)
+        polygons = list(zip(points, codes))
+        if polygons:
+            boxes = _np.array([[p[:, 0].min(), p[:, 0].max(), p[:, 1].min(), p[:, 1].max()] for p in points])
+        else:
+            boxes = _np.empty((0, 4))
+        layers.append((polygons, boxes))
+
+    _contour_polygons[key] = layers
+    while len(_contour_polygons) > _max_contour_polygons:
+        _contour_polygons.popitem(last=False)
+
+    return layers
+
+def _overlapping(boxes,
+                 extent):
+
+    """
+    This function returns which bounding boxes overlap an extent (longitudes are also compared 360 degrees apart).
+    """
+
+    west, east, south, north = extent
+    inside_y = (boxes[:, 3] >= south) & (boxes[:, 2] <= north)
+    inside_x = _np.zeros(boxes.shape[0], dtype=bool)
+    for shift in (-360, 0, 360):
+        inside_x |= (boxes[:, 1] + shift >= west) & (boxes[:, 0] + shift <= east)
+
+    return inside_x & inside_y
+
+def _cached_contourf(ax,
+                     lon,
+                     lat,
+                     values,
+                     cmap,
+                     levels,
+                     transform,
+                     alpha,
+                     zorder,
+                     extend):
+
+    """
+    This function draws filled contours from the contour polygon cache, keeping only the polygons that overlap the map.
+
+    A ContourSet is built by contourf on a tiny stand-in grid so the colors, the layers and the colorbar are exactly those of
+    contourf, and its paths are then replaced with the cached polygons.
+    """
+
+    layers = contour_polygons(lon,
+                              lat,
+                              values,
+                              levels,
+                              extend=extend)
+
+    try:
+        west, east, south, north = ax.get_extent(crs=transform)
+        margin_x = 0.05 * (east - west)
+        margin_y = 0.05 * (north - south)
+        extent = [west - margin_x, east + margin_x, south - margin_y, north + margin_y]
+    except Exception as e:
+        extent = None
+
+    paths = []
+    for polygons, boxes in layers:
+        if extent is not None and len(polygons) > 0:
+            keep = _np.flatnonzero(_overlapping(boxes, extent))
+            polygons = [polygons[i] for i in keep]
+        if polygons:
+            paths.append(_Path.make_compound_path(*[_Path(points, codes) for points, codes in polygons]))
+        else:
+            paths.append(_Path(_np.empty((0, 2))))
+
+    finite = _np.isfinite(lon) & _np.isfinite(lat)
+    x0, y0 = float(lon[finite][0]), float(lat[finite][0])
+    levels = _np.asarray(levels, dtype=float)
+
+    cs = ax.contourf(_np.array([[x0, x0 + 1e-6], [x0, x0 + 1e-6]]),
+                     _np.array([[y0, y0], [y0 + 1e-6, y0 + 1e-6]]),
+                     _np.array([[levels[0], levels[-1]], [levels[0], levels[-1]]]),
+                     cmap=cmap,
+                     levels=levels,
+                     transform=transform,
+                     alpha=alpha,
+                     zorder=zorder,
+                     extend=extend)
+
+    # ContourSet is a single Collection with one path per level since matplotlib 3.8.
+    cs.set_paths(paths)
+
+    return cs
+
+def render_field(ax,
+                 lon,
+                 lat,
+                 values,
+                 cmap,
+                 levels,
+                 transform,
+                 alpha=1,
+                 zorder=1,
+                 extend='both',
+                 render_mode='contourf',
+                 coarsen_quality=None,
+                 coarsen_method='mean',
+                 contour_cache=False):
+
+    """
+    This function draws a gridded field on the map.
+
+    Required Arguments:
+
+    1) ax (cartopy.mpl.geoaxes.GeoAxes) - The GeoAxes.
+
+    2) lon (numpy.array or xarray.array) - The 2-D longitude of the grid.
+
+    3) lat (numpy.array or xarray.array) - The 2-D latitude of the grid.
+
+    4) values (numpy.array or xarray.array) - The 2-D values.
+
+    5) cmap (matplotlib.colors.Colormap or String) - The colormap.
+
+    6) levels (numpy.array) - The contour levels.
+
+    7) transform (cartopy.crs) - The coordinate reference system of the data.
+
+    Optional Arguments:
+
+    1) alpha (Float) - Default=1. The transparency of the field.
+
+    2) zorder (Integer) - Default=1. The z-order of the field.
+
+    3) extend (String) - Default='both'. The extend setting of the colors.
+
+    4) render_mode (String) - Default='contourf'. 'contourf', 'pcolormesh' or 'imshow'.
+
+    5) coarsen_quality (Integer, Float or None) - Default=None. When set, the field is first coarsened so about this many grid cells
+        remain per pixel of the map (see coarsen_to_resolution()).
+
+    6) coarsen_method (String) - Default='mean'. 'mean' (NaN-aware block averages) or 'stride' (every n-th grid point).
+
+    7) contour_cache (Boolean) - Default=False. When set to True and render_mode='contourf', the filled contours are taken from
+        the contour polygon cache (see contour_polygons()) so the same field is only contoured once for every region.
+        The field is not coarsened in this case since the polygons are shared between regions of different sizes.
+
+    Returns
+    -------
+
+    The mappable used to build the colorbar.
+    """
+
+    if render_mode not in render_modes:
+        raise ValueError(f"Unknown render_mode '{render_mode}'. Valid render modes: {render_modes}")
+
+    if render_mode == 'contourf' and contour_cache is True:
+        return _cached_contourf(ax,
+                                _np.asarray(lon, dtype=float),
+                                _np.asarray(lat, dtype=float),
+                                _np.asarray(values, dtype=float),
+                                cmap,
+                                levels,
+                                transform,
+                                alpha,
+                                zorder,
+                                extend)
+
+    if coarsen_quality is not None:
+        lon = _np.asarray(lon, dtype=float)
+        lat = _np.asarray(lat, dtype=float)
+        values = _np.asarray(values, dtype=float)
+
+        if lon.ndim == 2 and lon.shape == values.shape:
+            lon, lat, values = coarsen_to_resolution(ax,
+                                                     lon,
+                                                     lat,
+                                                     values,
+                                                     transform,
+                                                     quality=coarsen_quality,
+                                                     method=coarsen_method)
+
+    if render_mode == 'contourf':
+        return ax.contourf(lon,
+                           lat,
+                           values,
+                           cmap=cmap,
+                           levels=levels,
+                           transform=transform,
+                           alpha=alpha,
+                           zorder=zorder,
+                           extend=extend)
+
+    cmap, norm = boundary_norm(levels, cmap, extend=extend)
+
+    lon = _np.asarray(lon, dtype=float)
+    lat = _np.asarray(lat, dtype=float)
+    values = _np.asarray(values, dtype=float)
+
+    if render_mode == 'pcolormesh':
+        return ax.pcolormesh(_fill_coordinates(lon),
+                             _fill_coordinates(lat),
+                             _np.ma.masked_invalid(values),
+                             cmap=cmap,
+                             norm=norm,
+                             shading='nearest',
+                             transform=transform,
+                             alpha=alpha,
+                             zorder=zorder)
+
+    width, height = (max(int(round(v)), 1) for v in ax.bbox.size)
+    index = _pixel_lookup(ax, lon, lat, transform, width, height)
+
+    image = _np.take(values.reshape(-1), _np.where(index < 0, 0, index))
+    image = _np.ma.masked_where((index < 0) | ~_np.isfinite(image), image)
+
+    xlim = ax.get_xlim()
+    ylim = ax.get_ylim()
+
+    mappable = ax.imshow(image,
+                         extent=(xlim[0], xlim[1], ylim[0], ylim[1]),
+                         transform=ax.projection,
+                         origin='lower',
+                         cmap=cmap,
+                         norm=norm,
+                         interpolation='nearest',
+                         alpha=alpha,
+                         zorder=zorder)
+
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+
+    return mappable
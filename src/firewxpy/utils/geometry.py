@@ -7,10 +7,16 @@ import os
 
 from urllib.parse import urlparse
 from shapeography import(
-    client,
     unzip,
     geometry
 )
+from firewxpy.utils.cartographic_refresh import refresh_file
+from firewxpy.utils.region_layers import region_layer
+from firewxpy.utils.geometry_cache import(
+    geometry_key,
+    load_geometries,
+    store_geometries
+)
 
 def get_filename_from_url(url):
     
@@ -48,7 +54,10 @@ def import_shapefile_from_web(url,
                                 edgecolor,
                                 crs,
                                 convert_crs=False,
-                                convert_to='EPSG:4326'):
+                                convert_to='EPSG:4326',
+                                extent=None,
+                                figure_size=(12, 12),
+                                mapcrs=None):
     
     """
     This function downloads and imports the geometry from a shapefile hosted on the web.
@@ -74,9 +83,9 @@ def import_shapefile_from_web(url,
     
     6) notifications (String) - Notification when a file is downloaded and saved to {path}
     
-    7) refresh (Boolean) - When set to True, the branch that hosts the shapefiles files is completely
-       cleaned out and a new set of shapefiles is downloaded with each run. This is recommended for those using 
-       shapeography in automated tasks to account for periodic shapefile updates on the servers that host the shapefiles.
+    7) refresh (Boolean) - When set to True, the shapefiles are re-validated with the server once the freshness window
+       set by firewxpy.utils.set_refresh_policy() expires (ETag/Last-Modified) and the branch that hosts the shapefiles is cleaned out
+       and re-downloaded only when the archive changed on the server. When set to False, the shapefiles are only downloaded once.
     
     8) file_extension (String) - Default='.zip'. - The extension of the zip file. 
     
@@ -95,43 +104,94 @@ def import_shapefile_from_web(url,
     1) convert_crs (Boolean) - Default=False. Set to True if the coordinate reference system of the shapefile geometry needs to be 
         converted to PlateCarree. 
     
-    Returns
-    -------
+    2) convert_to (String) - Default='EPSG:4326'. The coordinate reference system the geometry is converted to when convert_crs=True.
     
-    The geometry of a shapefile to plot with cartopy.    
-    """
+    3) extent (List or None) - Default=None. [western_bound, eastern_bound, southern_bound, northern_bound] of the plot in decimal degrees.
+        When set, only the geometry clipped to the region (plus a margin) and simplified for the figure size is returned.
+        
+    4) figure_size (Tuple) - Default=(12, 12). The (figure_x_length, figure_y_length) of the plot in inches. Only used when extent is set.
     
-    client.get_shapefiles(url,
-                     path,
-                     filename,
-                     proxies=proxies,
-                     chunk_size=chunk_size,
-                     notifications=notifications,
-                     refresh=refresh)
+    5) mapcrs (cartopy.crs or None) - Default=None. The projection of the plot. When it is not PlateCarree, the geometry is clipped
+        to everything visible in the projected map. Only used when extent is set.
     
-    unzip.extract_files(path,
-                        file_extension=file_extension)
+    Returns
+    -------
     
-    for f in os.listdir(f"{path}"):
-        extraction_folder = f.split('.', 1)[0]
-        
-    for f in os.listdir(f"{path}/{extraction_folder}"):
-        if f.endswith('.shp'):
-            fname = f
+    The geometry of a shapefile to plot with cartopy. The parsed geometries are cached in FireWxPy Cache/Geometry
+    keyed by the URL and the content hash of the downloaded archive. When the archive has not changed, the geometries
+    are loaded from the cache without unzipping the archive or reading the shapefile.    
+    """
     
-    file_path = f"{path}/{extraction_folder}/{fname}"
+    digest, downloaded = refresh_file(url,
+                                      path,
+                                      filename,
+                                      proxies=proxies,
+                                      chunk_size=chunk_size,
+                                      notifications=notifications,
+                                      refresh=refresh)
     
     if convert_crs is True:
-        shapes = geometry.geodataframe(file_path,
-                                       crs=convert_to)
-        shapes = shapes['geometry']
-    
+        key = geometry_key(url, digest, convert_to)
     else:
-        shapes = geometry.cartopy_shapefeature(file_path,
-                                            edgecolor=edgecolor,
-                                            crs=crs)
+        key = geometry_key(url, digest)
+        
+    def load_layer():
+        
+        shapes = load_geometries(key)
+        
+        if shapes is not None:
+            return shapes
+        
+        if downloaded is False:
+            refresh_file(url,
+                         path,
+                         filename,
+                         proxies=proxies,
+                         chunk_size=chunk_size,
+                         notifications=notifications,
+                         refresh=refresh,
+                         force=True)
+        
+        unzip.extract_files(path,
+                            file_extension=file_extension)
+        
+        for f in os.listdir(f"{path}"):
+            extraction_folder = f.split('.', 1)[0]
+            
+        for f in os.listdir(f"{path}/{extraction_folder}"):
+            if f.endswith('.shp'):
+                fname = f
+        
+        file_path = f"{path}/{extraction_folder}/{fname}"
+        
+        if convert_crs is True:
+            shapes = geometry.geodataframe(file_path,
+                                           crs=convert_to)
+            shapes = shapes['geometry']
+        
+        else:
+            shapes = geometry.cartopy_shapefeature(file_path,
+                                                edgecolor=edgecolor,
+                                                crs=crs)
+        
+            shapes = shapes.geometries()
+        
+        return store_geometries(key, shapes)
+    
+    if extent is not None:
+        shapes = region_layer(key,
+                              load_layer,
+                              extent,
+                              figure_size,
+                              mapcrs=mapcrs)
+    else:
+        shapes = load_layer()
     
-        shapes = shapes.geometries()
+    if os.path.exists(f"{path}/{filename}"):
+        try:
+            os.remove(f"{path}/{filename}")
+        except Exception as e:
+            pass
     
     return shapes
 
@@ -203,9 +263,9 @@ def import_geojson_from_web(url,
     
     6) notifications (String) - Notification when a file is downloaded and saved to {path}
     
-    7) refresh (Boolean) - When set to True, the branch that hosts the GEOJSON files is completely
-       cleaned out and a new set of shapefiles is downloaded with each run. This is recommended for those using 
-       shapeography in automated tasks to account for periodic GEOJSON updates on the servers that host the GEOJSONs.
+    7) refresh (Boolean) - When set to True, the GEOJSON is re-validated with the server once the freshness window
+       set by firewxpy.utils.set_refresh_policy() expires (ETag/Last-Modified) and re-downloaded only when it changed on the server.
+       When set to False, the GEOJSON is only downloaded once.
     
     
     Returns
@@ -214,17 +274,17 @@ def import_geojson_from_web(url,
     The geometry of a GEOJSON to plot with cartopy.    
     """
     
-    client.get_geojson(url,
-                     path,
-                     filename,
-                     proxies=proxies,
-                     chunk_size=chunk_size,
-                     notifications=notifications,
-                     refresh=refresh)
-      
-    
     file_path = f"{path}/{filename}"
     
+    refresh_file(url,
+                 path,
+                 filename,
+                 proxies=proxies,
+                 chunk_size=chunk_size,
+                 notifications=notifications,
+                 refresh=refresh,
+                 force=(os.path.exists(file_path) is False))
+    
     shapes = geometry.get_geometries(file_path)
     
     return shapes
@@ -0,0 +1,303 @@
+"""
+This file hosts the persistent on-disk cache of parsed shapefile geometries.
+
+The geometries are stored as packed coordinate arrays plus an offsets index (shapely ragged arrays) in a .npz file.
+Each entry is keyed by the download URL, the content hash of the downloaded archive and the conversion options, so
+a warm run loads the geometries without unzipping the archive or reading the shapefile. The most recently used layers are
+also held in memory (at most max_layers of them) so later plots of the session do not read the .npz file again.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os as _os
+import hashlib as _hashlib
+import threading as _threading
+import numpy as _np
+import shapely as _shapely
+
+from collections import OrderedDict as _OrderedDict
+from firewxpy.utils.directory import cache_directory as _cache_directory
+
+_settings = {
+    'max_layers':16
+}
+
+_memory = _OrderedDict()
+_lock = _threading.Lock()
+
+def set_geometry_cache_policy(max_layers=16):
+
+    """
+    This function sets how many geometry layers are kept in memory.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) max_layers (Integer) - Default=16. The maximum number of geometry layers (one per shapefile and conversion options)
+        held in memory. When this is exceeded, the least recently used layer is dropped. Set to 0 to read the layers from
+        the files in FireWxPy Cache/Geometry on every call.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _settings['max_layers'] = max_layers
+        _evict()
+
+def clear_geometry_cache(disk=False):
+
+    """
+    This function drops every geometry layer held in memory.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) disk (Boolean) - Default=False. When set to True, the files in FireWxPy Cache/Geometry are removed as well.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _memory.clear()
+
+    if disk is True:
+        path = _cache_directory('Geometry')
+        for f in _os.listdir(path):
+            if f.endswith('.npz'):
+                try:
+                    _os.remove(f"{path}/{f}")
+                except OSError:
+                    pass
+
+def _evict():
+
+    """
+    This function drops the least recently used layers beyond max_layers.
+    """
+
+    while len(_memory) > max(_settings['max_layers'], 0):
+        _memory.popitem(last=False)
+
+def _remember(key,
+              geometries):
+
+    """
+    This function holds a geometry layer in memory as the most recently used one.
+    """
+
+    with _lock:
+        _memory[key] = geometries
+        _memory.move_to_end(key)
+        _evict()
+
+def file_digest(file_path,
+                chunk_size=1048576):
+
+    """
+    This function returns the SHA-256 content hash of a file.
+
+    Required Arguments:
+
+    1) file_path (String) - The path to the file.
+
+    Optional Arguments:
+
+    1) chunk_size (Integer) - Default=1048576. The number of bytes read at a time.
+
+    Returns
+    -------
+
+    The hexadecimal SHA-256 digest of the file.
+    """
+
+    digest = _hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+def geometry_key(*parts):
+
+    """
+    This function builds the cache key of a set of geometries.
+
+    Required Arguments:
+
+    1) *parts - The values that identify the geometries (i.e. URL, archive hash, conversion options).
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The cache key as a hexadecimal string.
+    """
+
+    return _hashlib.sha256('\n'.join(str(p) for p in parts).encode('utf-8')).hexdigest()
+
+def _cache_file(key):
+
+    """
+    This function returns the path of the cache file for a key.
+    """
+
+    return f"{_cache_directory('Geometry')}/{key}.npz"
+
+def pack_geometries(geometries):
+
+    """
+    This function packs shapely geometries into flat NumPy arrays.
+
+    Geometries of one type (i.e. Polygon/MultiPolygon) are stored as a shapely ragged array (coordinates + offsets).
+    The ragged array stores Polygons mixed with MultiPolygons as MultiPolygons, so the type of each geometry is stored too.
+    Mixed geometry types fall back to concatenated WKB bytes + offsets.
+
+    Required Arguments:
+
+    1) geometries (Iterable) - The shapely geometries.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A dictionary of NumPy arrays.
+    """
+
+    geometries = _np.asarray([g for g in geometries if g is not None and not g.is_empty], dtype=object)
+
+    try:
+        geometry_type, coords, offsets = _shapely.to_ragged_array(geometries)
+        arrays = {
+            'format':_np.array('ragged'),
+            'geometry_type':_np.array(int(geometry_type)),
+            'type_ids':_shapely.get_type_id(geometries).astype(_np.int8),
+            'coords':coords
+        }
+        for i, o in enumerate(offsets):
+            arrays[f"offsets_{i}"] = o
+
+    except (ValueError, TypeError):
+        wkb = _shapely.to_wkb(geometries)
+        lengths = _np.array([len(w) for w in wkb], dtype=_np.int64)
+        arrays = {
+            'format':_np.array('wkb'),
+            'wkb':_np.frombuffer(b''.join(wkb), dtype=_np.uint8),
+            'offsets_0':_np.concatenate([[0], _np.cumsum(lengths)])
+        }
+
+    return arrays
+
+def unpack_geometries(arrays):
+
+    """
+    This function rebuilds the shapely geometries from the arrays returned by pack_geometries().
+
+    Required Arguments:
+
+    1) arrays (dict or numpy.lib.npyio.NpzFile) - The packed arrays.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A list of shapely geometries.
+    """
+
+    if str(arrays['format']) == 'ragged':
+        offsets = []
+        i = 0
+        while f"offsets_{i}" in arrays:
+            offsets.append(arrays[f"offsets_{i}"])
+            i += 1
+        geometries = _shapely.from_ragged_array(_shapely.GeometryType(int(arrays['geometry_type'])),
+                                                arrays['coords'],
+                                                tuple(offsets))
+        if 'type_ids' in arrays:
+            promoted = _shapely.get_type_id(geometries) != arrays['type_ids']
+            geometries[promoted] = _shapely.get_geometry(geometries[promoted], 0)
+    else:
+        buffer = arrays['wkb'].tobytes()
+        offsets = arrays['offsets_0']
+        geometries = _shapely.from_wkb([buffer[a:b] for a, b in zip(offsets[:-1], offsets[1:])])
+
+    return list(geometries)
+
+def load_geometries(key):
+
+    """
+    This function loads cached geometries.
+
+    Required Arguments:
+
+    1) key (String) - The cache key returned by geometry_key().
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A list of shapely geometries or None if the geometries are not cached.
+    """
+
+    with _lock:
+        geometries = _memory.get(key)
+        if geometries is not None:
+            _memory.move_to_end(key)
+            return geometries
+
+    file_path = _cache_file(key)
+    if _os.path.exists(file_path) is False:
+        return None
+
+    try:
+        with _np.load(file_path, allow_pickle=False) as arrays:
+            geometries = unpack_geometries(arrays)
+    except Exception as e:
+        return None
+
+    _remember(key, geometries)
+
+    return geometries
+
+def store_geometries(key,
+                     geometries):
+
+    """
+    This function saves geometries to the cache.
+
+    Required Arguments:
+
+    1) key (String) - The cache key returned by geometry_key().
+
+    2) geometries (Iterable) - The shapely geometries.
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    A list of the shapely geometries that were cached.
+    """
+
+    geometries = [g for g in geometries if g is not None and not g.is_empty]
+
+    file_path = _cache_file(key)
+    tmp_path = f"{file_path}.{_os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        _np.savez(f, **pack_geometries(geometries))
+    _os.replace(tmp_path, file_path)
+
+    _remember(key, geometries)
+
+    return geometries
@@ -0,0 +1,122 @@
+"""
+This file hosts the 2-D coordinates of the regular latitude/longitude grids (i.e. the Hawaii RTMA grid).
+
+The regular grids only store 1-D longitude and latitude axes while the contours and the station plots need the coordinate of
+every grid point. Broadcasting the axes with numpy.meshgrid() allocates two full 2-D arrays for every product. The 2-D
+coordinates are built once for each grid definition and decimation and are shared (read-only) by every later plot. When the
+station plots only need every n-th point, the 1-D axes are decimated before they are broadcast so the full 2-D arrays are
+never built.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import threading as _threading
+import numpy as _np
+
+from collections import OrderedDict as _OrderedDict
+from firewxpy.utils.grid_index import grid_fingerprint as _grid_fingerprint
+
+_settings = {
+    'max_grids':16
+}
+
+_memory = _OrderedDict()
+_lock = _threading.Lock()
+
+def set_grid_coordinates_policy(max_grids=16):
+
+    """
+    This function sets how many 2-D coordinate grids are kept in memory.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) max_grids (Integer) - Default=16. The maximum number of 2-D coordinate grids (one per grid definition and decimation)
+        held in memory. When this is exceeded, the least recently used grid is dropped. Set to 0 to build the coordinates on
+        every call.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _settings['max_grids'] = max_grids
+        _evict()
+
+def clear_grid_coordinates():
+
+    """
+    This function drops every 2-D coordinate grid held in memory.
+
+    Required Arguments: None
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _memory.clear()
+
+def _evict():
+
+    """
+    This function drops the least recently used grids beyond max_grids.
+    """
+
+    while len(_memory) > max(_settings['max_grids'], 0):
+        _memory.popitem(last=False)
+
+def grid_coordinates(lon,
+                     lat,
+                     decimate=1):
+
+    """
+    This function returns the 2-D longitude and latitude of a regular grid from its 1-D axes.
+
+    Required Arguments:
+
+    1) lon (numpy.array or xarray.array) - The 1-D longitude axis of the grid.
+
+    2) lat (numpy.array or xarray.array) - The 1-D latitude axis of the grid.
+
+    Optional Arguments:
+
+    1) decimate (Integer) - Default=1. Only every n-th point of each axis is kept. The axes are decimated before they are broadcast.
+
+    Returns
+    -------
+
+    1) The 2-D longitude [lat, lon] (read-only).
+
+    2) The 2-D latitude [lat, lon] (read-only).
+    """
+
+    lon = _np.asarray(lon)[::decimate]
+    lat = _np.asarray(lat)[::decimate]
+
+    key = (_grid_fingerprint(lon, lat), lon.dtype.str, lat.dtype.str)
+
+    with _lock:
+        grid = _memory.get(key)
+        if grid is not None:
+            _memory.move_to_end(key)
+            return grid
+
+    lon2d, lat2d = _np.meshgrid(lon, lat)
+    lon2d.flags.writeable = False
+    lat2d.flags.writeable = False
+    grid = (lon2d, lat2d)
+
+    with _lock:
+        _memory[key] = grid
+        _memory.move_to_end(key)
+        _evict()
+
+    return grid
@@ -0,0 +1,389 @@
+"""
+This file hosts the index of the i/j windows that cover each region on each grid.
+
+Finding the window of a region on a curvilinear grid (i.e. the Alaska Polar Stereographic grid) requires a search of the
+full latitude/longitude arrays. The windows are computed once for each grid definition and region and are persisted in
+FireWxPy Cache/Grid Index so every later plot gets its subset by slicing alone. Each grid definition is identified by a
+fingerprint of its shape and a sample of its coordinates so a new grid definition never reuses a stale window.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os as _os
+import json as _json
+import hashlib as _hashlib
+import numpy as _np
+
+from firewxpy.utils.directory import cache_directory as _cache_directory
+from firewxpy.utils.region_layers import map_extent as _map_extent
+from firewxpy.utils.plot_coords import(
+    bounding_box as _bounding_box,
+    region_names as _region_names
+)
+
+_memory = {}
+
+def _normalize_longitude(lon,
+                         western_bound):
+
+    """
+    This function maps the longitudes into [western_bound, western_bound + 360) so 0 to 360 grids and regions
+    crossing the antimeridian compare correctly with the bounds of the region.
+    """
+
+    return ((lon - western_bound) % 360) + western_bound
+
+def _index_slice(inside,
+                 pad):
+
+    """
+    This function returns the slice that covers every True value of a 1-D boolean array plus a pad.
+    """
+
+    idx = _np.flatnonzero(inside)
+    if idx.size == 0:
+        return None
+
+    return slice(int(max(idx[0] - pad, 0)), int(min(idx[-1] + pad + 1, inside.size)))
+
+def compute_window(lon,
+                   lat,
+                   extent,
+                   halo=0.05,
+                   pad=2):
+
+    """
+    This function searches a grid for the i/j index window that covers a region.
+
+    Required Arguments:
+
+    1) lon (numpy.array) - The 1-D or 2-D longitude of the grid.
+
+    2) lat (numpy.array) - The 1-D or 2-D latitude of the grid.
+
+    3) extent (List or Tuple) - [western_bound, eastern_bound, southern_bound, northern_bound] in decimal degrees.
+
+    Optional Arguments:
+
+    1) halo (Float) - Default=0.05. The halo added around the region as a fraction of the width/height of the region.
+
+    2) pad (Integer) - Default=2. The number of extra grid points added on each side of the window.
+
+    Returns
+    -------
+
+    1) The latitude (row) slice.
+
+    2) The longitude (column) slice.
+
+    Returns None when no grid point falls inside of the region.
+    """
+
+    western_bound, eastern_bound, southern_bound, northern_bound = extent
+
+    x_halo = halo * abs(eastern_bound - western_bound)
+    y_halo = halo * abs(northern_bound - southern_bound)
+
+    western_bound = western_bound - x_halo
+    eastern_bound = eastern_bound + x_halo
+    southern_bound = southern_bound - y_halo
+    northern_bound = northern_bound + y_halo
+
+    lon = _np.asarray(lon)
+    lat = _np.asarray(lat)
+
+    if eastern_bound - western_bound >= 360:
+        lon_inside = _np.isfinite(lon)
+    else:
+        lon_inside = _normalize_longitude(lon, western_bound) <= eastern_bound
+
+    lat_inside = (lat >= southern_bound) & (lat <= northern_bound)
+
+    if lon.ndim == 1:
+        rows = _index_slice(lat_inside, pad)
+        cols = _index_slice(lon_inside, pad)
+
+    else:
+        inside = lon_inside & lat_inside
+        rows = _index_slice(inside.any(axis=1), pad)
+        cols = _index_slice(inside.any(axis=0), pad)
+
+    if rows is None or cols is None:
+        return None
+
+    return rows, cols
+
+def grid_fingerprint(lon,
+                     lat,
+                     samples=1024):
+
+    """
+    This function returns the fingerprint of a grid definition.
+
+    Required Arguments:
+
+    1) lon (numpy.array) - The 1-D or 2-D longitude of the grid.
+
+    2) lat (numpy.array) - The 1-D or 2-D latitude of the grid.
+
+    Optional Arguments:
+
+    1) samples (Integer) - Default=1024. The approximate number of coordinates sampled from each array.
+
+    Returns
+    -------
+
+    The fingerprint as a hexadecimal string.
+    """
+
+    digest = _hashlib.sha256()
+    for coords in (lon, lat):
+        coords = _np.asarray(coords)
+        flat = coords.reshape(-1)
+        stride = max(flat.size // samples, 1)
+        sample = _np.concatenate([flat[::stride], flat[-1:]])
+        digest.update(str(coords.shape).encode('utf-8'))
+        digest.update(_np.round(sample.astype(_np.float64), 5).tobytes())
+
+    return digest.hexdigest()[:32]
+
+def _window_key(extent,
+                halo,
+                pad):
+
+    """
+    This function returns the key of a window within the index of a grid.
+    """
+
+    return ','.join(f"{float(e):.4f}" for e in extent) + f"|{float(halo):.4f}|{int(pad)}"
+
+def _index_file(fingerprint):
+
+    """
+    This function returns the path of the index file of a grid.
+    """
+
+    return f"{_cache_directory('Grid Index')}/{fingerprint}.json"
+
+def _load_index(fingerprint):
+
+    """
+    This function loads the index of a grid from memory or disk.
+    """
+
+    if fingerprint not in _memory:
+        try:
+            with open(_index_file(fingerprint), 'r') as f:
+                _memory[fingerprint] = _json.load(f)
+        except Exception as e:
+            _memory[fingerprint] = {}
+
+    return _memory[fingerprint]
+
+def _save_index(fingerprint,
+                windows):
+
+    """
+    This function merges windows into the index of a grid on disk.
+    """
+
+    file_path = _index_file(fingerprint)
+
+    try:
+        with open(file_path, 'r') as f:
+            index = _json.load(f)
+    except Exception as e:
+        index = {}
+
+    index.update(windows)
+
+    tmp_path = f"{file_path}.{_os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        _json.dump(index, f)
+    _os.replace(tmp_path, file_path)
+
+    _load_index(fingerprint).update(index)
+
+def _to_slices(entry):
+
+    """
+    This function converts an index entry back to the (row, column) slices.
+    """
+
+    if entry is None:
+        return None
+
+    r0, r1, c0, c1 = entry
+
+    return slice(r0, r1), slice(c0, c1)
+
+def _to_entry(window):
+
+    """
+    This function converts the (row, column) slices into an index entry.
+    """
+
+    if window is None:
+        return None
+
+    rows, cols = window
+
+    return [rows.start, rows.stop, cols.start, cols.stop]
+
+def region_window(lon,
+                  lat,
+                  extent,
+                  halo=0.05,
+                  pad=2,
+                  fingerprint=None):
+
+    """
+    This function returns the i/j index window of a grid that covers a region, searching the grid only
+    the first time the (grid, region) pair is seen.
+
+    Required Arguments:
+
+    1) lon (numpy.array) - The 1-D or 2-D longitude of the grid.
+
+    2) lat (numpy.array) - The 1-D or 2-D latitude of the grid.
+
+    3) extent (List or Tuple) - [western_bound, eastern_bound, southern_bound, northern_bound] in decimal degrees.
+
+    Optional Arguments:
+
+    1) halo (Float) - Default=0.05. The halo added around the region as a fraction of the width/height of the region.
+
+    2) pad (Integer) - Default=2. The number of extra grid points added on each side of the window.
+
+    3) fingerprint (String or None) - Default=None. The fingerprint of the grid returned by grid_fingerprint().
+        When None, the fingerprint is computed from lon and lat.
+
+    Returns
+    -------
+
+    1) The latitude (row) slice.
+
+    2) The longitude (column) slice.
+
+    Returns None when no grid point falls inside of the region.
+    """
+
+    if fingerprint is None:
+        fingerprint = grid_fingerprint(lon, lat)
+
+    key = _window_key(extent, halo, pad)
+    index = _load_index(fingerprint)
+
+    if key in index:
+        return _to_slices(index[key])
+
+    window = compute_window(lon,
+                            lat,
+                            extent,
+                            halo=halo,
+                            pad=pad)
+
+    _save_index(fingerprint, {key:_to_entry(window)})
+
+    return window
+
+def precompute_region_windows(ds,
+                              regions=None,
+                              longitude_key='longitude',
+                              latitude_key='latitude',
+                              halo=0.05,
+                              pad=2,
+                              mapcrs=None):
+
+    """
+    This function builds the index windows of every region for the grid of a dataset.
+
+    Required Arguments:
+
+    1) ds (xarray.array) - A dataset on the grid (i.e. the RTMA CONUS, Alaska or Hawaii grid).
+
+    Optional Arguments:
+
+    1) regions (List or None) - Default=None. The regions (see firewxpy.utils.plot_coords.region_names()) or custom
+        [western_bound, eastern_bound, southern_bound, northern_bound] extents. When None, every named region is indexed.
+
+    2) longitude_key (String) - Default='longitude'. The longitude coordinate key name.
+
+    3) latitude_key (String) - Default='latitude'. The latitude coordinate key name.
+
+    4) halo (Float) - Default=0.05. The halo added around the region as a fraction of the width/height of the region.
+
+    5) pad (Integer) - Default=2. The number of extra grid points added on each side of the window.
+
+    6) mapcrs (cartopy.crs or None) - Default=None. The projection of the plots. None is PlateCarree.
+        See firewxpy.utils.grid_subset.subset_to_region().
+
+    Returns
+    -------
+
+    A dictionary with the (row, column) slices of each region. Regions outside of the grid map to None.
+    """
+
+    if regions is None:
+        regions = _region_names()
+
+    lon = ds[longitude_key].values
+    lat = ds[latitude_key].values
+    fingerprint = grid_fingerprint(lon, lat)
+    index = _load_index(fingerprint)
+
+    windows = {}
+    new = {}
+    for region in regions:
+        if isinstance(region, str):
+            extent = _bounding_box(region, None, None, None, None)
+            name = region
+        else:
+            extent = list(region)
+            name = tuple(region)
+
+        extent = _map_extent(extent, mapcrs)
+        key = _window_key(extent, halo, pad)
+        if key in index:
+            windows[name] = _to_slices(index[key])
+        else:
+            window = compute_window(lon,
+                                    lat,
+                                    extent,
+                                    halo=halo,
+                                    pad=pad)
+            new[key] = _to_entry(window)
+            windows[name] = window
+
+    if new:
+        _save_index(fingerprint, new)
+
+    return windows
+
+def clear_grid_index(disk=False):
+
+    """
+    This function clears the index of the region windows.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) disk (Boolean) - Default=False. When set to True, the index files in FireWxPy Cache/Grid Index are removed as well.
+
+    Returns
+    -------
+
+    None
+    """
+
+    _memory.clear()
+
+    if disk is True:
+        path = _cache_directory('Grid Index')
+        for f in _os.listdir(path):
+            if f.endswith('.json'):
+                try:
+                    _os.remove(f"{path}/{f}")
+                except OSError:
+                    pass
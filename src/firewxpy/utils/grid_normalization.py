@@ -0,0 +1,195 @@
+"""
+This file hosts the normalized coordinates of the grids that store their longitudes from 0 to 360 (i.e. the Alaska RTMA grid).
+
+Before such a grid is contoured with cartopy, its longitudes are converted to -180 to 180 and the points outside of a
+longitude window are masked so the contours do not streak across the antimeridian. The normalized longitude, latitude and
+mask only depend on the grid definition, so they are computed once per grid definition and persisted in
+FireWxPy Cache/Grid Normalization. Every later plot only applies the mask to its values, which is a view of the values
+when no point is masked and a single new array otherwise.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os as _os
+import threading as _threading
+import numpy as _np
+
+from collections import OrderedDict as _OrderedDict
+from firewxpy.utils.directory import cache_directory as _cache_directory
+from firewxpy.utils.grid_index import grid_fingerprint as _grid_fingerprint
+
+_settings = {
+    'max_grids':8
+}
+
+_memory = _OrderedDict()
+_lock = _threading.Lock()
+
+def _normalization_file(fingerprint,
+                        western_limit,
+                        eastern_limit):
+
+    """
+    This function returns the path of the file of a normalized grid.
+    """
+
+    return f"{_cache_directory('Grid Normalization')}/{fingerprint}_{float(western_limit):g}_{float(eastern_limit):g}.npz"
+
+def _read_only(*arrays):
+
+    """
+    This function marks arrays as read-only so the cached grids can be shared safely.
+    """
+
+    for array in arrays:
+        array.flags.writeable = False
+
+    return arrays
+
+def _compute(lon,
+             lat,
+             western_limit,
+             eastern_limit):
+
+    """
+    This function converts the longitudes to -180 to 180 and masks the points outside of the longitude window.
+    """
+
+    lon = _np.asarray(lon)
+    lat = _np.asarray(lat)
+
+    lon = _np.where(lon > 180, lon - 360, lon)
+    mask = (lon >= western_limit) & (lon <= eastern_limit)
+
+    return _np.where(mask, lon, _np.nan), _np.where(mask, lat, _np.nan), mask
+
+def normalized_grid(lon,
+                    lat,
+                    western_limit=-180,
+                    eastern_limit=-120,
+                    fingerprint=None):
+
+    """
+    This function returns the normalized coordinates and mask of a grid, computing them only the first time the grid is seen.
+
+    Required Arguments:
+
+    1) lon (numpy.array) - The 2-D longitude of the grid (0 to 360 or -180 to 180).
+
+    2) lat (numpy.array) - The 2-D latitude of the grid.
+
+    Optional Arguments:
+
+    1) western_limit (Float or Integer) - Default=-180. The western edge of the longitude window that is kept.
+
+    2) eastern_limit (Float or Integer) - Default=-120. The eastern edge of the longitude window that is kept.
+
+    3) fingerprint (String or None) - Default=None. The fingerprint of the grid returned by
+        firewxpy.utils.grid_index.grid_fingerprint(). When None, the fingerprint is computed from lon and lat.
+
+    Returns
+    -------
+
+    1) The longitude in -180 to 180 with NaN outside of the window (read-only).
+
+    2) The latitude with NaN outside of the window (read-only).
+
+    3) The boolean mask of the points inside of the window (read-only).
+    """
+
+    if fingerprint is None:
+        fingerprint = _grid_fingerprint(lon, lat)
+
+    key = (fingerprint, float(western_limit), float(eastern_limit))
+
+    with _lock:
+        grid = _memory.get(key)
+        if grid is not None:
+            _memory.move_to_end(key)
+            return grid
+
+    file_path = _normalization_file(fingerprint, western_limit, eastern_limit)
+
+    try:
+        with _np.load(file_path) as f:
+            grid = _read_only(f['lon'], f['lat'], f['mask'])
+    except Exception as e:
+        grid = None
+
+    if grid is None or grid[0].shape != _np.shape(lon):
+        grid = _read_only(*_compute(lon, lat, western_limit, eastern_limit))
+
+        tmp_path = f"{file_path}.{_os.getpid()}.{_threading.get_ident()}.tmp.npz"
+        try:
+            _np.savez(tmp_path, lon=grid[0], lat=grid[1], mask=grid[2])
+            _os.replace(tmp_path, file_path)
+        except Exception as e:
+            try:
+                _os.remove(tmp_path)
+            except OSError:
+                pass
+
+    with _lock:
+        _memory[key] = grid
+        _memory.move_to_end(key)
+        while len(_memory) > max(_settings['max_grids'], 0):
+            _memory.popitem(last=False)
+
+    return grid
+
+def apply_grid_mask(values,
+                    mask):
+
+    """
+    This function masks the values outside of the longitude window of a normalized grid.
+
+    Required Arguments:
+
+    1) values (numpy.array) - The values on the grid.
+
+    2) mask (numpy.array) - The mask returned by normalized_grid().
+
+    Optional Arguments: None
+
+    Returns
+    -------
+
+    The values with NaN outside of the window. When every point is inside of the window, the values themselves are
+    returned (no copy is made). Otherwise a single new array is created.
+    """
+
+    values = _np.asarray(values)
+
+    if mask.all():
+        return values
+
+    return _np.where(mask, values, _np.nan)
+
+def clear_grid_normalization(disk=False):
+
+    """
+    This function clears the normalized grids.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) disk (Boolean) - Default=False. When set to True, the files in FireWxPy Cache/Grid Normalization are removed as well.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _memory.clear()
+
+    if disk is True:
+        path = _cache_directory('Grid Normalization')
+        for f in _os.listdir(path):
+            if f.endswith('.npz'):
+                try:
+                    _os.remove(f"{path}/{f}")
+                except OSError:
+                    pass
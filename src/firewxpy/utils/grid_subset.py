@@ -0,0 +1,76 @@
+"""
+This file hosts the functions that crop the gridded data to the region of the plot before it is contoured.
+
+Both the regular grids (1-D latitude/longitude coordinates) and the curvilinear grids (2-D latitude/longitude coordinates
+such as the CONUS Lambert Conformal and Alaska Polar Stereographic grids) are supported. The dataset is cropped to the
+smallest i/j index window that covers the region plus a halo so the contours along the edges of the map stay intact.
+When the map is not in PlateCarree, the region is the latitude/longitude bounds of everything visible in the projected map
+(see firewxpy.utils.region_layers.map_extent()).
+The windows are looked up in the grid index (see firewxpy.utils.grid_index) so the grid is only searched once per region.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+from firewxpy.utils.grid_index import region_window
+from firewxpy.utils.region_layers import map_extent
+
+def subset_to_region(ds,
+                     extent,
+                     longitude_key='longitude',
+                     latitude_key='latitude',
+                     halo=0.05,
+                     pad=2,
+                     mapcrs=None):
+
+    """
+    This function crops a dataset to a region plus a halo.
+
+    Required Arguments:
+
+    1) ds (xarray.array) - The dataset.
+
+    2) extent (List or Tuple) - [western_bound, eastern_bound, southern_bound, northern_bound] in decimal degrees.
+
+    Optional Arguments:
+
+    1) longitude_key (String) - Default='longitude'. The longitude coordinate key name.
+
+    2) latitude_key (String) - Default='latitude'. The latitude coordinate key name.
+
+    3) halo (Float) - Default=0.05. The halo added around the region as a fraction of the width/height of the region.
+
+    4) pad (Integer) - Default=2. The number of extra grid points added on each side of the window.
+
+    5) mapcrs (cartopy.crs or None) - Default=None. The projection of the map. When it is not PlateCarree, the dataset is cropped
+        to everything visible in the projected map.
+
+    Returns
+    -------
+
+    The cropped xarray.array. The dataset is returned unchanged when the region covers the whole grid or
+    when no grid point falls inside of the region.
+    """
+
+    lon = ds[longitude_key]
+    lat = ds[latitude_key]
+
+    window = region_window(lon.values,
+                           lat.values,
+                           map_extent(extent, mapcrs),
+                           halo=halo,
+                           pad=pad)
+
+    if window is None:
+        return ds
+
+    rows, cols = window
+
+    if lon.ndim == 1:
+        y_dim, x_dim = lat.dims[0], lon.dims[0]
+    else:
+        y_dim, x_dim = lon.dims
+
+    if rows == slice(0, ds.sizes[y_dim]) and cols == slice(0, ds.sizes[x_dim]):
+        return ds
+
+    return ds.isel({y_dim:rows, x_dim:cols})
@@ -0,0 +1,158 @@
+"""
+This file hosts the benchmark of the time it takes to import FireWxPy.
+
+The FireWxPy packages load their modules lazily (see firewxpy._lazy) so import firewxpy must stay fast and must not import
+the heavy dependencies (matplotlib, cartopy, metpy, pandas, xarray and wxdata) until a graphics module is accessed.
+Each measurement is made in a fresh Python interpreter so the modules imported by the benchmark itself are not counted.
+
+The benchmark can be run from the command line and exits with an error when the import time regresses:
+
+    python -m firewxpy.utils.import_time --max-seconds 0.25
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import sys as _sys
+import json as _json
+import argparse as _argparse
+import statistics as _statistics
+import subprocess as _subprocess
+
+# The dependencies import firewxpy must not import.
+heavy_modules = [
+    'matplotlib',
+    'cartopy',
+    'metpy',
+    'pandas',
+    'xarray',
+    'wxdata',
+    'shapeography'
+]
+
+_script = """
+import sys, time, json
+modules = set(sys.modules)
+t = time.perf_counter()
+exec({statement!r})
+t = time.perf_counter() - t
+print(json.dumps({{'seconds':t, 'modules':sorted(set(sys.modules) - modules)}}))
+"""
+
+def _measure(statement,
+             python):
+
+    """
+    This function times a statement in a fresh Python interpreter.
+    """
+
+    result = _subprocess.run([python, '-c', _script.format(statement=statement)],
+                             capture_output=True,
+                             text=True)
+
+    if result.returncode != 0:
+        raise RuntimeError(f"'{statement}' failed:\n{result.stderr}")
+
+    return _json.loads(result.stdout.strip().splitlines()[-1])
+
+def benchmark_import_time(statement='import firewxpy',
+                          repeat=5,
+                          python=None):
+
+    """
+    This function measures the time it takes to run an import statement in a fresh Python interpreter.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) statement (String) - Default='import firewxpy'. The statement that is timed (i.e. 'import firewxpy; firewxpy.rtma_conus').
+
+    2) repeat (Integer) - Default=5. The number of measurements. A first run that compiles the bytecode is not counted.
+
+    3) python (String or None) - Default=None. The Python interpreter. When None, the current interpreter is used.
+
+    Returns
+    -------
+
+    A dictionary with:
+
+    1) 'seconds' - The median import time in seconds.
+
+    2) 'runs' - The import time of each run in seconds.
+
+    3) 'heavy_modules' - The heavy dependencies (see heavy_modules) the statement imported.
+    """
+
+    if python is None:
+        python = _sys.executable
+
+    _measure(statement, python)
+
+    runs = [_measure(statement, python) for i in range(max(int(repeat), 1))]
+    imported = {m.split('.')[0] for m in runs[-1]['modules']}
+
+    return {
+        'seconds':_statistics.median(r['seconds'] for r in runs),
+        'runs':[r['seconds'] for r in runs],
+        'heavy_modules':[m for m in heavy_modules if m in imported]
+    }
+
+def check_import_time(statement='import firewxpy',
+                      max_seconds=0.25,
+                      forbid_heavy_modules=True,
+                      repeat=5,
+                      python=None):
+
+    """
+    This function raises an error when an import statement is slower than a limit or imports the heavy dependencies.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) statement (String) - Default='import firewxpy'. The statement that is timed.
+
+    2) max_seconds (Float) - Default=0.25. The maximum median import time in seconds.
+
+    3) forbid_heavy_modules (Boolean) - Default=True. When set to True, importing any of the heavy dependencies
+        (see heavy_modules) is a regression.
+
+    4) repeat (Integer) - Default=5. The number of measurements.
+
+    5) python (String or None) - Default=None. The Python interpreter. When None, the current interpreter is used.
+
+    Returns
+    -------
+
+    The dictionary returned by benchmark_import_time().
+    """
+
+    result = benchmark_import_time(statement, repeat, python)
+
+    if forbid_heavy_modules is True and result['heavy_modules']:
+        raise RuntimeError(f"'{statement}' imports {', '.join(result['heavy_modules'])}.")
+
+    if result['seconds'] > max_seconds:
+        raise RuntimeError(f"'{statement}' takes {result['seconds']:.3f} seconds (limit {max_seconds:.3f} seconds).")
+
+    return result
+
+if __name__ == '__main__':
+
+    parser = _argparse.ArgumentParser(description='Benchmark the time it takes to import FireWxPy.')
+    parser.add_argument('--statement', default='import firewxpy')
+    parser.add_argument('--max-seconds', type=float, default=0.25)
+    parser.add_argument('--allow-heavy-modules', action='store_true')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    try:
+        result = check_import_time(args.statement,
+                                   args.max_seconds,
+                                   args.allow_heavy_modules is False,
+                                   args.repeat)
+    except RuntimeError as e:
+        print(e)
+        _sys.exit(1)
+
+    print(f"'{args.statement}': {result['seconds'] * 1000:.1f} ms (median of {len(result['runs'])} runs)")
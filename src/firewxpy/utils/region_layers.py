@@ -0,0 +1,374 @@
+"""
+This file hosts the functions that clip and simplify the cartographic reference layers to the region of the plot.
+
+Each layer is clipped to the extent of the region plus a margin and simplified to a tolerance of about half of a pixel
+for the figure size. When the map is not in PlateCarree, the layer is clipped to the latitude/longitude bounds of
+everything visible in the projected map instead (see map_extent()). The results are persisted in the geometry cache so each plot only loads the pre-clipped layer instead
+of handing the full national geometry sets to cartopy.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import numpy as _np
+import shapely as _shapely
+
+import cartopy.crs as _ccrs
+
+from firewxpy.utils.plot_coords import(
+    bounding_box as _bounding_box,
+    region_names as _region_names
+)
+from firewxpy.utils.geometry_cache import(
+    geometry_key as _geometry_key,
+    load_geometries as _load_geometries,
+    store_geometries as _store_geometries
+)
+
+# The built-in reference layers used by the plotting functions.
+# name: [url, folder, filename, convert_crs]
+cartographic_layers = {
+
+    'states':["https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_States_Territories.zip",
+              "Cartographic Files/US States",
+              "US_States_Territories.zip",
+              False],
+    'counties':["https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/Geographic%20Boundaries/US_Counties.zip",
+              "Cartographic Files/US Counties",
+              "US_Counties.zip",
+              False],
+    'gacc':["https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/GACC_Boundaries_2026.zip",
+              "Cartographic Files/GACC Boundaries",
+              "GACC_Boundaries_2026.zip",
+              False],
+    'psa':["https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/USDA/USFS/PSA_Boundaries.zip",
+              "Cartographic Files/PSA Boundaries",
+              "PSA_Boundaries.zip",
+              False],
+    'nws public zones':["https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Public_Zones_2026.zip",
+              "Cartographic Files/NWS Public Zones",
+              "NWS_Public_Zones_2026.zip",
+              False],
+    'nws fire weather zones':["https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_Fire_Weather_Zones_2026.zip",
+              "Cartographic Files/NWS Fire Weather Zones",
+              "NWS_Fire_Weather_Zones_2026.zip",
+              False],
+    'nws cwa':["https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/NOAA/NWS_CWA_2026.zip",
+              "Cartographic Files/NWS CWAs",
+              "NWS_CWA_2026.zip",
+              False],
+    'calfire':["https://raw.githubusercontent.com/edrewitz/shapeography/refs/heads/main/CALFIRE/CalFire_Administrative_Units.zip",
+              "Cartographic Files/CalFire",
+              "CalFire_Administrative_Units.zip",
+              True]
+}
+
+def map_extent(extent,
+               mapcrs=None,
+               samples=64):
+
+    """
+    This function returns the latitude/longitude bounds of everything visible on a map.
+
+    The plotting functions set the extent of the map from a latitude/longitude box (ax.set_extent(extent, datacrs)), so in a
+    projection other than PlateCarree the map shows the projected bounding box of that box, which reaches beyond the
+    latitudes and longitudes of the box (i.e. the top edge and the western corners of a Lambert Conformal map). The bounds
+    are found by transforming the edges of the projected bounding box back into latitude/longitude.
+
+    Required Arguments:
+
+    1) extent (List or Tuple) - [western_bound, eastern_bound, southern_bound, northern_bound] in decimal degrees.
+
+    Optional Arguments:
+
+    1) mapcrs (cartopy.crs or None) - Default=None. The projection of the map. When None or PlateCarree, {extent} is returned.
+
+    2) samples (Integer) - Default=64. The number of points sampled along each edge.
+
+    Returns
+    -------
+
+    [western_bound, eastern_bound, southern_bound, northern_bound] in decimal degrees covering the visible map.
+    When a pole is visible, the bounds reach the pole and span every longitude.
+    """
+
+    extent = [float(e) for e in extent]
+    western_bound, eastern_bound, southern_bound, northern_bound = extent
+
+    if mapcrs is None or isinstance(mapcrs, _ccrs.PlateCarree):
+        return extent
+
+    if western_bound >= eastern_bound or southern_bound >= northern_bound:
+        return extent
+
+    geodetic = _ccrs.PlateCarree()
+    t = _np.linspace(0, 1, samples)
+
+    def edges(x0, x1, y0, y1):
+        xs = _np.concatenate([x0 + (x1 - x0) * t, _np.full(samples, x1), x1 - (x1 - x0) * t, _np.full(samples, x0)])
+        ys = _np.concatenate([_np.full(samples, y0), y0 + (y1 - y0) * t, _np.full(samples, y1), y1 - (y1 - y0) * t])
+        return xs, ys
+
+    lons, lats = edges(western_bound, eastern_bound, southern_bound, northern_bound)
+    xy = mapcrs.transform_points(geodetic, lons, lats)[:, :2]
+    xy = xy[_np.isfinite(xy).all(axis=1)]
+
+    if len(xy) == 0:
+        return extent
+
+    x0, y0 = xy.min(axis=0)
+    x1, y1 = xy.max(axis=0)
+
+    xs, ys = edges(x0, x1, y0, y1)
+    lonlat = geodetic.transform_points(mapcrs, xs, ys)[:, :2]
+    lonlat = lonlat[_np.isfinite(lonlat).all(axis=1)]
+
+    if len(lonlat) == 0:
+        return extent
+
+    western_bound = min(western_bound, lonlat[:, 0].min())
+    eastern_bound = max(eastern_bound, lonlat[:, 0].max())
+    southern_bound = min(southern_bound, lonlat[:, 1].min())
+    northern_bound = max(northern_bound, lonlat[:, 1].max())
+
+    for pole in (90, -90):
+        x, y = mapcrs.transform_point(0, pole, geodetic)
+        if _np.isfinite([x, y]).all() and x0 <= x <= x1 and y0 <= y <= y1:
+            western_bound, eastern_bound = -180.0, 180.0
+            if pole > 0:
+                northern_bound = 90.0
+            else:
+                southern_bound = -90.0
+
+    return [float(western_bound), float(eastern_bound), float(southern_bound), float(northern_bound)]
+
+def simplify_tolerance(extent,
+                       figure_size,
+                       dpi=100):
+
+    """
+    This function returns the simplification tolerance in degrees for a region and figure size.
+
+    Required Arguments:
+
+    1) extent (List or Tuple) - [western_bound, eastern_bound, southern_bound, northern_bound] in decimal degrees.
+
+    2) figure_size (List or Tuple) - (figure_x_length, figure_y_length) in inches.
+
+    Optional Arguments:
+
+    1) dpi (Integer) - Default=100. The resolution of the figure in dots per inch.
+
+    Returns
+    -------
+
+    The tolerance in decimal degrees (half of a pixel).
+    """
+
+    western_bound, eastern_bound, southern_bound, northern_bound = extent
+    x_length, y_length = figure_size
+
+    return 0.5 * max(abs(eastern_bound - western_bound) / (x_length * dpi),
+                     abs(northern_bound - southern_bound) / (y_length * dpi))
+
+def clip_geometries(geometries,
+                    extent,
+                    margin=0.1,
+                    tolerance=0):
+
+    """
+    This function clips geometries to a region plus a margin and simplifies them.
+
+    Required Arguments:
+
+    1) geometries (Iterable) - The shapely geometries.
+
+    2) extent (List or Tuple) - [western_bound, eastern_bound, southern_bound, northern_bound] in decimal degrees.
+
+    Optional Arguments:
+
+    1) margin (Float) - Default=0.1. The margin added around the region as a fraction of the width/height of the region.
+
+    2) tolerance (Float) - Default=0. The simplification tolerance in decimal degrees. 0 disables the simplification.
+
+    Returns
+    -------
+
+    A list of the clipped and simplified shapely geometries.
+    """
+
+    western_bound, eastern_bound, southern_bound, northern_bound = extent
+
+    geometries = _np.asarray([g for g in geometries if g is not None], dtype=object)
+
+    if western_bound >= eastern_bound or southern_bound >= northern_bound:
+        return list(geometries)
+
+    x_margin = max(margin * (eastern_bound - western_bound), 0.5)
+    y_margin = max(margin * (northern_bound - southern_bound), 0.5)
+
+    clipped = _shapely.clip_by_rect(geometries,
+                                    western_bound - x_margin,
+                                    southern_bound - y_margin,
+                                    eastern_bound + x_margin,
+                                    northern_bound + y_margin)
+
+    if tolerance > 0:
+        clipped = _shapely.simplify(clipped, tolerance, preserve_topology=True)
+
+    return [g for g in clipped if g is not None and not g.is_empty]
+
+def region_layer_key(source_key,
+                     extent,
+                     figure_size,
+                     margin=0.1,
+                     dpi=100):
+
+    """
+    This function returns the cache key of a clipped layer.
+
+    Required Arguments:
+
+    1) source_key (String) - The geometry cache key of the full layer.
+
+    2) extent (List or Tuple) - [western_bound, eastern_bound, southern_bound, northern_bound] in decimal degrees.
+
+    3) figure_size (List or Tuple) - (figure_x_length, figure_y_length) in inches.
+
+    Optional Arguments:
+
+    1) margin (Float) - Default=0.1. The margin added around the region as a fraction of the width/height of the region.
+
+    2) dpi (Integer) - Default=100. The resolution of the figure in dots per inch.
+
+    Returns
+    -------
+
+    The cache key as a hexadecimal string.
+    """
+
+    extent = tuple(round(float(e), 4) for e in extent)
+    figure_size = tuple(round(float(f), 2) for f in figure_size)
+
+    return _geometry_key(source_key, 'region', extent, figure_size, margin, dpi)
+
+def region_layer(source_key,
+                 load_source,
+                 extent,
+                 figure_size,
+                 margin=0.1,
+                 dpi=100,
+                 mapcrs=None):
+
+    """
+    This function returns a layer clipped to a region, loading it from the cache when it was already precomputed.
+
+    Required Arguments:
+
+    1) source_key (String) - The geometry cache key of the full layer.
+
+    2) load_source (function) - A function without arguments that returns the full layer. Only called on a cache miss.
+
+    3) extent (List or Tuple) - [western_bound, eastern_bound, southern_bound, northern_bound] in decimal degrees.
+
+    4) figure_size (List or Tuple) - (figure_x_length, figure_y_length) in inches.
+
+    Optional Arguments:
+
+    1) margin (Float) - Default=0.1. The margin added around the region as a fraction of the width/height of the region.
+
+    2) dpi (Integer) - Default=100. The resolution of the figure in dots per inch.
+
+    3) mapcrs (cartopy.crs or None) - Default=None. The projection of the map. When it is not PlateCarree, the layer is clipped
+        to everything visible in the projected map (see map_extent()).
+
+    Returns
+    -------
+
+    A list of the clipped and simplified shapely geometries.
+    """
+
+    extent = map_extent(extent, mapcrs)
+
+    key = region_layer_key(source_key, extent, figure_size, margin=margin, dpi=dpi)
+
+    shapes = _load_geometries(key)
+
+    if shapes is None:
+        shapes = clip_geometries(load_source(),
+                                 extent,
+                                 margin=margin,
+                                 tolerance=simplify_tolerance(extent, figure_size, dpi=dpi))
+
+        shapes = _store_geometries(key, shapes)
+
+    return shapes
+
+def precompute_region_layers(regions=None,
+                             layers=None,
+                             figure_size=(12, 12),
+                             proxies=None,
+                             chunk_size=8192,
+                             notifications='off',
+                             refresh=True,
+                             mapcrs=None):
+
+    """
+    This function precomputes the clipped and simplified reference layers for each region.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) regions (List or None) - Default=None. The regions (see firewxpy.utils.plot_coords.region_names()).
+        When None, every named region is precomputed.
+
+    2) layers (List or None) - Default=None. The names of the layers in cartographic_layers. When None, every layer is precomputed.
+
+    3) figure_size (List or Tuple) - Default=(12, 12). The (figure_x_length, figure_y_length) of the plots in inches.
+
+    4) proxies (dict or None) - Default=None. The proxy server(s) used to download the shapefiles.
+
+    5) chunk_size (Integer) - Default=8192. The size of the chunks when writing the files.
+
+    6) notifications (String) - Default='off'. Notification when a file is downloaded.
+
+    7) refresh (Boolean) - Default=True. See firewxpy.utils.geometry.import_shapefile_from_web().
+
+    8) mapcrs (cartopy.crs or None) - Default=None. The projection of the plots. None is PlateCarree.
+
+    Returns
+    -------
+
+    A dictionary with the number of geometries in each (region, layer).
+    """
+
+    from firewxpy.utils.geometry import import_shapefile_from_web as _import_shapefile_from_web
+
+    if regions is None:
+        regions = _region_names()
+
+    if layers is None:
+        layers = list(cartographic_layers.keys())
+
+    counts = {}
+    for layer in layers:
+        url, folder, filename, convert_crs = cartographic_layers[layer]
+        for region in regions:
+            extent = _bounding_box(region, None, None, None, None)
+            shapes = _import_shapefile_from_web(url,
+                                                folder,
+                                                filename,
+                                                proxies,
+                                                chunk_size,
+                                                notifications,
+                                                refresh,
+                                                '.zip',
+                                                'black',
+                                                _ccrs.PlateCarree(),
+                                                convert_crs=convert_crs,
+                                                extent=extent,
+                                                figure_size=figure_size,
+                                                mapcrs=mapcrs)
+            counts[(region, layer)] = len(shapes)
+
+    return counts
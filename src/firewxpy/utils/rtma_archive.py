@@ -0,0 +1,365 @@
+"""
+This file hosts the local rolling archive of the hourly RTMA analyses used by the comparison products.
+
+Without the archive, every comparison graphic downloads both the current analysis and the analysis from {hours} earlier, so
+an analysis is downloaded again every hour for as long as it is used in a comparison. With the archive, each analysis is
+saved once as a NetCDF file in FireWxPy Cache/RTMA Archive. A comparison then only fetches the current analysis and reads
+the earlier one from the archive. When the earlier analysis is not archived yet (i.e. the first run), only the earlier
+analysis is downloaded next to the current one and both are archived. The archive files are compressed (zlib) and analyses
+older than the retention window are deleted.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os as _os
+import inspect as _inspect
+import threading as _threading
+import numpy as _np
+import pandas as _pd
+import xarray as _xr
+
+from firewxpy.utils.directory import cache_directory as _cache_directory
+
+_settings = {
+    'enabled':True,
+    'retention_hours':48
+}
+
+_lock = _threading.Lock()
+
+def set_rtma_archive_policy(enabled=True,
+                            retention_hours=48):
+
+    """
+    This function sets the policy of the local RTMA archive.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) enabled (Boolean) - Default=True. When set to False, the comparison products download both analyses on every call.
+
+    2) retention_hours (Integer) - Default=48. The number of hours an analysis is kept in the archive (counted back from the newest
+        archived analysis). Comparisons over more hours than this always download both analyses.
+
+    Returns
+    -------
+
+    None
+    """
+
+    with _lock:
+        _settings['enabled'] = enabled
+        _settings['retention_hours'] = retention_hours
+
+def _archive_directory(model,
+                       cat):
+
+    """
+    This function returns the archive directory of an RTMA model and category.
+    """
+
+    return _cache_directory(f"RTMA Archive/{model.upper()} {cat.upper()}")
+
+def _units_label(convert_temperature,
+                 convert_to):
+
+    """
+    This function returns the label of the temperature units the analyses were decoded with.
+    """
+
+    if convert_temperature is True:
+        return str(convert_to).lower()
+
+    return 'kelvin'
+
+def _file_path(model,
+               cat,
+               units,
+               valid_time):
+
+    """
+    This function returns the path of the archive file of an analysis.
+    """
+
+    return f"{_archive_directory(model, cat)}/{valid_time.strftime('%Y%m%d%H')}_{units}.nc"
+
+def valid_time(ds,
+               time_coord_key='time'):
+
+    """
+    This function returns the analysis time of an RTMA dataset rounded down to the hour.
+
+    Required Arguments:
+
+    1) ds (xarray.array) - The RTMA dataset.
+
+    Optional Arguments:
+
+    1) time_coord_key (String) - Default='time'. The time coordinate key name.
+
+    Returns
+    -------
+
+    The analysis time as a pandas.Timestamp.
+    """
+
+    times = _pd.to_datetime(_np.ravel(ds[time_coord_key].values))
+
+    return _pd.Timestamp(times[0]).floor('h')
+
+def archived_times(model='rtma',
+                   cat='analysis'):
+
+    """
+    This function returns the analysis times held in the archive.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) model (String) - Default='rtma'. The RTMA model ('rtma', 'ak rtma' or 'hi rtma').
+
+    2) cat (String) - Default='analysis'. The RTMA category.
+
+    Returns
+    -------
+
+    A sorted list of the archived analysis times (pandas.Timestamp).
+    """
+
+    times = set()
+    for f in _os.listdir(_archive_directory(model, cat)):
+        if f.endswith('.nc'):
+            try:
+                times.add(_pd.Timestamp(_pd.to_datetime(f.split('_')[0], format='%Y%m%d%H')))
+            except ValueError:
+                pass
+
+    return sorted(times)
+
+def _prune(model,
+           cat):
+
+    """
+    This function deletes the analyses older than the retention window.
+    """
+
+    times = archived_times(model, cat)
+    if not times:
+        return
+
+    oldest = times[-1] - _pd.Timedelta(hours=_settings['retention_hours'])
+    path = _archive_directory(model, cat)
+    for f in _os.listdir(path):
+        try:
+            t = _pd.Timestamp(_pd.to_datetime(f.split('_')[0], format='%Y%m%d%H'))
+        except ValueError:
+            continue
+        if t < oldest:
+            try:
+                _os.remove(f"{path}/{f}")
+            except OSError:
+                pass
+
+def store_analysis(ds,
+                   model='rtma',
+                   cat='analysis',
+                   units='fahrenheit'):
+
+    """
+    This function saves an RTMA analysis in the archive unless it is archived already.
+
+    Required Arguments:
+
+    1) ds (xarray.array) - The RTMA dataset.
+
+    Optional Arguments:
+
+    1) model (String) - Default='rtma'. The RTMA model ('rtma', 'ak rtma' or 'hi rtma').
+
+    2) cat (String) - Default='analysis'. The RTMA category.
+
+    3) units (String) - Default='fahrenheit'. The temperature units of the dataset ('fahrenheit', 'celsius' or 'kelvin').
+
+    Returns
+    -------
+
+    The path of the archive file or None when the dataset could not be archived.
+    """
+
+    try:
+        file_path = _file_path(model, cat, units, valid_time(ds))
+    except Exception as e:
+        return None
+
+    if _os.path.exists(file_path):
+        return file_path
+
+    tmp_path = f"{file_path}.{_os.getpid()}.{_threading.get_ident()}.tmp"
+    encoding = {name:{'zlib':True, 'complevel':4} for name in ds.data_vars}
+    try:
+        ds.to_netcdf(tmp_path, encoding=encoding)
+        _os.replace(tmp_path, file_path)
+    except Exception as e:
+        try:
+            _os.remove(tmp_path)
+        except OSError:
+            pass
+        return None
+
+    with _lock:
+        _prune(model, cat)
+
+    return file_path
+
+def load_analysis(time,
+                  model='rtma',
+                  cat='analysis',
+                  units='fahrenheit'):
+
+    """
+    This function reads an RTMA analysis from the archive.
+
+    Required Arguments:
+
+    1) time (pandas.Timestamp or datetime.datetime) - The analysis time.
+
+    Optional Arguments:
+
+    1) model (String) - Default='rtma'. The RTMA model ('rtma', 'ak rtma' or 'hi rtma').
+
+    2) cat (String) - Default='analysis'. The RTMA category.
+
+    3) units (String) - Default='fahrenheit'. The temperature units of the dataset ('fahrenheit', 'celsius' or 'kelvin').
+
+    Returns
+    -------
+
+    The xarray.array loaded into memory or None when the analysis is not archived.
+    """
+
+    file_path = _file_path(model, cat, units, _pd.Timestamp(time).floor('h'))
+
+    if not _os.path.exists(file_path):
+        return None
+
+    try:
+        with _xr.open_dataset(file_path) as ds:
+            return ds.load()
+    except Exception as e:
+        return None
+
+def clear_rtma_archive(model=None,
+                       cat='analysis'):
+
+    """
+    This function deletes the archived RTMA analyses.
+
+    Required Arguments: None
+
+    Optional Arguments:
+
+    1) model (String or None) - Default=None. The RTMA model ('rtma', 'ak rtma' or 'hi rtma'). When None, every model is cleared.
+
+    2) cat (String) - Default='analysis'. The RTMA category. Ignored when model=None.
+
+    Returns
+    -------
+
+    None
+    """
+
+    if model is None:
+        root = _cache_directory('RTMA Archive')
+        paths = [f"{root}/{d}" for d in _os.listdir(root) if _os.path.isdir(f"{root}/{d}")]
+    else:
+        paths = [_archive_directory(model, cat)]
+
+    for path in paths:
+        for f in _os.listdir(path):
+            try:
+                _os.remove(f"{path}/{f}")
+            except OSError:
+                pass
+
+def archived_comparison(fetch_comparison,
+                        fetch_current,
+                        fetch_analysis=None):
+
+    """
+    This function wraps the WxData RTMA comparison client (i.e. wxdata.rtma_comparison) so the comparison analysis is read from
+    the local archive whenever it is archived and only the current analysis is fetched.
+
+    Required Arguments:
+
+    1) fetch_comparison (function) - The WxData client that returns the current and comparison datasets.
+
+    2) fetch_current (function) - The WxData client that returns the current dataset (i.e. wxdata.rtma or a cached version of it).
+
+    Optional Arguments:
+
+    1) fetch_analysis (function or None) - Default=None. The client that returns the analysis of a given time. It is called
+        with the analysis time and the arguments of {fetch_comparison} (i.e. firewxpy.rtma.fetch.fetch_analysis) and may return
+        None when it cannot fetch the analysis. When the comparison analysis is not archived, only the comparison analysis is
+        fetched with it. When None (or when it fails), both analyses are fetched with {fetch_comparison}.
+
+    Returns
+    -------
+
+    A function with the same arguments as {fetch_comparison} that returns the current and comparison xarray.arrays.
+    """
+
+    signature = _inspect.signature(fetch_comparison)
+    current_parameters = _inspect.signature(fetch_current).parameters
+
+    def wrapper(*args, **kwargs):
+
+        if _settings['enabled'] is False:
+            return fetch_comparison(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+
+        # clear_data only deletes the raw GRIB files of the WxData client, the decoded analyses are still archived.
+        if arguments.get('process_data', True) is False:
+            return fetch_comparison(*args, **kwargs)
+
+        model = arguments.get('model', 'rtma')
+        cat = arguments.get('cat', 'analysis')
+        hours = arguments.get('hours', 24)
+        units = _units_label(arguments.get('convert_temperature', True), arguments.get('convert_to', 'fahrenheit'))
+
+        if hours <= _settings['retention_hours']:
+            ds = fetch_current(**{k:v for k, v in arguments.items() if k in current_parameters})
+            store_analysis(ds, model, cat, units)
+
+            time = valid_time(ds) - _pd.Timedelta(hours=hours)
+            ds_dt = load_analysis(time, model, cat, units)
+
+            if ds_dt is None and fetch_analysis is not None:
+                try:
+                    ds_dt = fetch_analysis(time, **arguments)
+                except Exception as e:
+                    ds_dt = None
+                if ds_dt is not None:
+                    store_analysis(ds_dt, model, cat, units)
+
+            if ds_dt is not None:
+                return ds, ds_dt
+
+        ds, ds_dt = fetch_comparison(*args, **kwargs)
+
+        store_analysis(ds, model, cat, units)
+        store_analysis(ds_dt, model, cat, units)
+
+        return ds, ds_dt
+
+    wrapper.__name__ = getattr(fetch_comparison, '__name__', 'archived_comparison')
+    wrapper.__qualname__ = getattr(fetch_comparison, '__qualname__', wrapper.__name__)
+    wrapper.__module__ = getattr(fetch_comparison, '__module__', __name__)
+    wrapper.__doc__ = fetch_comparison.__doc__
+    wrapper.__wrapped__ = fetch_comparison
+
+    return wrapper
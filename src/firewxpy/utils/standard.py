@@ -2,8 +2,9 @@
 This file hosts standard functions which are used across all plotting functions: 
 
     1) plot_creation_time()
-    2) no_data_graphic()
-    3) get_timezone()
+    2) creation_time()
+    3) no_data_graphic()
+    4) get_timezone()
 
  (C) Eric J. Drewitz 2024-2026
 """
@@ -14,8 +15,14 @@ try:
 except Exception as e:
     from datetime import datetime
 import warnings
+import threading
 warnings.filterwarnings('ignore')
 
+from contextlib import contextmanager
+
+# The creation time pinned by creation_time() in each thread.
+_pinned = threading.local()
+
 def get_timezone_abbreviation():
 
     """
@@ -55,7 +62,13 @@ def plot_creation_time():
     
     1) Local Time
     2) UTC Time    
+    
+    Inside of a creation_time() block, the creation time of the block is returned.
     """
+    pinned = getattr(_pinned, 'times', None)
+    if pinned is not None:
+        return pinned
+    
     local = datetime.now()
     
     try:
@@ -76,3 +89,31 @@ def plot_creation_time():
 
 
             
+
+@contextmanager
+def creation_time():
+
+    """
+    This context manager pins the creation time printed on every graphic made in the current thread inside of the block.
+    
+    A long-running process (i.e. the render daemon) makes every graphic of a job with the creation time of the job
+    instead of the time the process started. 
+    
+    Required Arguments: None
+    
+    Optional Arguments: None
+    
+    Returns
+    -------
+    
+    1) Local Time
+    2) UTC Time
+    """
+    previous = getattr(_pinned, 'times', None)
+    _pinned.times = None
+    _pinned.times = plot_creation_time()
+    
+    try:
+        yield _pinned.times
+    finally:
+        _pinned.times = previous
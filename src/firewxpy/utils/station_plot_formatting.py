@@ -4,10 +4,19 @@ This file hosts the function that returns a decimate dataframe for annotating st
 (C) Eric J. Drewitz 2024-2026
 """
 
+import os
+import hashlib
 import warnings
 import numpy as np
 warnings.filterwarnings('ignore')
 
+from firewxpy.utils.directory import cache_directory
+from firewxpy.utils.grid_index import grid_fingerprint
+from firewxpy.utils.grid_coordinates import grid_coordinates
+from firewxpy.calc.calc import wind_components as _wind_components
+
+_thinning_memory = {}
+
 def fix_var_array(ds,
                   parameter,
                   step,
@@ -66,11 +75,8 @@ def fix_var_array_rtma_hawaii(ds,
     
     An xarray.array used for plotting station plot overlays. 
     """
-    lon2d, lat2d = np.meshgrid(ds['longitude'], ds['latitude'])
-    vals2d = ds[parameter].values
-    lat_dec = lat2d[::decimate, ::decimate]
-    lon_dec = lon2d[::decimate, ::decimate]
-    val_dec = vals2d[::decimate, ::decimate]
+    lon_dec, lat_dec = grid_coordinates(ds['longitude'], ds['latitude'], decimate)
+    val_dec = ds[parameter].values[::decimate, ::decimate]
     lats_1d = lat_dec.ravel()
     lons_1d = lon_dec.ravel()
     vals_1d = val_dec.ravel()
@@ -106,12 +112,241 @@ def fix_var_array_ndfd_hawaii(ds,
     lons = ds['longitude'].values
     ds[parameter] = ds
 
-    lats_dec = lats[::decimate]
-    lons_dec = lons[::decimate]
-    lon2d_dec, lat2d_dec = np.meshgrid(lons_dec, lats_dec)
+    lon2d_dec, lat2d_dec = grid_coordinates(lons, lats, decimate)
     vals_dec = ds[parameter][:, ::decimate, ::decimate].values
     stn_lons = lon2d_dec.ravel()
     stn_lats = lat2d_dec.ravel()
     stn_vals = vals_dec.ravel()
 
-    return stn_lons, stn_lats, stn_vals
\ No newline at end of file
+    return stn_lons, stn_lats, stn_vals
+
+def extract_pixel_queries(ds,
+                          parameters,
+                          decimate,
+                          longitude_key='longitude',
+                          latitude_key='latitude',
+                          wind_components=None):
+    
+    """
+    This function extracts the decimated latitude, longitude and values of every parameter for the station plots in a single pass.
+    
+    Required Arguments:
+    
+    1) ds (xarray.array) - The GRIB dataset.
+    
+    2) parameters (List) - The parameter key names.
+    
+    3) decimate (Integer) - This determines how the pixel queries appear on the map. Higher numbers
+        equal more sparse and lower numbers equal less sparse. Use larger numbers for larger areas and smaller values for smaller areas. 
+        
+    Optional Arguments:
+    
+    1) longitude_key (String) - Default='longitude'. The longitude coordinate key name.
+    
+    2) latitude_key (String) - Default='latitude'. The latitude coordinate key name.
+    
+    3) wind_components (Tuple or None) - Default=None. The (u_var_key, v_var_key, wind_direction_var_key, wind_speed_var_key)
+        key names. When set, the u and v components are calculated from the wind speed and direction at the decimated points
+        only instead of being read from the dataset.
+        
+    Returns
+    -------
+    
+    A dictionary of contiguous NumPy arrays with the 'longitude', 'latitude' and parameter keys. 
+    The longitude and latitude are 1-D. Each parameter is 1-D or, when the dataset has more dimensions 
+    than the grid (i.e. step), has one leading axis per extra dimension (i.e. [step, point]).
+    """
+    
+    lon = ds[longitude_key]
+    lat = ds[latitude_key]
+    
+    if lon.ndim == 1:
+        y_dim, x_dim = lat.dims[0], lon.dims[0]
+        lon2d, lat2d = grid_coordinates(lon.values, lat.values, decimate)
+    else:
+        y_dim, x_dim = lon.dims
+        lon2d = lon.values[::decimate, ::decimate]
+        lat2d = lat.values[::decimate, ::decimate]
+        
+    vals = {
+        'longitude':np.ascontiguousarray(lon2d).reshape(-1),
+        'latitude':np.ascontiguousarray(lat2d).reshape(-1)
+    }
+        
+    if wind_components is not None:
+        u_var_key, v_var_key, wind_direction_var_key, wind_speed_var_key = wind_components
+        derived = [u_var_key, v_var_key]
+        parameters = [p for p in parameters if p not in derived] + [wind_direction_var_key, wind_speed_var_key]
+        
+    for parameter in parameters:
+        if parameter in vals:
+            continue
+        var = ds[parameter].transpose(..., y_dim, x_dim)
+        data = np.asarray(var.data[..., ::decimate, ::decimate])
+        vals[parameter] = np.ascontiguousarray(data).reshape(data.shape[:-2] + (-1,))
+        
+    if wind_components is not None:
+        vals[u_var_key], vals[v_var_key] = _wind_components(vals[wind_speed_var_key], vals[wind_direction_var_key])
+        
+    return vals
+
+
+def _thinning_key(ax,
+                  lon,
+                  lat,
+                  spacing):
+    
+    """
+    This function returns the cache key of the thinned pixel queries for a grid, region and figure layout.
+    """
+    
+    fig = ax.get_figure()
+    
+    parts = [
+        grid_fingerprint(lon, lat),
+        np.round(ax.get_extent(), 4).tolist(),
+        np.round(ax.get_position().bounds, 4).tolist(),
+        np.round(fig.get_size_inches(), 2).tolist(),
+        round(float(fig.dpi), 2),
+        ax.projection.proj4_init,
+        round(float(spacing), 2),
+        'minimum spacing'
+    ]
+    
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+def _spaced_points(xy,
+                   cells,
+                   cell_id,
+                   distance,
+                   spacing):
+    
+    """
+    This function selects at most one point per cell so that no two selected points are closer than {spacing}.
+    
+    Two points closer than {spacing} are always in the same or neighbouring cells, so each point is only compared with
+    the points selected in the 8 neighbouring cells. In each cell, the point closest to the center that keeps the spacing
+    is selected. The cells whose best point is closest to their center are filled first.
+    """
+    
+    order = np.lexsort((distance, cell_id))
+    _, start, count = np.unique(cell_id[order], return_index=True, return_counts=True)
+    
+    kept = {}
+    for i in np.argsort(distance[order[start]], kind='stable'):
+        group = order[start[i]:start[i] + count[i]]
+        x, y = cells[group[0]]
+        neighbours = [kept[k] for k in ((x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)) if k in kept]
+        
+        if neighbours:
+            gap = np.hypot(xy[group, None, 0] - xy[neighbours, 0], xy[group, None, 1] - xy[neighbours, 1]).min(axis=1)
+            valid = np.flatnonzero(gap >= spacing)
+            if len(valid) == 0:
+                continue
+            kept[(x, y)] = group[valid[0]]
+        else:
+            kept[(x, y)] = group[0]
+            
+    return np.fromiter(kept.values(), dtype=np.int64, count=len(kept))
+
+def thinned_indices(ax,
+                    lon,
+                    lat,
+                    spacing,
+                    crs):
+    
+    """
+    This function selects the pixel queries that keep a minimum spacing on the screen.
+    
+    The points are projected to display (pixel) coordinates and hashed into square cells of {spacing} pixels. 
+    In each cell, the point closest to the center that is at least {spacing} pixels away from the points selected in the
+    neighbouring cells is kept, so no two selected points are closer than {spacing} pixels. The points outside of the
+    axes are dropped. 
+    The selected indices are cached in memory and in FireWxPy Cache/Pixel Query Index for each 
+    (grid, region, figure layout, spacing).
+    
+    Required Arguments:
+    
+    1) ax (cartopy.mpl.geoaxes.GeoAxes) - The axes of the map. The colorbar must already be added so the layout is final.
+    
+    2) lon (numpy.array) - The 1-D longitude of the candidate points.
+    
+    3) lat (numpy.array) - The 1-D latitude of the candidate points.
+    
+    4) spacing (Integer or Float) - The minimum spacing between the pixel queries in pixels.
+    
+    5) crs (cartopy.crs) - The coordinate reference system of lon and lat.
+        
+    Returns
+    -------
+    
+    A 1-D NumPy array of the indices of the selected points.
+    """
+    
+    ax.apply_aspect()
+    key = _thinning_key(ax, lon, lat, spacing)
+    
+    if key in _thinning_memory:
+        return _thinning_memory[key]
+    
+    file_path = f"{cache_directory('Pixel Query Index')}/{key}.npy"
+    
+    try:
+        idx = np.load(file_path, allow_pickle=False)
+        
+    except Exception as e:
+        xyz = ax.projection.transform_points(crs, np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64))
+        xy = ax.transData.transform(xyz[:, :2])
+        
+        x0, y0, x1, y1 = ax.bbox.extents
+        inside = np.isfinite(xy).all(axis=1) & (xy[:, 0] >= x0) & (xy[:, 0] <= x1) & (xy[:, 1] >= y0) & (xy[:, 1] <= y1)
+        candidates = np.flatnonzero(inside)
+        
+        cells = np.floor((xy[candidates] - [x0, y0]) / spacing).astype(np.int64)
+        offset = xy[candidates] - [x0, y0] - (cells + 0.5) * spacing
+        distance = np.hypot(offset[:, 0], offset[:, 1])
+        
+        cell_id = cells[:, 0] * (int((y1 - y0) / spacing) + 2) + cells[:, 1]
+        kept = _spaced_points(xy[candidates], cells, cell_id, distance, spacing)
+        idx = np.sort(candidates[kept])
+        
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, idx)
+        os.replace(tmp_path, file_path)
+        
+    _thinning_memory[key] = idx
+    
+    return idx
+
+def thin_pixel_queries(ax,
+                       vals,
+                       spacing,
+                       crs):
+    
+    """
+    This function thins the pixel queries returned by extract_pixel_queries() to a minimum spacing on the screen.
+    
+    Required Arguments:
+    
+    1) ax (cartopy.mpl.geoaxes.GeoAxes) - The axes of the map. The colorbar must already be added so the layout is final.
+    
+    2) vals (dict) - The pixel queries returned by extract_pixel_queries().
+    
+    3) spacing (Integer or Float) - The minimum spacing between the pixel queries in pixels.
+    
+    4) crs (cartopy.crs) - The coordinate reference system of the data.
+        
+    Returns
+    -------
+    
+    A dictionary with the same keys as {vals} that only holds the selected points.
+    """
+    
+    idx = thinned_indices(ax,
+                          vals['longitude'],
+                          vals['latitude'],
+                          spacing,
+                          crs)
+    
+    return {k:np.ascontiguousarray(v[..., idx]) for k, v in vals.items()}
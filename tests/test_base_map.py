@@ -0,0 +1,93 @@
+"""
+Tests of the base map templates.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import pytest
+
+from firewxpy.utils import base_map
+
+@pytest.fixture
+def digests(monkeypatch):
+
+    state = {'sha256':{}, 'calls':[]}
+
+    def refresh_file(url, path, filename, proxies=None, chunk_size=8192, notifications='off', refresh=True, force=False):
+        state['calls'].append((url, refresh))
+        return state['sha256'].get(url, 'v1'), False
+
+    monkeypatch.setattr(base_map, '_refresh_file', refresh_file)
+
+    return state
+
+def _arguments(**kwargs):
+
+    arguments = {'western_bound':-125, 'eastern_bound':-66, 'southern_bound':24, 'northern_bound':50,
+                 'show_states':True, 'show_counties':False, 'refresh_cartographic_files':True}
+    arguments.update(kwargs)
+
+    return arguments
+
+def test_refreshed_layer_changes_the_key(digests):
+
+    states = base_map._cartographic_layers['states'][0]
+
+    key = base_map.base_map_key(_arguments())
+    assert base_map.base_map_key(_arguments()) == key
+    assert digests['calls'] == [(states, True), (states, True)]
+
+    digests['sha256'][states] = 'v2'
+    assert base_map.base_map_key(_arguments()) != key
+
+    # Only the layers that are shown are checked.
+    counties = base_map._cartographic_layers['counties'][0]
+    digests['sha256'][counties] = 'v2'
+    assert base_map.base_map_key(_arguments()) == base_map.base_map_key(_arguments())
+    assert counties not in [url for url, refresh in digests['calls']]
+
+def test_local_layer_changes_the_key(digests, tmp_path):
+
+    file_path = tmp_path / 'custom.geojson'
+    file_path.write_text('{"type":"FeatureCollection","features":[]}')
+
+    key = base_map.base_map_key(_arguments(custom_geojson_local_path=str(file_path)))
+
+    file_path.write_text('{"type":"FeatureCollection","features":[], "name":"v2"}')
+    assert base_map.base_map_key(_arguments(custom_geojson_local_path=str(file_path))) != key
+
+def test_rasters_keep_the_layering():
+
+    import numpy as np
+    import shapely
+    import cartopy.crs as ccrs
+
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(4, 3))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
+    ax.set_extent([-10, 10, -10, 10], ccrs.PlateCarree())
+
+    # The static layers: a fill and two borders.
+    ax.add_geometries([shapely.box(-8, -8, 8, 8)], crs=ccrs.PlateCarree(), facecolor='tan', edgecolor='none', zorder=1)
+    ax.add_geometries([shapely.box(-6, -6, 2, 2)], crs=ccrs.PlateCarree(), facecolor='none', edgecolor='red', linewidth=3, zorder=5)
+    ax.add_geometries([shapely.box(-2, -2, 6, 6)], crs=ccrs.PlateCarree(), facecolor='none', edgecolor='blue', linewidth=3, zorder=9)
+    base_map.store_base_map(('layering',), fig, ax)
+
+    # The plot draws between the layers: the borders must not be merged into one raster.
+    ax.fill([-9, 9, 9, -9], [-4, -4, 4, 4], color='green', alpha=0.6, zorder=3, transform=ccrs.PlateCarree())
+    ax.plot([-9, 9], [0, 0], color='k', linewidth=6, zorder=7, transform=ccrs.PlateCarree())
+
+    fig.canvas.draw()
+    vector = np.asarray(fig.canvas.buffer_rgba()).copy()
+
+    base_map.rasterize_base_map(fig, ax)
+    assert [image.get_zorder() for image in ax.images] == [1, 5, 9]
+
+    fig.canvas.draw()
+    np.testing.assert_array_equal(np.asarray(fig.canvas.buffer_rgba()), vector)
+
+    base_map.close_base_map(fig)
+    base_map.clear_base_maps()
@@ -0,0 +1,227 @@
+"""
+Tests of the unit conversion registry against MetPy (pint).
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+import pytest
+
+from metpy.units import units
+from firewxpy.calc import calc
+
+_values = np.array([-40.0, 0.0, 12.5, 273.15, 1000.0])
+
+@pytest.mark.parametrize('from_units, to_units', sorted(calc._kernels))
+def test_kernels_match_pint(from_units, to_units):
+
+    expected = units.Quantity(_values, calc._pint_names[from_units]).to(calc._pint_names[to_units]).magnitude
+
+    np.testing.assert_allclose(calc.convert_array(_values, from_units, to_units, dtype=None), expected, rtol=1e-12, atol=1e-9)
+
+def test_difference_is_only_scaled():
+
+    converted = calc.convert_array(np.array([1.0, 10.0]), 'kelvin', 'fahrenheit', dtype=None, difference=True)
+    expected = units.Quantity(np.array([1.0, 10.0]), 'delta_degC').to('delta_degF').magnitude
+
+    np.testing.assert_allclose(converted, expected)
+
+    ds = xr.Dataset({'2m_dew_point_depression':(('y', 'x'), np.full((2, 3), 5.0))})
+    ds = calc.convert_units(ds, '2m_dew_point_depression', 'fahrenheit', from_units='kelvin', difference=True)
+    np.testing.assert_allclose(ds['2m_dew_point_depression'].values, 9.0)
+
+@pytest.mark.parametrize('dtype', ['float32', 'float64'])
+def test_dtype_is_kept(dtype):
+
+    values = _values.astype(dtype)
+
+    assert calc.convert(values, 'kelvin', 'fahrenheit').dtype == np.dtype(dtype)
+    assert calc.convert_array(values, 'kelvin', 'fahrenheit', dtype=None).dtype == np.dtype(dtype)
+
+    # Integers are converted to float64.
+    assert calc.convert(np.arange(3), 'mps', 'mph').dtype == np.float64
+
+def test_in_place_conversion_aliases_the_values():
+
+    values = _values.astype('float32')
+    expected = calc.convert(values, 'celsius', 'fahrenheit')
+
+    converted = calc.convert(values, 'celsius', 'fahrenheit', in_place=True)
+    assert converted is values
+    np.testing.assert_array_equal(values, expected)
+
+    values = _values.astype('float32')
+    assert calc.convert_array(values, 'celsius', 'kelvin', out=values) is values
+
+    da = xr.DataArray(_values.astype('float32'), dims='x')
+    converted = calc.convert(da, 'celsius', 'kelvin', in_place=True)
+    assert np.shares_memory(converted.values, da.values)
+
+    # A buffer of another data type cannot hold the converted values.
+    values = np.arange(3)
+    assert calc.convert(values, 'mps', 'kts', in_place=True) is not values
+
+def test_containers_keep_their_type():
+
+    expected = calc.convert(_values, 'kelvin', 'celsius')
+
+    da = xr.DataArray(_values, dims='x', coords={'x':np.arange(5)}, attrs={'long_name':'temperature'})
+    converted = calc.convert(da, 'kelvin', 'celsius')
+    assert isinstance(converted, xr.DataArray)
+    assert converted.attrs['long_name'] == 'temperature'
+    assert converted.attrs[calc.units_attribute] == 'celsius'
+    np.testing.assert_array_equal(converted['x'].values, da['x'].values)
+    np.testing.assert_allclose(converted.values, expected)
+
+    series = pd.Series(_values, index=list('abcde'), name='t')
+    converted = calc.convert(series, 'kelvin', 'celsius')
+    assert isinstance(converted, pd.Series)
+    assert converted.name == 't' and list(converted.index) == list('abcde')
+    np.testing.assert_allclose(converted.to_numpy(), expected)
+
+    df = pd.DataFrame({'a':_values, 'b':_values})
+    converted = calc.convert(df, 'kelvin', 'celsius')
+    assert isinstance(converted, pd.DataFrame)
+    assert list(converted.columns) == ['a', 'b']
+    np.testing.assert_allclose(converted['b'].to_numpy(), expected)
+
+    assert calc.convert(300.0, 'kelvin', 'celsius') == pytest.approx(26.85)
+    assert np.ndim(calc.convert(300.0, 'kelvin', 'celsius')) == 0
+
+def test_unregistered_units_fall_back_to_pint():
+
+    assert calc.normalize_units('degR') == 'degree_Rankine'
+
+    converted = calc.convert(np.array([491.67, 671.67]), 'degR', 'celsius')
+    np.testing.assert_allclose(converted, [0.0, 100.0], atol=1e-9)
+
+    converted = calc.convert(np.array([1.0, 2.0]), 'inch', 'cm')
+    np.testing.assert_allclose(converted, units.Quantity([1.0, 2.0], 'inch').to('cm').magnitude)
+
+    # The derived kernel is added to the registry.
+    assert (calc.normalize_units('inch'), calc.normalize_units('cm')) in calc._kernels
+
+    with pytest.raises(ValueError):
+        calc.convert(1.0, 'not_a_unit', 'kelvin')
+
+    with pytest.raises(ValueError):
+        calc.convert(1.0, 'degR', 'mph')
+
+def test_convert_units_records_the_units():
+
+    ds = xr.Dataset({'2m_temperature':(('y', 'x'), np.full((2, 3), 273.15))})
+
+    with pytest.raises(ValueError):
+        calc.convert_units(ds, '2m_temperature', 'fahrenheit')
+
+    converted = calc.convert_units(ds, '2m_temperature', 'fahrenheit', from_units='kelvin')
+    assert converted['2m_temperature'].dtype == np.float32
+    assert calc.units_of(converted, '2m_temperature') == 'fahrenheit'
+    np.testing.assert_allclose(converted['2m_temperature'].values, 32.0, rtol=1e-6)
+
+    # The dataset that was passed in is not altered.
+    assert ds['2m_temperature'].dtype == np.float64
+    assert calc.units_of(ds, '2m_temperature') is None
+
+    # A variable that is already in the units is not converted twice.
+    again = calc.convert_units(converted, '2m_temperature', 'fahrenheit', from_units='kelvin')
+    assert again['2m_temperature'].values is converted['2m_temperature'].values
+
+def test_convert_units_in_place():
+
+    values = np.full((2, 3), 273.15, dtype='float32')
+    ds = xr.Dataset({'2m_temperature':(('y', 'x'), values)})
+
+    converted = calc.convert_units(ds, '2m_temperature', 'celsius', from_units='kelvin', in_place=True)
+    assert converted is ds
+    assert np.shares_memory(ds['2m_temperature'].values, values)
+    np.testing.assert_allclose(values, 0.0, atol=1e-4)
+
+def test_mph_to_kts():
+
+    np.testing.assert_allclose(calc.mph_to_kts(np.array([10.0, 50.0])), units.Quantity([10.0, 50.0], 'mph').to('knot').magnitude)
+    assert calc.mph_to_kts(10.0) == pytest.approx(8.68976, rel=1e-5)
+
+def _rtma(dtype):
+
+    rng = np.random.default_rng(0)
+    dims = ('y', 'x')
+    temperature = rng.uniform(240, 320, (30, 40))
+    dew_point = temperature - rng.uniform(0, 30, (30, 40))
+
+    return xr.Dataset({'2m_temperature':(dims, temperature.astype(dtype)),
+                       '2m_dew_point':(dims, dew_point.astype(dtype)),
+                       '2m_dew_point_depression':(dims, (temperature - dew_point).astype(dtype)),
+                       '10m_wind_speed':(dims, rng.uniform(0, 30, (30, 40)).astype(dtype))})
+
+@pytest.mark.parametrize('dtype', ['float32', 'float64'])
+def test_float32_temperature_fields_match_the_float64_formulas(dtype):
+
+    ds = _rtma(dtype)
+    converted = calc.convert_temperature_fields(ds)
+
+    for key in ['2m_temperature', '2m_dew_point']:
+        expected = (ds[key].values.astype('float64') - 273.15) * 9 / 5 + 32
+        assert converted[key].dtype == np.float32
+        np.testing.assert_allclose(converted[key].values, expected, rtol=1e-6, atol=1e-4)
+
+    expected = ds['2m_dew_point_depression'].values.astype('float64') * 9 / 5
+    assert converted['2m_dew_point_depression'].dtype == np.float32
+    np.testing.assert_allclose(converted['2m_dew_point_depression'].values, expected, rtol=1e-6, atol=1e-4)
+
+    # The variables that are not temperatures and the dataset that was passed in are left alone.
+    assert converted['10m_wind_speed'].values is ds['10m_wind_speed'].values
+    assert ds['2m_temperature'].dtype == np.dtype(dtype)
+    assert calc.units_of(ds, '2m_temperature') is None
+
+    # A converted dataset is not converted again.
+    again = calc.convert_temperature_fields(converted)
+    for key in ['2m_temperature', '2m_dew_point', '2m_dew_point_depression']:
+        assert again[key].values is converted[key].values
+
+def test_float32_wind_speed_matches_the_float64_formulas():
+
+    ds = _rtma('float32')
+
+    for to_units, factor in [('mph', 2.2369362920544), ('kts', 1.9438444924406)]:
+        converted = calc.convert_units(ds, '10m_wind_speed', to_units, from_units='mps')
+        assert converted['10m_wind_speed'].dtype == np.float32
+        np.testing.assert_allclose(converted['10m_wind_speed'].values,
+                                   ds['10m_wind_speed'].values.astype('float64') * factor, rtol=1e-6)
+
+@pytest.mark.parametrize('dtype', ['float32', 'float64'])
+def test_wind_components_round_trip(dtype):
+
+    rng = np.random.default_rng(0)
+    speed = rng.uniform(0.5, 40, 500).astype(dtype)
+    direction = rng.uniform(0, 360, 500).astype(dtype)
+
+    u, v = calc.wind_components(speed, direction)
+    assert u.dtype == v.dtype == np.dtype(dtype)
+
+    # The meteorological convention: a wind blowing from the north (0 degrees) has a negative v component.
+    radians = np.deg2rad(direction.astype('float64'))
+    np.testing.assert_allclose(u, -speed * np.sin(radians), rtol=1e-5, atol=1e-4)
+    np.testing.assert_allclose(v, -speed * np.cos(radians), rtol=1e-5, atol=1e-4)
+
+    speed_back, direction_back = calc.speed_and_direction(u, v)
+    np.testing.assert_allclose(speed_back, speed, rtol=1e-5)
+
+    # The directions are compared on the circle (359.99 and 0.01 degrees are close).
+    delta = (direction_back.astype('float64') - direction + 180) % 360 - 180
+    np.testing.assert_allclose(delta, 0, atol=1e-3)
+
+def test_wind_components_are_written_into_the_buffers():
+
+    speed = np.array([10.0, 5.0, 0.0])
+    direction = np.array([0.0, 90.0, 180.0])
+    u, v = np.empty(3), np.empty(3)
+
+    assert calc.wind_components(speed, direction, u=u, v=v)[0] is u
+    np.testing.assert_allclose(u, [0.0, -5.0, 0.0], atol=1e-12)
+    np.testing.assert_allclose(v, [-10.0, 0.0, 0.0], atol=1e-12)
+
+    speed_back, direction_back = calc.speed_and_direction(u[:2], v[:2])
+    np.testing.assert_allclose(direction_back, [0.0, 90.0], atol=1e-9)
@@ -0,0 +1,99 @@
+"""
+Tests of the freshness policy of the cartographic files against a local stand-in server.
+
+The stand-in server is an http.server that serves one file with an ETag and answers 304 Not Modified to a matching
+If-None-Match header. Every request it receives is recorded.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import hashlib
+import threading
+import pytest
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from firewxpy.utils import cartographic_refresh
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+
+    # The manifest is written under the working directory.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(cartographic_refresh._settings, 'ttl', 3600)
+
+    state = {'content':b'shapefile v1', 'requests':[]}
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            etag = f'"{hashlib.md5(state["content"]).hexdigest()}"'
+            state['requests'].append(self.headers.get('If-None-Match'))
+
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', str(len(state['content'])))
+            self.end_headers()
+            self.wfile.write(state['content'])
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    state['url'] = f"http://127.0.0.1:{httpd.server_address[1]}/US_States.zip"
+
+    yield state
+
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_download_then_fresh_then_not_modified(server, tmp_path, monkeypatch):
+
+    path = str(tmp_path / 'Cartographic Files' / 'US States')
+
+    # 200: the file is downloaded and its hash recorded.
+    digest, downloaded = cartographic_refresh.refresh_file(server['url'], path, 'US_States.zip')
+    assert downloaded is True
+    assert digest == hashlib.sha256(b'shapefile v1').hexdigest()
+    assert (tmp_path / 'Cartographic Files' / 'US States' / 'US_States.zip').read_bytes() == b'shapefile v1'
+    assert server['requests'] == [None]
+
+    # Within the freshness window: no request is sent.
+    assert cartographic_refresh.refresh_file(server['url'], path, 'US_States.zip') == (digest, False)
+    assert len(server['requests']) == 1
+
+    # Once the window expires: a conditional request is answered with 304 and the local copy is kept.
+    monkeypatch.setitem(cartographic_refresh._settings, 'ttl', 0)
+    checked = cartographic_refresh.read_manifest(server['url'])['checked']
+
+    assert cartographic_refresh.refresh_file(server['url'], path, 'US_States.zip') == (digest, False)
+    assert server['requests'][1] == cartographic_refresh.read_manifest(server['url'])['etag']
+    assert cartographic_refresh.read_manifest(server['url'])['checked'] > checked
+
+    # The file changed on the server: it is downloaded again.
+    server['content'] = b'shapefile v2'
+    digest, downloaded = cartographic_refresh.refresh_file(server['url'], path, 'US_States.zip')
+    assert downloaded is True
+    assert digest == hashlib.sha256(b'shapefile v2').hexdigest()
+    assert len(server['requests']) == 3
+
+def test_refresh_false_never_revalidates(server, tmp_path, monkeypatch):
+
+    path = str(tmp_path / 'Cartographic Files' / 'US States')
+    cartographic_refresh.refresh_file(server['url'], path, 'US_States.zip')
+
+    monkeypatch.setitem(cartographic_refresh._settings, 'ttl', 0)
+    server['content'] = b'shapefile v2'
+
+    digest, downloaded = cartographic_refresh.refresh_file(server['url'], path, 'US_States.zip', refresh=False)
+    assert downloaded is False
+    assert digest == hashlib.sha256(b'shapefile v1').hexdigest()
+    assert len(server['requests']) == 1
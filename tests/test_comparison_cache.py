@@ -0,0 +1,107 @@
+"""
+Tests of the cache of the differences between the current and comparison RTMA analyses.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+import pytest
+
+from firewxpy.calc import calc
+from firewxpy.utils import comparison_cache
+
+_now = pd.Timestamp('2026-10-17 12:00')
+
+@pytest.fixture(autouse=True)
+def cache():
+
+    comparison_cache.clear_comparison_cache()
+    yield
+    comparison_cache.set_comparison_cache_policy()
+    comparison_cache.clear_comparison_cache()
+
+def _analysis(time, offset=0.0):
+
+    rng = np.random.default_rng(int(offset * 10))
+    dims = ('y', 'x')
+    temperature = 280 + offset + rng.normal(size=(20, 30))
+
+    ds = xr.Dataset({'2m_temperature':(dims, temperature.astype('float32')),
+                     '10m_wind_speed':(dims, (5 + offset + 0 * temperature).astype('float32'))},
+                    coords={'longitude':(dims, np.tile(np.arange(30.0), (20, 1))),
+                            'latitude':(dims, np.tile(np.arange(20.0)[:, None], (1, 30)))})
+
+    return ds.assign_coords(time=np.datetime64(time))
+
+def test_difference_is_computed_once_and_read_only():
+
+    ds1, ds2 = _analysis(_now, 3.0), _analysis(_now - pd.Timedelta(hours=24))
+
+    diff = comparison_cache.comparison_difference(ds1, ds2, '2m_temperature')
+    expected = ds1['2m_temperature'].values - ds2['2m_temperature'].values
+    np.testing.assert_allclose(diff['2m_temperature'].values, expected)
+    assert diff['2m_temperature'].dtype == np.float32
+
+    with pytest.raises(ValueError):
+        diff['2m_temperature'].values[0, 0] = 0
+
+    # The same pair of analyses (even converted into new arrays of the same values) reads the cached difference.
+    again = comparison_cache.comparison_difference(ds1.copy(deep=True), ds2.copy(deep=True), '2m_temperature')
+    assert again['2m_temperature'].values is diff['2m_temperature'].values
+
+def test_difference_is_invalidated_when_the_time_changes():
+
+    ds1, ds2 = _analysis(_now, 3.0), _analysis(_now - pd.Timedelta(hours=24))
+    diff = comparison_cache.comparison_difference(ds1, ds2, '2m_temperature')
+
+    # The same values at another valid time (i.e. a re-issued analysis) are differenced again.
+    later = ds1.assign_coords(time=np.datetime64(_now + pd.Timedelta(hours=1)))
+    again = comparison_cache.comparison_difference(later, ds2, '2m_temperature')
+
+    assert again['2m_temperature'].values is not diff['2m_temperature'].values
+    np.testing.assert_array_equal(again['2m_temperature'].values, diff['2m_temperature'].values)
+
+def test_difference_is_invalidated_when_the_units_change():
+
+    ds1, ds2 = _analysis(_now, 3.0), _analysis(_now - pd.Timedelta(hours=24))
+
+    kelvin = comparison_cache.comparison_difference(ds1, ds2, '2m_temperature', from_units='kelvin')
+    fahrenheit = comparison_cache.comparison_difference(ds1, ds2, '2m_temperature', to_units='fahrenheit', from_units='kelvin')
+
+    # Only the scale of the conversion applies to a difference.
+    np.testing.assert_allclose(fahrenheit['2m_temperature'].values, kelvin['2m_temperature'].values * 1.8, rtol=1e-6)
+    assert calc.units_of(fahrenheit, '2m_temperature') == 'fahrenheit'
+
+    # The analyses converted to fahrenheit hold other values and units: their difference is not the cached kelvin one.
+    converted = comparison_cache.comparison_difference(calc.convert_temperature_fields(ds1),
+                                                       calc.convert_temperature_fields(ds2),
+                                                       '2m_temperature')
+    assert converted['2m_temperature'].values is not kelvin['2m_temperature'].values
+    np.testing.assert_allclose(converted['2m_temperature'].values, fahrenheit['2m_temperature'].values, rtol=1e-5, atol=1e-4)
+
+    # The same values with other recorded units are differenced again.
+    relabeled = ds1.copy()
+    relabeled['2m_temperature'].attrs[calc.units_attribute] = 'celsius'
+    again = comparison_cache.comparison_difference(relabeled, ds2, '2m_temperature', from_units='kelvin')
+    assert again['2m_temperature'].values is not kelvin['2m_temperature'].values
+
+def test_least_recently_used_differences_are_evicted():
+
+    comparison_cache.set_comparison_cache_policy(max_entries=2)
+    ds2 = _analysis(_now - pd.Timedelta(hours=24))
+
+    pairs = [_analysis(_now + pd.Timedelta(hours=h), 3.0) for h in range(3)]
+    first = comparison_cache.comparison_difference(pairs[0], ds2, '2m_temperature')
+    comparison_cache.comparison_difference(pairs[1], ds2, '2m_temperature')
+    comparison_cache.comparison_difference(pairs[2], ds2, '2m_temperature')
+
+    assert len(comparison_cache._cache) == 2
+    assert comparison_cache.comparison_difference(pairs[0], ds2, '2m_temperature')['2m_temperature'].values is not \
+        first['2m_temperature'].values
+
+    comparison_cache.set_comparison_cache_policy(enabled=False)
+    comparison_cache.clear_comparison_cache()
+    comparison_cache.comparison_difference(pairs[0], ds2, '2m_temperature')
+    assert len(comparison_cache._cache) == 0
@@ -0,0 +1,181 @@
+"""
+Tests of the in-process dataset cache.
+
+The clock of the cache is replaced by a fake clock so the expiry and the hourly cycles can be stepped through.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import inspect
+import time
+import numpy as np
+import pandas as pd
+import xarray as xr
+import wxdata
+import pytest
+
+from firewxpy.utils import dataset_cache
+
+class _Clock:
+
+    """
+    A stand-in for the time module: monotonic() and the UTC wall clock both follow {now}.
+    """
+
+    strftime = staticmethod(time.strftime)
+
+    def __init__(self, now):
+        self.now = pd.Timestamp(now).timestamp()
+
+    def advance(self, seconds):
+        self.now += seconds
+
+    def monotonic(self):
+        return self.now
+
+    def gmtime(self, *args):
+        return time.gmtime(self.now)
+
+def _analysis(cycle, shape=(20, 30)):
+
+    y, x = np.mgrid[0:shape[0], 0:shape[1]]
+    dims = ('y', 'x')
+    ds = xr.Dataset({'2m_temperature':(dims, (60 + 0.1 * x).astype('float32')),
+                     '2m_relative_humidity':(dims, (40 + 0.1 * y).astype('float32'))},
+                    coords={'longitude':(dims, -130 + x * 70 / shape[1]), 'latitude':(dims, 20 + y * 35 / shape[0])})
+
+    return ds.assign_coords(time=np.datetime64(pd.Timestamp(cycle)))
+
+@pytest.fixture
+def source(monkeypatch):
+
+    clock = _Clock('2026-10-17 12:05')
+    monkeypatch.setattr(dataset_cache, '_time', clock)
+    monkeypatch.setattr(dataset_cache, '_settings', {'enabled':True, 'ttl':3600, 'max_entries':4, 'recheck':300, 'cycle':None})
+    dataset_cache.clear_dataset_cache()
+
+    state = {'calls':0, 'cycle':pd.Timestamp('2026-10-17 12:00'), 'shape':(20, 30), 'clock':clock}
+
+    def fetch(**kwargs):
+        state['calls'] += 1
+        return _analysis(state['cycle'], state['shape'])
+
+    fetch.__signature__ = inspect.signature(wxdata.rtma)
+    state['client'] = dataset_cache.cached_dataset(fetch)
+
+    yield state
+
+    dataset_cache.clear_dataset_cache()
+
+def test_hit_and_miss(source):
+
+    client = source['client']
+
+    ds = client(convert_to='fahrenheit', clear_data=True)
+    assert source['calls'] == 1
+
+    # The transport arguments do not change the decoded dataset.
+    client(convert_to='fahrenheit', clear_data=False, chunk_size=1024)
+    assert source['calls'] == 1
+
+    # Default arguments are bound: both calls ask for the same dataset.
+    client(model='rtma', convert_to='fahrenheit')
+    assert source['calls'] == 1
+
+    client(convert_to='celsius')
+    assert source['calls'] == 2
+
+    # A plotting function reassigning a variable does not alter the cached entry.
+    ds['2m_temperature'] = ds['2m_temperature'] * 0
+    assert float(client(convert_to='fahrenheit')['2m_temperature'].max()) > 0
+
+def test_ttl_eviction(source):
+
+    client = source['client']
+
+    client()
+    source['clock'].advance(3000)
+    client()
+    assert source['calls'] == 1
+
+    source['clock'].advance(601)
+    client()
+    assert source['calls'] == 2
+
+def test_size_eviction(source, monkeypatch):
+
+    client = source['client']
+    monkeypatch.setitem(dataset_cache._settings, 'max_entries', 2)
+
+    client(convert_to='fahrenheit')
+    client(convert_to='celsius')
+
+    # The least recently used entry is evicted.
+    client(convert_to='fahrenheit')
+    client(convert_to='kelvin')
+    assert source['calls'] == 3
+
+    client(convert_to='fahrenheit')
+    assert source['calls'] == 3
+
+    client(convert_to='celsius')
+    assert source['calls'] == 4
+
+def test_analysis_older_than_the_cycle_is_rechecked(source):
+
+    client = source['client']
+
+    # 12:05 UTC: the 12z analysis is not published yet and the 11z analysis is returned.
+    source['cycle'] = pd.Timestamp('2026-10-17 11:00')
+    client()
+    source['clock'].advance(120)
+    assert dataset_cache._valid_cycle(client()) == '2026101711'
+    assert source['calls'] == 1
+
+    # After the recheck interval the data source is asked again and returns the new analysis.
+    source['cycle'] = pd.Timestamp('2026-10-17 12:00')
+    source['clock'].advance(200)
+    assert dataset_cache._valid_cycle(client()) == '2026101712'
+    assert source['calls'] == 2
+
+    # The entry holds the current cycle: it is kept for the ttl.
+    source['clock'].advance(1800)
+    client()
+    assert source['calls'] == 2
+
+def test_hold_datasets_freezes_the_cycle(source):
+
+    client, clock = source['client'], source['clock']
+    clock.advance(50 * 60)
+
+    with dataset_cache.hold_datasets():
+        client()
+
+        # Past the top of the hour and past the ttl: the batch still reuses the dataset.
+        clock.advance(2 * 3600)
+        client()
+        assert source['calls'] == 1
+
+    # Once the hold ends, the entry is stale.
+    client()
+    assert source['calls'] == 2
+    assert dataset_cache._settings['ttl'] == 3600 and dataset_cache._settings['cycle'] is None
+
+def test_plot_functions_share_one_download(source, tmp_path, monkeypatch):
+
+    import matplotlib.figure
+
+    from firewxpy.rtma.conus import rtma
+
+    # The graphics are not saved: only the data path is tested (drawing the map downloads the Natural Earth features).
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(matplotlib.figure.Figure, 'savefig', lambda self, *args, **kwargs: None)
+    monkeypatch.setattr(rtma, '_rtma', source['client'])
+    source['shape'] = (150, 300)
+
+    rtma.plot_temperature(show_states=False, show_counties=False)
+    rtma.plot_relative_humidity(show_states=False, show_counties=False)
+    assert source['calls'] == 1
+
+    rtma.plot_temperature(show_states=False, show_counties=False, convert_to='celsius')
+    assert source['calls'] == 2
@@ -0,0 +1,187 @@
+"""
+Tests of the render modes of the gridded weather field.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import numpy as np
+import cartopy.crs as ccrs
+import pytest
+
+from matplotlib.figure import Figure
+from firewxpy.utils import field_rendering
+
+_levels = np.arange(40, 100, 5)
+
+def _grid(ny=60, nx=80):
+
+    lon, lat = np.meshgrid(np.linspace(-125, -100, nx), np.linspace(30, 45, ny))
+    values = 70 + 25 * np.sin(lon / 4) * np.cos(lat / 3)
+
+    return lon, lat, values
+
+def _ax(extent=(-123, -102, 32, 43), figsize=(6, 4)):
+
+    fig = Figure(figsize=figsize)
+    ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
+    ax.set_extent(extent, ccrs.PlateCarree())
+
+    return ax
+
+def test_boundary_norm_matches_the_contourf_colors():
+
+    lon, lat, values = _grid()
+    ax = _ax()
+
+    # One value inside of every filled layer (below the levels, between each pair of levels and above the levels).
+    samples = np.concatenate([[_levels[0] - 3], (_levels[:-1] + _levels[1:]) / 2 + 1, [_levels[-1] + 3]])
+
+    for extend in ['both', 'neither', 'min', 'max']:
+        cs = ax.contourf(lon, lat, values, cmap='jet', levels=_levels, extend=extend, transform=ccrs.PlateCarree())
+        cmap, norm = field_rendering.boundary_norm(_levels, 'jet', extend=extend)
+
+        inside = np.ones(samples.shape, dtype=bool)
+        inside[0] = extend in ('both', 'min')
+        inside[-1] = extend in ('both', 'max')
+
+        np.testing.assert_allclose(cs.get_facecolor(), cmap(norm(samples[inside])))
+
+def test_imshow_takes_the_nearest_grid_point():
+
+    lon, lat, values = _grid(20, 30)
+    ax = _ax(figsize=(3, 2))
+
+    image = field_rendering.render_field(ax, lon, lat, values, 'jet', _levels, ccrs.PlateCarree(), render_mode='imshow')
+    data = image.get_array()
+    height, width = data.shape
+
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+    x = xlim[0] + (np.arange(width) + 0.5) * (xlim[1] - xlim[0]) / width
+    y = ylim[0] + (np.arange(height) + 0.5) * (ylim[1] - ylim[0]) / height
+
+    assert np.ma.count_masked(data) == 0
+
+    # The value of each pixel is the value of a grid point at the minimum distance (pixels halfway between two grid points may
+    # take either of them).
+    for row in range(height):
+        distance = np.hypot(x[:, None] - lon.reshape(-1), y[row] - lat.reshape(-1))
+        nearest = distance <= distance.min(axis=1, keepdims=True) + 1e-9
+        assert (nearest & (values.reshape(-1) == data[row][:, None])).any(axis=1).all()
+
+def test_imshow_masks_the_map_outside_of_the_grid():
+
+    lon, lat, values = _grid()
+    ax = _ax(extent=(-130, -95, 25, 50))
+
+    data = field_rendering.render_field(ax, lon, lat, values, 'jet', _levels, ccrs.PlateCarree(), render_mode='imshow').get_array()
+
+    xlim = ax.get_xlim()
+    x = xlim[0] + (np.arange(data.shape[1]) + 0.5) * (xlim[1] - xlim[0]) / data.shape[1]
+    outside = (x < -126) | (x > -99)
+
+    assert np.ma.getmaskarray(data)[:, outside].all()
+    assert not np.ma.getmaskarray(data)[data.shape[0] // 2, ~((x < -125) | (x > -100))].any()
+
+def test_pcolormesh_fills_the_missing_coordinates():
+
+    lon, lat, values = _grid(10, 12)
+    lon[:, :3] = np.nan
+    lat[-2:, :] = np.nan
+
+    filled_lon = field_rendering._fill_coordinates(lon)
+    filled_lat = field_rendering._fill_coordinates(lat)
+
+    assert np.isfinite(filled_lon).all() and np.isfinite(filled_lat).all()
+    np.testing.assert_array_equal(filled_lon[:, :4], np.repeat(lon[:, 3:4], 4, axis=1))
+    np.testing.assert_array_equal(filled_lat[-3:], np.repeat(lat[-3:-2], 3, axis=0))
+
+    ax = _ax()
+    mesh = field_rendering.render_field(ax, lon, lat, values, 'jet', _levels, ccrs.PlateCarree(), render_mode='pcolormesh')
+    cmap, norm = field_rendering.boundary_norm(_levels, 'jet')
+    assert isinstance(mesh.norm, type(norm))
+    np.testing.assert_array_equal(mesh.cmap.colors, cmap.colors)
+
+def test_unknown_render_mode():
+
+    lon, lat, values = _grid()
+
+    with pytest.raises(ValueError):
+        field_rendering.render_field(_ax(), lon, lat, values, 'jet', _levels, ccrs.PlateCarree(), render_mode='scatter')
+
+def _manual_block_means(array, block):
+
+    ny, nx = array.shape
+    means = np.full((-(-ny // block), -(-nx // block)), np.nan)
+    for j in range(means.shape[0]):
+        for i in range(means.shape[1]):
+            cells = array[j * block:(j + 1) * block, i * block:(i + 1) * block]
+            if np.isfinite(cells).any():
+                means[j, i] = np.nanmean(cells)
+
+    return means
+
+@pytest.mark.parametrize('block', [2, 3, 7])
+def test_block_means_match_the_nan_aware_means(block):
+
+    rng = np.random.default_rng(0)
+    array = rng.normal(size=(23, 31))
+    array[rng.random(array.shape) < 0.2] = np.nan
+    array[:block, :block] = np.nan
+
+    np.testing.assert_allclose(field_rendering._block_reduce(array, block, 'mean'), _manual_block_means(array, block))
+    np.testing.assert_array_equal(field_rendering._block_reduce(array, block, 'stride'),
+                                  array[block // 2::block, block // 2::block])
+
+def test_coarsened_field_keeps_the_requested_cells_per_pixel():
+
+    lon, lat, values = _grid(600, 800)
+    ax = _ax(figsize=(2, 1.5))
+
+    cells_y, cells_x = field_rendering.cells_per_pixel(ax, lon, lat, ccrs.PlateCarree())
+    block = int(min(cells_y, cells_x))
+    assert block >= 2
+
+    coarse = field_rendering.coarsen_to_resolution(ax, lon, lat, values, ccrs.PlateCarree(), quality=1)
+    for coarsened, field in zip(coarse, (lon, lat, values)):
+        np.testing.assert_allclose(coarsened, _manual_block_means(field, block))
+
+    strided = field_rendering.coarsen_to_resolution(ax, lon, lat, values, ccrs.PlateCarree(), quality=1, method='stride')
+    np.testing.assert_array_equal(strided[2], values[block // 2::block, block // 2::block])
+
+def test_field_is_unchanged_when_not_coarsened():
+
+    ax = _ax(figsize=(2, 1.5))
+
+    # Without a quality and on a grid that is not finer than the pixels of the map.
+    lon, lat, values = _grid(600, 800)
+    assert field_rendering.coarsen_to_resolution(ax, lon, lat, values, ccrs.PlateCarree(), quality=None)[2] is values
+
+    lon, lat, values = _grid()
+    assert field_rendering.coarsen_to_resolution(ax, lon, lat, values, ccrs.PlateCarree())[2] is values
+
+    with pytest.raises(ValueError):
+        field_rendering.coarsen_to_resolution(ax, lon, lat, values, ccrs.PlateCarree(), method='median')
+
+def test_cached_contour_polygons_match_contourf():
+
+    lon, lat, values = _grid()
+    values[5:9, 10:14] = np.nan
+    field_rendering._contour_polygons.clear()
+
+    layers = field_rendering.contour_polygons(lon, lat, values, _levels, extend='both')
+    assert field_rendering.contour_polygons(lon, lat, values.copy(), _levels, extend='both') is layers
+    assert field_rendering.contour_polygons(lon, lat, values + 1, _levels, extend='both') is not layers
+
+    # The whole grid is on the map so every polygon is kept.
+    cs = _ax(extent=(-130, -95, 25, 50)).contourf(lon, lat, values, cmap='jet', levels=_levels, extend='both',
+                                                  transform=ccrs.PlateCarree())
+    cached = field_rendering.render_field(_ax(extent=(-130, -95, 25, 50)), lon, lat, values, 'jet', _levels,
+                                          ccrs.PlateCarree(), contour_cache=True)
+
+    assert len(cached.get_paths()) == len(cs.get_paths()) == len(layers)
+    for path, expected in zip(cached.get_paths(), cs.get_paths()):
+        np.testing.assert_array_equal(path.vertices, expected.vertices)
+        np.testing.assert_array_equal(path.codes, expected.codes)
+
+    np.testing.assert_allclose(cached.get_facecolor(), cs.get_facecolor())
+    np.testing.assert_array_equal(cached.levels, cs.levels)
@@ -0,0 +1,100 @@
+"""
+Tests of the on-disk cache of the parsed shapefile geometries.
+
+The geometries loaded back from the cache are compared with the geometries shapeography reads from the shapefile.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import cartopy.crs as ccrs
+import geopandas as gpd
+import shapely
+import pytest
+
+from shapeography import geometry
+from firewxpy.utils import geometry_cache
+
+@pytest.fixture
+def shapefile(tmp_path, monkeypatch):
+
+    # The cache is written under the working directory.
+    monkeypatch.chdir(tmp_path)
+    geometry_cache.clear_geometry_cache()
+    monkeypatch.setitem(geometry_cache._settings, 'max_layers', 16)
+
+    shapes = [shapely.box(-120, 35, -119, 36),
+              shapely.MultiPolygon([shapely.box(-118, 34, -117, 35), shapely.box(-116, 33, -115.5, 33.25)]),
+              shapely.Polygon([(-110, 30), (-105, 30), (-105, 35), (-110, 35)],
+                              [[(-109, 31), (-106, 31), (-106, 34), (-109, 34)]])]
+
+    file_path = str(tmp_path / 'layer.shp')
+    gpd.GeoDataFrame({'id':[1, 2, 3]}, geometry=shapes, crs='EPSG:4326').to_file(file_path)
+
+    return file_path
+
+def _assert_same(cached, expected):
+
+    assert len(cached) == len(expected)
+    for a, b in zip(cached, expected):
+        assert a.geom_type == b.geom_type
+        assert shapely.equals_exact(a, b, tolerance=0)
+
+@pytest.mark.parametrize('convert_crs', [False, True])
+def test_round_trip_matches_shapeography(shapefile, convert_crs):
+
+    # The two ways import_shapefile_from_web() reads a shapefile.
+    if convert_crs is True:
+        expected = list(geometry.geodataframe(shapefile, crs='EPSG:4326')['geometry'])
+    else:
+        expected = list(geometry.cartopy_shapefeature(shapefile, edgecolor='black', crs=ccrs.PlateCarree()).geometries())
+
+    key = geometry_cache.geometry_key('https://example.com/layer.zip', geometry_cache.file_digest(shapefile), convert_crs)
+    geometry_cache.store_geometries(key, expected)
+
+    # A new process: the geometries are read from the .npz file.
+    geometry_cache.clear_geometry_cache()
+    _assert_same(geometry_cache.load_geometries(key), expected)
+
+def test_mixed_geometry_types_round_trip(shapefile):
+
+    expected = [shapely.box(0, 0, 1, 1), shapely.LineString([(0, 0), (1, 1), (2, 0)]), shapely.Point(3, 4)]
+
+    arrays = geometry_cache.pack_geometries(expected)
+    assert str(arrays['format']) == 'wkb'
+    _assert_same(geometry_cache.unpack_geometries(arrays), expected)
+
+    geometry_cache.store_geometries('mixed', expected)
+    geometry_cache.clear_geometry_cache()
+    _assert_same(geometry_cache.load_geometries('mixed'), expected)
+
+def test_missing_and_corrupt_entries(shapefile):
+
+    assert geometry_cache.load_geometries('missing') is None
+
+    with open(geometry_cache._cache_file('corrupt'), 'wb') as f:
+        f.write(b'not a npz file')
+    assert geometry_cache.load_geometries('corrupt') is None
+
+def test_least_recently_used_layers_are_dropped(shapefile):
+
+    geometry_cache.set_geometry_cache_policy(max_layers=2)
+
+    layers = {key:geometry_cache.store_geometries(key, [shapely.box(i, 0, i + 1, 1)]) for i, key in enumerate('abc')}
+    assert list(geometry_cache._memory) == ['b', 'c']
+
+    # A layer read back from its file becomes the most recently used one.
+    loaded = geometry_cache.load_geometries('a')
+    _assert_same(loaded, layers['a'])
+    assert list(geometry_cache._memory) == ['c', 'a']
+
+    # A hit in memory is the same list and is moved to the end.
+    assert geometry_cache.load_geometries('c') is layers['c']
+    assert list(geometry_cache._memory) == ['a', 'c']
+
+    geometry_cache.set_geometry_cache_policy(max_layers=0)
+    assert len(geometry_cache._memory) == 0
+    _assert_same(geometry_cache.load_geometries('b'), layers['b'])
+    assert len(geometry_cache._memory) == 0
+
+    geometry_cache.clear_geometry_cache(disk=True)
+    assert geometry_cache.load_geometries('a') is None
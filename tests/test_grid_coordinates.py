@@ -0,0 +1,69 @@
+"""
+Tests of the 2-D coordinates of the regular latitude/longitude grids.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import importlib
+import numpy as np
+import xarray as xr
+import pytest
+
+# firewxpy.utils exports the grid_coordinates() function under the name of its module.
+grid_coordinates = importlib.import_module('firewxpy.utils.grid_coordinates')
+
+@pytest.fixture(autouse=True)
+def cache():
+
+    grid_coordinates.clear_grid_coordinates()
+    yield
+    grid_coordinates.set_grid_coordinates_policy()
+    grid_coordinates.clear_grid_coordinates()
+
+_lon = np.arange(-161, -154, 0.025)
+_lat = np.arange(18, 23, 0.025)
+
+@pytest.mark.parametrize('decimate', [1, 3, 10])
+def test_grid_coordinates_match_meshgrid(decimate):
+
+    lon2d, lat2d = grid_coordinates.grid_coordinates(_lon, _lat, decimate=decimate)
+    expected_lon, expected_lat = np.meshgrid(_lon, _lat)
+
+    np.testing.assert_array_equal(lon2d, expected_lon[::decimate, ::decimate])
+    np.testing.assert_array_equal(lat2d, expected_lat[::decimate, ::decimate])
+    assert lon2d.dtype == expected_lon.dtype and lat2d.dtype == expected_lat.dtype
+
+    with pytest.raises(ValueError):
+        lon2d[0, 0] = 0
+
+def test_grid_coordinates_are_shared_per_grid_and_decimation():
+
+    ds = xr.Dataset(coords={'longitude':_lon, 'latitude':_lat})
+
+    grid = grid_coordinates.grid_coordinates(ds['longitude'], ds['latitude'])
+    assert grid_coordinates.grid_coordinates(_lon.copy(), _lat.copy()) is grid
+    assert grid_coordinates.grid_coordinates(_lon, _lat, decimate=2) is not grid
+
+    # Another data type of the same axes is another grid.
+    lon2d, lat2d = grid_coordinates.grid_coordinates(_lon.astype('float32'), _lat.astype('float32'))
+    assert lon2d.dtype == np.float32
+    np.testing.assert_array_equal(lon2d, np.meshgrid(_lon.astype('float32'), _lat.astype('float32'))[0])
+
+def test_least_recently_used_grids_are_dropped():
+
+    grid_coordinates.set_grid_coordinates_policy(max_grids=2)
+
+    first = grid_coordinates.grid_coordinates(_lon, _lat, decimate=1)
+    second = grid_coordinates.grid_coordinates(_lon, _lat, decimate=2)
+
+    # The first grid is used again so the second is the least recently used one.
+    assert grid_coordinates.grid_coordinates(_lon, _lat, decimate=1) is first
+    grid_coordinates.grid_coordinates(_lon, _lat, decimate=3)
+
+    assert len(grid_coordinates._memory) == 2
+    assert grid_coordinates.grid_coordinates(_lon, _lat, decimate=1) is first
+    assert grid_coordinates.grid_coordinates(_lon, _lat, decimate=2) is not second
+
+    grid_coordinates.set_grid_coordinates_policy(max_grids=0)
+    assert len(grid_coordinates._memory) == 0
+    assert grid_coordinates.grid_coordinates(_lon, _lat) is not first
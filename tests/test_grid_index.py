@@ -0,0 +1,77 @@
+"""
+Tests of the persisted index windows of the regions on a grid.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import numpy as np
+import xarray as xr
+import cartopy.crs as ccrs
+import pytest
+
+from firewxpy.utils import grid_index
+
+_extents = [[-170, -130, 52, 72],
+            [-155, -145, 58, 64],
+            [172, 230, 50, 70],
+            [-60, -50, 10, 20]]
+
+def _polar_grid(east=False):
+
+    # A curvilinear grid like the RTMA Alaska grid (polar stereographic).
+    proj = ccrs.NorthPolarStereo(central_longitude=-150, true_scale_latitude=60)
+    x, y = np.meshgrid(np.linspace(-3.0e6, 3.0e6, 240), np.linspace(-5.5e6, -1.5e6, 160))
+    lonlat = ccrs.PlateCarree().transform_points(proj, x, y)
+    lon, lat = lonlat[..., 0], lonlat[..., 1]
+
+    if east is True:
+        lon = lon % 360
+
+    return lon, lat
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+
+    # The index is written under the working directory.
+    monkeypatch.chdir(tmp_path)
+    grid_index._memory.clear()
+
+    yield
+
+    grid_index._memory.clear()
+
+@pytest.mark.parametrize('east', [False, True])
+@pytest.mark.parametrize('extent', _extents)
+def test_persisted_window_matches_a_fresh_search(extent, east):
+
+    lon, lat = _polar_grid(east)
+    expected = grid_index.compute_window(lon, lat, extent)
+
+    assert grid_index.region_window(lon, lat, extent) == expected
+
+    # A new process: the window is read from the index on disk.
+    grid_index._memory.clear()
+    assert grid_index.region_window(lon, lat, extent) == expected
+
+def test_precomputed_windows_match_a_fresh_search():
+
+    lon, lat = _polar_grid()
+    dims = ('y', 'x')
+    ds = xr.Dataset(coords={'longitude':(dims, lon), 'latitude':(dims, lat)})
+
+    windows = grid_index.precompute_region_windows(ds, regions=_extents)
+    grid_index._memory.clear()
+
+    for extent in _extents:
+        expected = grid_index.compute_window(lon, lat, extent)
+        assert windows[tuple(extent)] == expected
+        assert grid_index.region_window(lon, lat, extent) == expected
+
+def test_new_grid_definition_does_not_reuse_a_window():
+
+    lon, lat = _polar_grid()
+    grid_index.region_window(lon, lat, _extents[1])
+
+    shifted = lon + 5
+    assert grid_index.grid_fingerprint(shifted, lat) != grid_index.grid_fingerprint(lon, lat)
+    assert grid_index.region_window(shifted, lat, _extents[1]) == grid_index.compute_window(shifted, lat, _extents[1])
@@ -0,0 +1,90 @@
+"""
+Tests of the normalized coordinates of the grids that store their longitudes from 0 to 360.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os
+import numpy as np
+import pytest
+
+from firewxpy.utils import grid_normalization
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+
+    # The normalized grids are written under the working directory.
+    monkeypatch.chdir(tmp_path)
+    grid_normalization.clear_grid_normalization()
+    yield
+    grid_normalization.clear_grid_normalization()
+
+def _alaska(ny=40, nx=60):
+
+    # A curvilinear grid from 170 to 240 degrees east that crosses the antimeridian.
+    y, x = np.mgrid[0:ny, 0:nx]
+    lon = 170 + x * (70 / (nx - 1)) + 0.05 * y
+    lat = 50 + y * 0.5
+
+    return lon, lat, 10 + 0.1 * x + 0.2 * y
+
+def _per_plot(lon, lat, values, western_limit=-180, eastern_limit=-120):
+
+    # The normalization every plot computed before the grids were cached.
+    lon = np.where(lon > 180, lon - 360, lon)
+    mask = (lon >= western_limit) & (lon <= eastern_limit)
+
+    return np.where(mask, lon, np.nan), np.where(mask, lat, np.nan), np.where(mask, values, np.nan)
+
+def test_normalized_grid_matches_the_per_plot_masking():
+
+    lon, lat, values = _alaska()
+    expected = _per_plot(lon, lat, values)
+    assert np.isnan(expected[0]).any() and np.isfinite(expected[0]).any()
+
+    lon_masked, lat_masked, mask = grid_normalization.normalized_grid(lon, lat)
+
+    np.testing.assert_array_equal(lon_masked, expected[0])
+    np.testing.assert_array_equal(lat_masked, expected[1])
+    np.testing.assert_array_equal(grid_normalization.apply_grid_mask(values, mask), expected[2])
+    assert np.nanmin(lon_masked) >= -180 and np.nanmax(lon_masked) <= -120
+
+    # The cached arrays are shared: they are read-only.
+    for array in (lon_masked, lat_masked, mask):
+        with pytest.raises(ValueError):
+            array[0, 0] = 0
+
+def test_normalized_grid_is_read_back_from_memory_and_disk():
+
+    lon, lat, values = _alaska()
+    grid = grid_normalization.normalized_grid(lon, lat)
+    assert grid_normalization.normalized_grid(lon.copy(), lat.copy()) is grid
+
+    # A new session reads the persisted grid.
+    grid_normalization.clear_grid_normalization()
+    again = grid_normalization.normalized_grid(lon, lat)
+    assert again is not grid
+    for cached, expected in zip(again, grid):
+        np.testing.assert_array_equal(cached, expected)
+
+    # Another window is another grid.
+    lon_masked, lat_masked, mask = grid_normalization.normalized_grid(lon, lat, western_limit=-175, eastern_limit=-130)
+    expected = _per_plot(lon, lat, values, western_limit=-175, eastern_limit=-130)
+    np.testing.assert_array_equal(lon_masked, expected[0])
+
+    path = grid_normalization._cache_directory('Grid Normalization')
+    assert len(os.listdir(path)) == 2
+
+    grid_normalization.clear_grid_normalization(disk=True)
+    assert os.listdir(path) == []
+
+def test_grid_mask_is_a_view_when_nothing_is_masked():
+
+    lon, lat = np.meshgrid(np.linspace(190, 230, 30), np.linspace(55, 70, 20))
+    values = np.arange(lon.size, dtype='float32').reshape(lon.shape)
+
+    lon_masked, lat_masked, mask = grid_normalization.normalized_grid(lon, lat)
+
+    assert mask.all()
+    np.testing.assert_allclose(lon_masked, lon - 360)
+    assert grid_normalization.apply_grid_mask(values, mask) is values
@@ -0,0 +1,48 @@
+"""
+Tests of the cropping of the gridded data to the visible map.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import numpy as np
+import xarray as xr
+import cartopy.crs as ccrs
+import pytest
+
+from firewxpy.utils.grid_subset import subset_to_region
+
+_extent = [-125, -66, 24, 50]
+
+@pytest.fixture
+def ds(tmp_path, monkeypatch):
+
+    # The grid index is written under the working directory.
+    monkeypatch.chdir(tmp_path)
+
+    lon, lat = np.meshgrid(np.arange(-130, -60, 0.5), np.arange(20, 60, 0.5))
+    dims = ('y', 'x')
+
+    return xr.Dataset({'2m_temperature':(dims, np.zeros(lon.shape, dtype='float32'))},
+                      coords={'longitude':(dims, lon), 'latitude':(dims, lat)})
+
+def _covers(ds, lon, lat):
+
+    return (ds['longitude'].min() <= lon <= ds['longitude'].max()) and (ds['latitude'].min() <= lat <= ds['latitude'].max())
+
+def test_plate_carree_crop_is_unchanged(ds):
+
+    assert subset_to_region(ds, _extent, mapcrs=ccrs.PlateCarree()).sizes == subset_to_region(ds, _extent).sizes
+
+def test_projected_crop_covers_the_visible_map(ds):
+
+    mapcrs = ccrs.LambertConformal(central_longitude=-96)
+
+    # The middle of the top edge of the map as cartopy sets it (ax.set_extent(extent, PlateCarree())).
+    lons, lats = np.meshgrid(np.linspace(_extent[0], _extent[1], 50), np.linspace(_extent[2], _extent[3], 50))
+    xy = mapcrs.transform_points(ccrs.PlateCarree(), lons.ravel(), lats.ravel())
+    x, y = xy[:, 0].mean(), xy[:, 1].max()
+    lon, lat = ccrs.PlateCarree().transform_point(x, y, mapcrs)
+
+    assert lat > _extent[3] + 2
+    assert not _covers(subset_to_region(ds, _extent), lon, lat)
+    assert _covers(subset_to_region(ds, _extent, mapcrs=mapcrs), lon, lat)
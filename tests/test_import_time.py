@@ -0,0 +1,24 @@
+"""
+Tests of the import time of FireWxPy (see firewxpy.utils.import_time).
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import pytest
+
+from firewxpy.utils.import_time import check_import_time
+
+@pytest.mark.parametrize('statement', ['import firewxpy',
+                                       'import firewxpy.utils',
+                                       'import firewxpy; firewxpy.utils, firewxpy.rtma, firewxpy.observations.upper_air'])
+def test_import_time(statement):
+
+    check_import_time(statement, repeat=3)
+
+def test_subpackages_are_attributes():
+
+    import firewxpy
+
+    for name in ['calc', 'observations', 'rtma', 'utils']:
+        assert name in dir(firewxpy)
+        assert getattr(firewxpy, name).__name__ == f"firewxpy.{name}"
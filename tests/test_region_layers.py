@@ -0,0 +1,49 @@
+"""
+Tests of the clipping of the reference layers to the visible map.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import numpy as np
+import cartopy.crs as ccrs
+import shapely
+
+from firewxpy.utils.region_layers import map_extent, clip_geometries
+
+_extent = [-125, -66, 24, 50]
+
+def test_plate_carree_extent_is_unchanged():
+
+    assert map_extent(_extent) == _extent
+    assert map_extent(_extent, ccrs.PlateCarree()) == _extent
+
+def test_projected_corners_are_inside_the_bounds():
+
+    mapcrs = ccrs.LambertConformal(central_longitude=-96)
+    western_bound, eastern_bound, southern_bound, northern_bound = map_extent(_extent, mapcrs)
+
+    # The corners of the map as cartopy sets it (ax.set_extent(extent, PlateCarree())).
+    lons, lats = np.meshgrid(np.linspace(_extent[0], _extent[1], 100), np.linspace(_extent[2], _extent[3], 100))
+    xy = mapcrs.transform_points(ccrs.PlateCarree(), lons.ravel(), lats.ravel())
+    x0, y0 = xy[:, :2].min(axis=0)
+    x1, y1 = xy[:, :2].max(axis=0)
+    corners = ccrs.PlateCarree().transform_points(mapcrs, np.array([x0, x1, x1, x0]), np.array([y0, y0, y1, y1]))
+
+    assert (corners[:, 0] >= western_bound).all() and (corners[:, 0] <= eastern_bound).all()
+    assert (corners[:, 1] >= southern_bound).all() and (corners[:, 1] <= northern_bound).all()
+    # The middle of the top edge of the Lambert Conformal map reaches beyond the northern bound of the box.
+    assert northern_bound > _extent[3] + 1
+
+def test_visible_geometries_are_kept():
+
+    # A border in the north-western corner of the Lambert Conformal map, west of the box and its margin.
+    border = shapely.LineString([(-134, 46), (-133, 48)])
+
+    assert clip_geometries([border], _extent) == []
+    assert len(clip_geometries([border], map_extent(_extent, ccrs.LambertConformal(central_longitude=-96)))) == 1
+
+def test_visible_pole():
+
+    western_bound, eastern_bound, southern_bound, northern_bound = map_extent([-180, 180, 60, 90], ccrs.NorthPolarStereo())
+
+    assert northern_bound == 90 and western_bound == -180 and eastern_bound == 180
@@ -0,0 +1,96 @@
+"""
+Tests of the render daemon with a stand-in RTMA module.
+
+The stand-in module has one plot function that writes the creation time printed on its graphic to a file (or kills its
+worker process) so the jobs render without any data.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import time
+import pytest
+
+from firewxpy.rtma import daemon as render_daemon
+
+_module = '''
+import os
+
+from firewxpy.utils.standard import plot_creation_time
+
+def plot_temperature(region='conus', reference_system='States & Counties', notifications='off', output=None, crash=False):
+
+    if crash is True:
+        os._exit(1)
+
+    local, utc = plot_creation_time()
+    with open(output, 'a') as f:
+        f.write(utc.isoformat(timespec='seconds') + '\\n')
+'''
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+
+    (tmp_path / 'stand_in_rtma.py').write_text(_module)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(render_daemon.modules, 'stand_in', 'stand_in_rtma')
+
+    d = render_daemon.start_render_daemon(port=0, workers=1, block=False)
+
+    yield d
+
+    render_daemon.stop_render_daemon(d)
+
+def _job(tmp_path, name, **kwargs):
+
+    return {'module':'stand_in', 'kwargs':dict(output=str(tmp_path / f"{name}.txt"), **kwargs)}
+
+def test_submit_status_and_creation_times(daemon, tmp_path):
+
+    first = render_daemon.submit(daemon, _job(tmp_path, 'first'))
+    assert render_daemon.status(daemon, first)['status'] in ('queued', 'running', 'done')
+
+    record = render_daemon.status(daemon, first, wait=True, timeout=120)
+    assert record['status'] == 'done'
+    assert record['results'][0]['error'] is None
+
+    # The creation time of the next job is not the creation time of the worker.
+    time.sleep(1.1)
+    second = render_daemon.status(daemon, render_daemon.submit(daemon, _job(tmp_path, 'second')), wait=True, timeout=120)
+    assert second['status'] == 'done'
+    assert second['worker'] == record['worker']
+    assert second['created'] > record['created']
+
+    # Every graphic of a job is stamped with the creation time of the job.
+    assert (tmp_path / 'first.txt').read_text().split() == [record['created']]
+    assert (tmp_path / 'second.txt').read_text().split() == [second['created']]
+
+    assert render_daemon.status(daemon, 'unknown') is None
+
+    with pytest.raises(ValueError):
+        render_daemon.submit(daemon, {'module':'not_a_module'})
+
+def test_http_endpoints(daemon, tmp_path):
+
+    url = f"http://127.0.0.1:{daemon.server_address[1]}"
+
+    record = render_daemon.submit_render_job('stand_in', url=url, wait=True, timeout=120, output=str(tmp_path / 'http.txt'))
+    assert record['status'] == 'done'
+    assert render_daemon.render_job_status(record['id'], url=url)['created'] == record['created']
+
+    health = render_daemon._request_json(f"{url}/health")
+    assert health['jobs']['done'] == 1 and health['restarts'] == 0
+
+    with pytest.raises(KeyError):
+        render_daemon.render_job_status('unknown', url=url)
+
+def test_dead_worker_restarts_the_pool(daemon, tmp_path):
+
+    crashed = render_daemon.submit(daemon, _job(tmp_path, 'crashed', crash=True))
+    record = render_daemon.status(daemon, crashed, wait=True, timeout=120)
+    assert record['status'] == 'failed'
+    assert record['error'].startswith('BrokenProcessPool')
+
+    # The next job is rendered by a new pool.
+    record = render_daemon.status(daemon, render_daemon.submit(daemon, _job(tmp_path, 'after')), wait=True, timeout=120)
+    assert record['status'] == 'done'
+    assert daemon.restarts == 1
@@ -0,0 +1,154 @@
+"""
+Tests of the local RTMA archive used by the comparison products.
+
+The WxData clients are replaced by small synthetic analyses and only the calls to them are counted.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+import pytest
+
+from firewxpy.utils import rtma_archive
+
+_now = pd.Timestamp('2026-10-17 12:00')
+
+def _analysis(cycle):
+
+    y, x = np.mgrid[0:20, 0:30]
+    dims = ('y', 'x')
+    ds = xr.Dataset({'2m_temperature':(dims, (60 + 0.1 * x).astype('float32')),
+                     '10m_wind_speed':(dims, (5 + 0.1 * y).astype('float32'))},
+                    coords={'longitude':(dims, -125 + x * 2.0), 'latitude':(dims, 25 + y * 1.25)})
+
+    return ds.assign_coords(time=np.datetime64(pd.Timestamp(cycle)))
+
+@pytest.fixture
+def clients(tmp_path, monkeypatch):
+
+    # The archive is written under the working directory.
+    monkeypatch.chdir(tmp_path)
+
+    calls = {'comparison':0, 'current':0, 'analysis':[]}
+
+    def fetch_comparison(model='rtma', cat='analysis', hours=24, proxies=None, process_data=True, clear_data=False,
+                         convert_temperature=True, convert_to='fahrenheit'):
+        calls['comparison'] += 1
+        return _analysis(_now), _analysis(_now - pd.Timedelta(hours=hours))
+
+    def fetch_current(model='rtma', cat='analysis', proxies=None, process_data=True, clear_data=False,
+                      convert_temperature=True, convert_to='fahrenheit'):
+        calls['current'] += 1
+        return _analysis(_now)
+
+    def fetch_analysis(time, **kwargs):
+        calls['analysis'].append(pd.Timestamp(time))
+        return _analysis(time)
+
+    return calls, fetch_comparison, fetch_current, fetch_analysis
+
+def test_archive_miss_fetches_only_the_comparison_analysis(clients):
+
+    calls, fetch_comparison, fetch_current, fetch_analysis = clients
+    client = rtma_archive.archived_comparison(fetch_comparison, fetch_current, fetch_analysis)
+
+    ds, ds_dt = client(hours=6)
+    assert calls['current'] == 1 and calls['comparison'] == 0
+    assert calls['analysis'] == [_now - pd.Timedelta(hours=6)]
+    assert rtma_archive.valid_time(ds_dt) == _now - pd.Timedelta(hours=6)
+
+    # Both analyses are archived: only the current analysis is fetched again.
+    ds, ds_dt = client(hours=6)
+    assert calls['current'] == 2 and calls['comparison'] == 0 and len(calls['analysis']) == 1
+    np.testing.assert_array_equal(ds_dt['2m_temperature'].values, ds['2m_temperature'].values)
+
+def test_archive_miss_without_fetch_analysis(clients):
+
+    calls, fetch_comparison, fetch_current, fetch_analysis = clients
+
+    client = rtma_archive.archived_comparison(fetch_comparison, fetch_current, lambda time, **kwargs: None)
+    client(hours=6)
+    assert calls['current'] == 1 and calls['comparison'] == 1
+
+    # The comparison analysis was archived by the fallback.
+    client(hours=6)
+    assert calls['current'] == 2 and calls['comparison'] == 1
+
+def test_archive_files_are_compressed(clients):
+
+    file_path = rtma_archive.store_analysis(_analysis(_now))
+
+    with xr.open_dataset(file_path) as ds:
+        assert ds['2m_temperature'].encoding['zlib'] is True
+
+    ds = rtma_archive.load_analysis(_now)
+    np.testing.assert_array_equal(ds['2m_temperature'].values, _analysis(_now)['2m_temperature'].values)
+
+def _conus_analysis(cycle):
+
+    y, x = np.mgrid[0:150, 0:300]
+    lon = -130 + x * 0.25
+    lat = 20 + y * 0.25
+    dims = ('y', 'x')
+    data = {
+        '2m_temperature':60 + 10 * np.sin(lon / 5),
+        '2m_dew_point':45 + 5 * np.cos(lat / 3),
+        '2m_relative_humidity':50 + 0 * x,
+        '10m_wind_speed':5 + 0.01 * y,
+        '10m_u_wind_component':3 + 0 * x,
+        '10m_v_wind_component':-2 + 0 * x,
+        '10m_wind_gust':8 + 0.01 * x,
+        '10m_wind_direction':180 + 0 * x,
+    }
+    ds = xr.Dataset({k:(dims, v.astype('float32')) for k, v in data.items()},
+                    coords={'longitude':(dims, lon), 'latitude':(dims, lat)})
+
+    return ds.assign_coords(time=np.datetime64(pd.Timestamp(cycle)))
+
+def test_plot_with_default_arguments_reads_the_archive(tmp_path, monkeypatch):
+
+    import inspect
+    import wxdata
+    import matplotlib.figure
+
+    from firewxpy.rtma.conus import rtma_comparison
+    from firewxpy.utils.dataset_cache import cached_dataset, clear_dataset_cache
+
+    # The graphics are not saved: only the data path is tested (drawing the map downloads the Natural Earth features).
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(matplotlib.figure.Figure, 'savefig', lambda self, *args, **kwargs: None)
+
+    calls = {'comparison':0, 'current':0, 'analysis':0}
+
+    def fetch_comparison(**kwargs):
+        calls['comparison'] += 1
+        return _conus_analysis(_now), _conus_analysis(_now - pd.Timedelta(hours=kwargs['hours']))
+
+    def fetch_current(**kwargs):
+        calls['current'] += 1
+        return _conus_analysis(_now)
+
+    def fetch_analysis(time, **kwargs):
+        calls['analysis'] += 1
+        return _conus_analysis(time)
+
+    fetch_comparison.__signature__ = inspect.signature(wxdata.rtma_comparison)
+    fetch_current.__signature__ = inspect.signature(wxdata.rtma)
+
+    # The same client as the module builds from the WxData clients.
+    client = cached_dataset(rtma_archive.archived_comparison(fetch_comparison, fetch_current, fetch_analysis))
+    monkeypatch.setattr(rtma_comparison, '_rtma_comparison', client)
+
+    clear_dataset_cache()
+    rtma_comparison.plot_temperature(show_states=False, show_counties=False)
+    assert calls == {'comparison':0, 'current':1, 'analysis':1}
+    assert len(rtma_archive.archived_times()) == 2
+
+    # A new session: the comparison analysis is read from the archive.
+    clear_dataset_cache()
+    rtma_comparison.plot_temperature(show_states=False, show_counties=False)
+    assert calls == {'comparison':0, 'current':2, 'analysis':1}
+
+    clear_dataset_cache()
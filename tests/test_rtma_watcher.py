@@ -0,0 +1,177 @@
+"""
+Tests of the RTMA watcher against a local stand-in data server.
+
+The stand-in server is an http.server serving empty files with the NCEP/NOMADS layout. The analyses are small synthetic
+datasets returned by the fetch hook and the graphics are recorded instead of rendered.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import os
+import functools
+import threading
+import numpy as np
+import pandas as pd
+import xarray as xr
+import pytest
+
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from firewxpy.rtma import watcher
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+
+    # The watcher state and the RTMA archive are written under the working directory.
+    monkeypatch.chdir(tmp_path)
+
+    root = tmp_path / 'server'
+    root.mkdir()
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(_QuietHandler, directory=str(root)))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/"
+
+    def publish(domain, cycle, content=b'grib'):
+        file_path = root / watcher.cycle_url(domain, cycle, url)[len(url):]
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+
+    yield url, publish
+
+    httpd.shutdown()
+    httpd.server_close()
+
+def _analysis(cycle,
+              wind_offset=0):
+
+    y, x = np.mgrid[0:20, 0:30]
+    lon = -125 + x * 2.0
+    lat = 25 + y * 1.25
+    dims = ('y', 'x')
+    data = {
+        '2m_temperature':290 + 0.1 * x,
+        '2m_dew_point':280 + 0.1 * y,
+        '2m_dew_point_depression':10 + 0.1 * x - 0.1 * y,
+        '2m_relative_humidity':50 + 0 * x,
+        '10m_wind_speed':5 + 0.1 * y + wind_offset,
+        '10m_u_wind_component':3 + 0 * x,
+        '10m_v_wind_component':-2 + 0 * x,
+        '10m_wind_gust':8 + 0.1 * x,
+        '10m_wind_direction':180 + 0 * x,
+    }
+    ds = xr.Dataset({k:(dims, v.astype('float32')) for k, v in data.items()},
+                    coords={'longitude':(dims, lon), 'latitude':(dims, lat)})
+
+    return ds.assign_coords(time=np.datetime64(pd.Timestamp(cycle)))
+
+@pytest.fixture
+def rendered(monkeypatch):
+
+    calls = []
+
+    def render_job(module, product, region, reference_system, layers, datasets, product_kwargs, kwargs, notifications='off'):
+        calls.append((module.__name__.split('.')[-1], product, datasets))
+        return {'product':product, 'region':region, 'reference_system':reference_system, 'seconds':0, 'error':None, 'worker':os.getpid()}
+
+    monkeypatch.setattr(watcher, '_render_job', render_job)
+
+    return calls
+
+_suites = {'conus':{'products':['temperature', 'wind_speed'], 'reference_systems':{'Plain':{'show_states':False}}}}
+
+def test_latest_cycle(server):
+
+    url, publish = server
+    now = pd.Timestamp('2026-10-17 12:20')
+
+    assert watcher.latest_cycle('conus', url, now=now) == (None, None)
+
+    publish('conus', '2026-10-17 10:00')
+    cycle, signature = watcher.latest_cycle('conus', url, now=now)
+    assert cycle == pd.Timestamp('2026-10-17 10:00')
+    assert signature
+
+    publish('conus', '2026-10-17 12:00')
+    assert watcher.latest_cycle('conus', url, now=now)[0] == pd.Timestamp('2026-10-17 12:00')
+
+    # Cycles older than the lookback are not found.
+    assert watcher.latest_cycle('conus', url, lookback=1, now=now + pd.Timedelta(hours=3)) == (None, None)
+
+def test_due():
+
+    cycle = pd.Timestamp('2026-10-17 12:00')
+    state = {'domains':{}, 'graphics':{}}
+
+    assert watcher._due(state, 'conus', None, None) is False
+    assert watcher._due(state, 'conus', cycle, 'a') is True
+
+    state['domains']['conus'] = {'cycle':str(cycle), 'signature':'a', 'complete':True, 'attempts':1}
+    assert watcher._due(state, 'conus', cycle, 'a') is False
+    assert watcher._due(state, 'conus', cycle, 'b') is True
+    assert watcher._due(state, 'conus', cycle + pd.Timedelta(hours=1), 'a') is True
+    assert watcher._due(state, 'conus', cycle - pd.Timedelta(hours=1), 'a') is False
+
+    state['domains']['conus'].update(complete=False, attempts=1)
+    assert watcher._due(state, 'conus', cycle, 'a') is True
+    state['domains']['conus']['attempts'] = watcher._settings['max_attempts']
+    assert watcher._due(state, 'conus', cycle, 'a') is False
+
+def test_poll_renders_only_what_changed(server, rendered):
+
+    url, publish = server
+    now = pd.Timestamp.now(tz='UTC').tz_localize(None).floor('h')
+    reissued = {'wind_offset':0}
+    fetched = []
+
+    def fetch(domain, cycle, server):
+        fetched.append(pd.Timestamp(cycle))
+        return _analysis(cycle, reissued['wind_offset'] if cycle == now else 0)
+
+    # No analysis on the server: nothing is fetched or rendered.
+    summary = watcher.poll_rtma(_suites, server=url, fetch=fetch)
+    assert summary['conus']['rendered'] is False
+    assert fetched == [] and rendered == []
+
+    # A new cycle renders the RTMA and comparison suites.
+    publish('conus', now)
+    summary = watcher.poll_rtma(_suites, server=url, fetch=fetch, prefetch=True)
+    assert summary['conus']['rendered'] is True
+    assert fetched == [now, now - pd.Timedelta(hours=24)]
+    assert sorted((m, p) for m, p, d in rendered) == [('rtma', 'temperature'), ('rtma', 'wind_speed'),
+                                                      ('rtma_comparison', 'temperature'), ('rtma_comparison', 'wind_speed')]
+
+    # The same file again: nothing is fetched or rendered.
+    del fetched[:], rendered[:]
+    summary = watcher.poll_rtma(_suites, server=url, fetch=fetch)
+    assert summary['conus']['rendered'] is False
+    assert fetched == [] and rendered == []
+
+    # A re-issued file with new winds only re-renders the wind products. The comparison analysis comes from the archive.
+    reissued['wind_offset'] = 1
+    publish('conus', now, b'grib, re-issued')
+    summary = watcher.poll_rtma(_suites, server=url, fetch=fetch)
+    assert fetched == [now]
+    assert sorted((m, p) for m, p, d in rendered) == [('rtma', 'wind_speed'), ('rtma_comparison', 'wind_speed')]
+    assert sum(r['skipped'] for r in summary['conus']['results']) == 2
+
+def test_shared_datasets_are_in_module_units(server, rendered):
+
+    url, publish = server
+    now = pd.Timestamp.now(tz='UTC').tz_localize(None).floor('h')
+    publish('conus', now)
+
+    watcher.poll_rtma(_suites, server=url, fetch=lambda domain, cycle, server: _analysis(cycle))
+
+    for module, product, datasets in rendered:
+        for ds in datasets.values():
+            assert ds['2m_temperature'].attrs['firewxpy_units'] == 'fahrenheit'
+            assert ds['2m_dew_point_depression'].attrs['firewxpy_units'] == 'fahrenheit'
+            np.testing.assert_allclose(ds['2m_temperature'].values[0, 0], 62.33, atol=0.01)
+            # The dew point depression is a difference: 10 K is 18 F.
+            np.testing.assert_allclose(ds['2m_dew_point_depression'].values[0, 0], 18, atol=0.01)
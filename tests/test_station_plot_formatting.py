@@ -0,0 +1,111 @@
+"""
+Tests of the extraction and the thinning of the pixel queries.
+
+(C) Eric J. Drewitz 2024-2026
+"""
+
+import numpy as np
+import xarray as xr
+import cartopy.crs as ccrs
+import pytest
+
+from matplotlib.figure import Figure
+from firewxpy.utils import station_plot_formatting
+
+@pytest.fixture
+def ax(tmp_path, monkeypatch):
+
+    # The thinned indices are cached under the working directory.
+    monkeypatch.chdir(tmp_path)
+    station_plot_formatting._thinning_memory.clear()
+
+    fig = Figure(figsize=(8, 6))
+    ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
+    ax.set_extent([-125, -66, 24, 50], ccrs.PlateCarree())
+
+    return ax
+
+@pytest.mark.parametrize('spacing', [15, 40])
+def test_thinned_points_keep_the_minimum_spacing(ax, spacing):
+
+    rng = np.random.default_rng(0)
+    lon = rng.uniform(-125, -66, 20000)
+    lat = rng.uniform(24, 50, 20000)
+
+    idx = station_plot_formatting.thinned_indices(ax, lon, lat, spacing, ccrs.PlateCarree())
+
+    xy = ax.transData.transform(ax.projection.transform_points(ccrs.PlateCarree(), lon[idx], lat[idx])[:, :2])
+    distance = np.hypot(xy[:, None, 0] - xy[None, :, 0], xy[:, None, 1] - xy[None, :, 1])
+    np.fill_diagonal(distance, np.inf)
+
+    assert distance.min() >= spacing
+
+    # At most one point per cell of the axes.
+    width, height = ax.bbox.size
+    assert len(idx) <= (np.ceil(width / spacing) + 1) * (np.ceil(height / spacing) + 1)
+
+def _curvilinear(ny=45, nx=60):
+
+    y, x = np.mgrid[0:ny, 0:nx]
+    dims = ('y', 'x')
+    lon = -130 + x * 0.9 + 0.01 * y
+    lat = 20 + y * 0.7
+
+    return xr.Dataset({'2m_temperature':(dims, (60 + x + 0.5 * y).astype('float32')),
+                       '10m_wind_speed':(dims, (3 + 0.1 * x).astype('float32')),
+                       '10m_wind_direction':(dims, ((17 * x + 29 * y) % 360).astype('float32'))},
+                      coords={'longitude':(dims, lon), 'latitude':(dims, lat)})
+
+@pytest.mark.parametrize('decimate', [1, 7, 20])
+def test_pixel_queries_match_the_per_point_indexing(decimate):
+
+    ds = _curvilinear()
+    vals = station_plot_formatting.extract_pixel_queries(ds, ['2m_temperature', '10m_wind_speed'], decimate)
+
+    for parameter in ['2m_temperature', '10m_wind_speed']:
+        df = station_plot_formatting.fix_var_array(ds, parameter, 0, decimate)
+        np.testing.assert_array_equal(vals['longitude'], df['longitude'].to_numpy())
+        np.testing.assert_array_equal(vals['latitude'], df['latitude'].to_numpy())
+        np.testing.assert_array_equal(vals[parameter], df[parameter].to_numpy())
+
+@pytest.mark.parametrize('decimate', [1, 5])
+def test_pixel_queries_of_a_regular_grid_match_the_hawaii_indexing(decimate):
+
+    lon = np.arange(-161, -154, 0.05)
+    lat = np.arange(18, 23, 0.05)
+    ds = xr.Dataset({'2m_temperature':(('latitude', 'longitude'), np.add.outer(lat, lon).astype('float32'))},
+                    coords={'longitude':lon, 'latitude':lat})
+
+    vals = station_plot_formatting.extract_pixel_queries(ds, ['2m_temperature'], decimate)
+    lats, lons, values = station_plot_formatting.fix_var_array_rtma_hawaii(ds, '2m_temperature', decimate)
+
+    np.testing.assert_array_equal(vals['latitude'], lats)
+    np.testing.assert_array_equal(vals['longitude'], lons)
+    np.testing.assert_array_equal(vals['2m_temperature'], values)
+
+def test_pixel_queries_keep_the_leading_dimensions():
+
+    ds = _curvilinear()
+    ds = xr.concat([ds, ds + 1], dim='step')
+
+    vals = station_plot_formatting.extract_pixel_queries(ds, ['2m_temperature'], 4)
+
+    assert vals['2m_temperature'].shape[0] == 2
+    for i in range(2):
+        expected = ds['2m_temperature'].isel(step=i).values[::4, ::4].reshape(-1)
+        np.testing.assert_array_equal(vals['2m_temperature'][i], expected)
+
+def test_wind_components_at_the_points_match_the_full_grid():
+
+    ds = _curvilinear()
+    keys = ('u', 'v', '10m_wind_direction', '10m_wind_speed')
+
+    vals = station_plot_formatting.extract_pixel_queries(ds, ['u', 'v'], 6, wind_components=keys)
+
+    # The components of the full grid, decimated afterwards.
+    radians = np.deg2rad(ds['10m_wind_direction'].values)
+    u = -ds['10m_wind_speed'].values * np.sin(radians)
+    v = -ds['10m_wind_speed'].values * np.cos(radians)
+
+    np.testing.assert_allclose(vals['u'], u[::6, ::6].reshape(-1), rtol=1e-5, atol=1e-5)
+    np.testing.assert_allclose(vals['v'], v[::6, ::6].reshape(-1), rtol=1e-5, atol=1e-5)